@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+"""Benchmark of streaming text extraction with `pptx.extract.iter_text()`.
+
+Builds a deck of slides each having a title, a few text boxes, a table and a notes page, then gets
+all its text both by opening it with `Presentation()` and walking its shapes, which is what
+indexing a deck took before, and with `iter_text()`. Reports the time each takes and its peak
+memory as `tracemalloc` counts it, which leaves out the memory `lxml` allocates for the XML trees
+themselves, so understates the memory `Presentation()` holds.
+
+Run from the repository root:
+
+    $ python lab/benchmarks/extract_text.py
+"""
+
+from __future__ import annotations
+
+import io
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from pptx import Presentation
+from pptx.extract import iter_text
+from pptx.util import Inches
+
+N_SLIDES = 200
+N_TEXTBOXES = 8
+REPEAT = 3
+
+
+def build_deck() -> bytes:
+    prs = Presentation()
+    for n in range(N_SLIDES):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Slide %d" % n
+        for m in range(N_TEXTBOXES):
+            textbox = slide.shapes.add_textbox(Inches(1), Inches(m * 0.5), Inches(4), Inches(0.5))
+            textbox.text_frame.text = "Paragraph %d of text box %d\nsecond line" % (n, m)
+        table = slide.shapes.add_table(4, 4, Inches(5), Inches(1), Inches(4), Inches(2)).table
+        for cell in table.iter_cells():
+            cell.text = "cell"
+        slide.notes_slide.notes_text_frame.text = "Speaker notes for slide %d" % n
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def object_model_text(blob: bytes) -> list[tuple[int, int, str, bool]]:
+    """Text of `blob` gathered through the `Presentation` object, as `iter_text()` gives it."""
+    records: list[tuple[int, int, str, bool]] = []
+
+    def add_shape_text(slide_idx: int, shapes: Any, is_notes: bool):
+        for shape in shapes:
+            if shape.shape_type is not None and shape.has_table:
+                texts = [cell.text for cell in shape.table.iter_cells()]
+            elif getattr(shape, "has_text_frame", False) and shape.has_text_frame:
+                texts = [shape.text_frame.text]
+            elif hasattr(shape, "shapes"):
+                add_shape_text(slide_idx, shape.shapes, is_notes)
+                continue
+            else:
+                continue
+            records.extend((slide_idx, shape.shape_id, text, is_notes) for text in texts if text)
+
+    prs = Presentation(io.BytesIO(blob))
+    for slide_idx, slide in enumerate(prs.slides):
+        add_shape_text(slide_idx, slide.shapes, False)
+        if slide.has_notes_slide:
+            add_shape_text(slide_idx, slide.notes_slide.shapes, True)
+    return records
+
+
+def streamed_text(blob: bytes) -> list[tuple[int, int, str, bool]]:
+    return [tuple(record) for record in iter_text(io.BytesIO(blob))]
+
+
+def measure(extract: Callable[[bytes], Any], blob: bytes) -> tuple[float, float]:
+    """Return (seconds, peak-MB) taken by the fastest of `REPEAT` calls of `extract(blob)`."""
+    best = 1e9
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        extract(blob)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    extract(blob)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak / 2**20
+
+
+def main() -> None:
+    blob = build_deck()
+    assert object_model_text(blob) == streamed_text(blob)
+
+    print("%d slides, %.1f MB package" % (N_SLIDES, len(blob) / 2**20))
+    print("%-14s %10s %10s" % ("method", "time", "py peak"))
+    model_time, model_peak = measure(object_model_text, blob)
+    print("%-14s %8.0f ms %7.1f MB" % ("Presentation()", model_time * 1000, model_peak))
+    stream_time, stream_peak = measure(streamed_text, blob)
+    print("%-14s %8.0f ms %7.1f MB" % ("iter_text()", stream_time * 1000, stream_peak))
+    print(
+        "%.1fx faster, %.1fx less peak Python memory"
+        % (model_time / stream_time, model_peak / stream_peak)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+"""Benchmark of package triage with `pptx.opc.inspection.inspect_package()`.
+
+Builds a deck of slides each having a title, a picture and a notes page and writes it to a
+temporary file, then gets its slide count and media total both by opening it with
+`Presentation()`, which is what triage took before, and with `inspect_package()`. Reports the
+time each takes per file and the number of files per second that makes.
+
+Run from the repository root:
+
+    $ python lab/benchmarks/inspect_package.py
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import time
+from typing import Callable
+
+from pptx import Presentation
+from pptx.opc.inspection import inspect_package
+from pptx.util import Inches
+
+N_SLIDES = 100
+REPEAT = 5
+IMAGE_PATH = os.path.join("tests", "test_files", "monty-truth.png")
+
+
+def build_deck(path: str) -> None:
+    prs = Presentation()
+    for n in range(N_SLIDES):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Slide %d" % n
+        with open(IMAGE_PATH, "rb") as f:
+            # -- a distinct image for each slide, so the package holds one image per slide --
+            image = io.BytesIO(f.read() + b"%d" % n)
+        slide.shapes.add_picture(image, Inches(1), Inches(2))
+        slide.notes_slide.notes_text_frame.text = "Speaker notes for slide %d" % n
+    prs.save(path)
+
+
+def object_model_summary(path: str) -> tuple[int, int]:
+    """(slide-count, media-size) of the deck at `path`, got by opening it with `Presentation()`."""
+    prs = Presentation(path)
+    media_size = sum(
+        len(part.blob)
+        for part in prs.part.package.iter_parts()
+        if part.partname.startswith("/ppt/media/")
+    )
+    return len(prs.slides), media_size
+
+
+def inspected_summary(path: str) -> tuple[int, int]:
+    summary = inspect_package(path)
+    return summary.slide_count, summary.media_size
+
+
+def best_time(summarize: Callable[[str], object], path: str) -> float:
+    """Return the seconds taken by the fastest of `REPEAT` calls of `summarize(path)`."""
+    best = 1e9
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        summarize(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "deck.pptx")
+        build_deck(path)
+        assert object_model_summary(path) == inspected_summary(path)
+
+        print("%d slides, %.1f MB package" % (N_SLIDES, os.path.getsize(path) / 2**20))
+        print("%-18s %10s %12s" % ("method", "per file", "files/s"))
+        model_time = best_time(object_model_summary, path)
+        print("%-18s %7.2f ms %12.0f" % ("Presentation()", model_time * 1000, 1 / model_time))
+        inspect_time = best_time(inspected_summary, path)
+        print(
+            "%-18s %7.2f ms %12.0f" % ("inspect_package()", inspect_time * 1000, 1 / inspect_time)
+        )
+        print("%.0fx faster" % (model_time / inspect_time))
+
+
+if __name__ == "__main__":
+    main()
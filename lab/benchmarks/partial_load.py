@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+"""Benchmark of opening a large deck with only selected slides loaded.
+
+Builds a deck of slides each having a title, a few text boxes and a notes page, then times opening
+it with `Presentation()` and reading the text of one slide, both with every slide loaded and with
+`Presentation(path, slides=[...])` loading only that slide.
+
+Run from the repository root:
+
+    $ python lab/benchmarks/partial_load.py
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from typing import Callable
+
+from pptx import Presentation
+from pptx.util import Inches
+
+N_SLIDES = 900
+N_TEXTBOXES = 4
+SLIDE_IDX = 450
+REPEAT = 5
+
+
+def build_deck() -> bytes:
+    prs = Presentation()
+    for n in range(N_SLIDES):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Slide %d" % n
+        for m in range(N_TEXTBOXES):
+            textbox = slide.shapes.add_textbox(Inches(1), Inches(m + 1), Inches(4), Inches(0.5))
+            textbox.text_frame.text = "Text box %d of slide %d" % (m, n)
+        slide.notes_slide.notes_text_frame.text = "Speaker notes for slide %d" % n
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def slide_text(blob: bytes, slides: list[int] | None) -> list[str]:
+    """Text of the shapes on slide `SLIDE_IDX` of `blob`, opened loading only `slides`."""
+    prs = Presentation(io.BytesIO(blob), slides=slides)
+    return [shape.text_frame.text for shape in prs.slides[SLIDE_IDX].shapes]
+
+
+def best_time(func: Callable[[], object]) -> float:
+    """Return the seconds taken by the fastest of `REPEAT` calls of `func()`."""
+    best = 1e9
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    blob = build_deck()
+    assert slide_text(blob, None) == slide_text(blob, [SLIDE_IDX])
+
+    print("%d slides, %.1f MB package" % (N_SLIDES, len(blob) / 2**20))
+    full_time = best_time(lambda: slide_text(blob, None))
+    print("%-22s %8.0f ms" % ("all slides", full_time * 1000))
+    partial_time = best_time(lambda: slide_text(blob, [SLIDE_IDX]))
+    print("%-22s %8.0f ms" % ("slides=[%d]" % SLIDE_IDX, partial_time * 1000))
+    print("%.1fx faster" % (full_time / partial_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+"""Memory benchmark of the `__slots__`-based proxy classes.
+
+Builds a deck holding a 100 x 100 table having a run of text in each cell, walks every cell,
+paragraph, run, font and color in it and keeps each proxy object created on the way, as an
+analysis pass collecting them would. For each proxy class it reports the memory taken by an
+instance, against that taken by a stand-in having the same attributes in an instance `__dict__`,
+which is how the proxy classes stored them before they used `__slots__`.
+
+Run from the repository root:
+
+    $ python lab/benchmarks/proxy_memory.py
+"""
+
+from __future__ import annotations
+
+import copy
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable
+
+from pptx import Presentation
+from pptx.util import Inches
+
+ROWS = COLS = 100
+N_COPIES = 10000
+
+
+def build_table():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    graphic_frame = slide.shapes.add_table(ROWS, COLS, 0, 0, Inches(10), Inches(7.5))
+    table = graphic_frame.table
+    for cell in table.iter_cells():
+        cell.text = "text"
+    return table
+
+
+def traverse(table: Any) -> list[Any]:
+    """Return each proxy object created in a walk of every run in `table`."""
+    proxies: list[Any] = []
+    for cell in table.iter_cells():
+        proxies.append(cell)
+        text_frame = cell.text_frame
+        proxies.append(text_frame)
+        for paragraph in text_frame.paragraphs:
+            proxies.append(paragraph)
+            for run in paragraph.runs:
+                font = run.font
+                proxies.extend((run, font, font.color, font.fill))
+    return proxies
+
+
+def bytes_per_object(new_object: Callable[[], Any]) -> float:
+    """Return the memory allocated, in bytes, for each object `new_object()` returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [new_object() for _ in range(N_COPIES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / N_COPIES
+
+
+def dict_backed_copier(proxy: Any) -> Callable[[], Any]:
+    """Return a function that creates a copy of `proxy` keeping its attributes in a `__dict__`.
+
+    The copies are instances of a class of their own, so they share dict keys as instances of the
+    proxy class itself would.
+    """
+    cls = type("DictBacked%s" % type(proxy).__name__, (object,), {})
+    attrs = {
+        name: getattr(proxy, name)
+        for base in type(proxy).__mro__
+        for name in base.__dict__.get("__slots__", ())
+        if hasattr(proxy, name)
+    }
+
+    def new_copy() -> Any:
+        obj = cls()
+        for name, value in attrs.items():
+            setattr(obj, name, value)
+        return obj
+
+    return new_copy
+
+
+def main() -> None:
+    proxies = traverse(build_table())
+    counts = Counter(type(proxy) for proxy in proxies)
+    samples = {type(proxy): proxy for proxy in proxies}
+
+    print("%-12s %8s %12s %10s %8s" % ("class", "count", "__dict__", "__slots__", "saved"))
+    total_dict = total_slots = 0.0
+    for cls, count in counts.most_common():
+        proxy = samples[cls]
+        dict_size = bytes_per_object(dict_backed_copier(proxy))
+        slots_size = bytes_per_object(lambda: copy.copy(proxy))
+        total_dict += dict_size * count
+        total_slots += slots_size * count
+        print(
+            "%-12s %8d %10.0f B %8.0f B %7.0f%%"
+            % (cls.__name__, count, dict_size, slots_size, (1 - slots_size / dict_size) * 100)
+        )
+    print(
+        "\n%d proxies: %.2f MB with __dict__, %.2f MB with __slots__"
+        % (len(proxies), total_dict / 2**20, total_slots / 2**20)
+    )
+
+
+if __name__ == "__main__":
+    main()
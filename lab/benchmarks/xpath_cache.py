@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+"""Microbenchmark of the compiled-XPath cache behind `BaseOxmlElement.xpath()`.
+
+Compares each expression evaluated by `lxml` from its string on every call, which is what
+`BaseOxmlElement.xpath()` used to do, against the cached compiled form it uses now.
+
+Run from the repository root:
+
+    $ python lab/benchmarks/xpath_cache.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING, Any, Callable
+
+from lxml import etree
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import _nsmap, nsdecls
+
+if TYPE_CHECKING:
+    from pptx.oxml.xmlchemy import BaseOxmlElement
+
+N_SHAPES = 20
+N_POINTS = 50
+NUMBER = 2000
+
+
+def sptree_xml() -> str:
+    sps = "".join(
+        '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="Shape %d"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+        "<p:spPr/></p:sp>" % (n + 2, n + 1)
+        for n in range(N_SHAPES)
+    )
+    return (
+        '<p:spTree %s><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+        "</p:nvGrpSpPr><p:grpSpPr/>%s</p:spTree>" % (nsdecls("p"), sps)
+    )
+
+
+def numcache_xml() -> str:
+    pts = "".join('<c:pt idx="%d"><c:v>%d.5</c:v></c:pt>' % (n, n) for n in range(N_POINTS))
+    return '<c:numCache %s><c:ptCount val="%d"/>%s</c:numCache>' % (nsdecls("c"), N_POINTS, pts)
+
+
+def bench(label: str, uncached: Callable[[], Any], cached: Callable[[], Any]) -> None:
+    """Print the time per call of `uncached` and `cached`, which must give the same result."""
+    assert uncached() == cached()
+    t_uncached = min(timeit.repeat(uncached, number=NUMBER, repeat=5))
+    t_cached = min(timeit.repeat(cached, number=NUMBER, repeat=5))
+    print(
+        "%-28s %8.2f us %8.2f us %6.1fx"
+        % (
+            label,
+            t_uncached / NUMBER * 1e6,
+            t_cached / NUMBER * 1e6,
+            t_uncached / t_cached,
+        )
+    )
+
+
+def main() -> None:
+    spTree = parse_xml(sptree_xml())
+    numCache = parse_xml(numcache_xml())
+    cNvPr = spTree.xpath("./p:sp/p:nvSpPr/p:cNvPr")[0]
+
+    def uncached_xpath(element: BaseOxmlElement, xpath_str: str) -> Any:
+        return etree._Element.xpath(element, xpath_str, namespaces=_nsmap)
+
+    print("%-28s %11s %11s %7s" % ("expression", "uncompiled", "cached", "speedup"))
+    bench(
+        "//@id (max_shape_id)",
+        lambda: uncached_xpath(spTree, "//@id"),
+        lambda: spTree.xpath("//@id"),
+    )
+    bench(
+        "./p:sp (iter_shape_elms)",
+        lambda: uncached_xpath(spTree, "./p:sp"),
+        lambda: spTree.xpath("./p:sp"),
+    )
+    bench(
+        "ancestor::p:sp",
+        lambda: uncached_xpath(cNvPr, "ancestor::p:sp[1]"),
+        lambda: cNvPr.xpath("ancestor::p:sp[1]"),
+    )
+    bench(
+        ".//c:pt[@idx=N] (pt_v)",
+        lambda: uncached_xpath(numCache, ".//c:pt[@idx=%d]" % 40),
+        lambda: numCache.xpath(".//c:pt[@idx=$idx]", idx=40),
+    )
+    bench(
+        "./c:ptCount/@val",
+        lambda: uncached_xpath(numCache, "./c:ptCount/@val"),
+        lambda: numCache.xpath("./c:ptCount/@val"),
+    )
+
+
+if __name__ == "__main__":
+    main()
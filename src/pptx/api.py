@@ -8,7 +8,7 @@ provides some insulation so not so many classes in the other modules need to be
 from __future__ import annotations
 
 import os
-from typing import IO, TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Sequence
 
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.package import Package
@@ -18,17 +18,44 @@ if TYPE_CHECKING:
     from pptx.parts.presentation import PresentationPart
 
 
-def Presentation(pptx: str | IO[bytes] | None = None) -> presentation.Presentation:
+def Presentation(
+    pptx: str | IO[bytes] | None = None,
+    slides: Sequence[int] | None = None,
+    reuse_unchanged_xml: bool = False,
+) -> presentation.Presentation:
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *slides* is provided, only the slides at those (zero-based) positions
+    in the slide sequence are loaded, along with the layouts, masters, images
+    and other parts they depend on. Slide positions and the rest of the
+    presentation are unaffected; any other slide is loaded from *pptx* when it
+    is first accessed, so *pptx* must remain available while the presentation
+    is in use. Slides never accessed are saved unchanged.
+
+    When *pptx* is a path, a media or other binary part of 16 MiB or more, like
+    a video, is left in that file until it is needed rather than read into
+    memory. The file must then not be moved, deleted or replaced while the
+    presentation is in use, although saving over it is fine. Smaller parts are
+    read when the presentation is opened, so without such large parts the file
+    can be changed once this function returns.
+
+    The XML of a part that is never accessed is always saved as it was loaded.
+    The XML of any other part is serialized again on each save, unless
+    *reuse_unchanged_xml* is |True|. In that case, XML not changed since it was
+    loaded, or since it was last saved, is saved from those same bytes. This
+    makes saving the same presentation repeatedly faster, but only changes made
+    through python-pptx are detected. Do not use it when the XML is also
+    changed with lxml directly, like with ``lxml.etree.SubElement()`` on a
+    shape's ``.element``; such a change would be lost on save.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    presentation_part = Package.open(pptx, slides, reuse_unchanged_xml).main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
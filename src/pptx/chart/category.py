@@ -101,7 +101,8 @@ class Categories(Sequence):
         the same length as the number of levels (excepting certain edge
         cases which I believe always indicate a chart construction error).
         """
-        levels = self.levels
+        # ---each level is read once here rather than by index for each leaf---
+        levels = [tuple(level) for level in self.levels]
         if not levels:
             return
         leaf_level, remaining_levels = levels[0], levels[1:]
@@ -196,5 +197,9 @@ class CategoryLevel(Sequence):
     def __getitem__(self, offset):
         return Category(self._lvl.pt_lst[offset])
 
+    def __iter__(self):
+        for pt in self._lvl.pt_lst:
+            yield Category(pt)
+
     def __len__(self):
         return len(self._lvl.pt_lst)
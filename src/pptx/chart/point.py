@@ -7,7 +7,7 @@ from collections.abc import Sequence
 from pptx.chart.datalabel import DataLabel
 from pptx.chart.marker import Marker
 from pptx.dml.chtfmt import ChartFormat
-from pptx.util import lazyproperty
+from pptx.util import lazyslotproperty
 
 
 class _BasePoints(Sequence):
@@ -58,20 +58,30 @@ class Point(object):
     font of its data label.
     """
 
+    __slots__ = (
+        "_element",
+        "_ser",
+        "_idx",
+        "_lazy_data_label",
+        "_lazy_format",
+        "_lazy_marker",
+        "__weakref__",
+    )
+
     def __init__(self, ser, idx):
         super(Point, self).__init__()
         self._element = ser
         self._ser = ser
         self._idx = idx
 
-    @lazyproperty
+    @lazyslotproperty
     def data_label(self):
         """
         The |DataLabel| object representing the label on this data point.
         """
         return DataLabel(self._ser, self._idx)
 
-    @lazyproperty
+    @lazyslotproperty
     def format(self):
         """
         The |ChartFormat| object providing access to the shape formatting
@@ -80,7 +90,7 @@ class Point(object):
         dPt = self._ser.get_or_add_dPt_for_point(self._idx)
         return ChartFormat(dPt)
 
-    @lazyproperty
+    @lazyslotproperty
     def marker(self):
         """
         The |Marker| instance for this point, providing access to the visual
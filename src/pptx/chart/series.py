@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import array
+import importlib
+import math
 from collections.abc import Sequence
+from typing import Any, Iterable
+
+from typing_extensions import Literal
 
 from pptx.chart.datalabel import DataLabels
 from pptx.chart.marker import Marker
@@ -67,20 +73,25 @@ class _BaseCategorySeries(_BaseSeries):
         return CategoryPoints(self._ser)
 
     @property
-    def values(self):
+    def values(self) -> tuple[float | None, ...]:
         """
         Read-only. A sequence containing the float values for this series, in
         the order they appear on the chart.
         """
+        val = self._element.val
+        if val is None:
+            return ()
+        return tuple(val.pt_values)
 
-        def iter_values():
-            val = self._element.val
-            if val is None:
-                return
-            for idx in range(val.ptCount_val):
-                yield val.pt_v(idx)
+    def values_as(self, kind: Literal["array", "numpy"]) -> array.array[float] | Any:
+        """
+        Return the values of this series as a float array of *kind*.
 
-        return tuple(iter_values())
+        *kind* is either `"array"`, for a standard-library `array.array` of
+        typecode `"d"`, or `"numpy"`, for a NumPy `ndarray` of `float64`, which
+        requires NumPy be installed. A missing value appears as NaN.
+        """
+        return _float_array(self.values, kind)
 
 
 class _MarkerMixin(object):
@@ -181,8 +192,8 @@ class XySeries(_BaseSeries, _MarkerMixin):
         if yVal is None:
             return
 
-        for idx in range(yVal.ptCount_val):
-            yield yVal.pt_v(idx)
+        for value in yVal.pt_values:
+            yield value
 
     @lazyproperty
     def points(self):
@@ -193,13 +204,41 @@ class XySeries(_BaseSeries, _MarkerMixin):
         return XyPoints(self._ser)
 
     @property
-    def values(self):
+    def values(self) -> tuple[float | None, ...]:
         """
         Read-only. A sequence containing the float values for this series, in
         the order they appear on the chart.
         """
         return tuple(self.iter_values())
 
+    def values_as(self, kind: Literal["array", "numpy"]) -> array.array[float] | Any:
+        """
+        Return the Y values of this series as a float array of *kind*.
+
+        *kind* is `"array"` or `"numpy"`, as for `values_as()`.
+        """
+        return _float_array(self.values, kind)
+
+    @property
+    def x_values(self) -> tuple[float | None, ...]:
+        """
+        Read-only. A sequence containing the float X value of each data point in
+        this series, in the order they appear on the chart. A value of `None`
+        represents a missing X value.
+        """
+        xVal = self._element.xVal
+        if xVal is None:
+            return ()
+        return tuple(xVal.pt_values)
+
+    def x_values_as(self, kind: Literal["array", "numpy"]) -> array.array[float] | Any:
+        """
+        Return the X values of this series as a float array of *kind*.
+
+        *kind* is `"array"` or `"numpy"`, as for `values_as()`.
+        """
+        return _float_array(self.x_values, kind)
+
 
 class BubbleSeries(XySeries):
     """
@@ -215,6 +254,26 @@ class BubbleSeries(XySeries):
         """
         return BubblePoints(self._ser)
 
+    @property
+    def bubble_sizes(self) -> tuple[float | None, ...]:
+        """
+        Read-only. A sequence containing the float bubble size of each data
+        point in this series, in the order they appear on the chart. A value of
+        `None` represents a missing bubble size.
+        """
+        bubbleSize = self._element.bubbleSize
+        if bubbleSize is None:
+            return ()
+        return tuple(bubbleSize.pt_values)
+
+    def bubble_sizes_as(self, kind: Literal["array", "numpy"]) -> array.array[float] | Any:
+        """
+        Return the bubble sizes of this series as a float array of *kind*.
+
+        *kind* is `"array"` or `"numpy"`, as for `values_as()`.
+        """
+        return _float_array(self.bubble_sizes, kind)
+
 
 class SeriesCollection(Sequence):
     """
@@ -256,3 +315,21 @@ def _SeriesFactory(ser):
         raise NotImplementedError("series class for %s not yet implemented" % xChart_tag)
 
     return SeriesCls(ser)
+
+
+def _float_array(
+    values: Iterable[float | None], kind: Literal["array", "numpy"]
+) -> array.array[float] | Any:
+    """Return *values* as a float array of *kind*, with NaN in place of each `None`.
+
+    *kind* is `"array"` for an `array.array` of typecode `"d"` or `"numpy"` for a NumPy
+    `ndarray`, typed as `Any` here. NumPy is not a dependency of this package and is only
+    imported when asked for.
+    """
+    floats = [math.nan if value is None else value for value in values]
+    if kind == "array":
+        return array.array("d", floats)
+    if kind == "numpy":
+        numpy = importlib.import_module("numpy")
+        return numpy.array(floats, dtype=numpy.float64)
+    raise ValueError("kind must be 'array' or 'numpy', got %r" % (kind,))
@@ -19,6 +19,8 @@ class ColorFormat(object):
     luminance adjustments.
     """
 
+    __slots__ = ("_xFill", "_color", "__weakref__")
+
     def __init__(self, eg_colorChoice_parent, color):
         super(ColorFormat, self).__init__()
         self._xFill = eg_colorChoice_parent
@@ -113,6 +115,8 @@ class _Color(object):
     class for all color type classes such as SRgbColor.
     """
 
+    __slots__ = ("_xClr", "__weakref__")
+
     def __new__(cls, xClr):
         color_cls = {
             type(None): _NoneColor,
@@ -187,12 +191,16 @@ class _Color(object):
 
 
 class _HslColor(_Color):
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.HSL
 
 
 class _NoneColor(_Color):
+    __slots__ = ()
+
     @property
     def color_type(self):
         return None
@@ -208,12 +216,16 @@ class _NoneColor(_Color):
 
 
 class _PrstColor(_Color):
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.PRESET
 
 
 class _SchemeColor(_Color):
+    __slots__ = ("_schemeClr",)
+
     def __init__(self, schemeClr):
         super(_SchemeColor, self).__init__(schemeClr)
         self._schemeClr = schemeClr
@@ -239,12 +251,16 @@ class _SchemeColor(_Color):
 
 
 class _ScRgbColor(_Color):
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.SCRGB
 
 
 class _SRgbColor(_Color):
+    __slots__ = ("_srgbClr",)
+
     def __init__(self, srgbClr):
         super(_SRgbColor, self).__init__(srgbClr)
         self._srgbClr = srgbClr
@@ -267,6 +283,8 @@ class _SRgbColor(_Color):
 
 
 class _SysColor(_Color):
+    __slots__ = ()
+
     @property
     def color_type(self):
         return MSO_COLOR_TYPE.SYSTEM
@@ -17,7 +17,7 @@ from pptx.oxml.dml.fill import (
 )
 from pptx.oxml.xmlchemy import BaseOxmlElement
 from pptx.shared import ElementProxy
-from pptx.util import lazyproperty
+from pptx.util import lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.enum.dml import MSO_FILL_TYPE
@@ -30,6 +30,8 @@ class FillFormat(object):
     Also provides methods to change the fill type.
     """
 
+    __slots__ = ("_xPr", "_fill", "__weakref__")
+
     def __init__(self, eg_fill_properties_parent: BaseOxmlElement, fill_obj: _Fill):
         super(FillFormat, self).__init__()
         self._xPr = eg_fill_properties_parent
@@ -168,6 +170,8 @@ class _Fill(object):
     fill classes
     """
 
+    __slots__ = ("__weakref__",)
+
     def __new__(cls, xFill):
         if xFill is None:
             fill_cls = _NoneFill
@@ -213,6 +217,8 @@ class _Fill(object):
 
 
 class _BlipFill(_Fill):
+    __slots__ = ()
+
     @property
     def type(self):
         return MSO_FILL.PICTURE
@@ -221,6 +227,8 @@ class _BlipFill(_Fill):
 class _GradFill(_Fill):
     """Proxies an `a:gradFill` element."""
 
+    __slots__ = ("_element", "_gradFill", "_lazy_gradient_stops")
+
     def __init__(self, gradFill):
         self._element = self._gradFill = gradFill
 
@@ -261,7 +269,7 @@ class _GradFill(_Fill):
             raise ValueError("not a linear gradient")
         lin.ang = 360.0 - value
 
-    @lazyproperty
+    @lazyslotproperty
     def gradient_stops(self):
         """|_GradientStops| object providing access to gradient colors.
 
@@ -276,18 +284,24 @@ class _GradFill(_Fill):
 
 
 class _GrpFill(_Fill):
+    __slots__ = ()
+
     @property
     def type(self):
         return MSO_FILL.GROUP
 
 
 class _NoFill(_Fill):
+    __slots__ = ()
+
     @property
     def type(self):
         return MSO_FILL.BACKGROUND
 
 
 class _NoneFill(_Fill):
+    __slots__ = ()
+
     @property
     def type(self):
         return None
@@ -296,17 +310,19 @@ class _NoneFill(_Fill):
 class _PattFill(_Fill):
     """Provides access to patterned fill properties."""
 
+    __slots__ = ("_element", "_pattFill", "_lazy_back_color", "_lazy_fore_color")
+
     def __init__(self, pattFill):
         super(_PattFill, self).__init__()
         self._element = self._pattFill = pattFill
 
-    @lazyproperty
+    @lazyslotproperty
     def back_color(self):
         """Return |ColorFormat| object that controls background color."""
         bgClr = self._pattFill.get_or_add_bgClr()
         return ColorFormat.from_colorchoice_parent(bgClr)
 
-    @lazyproperty
+    @lazyslotproperty
     def fore_color(self):
         """Return |ColorFormat| object that controls foreground color."""
         fgClr = self._pattFill.get_or_add_fgClr()
@@ -334,11 +350,13 @@ class _PattFill(_Fill):
 class _SolidFill(_Fill):
     """Provides access to fill properties such as color for solid fills."""
 
+    __slots__ = ("_solidFill", "_lazy_fore_color")
+
     def __init__(self, solidFill):
         super(_SolidFill, self).__init__()
         self._solidFill = solidFill
 
-    @lazyproperty
+    @lazyslotproperty
     def fore_color(self):
         """Return |ColorFormat| object controlling fill color."""
         return ColorFormat.from_colorchoice_parent(self._solidFill)
@@ -373,11 +391,13 @@ class _GradientStop(ElementProxy):
     A gradient stop defines a color and a position.
     """
 
+    __slots__ = ("_gs", "_lazy_color")
+
     def __init__(self, gs):
         super(_GradientStop, self).__init__(gs)
         self._gs = gs
 
-    @lazyproperty
+    @lazyslotproperty
     def color(self):
         """Return |ColorFormat| object controlling stop color."""
         return ColorFormat.from_colorchoice_parent(self._gs)
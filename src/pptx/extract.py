@@ -0,0 +1,133 @@
+"""Streaming text extraction from a presentation package.
+
+Text is read straight from the slide and notes-slide XML in the package, without loading the
+package or creating the shape objects `Presentation()` would, for indexing and bulk crawling of
+large numbers of decks. Only the part being read is held in memory, so memory use does not grow
+with the number of slides in the deck.
+"""
+
+from __future__ import annotations
+
+from typing import IO, TYPE_CHECKING, Iterator, NamedTuple
+
+from lxml import etree
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import PackageReader, internal_rels, raw_xml_parser
+from pptx.oxml.ns import qn
+
+if TYPE_CHECKING:
+    from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
+
+_BR = qn("a:br")
+_CNVPR = qn("p:cNvPr")
+_P = qn("a:p")
+_R_ID = qn("r:id")
+_SLDID = qn("p:sldId")
+_T = qn("a:t")
+_TXBODY_TAGS = (qn("p:txBody"), qn("a:txBody"))
+
+
+class TextRecord(NamedTuple):
+    """The text of one text frame in a slide or its notes page.
+
+    `slide_idx` is the zero-based position of the slide in the slide sequence and `shape_id` the
+    id of the shape the text frame belongs to, as in `BaseShape.shape_id`. `text` is the text in
+    the text frame, as in `TextFrame.text`. `is_notes` is True when the text frame is on the notes
+    page of the slide rather than on the slide itself.
+    """
+
+    slide_idx: int
+    shape_id: int
+    text: str
+    is_notes: bool
+
+
+def iter_text(pkg_file: str | IO[bytes], notes: bool = True) -> Iterator[TextRecord]:
+    """Generate a |TextRecord| for each text frame having text in the presentation `pkg_file`.
+
+    `pkg_file` is a path to a .pptx file or an expanded package directory, or a file-like object
+    containing a .pptx file, like the argument to `Presentation()`. Slides are visited in slide
+    sequence and the text frames of each in document order, followed by those on its notes page
+    when `notes` is True.
+
+    The text frame of each autoshape, placeholder and table cell is included, but text frames
+    containing no text are skipped. Each cell of a table produces its own record, having the
+    shape-id of the graphic frame containing the table. Text in charts and SmartArt diagrams is
+    not included.
+
+    The package file is closed when the generator is exhausted or closed.
+    """
+    package_reader = PackageReader(pkg_file)
+    try:
+        prs_partname = _related_partname(package_reader, PACKAGE_URI, RT.OFFICE_DOCUMENT)
+        if prs_partname is None:
+            return
+        for slide_idx, slide_partname in enumerate(_slide_partnames(package_reader, prs_partname)):
+            yield from _iter_part_text(package_reader, slide_partname, slide_idx, False)
+            if not notes:
+                continue
+            notes_partname = _related_partname(package_reader, slide_partname, RT.NOTES_SLIDE)
+            if notes_partname is not None:
+                yield from _iter_part_text(package_reader, notes_partname, slide_idx, True)
+    finally:
+        package_reader.close()
+
+
+def _iter_part_text(
+    package_reader: PackageReader, partname: PackURI, slide_idx: int, is_notes: bool
+) -> Iterator[TextRecord]:
+    """Generate a |TextRecord| for each text frame having text in the slide part `partname`."""
+    part_elm = etree.fromstring(package_reader[partname], raw_xml_parser)
+    shape_id = 0
+    for elm in part_elm.iter(_CNVPR, *_TXBODY_TAGS):
+        if elm.tag == _CNVPR:
+            # -- the `p:cNvPr` of a shape comes before its text body, if it has one --
+            shape_id = int(elm.get("id", "0"))
+            continue
+        text = _text_of(elm)
+        if text:
+            yield TextRecord(slide_idx, shape_id, text, is_notes)
+
+
+def _related_partname(
+    package_reader: PackageReader, partname: PackURI, reltype: str
+) -> PackURI | None:
+    """Partname of the first part `partname` is related to by `reltype`, None if there is none."""
+    for rel_reltype, target_partname in internal_rels(package_reader, partname).values():
+        if rel_reltype == reltype:
+            return target_partname
+    return None
+
+
+def _slide_partnames(package_reader: PackageReader, prs_partname: PackURI) -> list[PackURI]:
+    """Partname of each slide in the presentation, in slide-sequence order."""
+    rels = internal_rels(package_reader, prs_partname)
+    rIds = [
+        sldId.get(_R_ID, "")
+        for sldId in etree.fromstring(package_reader[prs_partname], raw_xml_parser).iter(_SLDID)
+    ]
+    return [
+        target_partname
+        for reltype, target_partname in (rels[rId] for rId in rIds if rId in rels)
+        if reltype == RT.SLIDE
+    ]
+
+
+def _text_of(txBody: _Element) -> str:
+    """The text of `txBody`, the same as `TextFrame.text` gives.
+
+    Each `a:t` element is in the `a:r` or `a:fld` element of a paragraph, so its text is added to
+    the paragraph most recently started.
+    """
+    paragraphs: list[list[str]] = []
+    for elm in txBody.iter(_P, _T, _BR):
+        tag = elm.tag
+        if tag == _P:
+            paragraphs.append([])
+        elif tag == _T:
+            paragraphs[-1].append(elm.text or "")
+        else:
+            paragraphs[-1].append("\v")
+    return "\n".join("".join(paragraph) for paragraph in paragraphs)
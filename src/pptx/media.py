@@ -8,20 +8,23 @@ import os
 from typing import IO
 
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.serialized import FILE_BACKED_MIN_SIZE, FileBackedBlob, PathBlob
 from pptx.util import lazyproperty
 
 
 class Video(object):
     """Immutable value object representing a video such as MP4."""
 
-    def __init__(self, blob: bytes, mime_type: str | None, filename: str | None):
+    def __init__(self, blob: bytes | FileBackedBlob, mime_type: str | None, filename: str | None):
         super(Video, self).__init__()
         self._blob = blob
         self._mime_type = mime_type
         self._filename = filename
 
     @classmethod
-    def from_blob(cls, blob: bytes, mime_type: str | None, filename: str | None = None):
+    def from_blob(
+        cls, blob: bytes | FileBackedBlob, mime_type: str | None, filename: str | None = None
+    ):
         """Return a new |Video| object loaded from image binary in *blob*."""
         return cls(blob, mime_type, filename)
 
@@ -30,12 +33,19 @@ class Video(object):
         """Return a new |Video| object containing video in *movie_file*.
 
         *movie_file* can be either a path (string) or a file-like
-        (e.g. StringIO) object.
+        (e.g. StringIO) object. A movie file at a path that is larger than
+        `pptx.opc.serialized.FILE_BACKED_MIN_SIZE` is not read into memory;
+        it is streamed from that path when the presentation is saved, so it
+        must remain in place until then.
         """
+        blob: bytes | FileBackedBlob
         if isinstance(movie_file, str):
             # treat movie_file as a path
-            with open(movie_file, "rb") as f:
-                blob = f.read()
+            if os.path.getsize(movie_file) >= FILE_BACKED_MIN_SIZE:
+                blob = PathBlob(movie_file)
+            else:
+                with open(movie_file, "rb") as f:
+                    blob = f.read()
             filename = os.path.basename(movie_file)
         else:
             # assume movie_file is a file-like object
@@ -45,8 +55,13 @@ class Video(object):
         return cls.from_blob(blob, mime_type, filename)
 
     @property
-    def blob(self):
-        """The bytestream of the media "file"."""
+    def blob(self) -> bytes:
+        """The bytestream of the media "file".
+
+        A file-backed video is read from its file each time.
+        """
+        if isinstance(self._blob, FileBackedBlob):
+            return self._blob.read()
         return self._blob
 
     @property
@@ -76,6 +91,14 @@ class Video(object):
             CT.X_MS_VIDEO: "avi",
         }.get(self._mime_type, "vid")
 
+    @property
+    def file_blob(self) -> FileBackedBlob | None:
+        """|FileBackedBlob| for a video left in its file rather than read into memory.
+
+        |None| when the bytes of this video are held in memory.
+        """
+        return self._blob if isinstance(self._blob, FileBackedBlob) else None
+
     @property
     def filename(self) -> str:
         """Return a filename.ext string appropriate to this video.
@@ -96,6 +119,8 @@ class Video(object):
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
         """
+        if isinstance(self._blob, FileBackedBlob):
+            return self._blob.sha1
         return hashlib.sha1(self._blob).hexdigest()
 
 
@@ -0,0 +1,158 @@
+"""Summary of an OPC package read without loading it.
+
+Only the zip central-directory, `[Content_Types].xml`, the package relationships and the main
+document part are read, so a package can be summarized at a small fraction of the cost of opening
+it, for triage of large numbers of files.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Callable, NamedTuple
+
+from lxml import etree
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.opc.serialized import PackageReader, internal_rels, raw_xml_parser
+from pptx.oxml.ns import qn
+
+_DEFAULT = qn("ct:Default")
+_OVERRIDE = qn("ct:Override")
+_SLDID = qn("p:sldId")
+
+# -- directories PowerPoint stores media and embedded-object parts in --
+_EMBEDDINGS_DIR = "/ppt/embeddings"
+_MEDIA_DIR = "/ppt/media"
+
+
+class PartInfo(NamedTuple):
+    """Partname, content-type and sizes of a part, as recorded in the package.
+
+    `content_type` is None when `[Content_Types].xml` assigns the part none. `compressed_size` is
+    the number of bytes the part takes in the package and `size` the number of bytes of its
+    content once decompressed.
+    """
+
+    partname: PackURI
+    content_type: str | None
+    compressed_size: int
+    size: int
+
+
+class PackageSummary(NamedTuple):
+    """Summary of a presentation package, as `inspect_package()` reads it.
+
+    `parts` holds a |PartInfo| for each part in the package, in the order the package stores
+    them. Relationship items and `[Content_Types].xml` are not parts and are not included.
+    `slide_count` is the number of slides in the slide sequence of the presentation.
+    """
+
+    parts: tuple[PartInfo, ...]
+    slide_count: int
+
+    @property
+    def compressed_size(self) -> int:
+        """Number of bytes the parts of the package take in the package."""
+        return sum(part.compressed_size for part in self.parts)
+
+    @property
+    def embedded_parts(self) -> tuple[PartInfo, ...]:
+        """|PartInfo| of each embedded object, like an OLE object or an Excel workbook."""
+        return tuple(part for part in self.parts if part.partname.baseURI == _EMBEDDINGS_DIR)
+
+    @property
+    def embedded_size(self) -> int:
+        """Number of bytes of content in the embedded-object parts, once decompressed."""
+        return sum(part.size for part in self.embedded_parts)
+
+    @property
+    def media_parts(self) -> tuple[PartInfo, ...]:
+        """|PartInfo| of each image, audio and video part."""
+        return tuple(part for part in self.parts if part.partname.baseURI == _MEDIA_DIR)
+
+    @property
+    def media_size(self) -> int:
+        """Number of bytes of content in the image, audio and video parts, once decompressed."""
+        return sum(part.size for part in self.media_parts)
+
+    @property
+    def size(self) -> int:
+        """Number of bytes of content in the parts of the package, once decompressed."""
+        return sum(part.size for part in self.parts)
+
+
+def inspect_package(pkg_file: str | IO[bytes]) -> PackageSummary:
+    """Return a |PackageSummary| of the presentation package `pkg_file`.
+
+    `pkg_file` is a path to a .pptx file or an expanded package directory, or a file-like object
+    containing a .pptx file, like the argument to `Presentation()`. Only the zip central-directory,
+    `[Content_Types].xml`, the package relationships and `presentation.xml` are read; no other
+    part is read or decompressed.
+
+    Raises |PackageNotFoundError| when `pkg_file` is a path to neither a zip file nor a directory.
+    """
+    package_reader = PackageReader(pkg_file)
+    try:
+        content_type_for = _content_type_lookup(package_reader)
+        parts = tuple(
+            PartInfo(pack_uri, content_type_for(pack_uri), compressed_size, size)
+            for pack_uri, compressed_size, size in package_reader.iter_member_sizes()
+            if _is_part(pack_uri)
+        )
+        return PackageSummary(parts, _slide_count(package_reader))
+    finally:
+        package_reader.close()
+
+
+def _content_type_lookup(package_reader: PackageReader) -> Callable[[PackURI], str | None]:
+    """Return a function giving the content-type `[Content_Types].xml` assigns a partname.
+
+    The function returns None for a partname having no content-type.
+    """
+    overrides: dict[str, str] = {}
+    defaults: dict[str, str] = {}
+    if CONTENT_TYPES_URI in package_reader:
+        types = etree.fromstring(package_reader[CONTENT_TYPES_URI], raw_xml_parser)
+        # -- partnames and extensions are matched case-insensitively --
+        for override in types.iterchildren(_OVERRIDE):
+            overrides[override.get("PartName", "").lower()] = override.get("ContentType", "")
+        for default in types.iterchildren(_DEFAULT):
+            defaults[default.get("Extension", "").lower()] = default.get("ContentType", "")
+
+    def content_type_for(partname: PackURI) -> str | None:
+        content_type = overrides.get(partname.lower())
+        if content_type is None:
+            content_type = defaults.get(partname.ext.lower())
+        return content_type
+
+    return content_type_for
+
+
+def _is_part(pack_uri: PackURI) -> bool:
+    """True when the package member `pack_uri` is a part.
+
+    `[Content_Types].xml` and the relationship items are package members that are not parts.
+    """
+    if pack_uri == CONTENT_TYPES_URI:
+        return False
+    # -- `.ext` can't be used here, the package rels item "/_rels/.rels" has no extension --
+    return not (pack_uri.endswith(".rels") and pack_uri.rpartition("/")[0].endswith("/_rels"))
+
+
+def _slide_count(package_reader: PackageReader) -> int:
+    """Number of slides in the slide sequence of the presentation in `package_reader`.
+
+    Zero when the package has no main document part.
+    """
+    prs_partname = next(
+        (
+            target_partname
+            for reltype, target_partname in internal_rels(package_reader, PACKAGE_URI).values()
+            if reltype == RT.OFFICE_DOCUMENT
+        ),
+        None,
+    )
+    if prs_partname is None or prs_partname not in package_reader:
+        return 0
+    prs_elm = etree.fromstring(package_reader[prs_partname], raw_xml_parser)
+    return sum(1 for _ in prs_elm.iter(_SLDID))
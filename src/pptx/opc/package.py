@@ -7,21 +7,43 @@ presentations to and from a .pptx file.
 from __future__ import annotations
 
 import collections
-from typing import IO, TYPE_CHECKING, DefaultDict, Iterator, Mapping, Set, cast
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    Sequence,
+    Set,
+    cast,
+)
 
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.oxml import CT_Relationships, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
-from pptx.opc.serialized import PackageReader, PackageWriter
+from pptx.opc.serialized import (
+    CompressionPolicy,
+    FileBackedBlob,
+    PackageReader,
+    PackageWriter,
+)
 from pptx.opc.shared import CaseInsensitiveDict
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import attribute_value_counts, tree_revision
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
     from pptx.opc.oxml import CT_Relationship, CT_Types
+    from pptx.oxml.presentation import CT_Presentation
     from pptx.oxml.xmlchemy import BaseOxmlElement
     from pptx.package import Package
     from pptx.parts.presentation import PresentationPart
@@ -46,9 +68,12 @@ class _RelatableMixin:
         """
         if isinstance(target, str):
             assert is_external
-            return self._rels.get_or_add_ext_rel(reltype, target)
+            rId = self._rels.get_or_add_ext_rel(reltype, target)
+        else:
+            rId = self._rels.get_or_add(reltype, target)
 
-        return self._rels.get_or_add(reltype, target)
+        self._notify_rel_added(self._rels[rId])
+        return rId
 
     def related_part(self, rId: str) -> Part:
         """Return related |Part| subtype identified by `rId`."""
@@ -58,6 +83,12 @@ class _RelatableMixin:
         """Return URL contained in target ref of relationship identified by `rId`."""
         return self._rels[rId].target_ref
 
+    def _notify_rel_added(self, rel: _Relationship) -> None:
+        """Tell the package relationship `rel` was added, so it can index it and its target."""
+        raise NotImplementedError(  # pragma: no cover
+            "`%s` must implement `._notify_rel_added()`" % type(self).__name__
+        )
+
     @lazyproperty
     def _rels(self) -> _Relationships:
         """|_Relationships| object containing relationships from this part to others."""
@@ -73,54 +104,59 @@ class OpcPackage(_RelatableMixin):
     file or file-like object containing a package (.pptx file).
     """
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    def __init__(self, pkg_file: str | IO[bytes], reuse_unchanged_xml: bool = False):
         self._pkg_file = pkg_file
+        self._reuse_unchanged_xml = reuse_unchanged_xml
 
     @classmethod
-    def open(cls, pkg_file: str | IO[bytes]) -> Self:
-        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        return cls(pkg_file)._load()
+    def open(
+        cls,
+        pkg_file: str | IO[bytes],
+        slides: Sequence[int] | None = None,
+        reuse_unchanged_xml: bool = False,
+    ) -> Self:
+        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`.
+
+        When `slides` is provided, only the slides at those zero-based positions in the slide
+        sequence are loaded up front, along with the parts they depend on. Each other part is
+        loaded from `pkg_file` on first use, so `pkg_file` must remain available, and is written
+        unchanged on save when it is not used.
+
+        `reuse_unchanged_xml` determines `.reuses_unchanged_xml`.
+        """
+        return cls(pkg_file, reuse_unchanged_xml)._load(slides)
 
     def drop_rel(self, rId: str) -> None:
         """Remove relationship identified by `rId`."""
-        self._rels.pop(rId)
+        self.notify_rel_dropped(self._rels.pop(rId))
 
     def iter_parts(self) -> Iterator[Part]:
         """Generate exactly one reference to each part in the package."""
-        visited: Set[Part] = set()
-        for rel in self.iter_rels():
-            if rel.is_external:
-                continue
-            part = rel.target_part
-            if part in visited:
-                continue
-            yield part
-            visited.add(part)
+        return self._rel_graph.iter_parts()
 
     def iter_rels(self) -> Iterator[_Relationship]:
         """Generate exactly one reference to each relationship in package.
 
-        Performs a depth-first traversal of the rels graph.
+        Relationships are generated in depth-first order of the rels graph as it was when first
+        traversed, followed by those added since, in the order they were added.
         """
-        visited: Set[Part] = set()
+        return self._rel_graph.iter_rels()
 
-        def walk_rels(rels: _Relationships) -> Iterator[_Relationship]:
-            for rel in rels.values():
-                yield rel
-                # --- external items can have no relationships ---
-                if rel.is_external:
-                    continue
-                # -- all relationships other than those for the package belong to a part. Once
-                # -- that part has been processed, processing it again would lead to the same
-                # -- relationships appearing more than once.
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.add(part)
-                # --- recurse into relationships of each unvisited target-part ---
-                yield from walk_rels(part.rels)
+    def iter_save(
+        self, workers: int = 1, compression: str | CompressionPolicy = "default"
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this package, serialized as by :meth:`save`, in chunks.
 
-        yield from walk_rels(self._rels)
+        Suitable for writing the package to a non-seekable destination, like an HTTP response,
+        without first assembling the whole package in memory.
+        """
+        return PackageWriter.iter_write(
+            self._rels,
+            tuple(self.iter_parts()),
+            source=self._package_reader,
+            workers=workers,
+            compression=compression,
+        )
 
     @property
     def main_document_part(self) -> PresentationPart:
@@ -137,30 +173,130 @@ class OpcPackage(_RelatableMixin):
         to be used to insert the integer portion of the partname. Example:
         '/ppt/slides/slide%d.xml'
         """
-        # --- expected next partname is tmpl % n where n is one greater than the number
-        # --- of existing partnames that match tmpl. Speed up finding the next one
-        # --- (maybe) by searching from the end downward rather than from 1 upward.
-        prefix = tmpl[: (tmpl % 42).find("42")]
-        partnames = {p.partname for p in self.iter_parts() if p.partname.startswith(prefix)}
-        for n in range(len(partnames) + 1, 0, -1):
-            candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
-        raise Exception("ProgrammingError: ran out of candidate_partnames")  # pragma: no cover
+        return PackURI(self._partname_index.next_partname(tmpl))
+
+    def notify_part_renamed(self, part: Part, old_partname: PackURI) -> None:
+        """Update the partname index after `part` is renamed from `old_partname`.
+
+        Called by a part when its partname changes.
+        """
+        partname_index = self.__dict__.get("_partname_index")
+        if partname_index is not None:
+            partname_index.rename_part(part, old_partname)
+
+    def notify_rel_added(self, source: Part | None, rel: _Relationship) -> None:
+        """Update the rels graph and partname index after relationship `rel` is added.
+
+        `source` is the part `rel` is from, or |None| for a package relationship. Called by a part
+        when it is related to another part or an external resource.
+        """
+        # -- the partname index is built from the rels graph, so exists only once that does --
+        rel_graph: _RelationshipGraph | None = self.__dict__.get("_rel_graph")
+        if rel_graph is None:
+            return
+        added_parts = rel_graph.add_rel(source, rel)
+        partname_index: _PartnameIndex | None = self.__dict__.get("_partname_index")
+        if partname_index is not None:
+            for part in added_parts:
+                partname_index.add_part(part)
+
+    def notify_rel_dropped(self, rel: _Relationship) -> None:
+        """Update the rels graph and partname index after relationship `rel` is removed.
+
+        A part that is no longer reachable from the package without `rel` is removed from both.
+        Called by a part when it drops a relationship.
+        """
+        rel_graph: _RelationshipGraph | None = self.__dict__.get("_rel_graph")
+        if rel_graph is None:
+            return
+        removed_parts = rel_graph.drop_rel(rel)
+        if removed_parts:
+            self._notify_parts_removed(removed_parts)
+
+    @property
+    def reuses_unchanged_xml(self) -> bool:
+        """True when an XML part reuses its last serialization while its XML is unchanged.
+
+        Only a change made through the methods of an oxml element is detected, so a change made
+        with lxml functions like `etree.SubElement()` would be lost. So by default, the element of
+        an XML part is serialized again each time its blob is required, and only an XML part never
+        parsed is written back as it was loaded.
+        """
+        return self._reuse_unchanged_xml
 
-    def save(self, pkg_file: str | IO[bytes]) -> None:
+    def save(
+        self,
+        pkg_file: str | IO[bytes],
+        workers: int = 1,
+        compression: str | CompressionPolicy = "default",
+    ) -> None:
         """Save this package to `pkg_file`.
 
-        `file` can be either a path to a file (a string) or a file-like object.
+        `file` can be either a path to a file (a string) or a file-like object. `workers` is the
+        number of threads used to compress parts. `compression` is a |CompressionPolicy| or the
+        name of one of its profiles.
+        """
+        PackageWriter.write(
+            pkg_file,
+            self._rels,
+            tuple(self.iter_parts()),
+            source=self._package_reader,
+            workers=workers,
+            compression=compression,
+        )
+
+    def _notify_parts_removed(self, parts: Sequence[Part]) -> None:
+        """Update the partname index after `parts` are removed from the package.
+
+        Called when dropping a relationship leaves `parts` no longer reachable from the package.
         """
-        PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()))
+        partname_index: _PartnameIndex | None = self.__dict__.get("_partname_index")
+        if partname_index is None:
+            return
+        for part in parts:
+            partname_index.remove_part(part)
+
+    def _notify_rel_added(self, rel: _Relationship) -> None:
+        """Tell this package package-relationship `rel` was added."""
+        self.notify_rel_added(None, rel)
+
+    def _load(self, slides: Sequence[int] | None = None) -> Self:
+        """Return the package after loading its parts and relationships.
 
-    def _load(self) -> Self:
-        """Return the package after loading all parts and relationships."""
-        pkg_xml_rels, parts = _PackageLoader.load(self._pkg_file, cast("Package", self))
+        All parts are loaded unless `slides` selects the only slides to be loaded up front.
+        """
+        pkg_xml_rels, parts = _PackageLoader.load(
+            self._package_reader, cast("Package", self), slides
+        )
         self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
         return self
 
+    @lazyproperty
+    def _partname_index(self) -> _PartnameIndex:
+        """|_PartnameIndex| of the parts in this package, used to allocate new partnames.
+
+        Built from the parts in the package on first use and maintained as parts are related and
+        renamed, so allocating a partname does not require a traversal of the package graph.
+        """
+        return _PartnameIndex(self.iter_parts())
+
+    @lazyproperty
+    def _rel_graph(self) -> _RelationshipGraph:
+        """|_RelationshipGraph| of the parts and relationships in this package.
+
+        Traversed on first use and extended as relationships are added, so iterating the parts or
+        relationships of the package does not require a traversal each time.
+        """
+        return _RelationshipGraph(self._rels)
+
+    @lazyproperty
+    def _package_reader(self) -> PackageReader:
+        """|PackageReader| for the package file this package was loaded from.
+
+        Retained after loading so unchanged parts can be copied from it verbatim on save.
+        """
+        return PackageReader(self._pkg_file)
+
     @lazyproperty
     def _rels(self) -> _Relationships:
         """|Relationships| object containing relationships of this package."""
@@ -170,34 +306,80 @@ class OpcPackage(_RelatableMixin):
 class _PackageLoader:
     """Function-object that loads a package from disk (or other store)."""
 
-    def __init__(self, pkg_file: str | IO[bytes], package: Package):
-        self._pkg_file = pkg_file
+    def __init__(
+        self,
+        package_reader: PackageReader,
+        package: Package,
+        slide_idxs: Sequence[int] | None = None,
+    ):
+        self._package_reader = package_reader
         self._package = package
+        self._slide_idxs = slide_idxs
 
     @classmethod
     def load(
-        cls, pkg_file: str | IO[bytes], package: Package
+        cls,
+        package_reader: PackageReader,
+        package: Package,
+        slide_idxs: Sequence[int] | None = None,
     ) -> tuple[CT_Relationships, dict[PackURI, Part]]:
-        """Return (pkg_xml_rels, parts) pair resulting from loading `pkg_file`.
+        """Return (pkg_xml_rels, parts) pair resulting from loading `package_reader`.
 
         The returned `parts` value is a {partname: part} mapping with each part in the package
         included and constructed complete with its relationships to other parts in the package.
 
+        When `slide_idxs` is provided, only the slides at those positions in the slide sequence
+        are loaded, along with each part that can be reached without passing through another
+        slide. Each other slide, and each part reachable only through one, is loaded the first
+        time a relationship to it is followed, with its own relationships loaded on first use.
+
         The returned `pkg_xml_rels` value is a `CT_Relationships` object containing the parsed
         package relationships. It is the caller's responsibility (the package object) to load
         those relationships into its |_Relationships| object.
         """
-        return cls(pkg_file, package)._load()
+        return cls(package_reader, package, slide_idxs)._load()
 
     def _load(self) -> tuple[CT_Relationships, dict[PackURI, Part]]:
-        """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file."""
+        """Return (pkg_xml_rels, parts) pair resulting from loading the package."""
         parts, xml_rels = self._parts, self._xml_rels
 
         for partname, part in parts.items():
             part.load_rels_from_xml(xml_rels[partname], parts)
 
+        # -- the parts loaded up front have all been read, release the package file; it is
+        # -- reopened if a part left in it is used later --
+        self._package_reader.close()
+
         return xml_rels[PACKAGE_URI], parts
 
+    def load_part(self, partname: PackURI) -> Part:
+        """Return the part `partname` newly loaded from the package, not loaded up front.
+
+        The relationships of the part are left to be loaded when they are first used.
+        """
+        content_type = self._content_types[partname]
+        part = PartFactory(
+            partname,
+            content_type,
+            self._package,
+            blob=self._blob_for(partname, content_type),
+        )
+        part.defer_rels_from_xml(lambda: self._xml_rels_for(partname), self._parts)
+        return part
+
+    def _blob_for(self, partname: PackURI, content_type: str) -> bytes | FileBackedBlob:
+        """Return the content of `partname`, left in the package file when it is large.
+
+        A large binary part is only read from the package file when its content is needed. XML
+        parts are always read into memory.
+        """
+        package_reader = self._package_reader
+        if not content_type.endswith("xml"):
+            file_blob = package_reader.file_blob(partname)
+            if file_blob is not None:
+                return file_blob
+        return package_reader[partname]
+
     @lazyproperty
     def _content_types(self) -> _ContentTypeMap:
         """|_ContentTypeMap| object providing content-types for items of this package.
@@ -207,9 +389,45 @@ class _PackageLoader:
         return _ContentTypeMap.from_xml(self._package_reader[CONTENT_TYPES_URI])
 
     @lazyproperty
-    def _package_reader(self) -> PackageReader:
-        """|PackageReader| object providing access to package-items in pkg_file."""
-        return PackageReader(self._pkg_file)
+    def _deferred_partnames(self) -> Set[PackURI]:
+        """Partnames of the slides to be loaded on first use rather than with the package.
+
+        Empty unless only selected slides are to be loaded, in which case it holds the partname of
+        each slide not selected. Raises |IndexError| when a selected slide is not in the slide
+        sequence.
+        """
+        slide_idxs = self._slide_idxs
+        if slide_idxs is None:
+            return set()
+
+        prs_partname = next(
+            (
+                PackURI.from_rel_ref(PACKAGE_URI.baseURI, rel.target_ref)
+                for rel in self._xml_rels_for(PACKAGE_URI).relationship_lst
+                if rel.reltype == RT.OFFICE_DOCUMENT
+            ),
+            None,
+        )
+        if prs_partname is None:
+            return set()
+
+        slide_partnames_by_rId = {
+            rel.rId: PackURI.from_rel_ref(prs_partname.baseURI, rel.target_ref)
+            for rel in self._xml_rels_for(prs_partname).relationship_lst
+            if rel.reltype == RT.SLIDE
+        }
+        sldIdLst = cast("CT_Presentation", parse_xml(self._package_reader[prs_partname])).sldIdLst
+        slide_partnames = [
+            slide_partnames_by_rId[sldId.rId]
+            for sldId in ([] if sldIdLst is None else sldIdLst.sldId_lst)
+            if sldId.rId in slide_partnames_by_rId
+        ]
+        try:
+            selected_partnames = {slide_partnames[idx] for idx in slide_idxs}
+        except IndexError:
+            raise IndexError("slide index out of range")
+
+        return set(slide_partnames_by_rId.values()) - selected_partnames
 
     @lazyproperty
     def _parts(self) -> dict[PackURI, Part]:
@@ -223,18 +441,22 @@ class _PackageLoader:
         package = self._package
         package_reader = self._package_reader
 
-        return {
-            partname: PartFactory(
-                partname,
-                content_types[partname],
-                package,
-                blob=package_reader[partname],
-            )
-            for partname in (p for p in self._xml_rels if p != "/")
-            # -- invalid partnames can arise in some packages; ignore those rather than raise an
-            # -- exception.
-            if partname in package_reader
-        }
+        return _PartsOnDemand(
+            {
+                partname: PartFactory(
+                    partname,
+                    content_types[partname],
+                    package,
+                    blob=self._blob_for(partname, content_types[partname]),
+                )
+                for partname in (p for p in self._xml_rels if p != "/")
+                # -- invalid partnames can arise in some packages; ignore those rather than raise
+                # -- an exception.
+                if partname in package_reader
+            },
+            package_reader,
+            self.load_part,
+        )
 
     @lazyproperty
     def _xml_rels(self) -> dict[PackURI, CT_Relationships]:
@@ -244,7 +466,9 @@ class _PackageLoader:
         populating their relationships.
         """
         xml_rels: dict[PackURI, CT_Relationships] = {}
-        visited_partnames: Set[PackURI] = set()
+        # -- a slide to be loaded on first use is not traversed, nor what is only reachable
+        # -- through it --
+        visited_partnames: Set[PackURI] = set(self._deferred_partnames)
 
         def load_rels(source_partname: PackURI, rels: CT_Relationships):
             """Populate `xml_rels` dict by traversing relationships depth-first."""
@@ -287,30 +511,44 @@ class Part(_RelatableMixin):
     """
 
     def __init__(
-        self, partname: PackURI, content_type: str, package: Package, blob: bytes | None = None
+        self,
+        partname: PackURI,
+        content_type: str,
+        package: Package,
+        blob: bytes | FileBackedBlob | None = None,
     ):
         # --- XmlPart subtypes, don't store a blob (the original XML) ---
         self._partname = partname
         self._content_type = content_type
         self._package = package
-        self._blob = blob
+        # -- a file-backed blob stays in its file, see `.file_blob` --
+        self._file_blob = blob if isinstance(blob, FileBackedBlob) else None
+        self._blob = None if isinstance(blob, FileBackedBlob) else blob
+        self._source_partname: PackURI | None = None
 
     @classmethod
-    def load(cls, partname: PackURI, content_type: str, package: Package, blob: bytes) -> Self:
+    def load(
+        cls, partname: PackURI, content_type: str, package: Package, blob: bytes | FileBackedBlob
+    ) -> Self:
         """Return `cls` instance loaded from arguments.
 
         This one is a straight pass-through, but subtypes may do some pre-processing, see XmlPart
         for an example.
         """
-        return cls(partname, content_type, package, blob)
+        part = cls(partname, content_type, package, blob)
+        part._source_partname = partname
+        return part
 
     @property
     def blob(self) -> bytes:
         """Contents of this package part as a sequence of bytes.
 
         Intended to be overridden by subclasses. Default behavior is to return the blob initial
-        loaded during `Package.open()` operation.
+        loaded during `Package.open()` operation. The content of a file-backed part is read from
+        its file each time.
         """
+        if self._file_blob is not None:
+            return self._file_blob.read()
         return self._blob or b""
 
     @blob.setter
@@ -321,12 +559,45 @@ class Part(_RelatableMixin):
         demand. This works fine for binary parts though.
         """
         self._blob = blob
+        self._file_blob = None
+        self._source_partname = None
 
     @lazyproperty
     def content_type(self) -> str:
         """Content-type (MIME-type) of this part."""
         return self._content_type
 
+    @property
+    def file_blob(self) -> FileBackedBlob | None:
+        """|FileBackedBlob| holding the content of this part when it is left in its file.
+
+        A large binary part loaded from a package file, like a video, is left in that file until
+        its content is needed. On save, it is streamed from that file, copied without
+        decompressing it when it is compressed the way the package writer calls for. |None| when
+        the content of this part is in memory, as it is for most parts.
+        """
+        return self._file_blob
+
+    def load_file_blob(self) -> None:
+        """Read the content of a file-backed part into memory, making it no longer file-backed.
+
+        Does nothing when this part is not file-backed.
+        """
+        if self._file_blob is None:
+            return
+        self._blob = self._file_blob.read()
+        self._file_blob = None
+
+    def defer_rels_from_xml(
+        self, load_xml_rels: Callable[[], CT_Relationships], parts: Mapping[PackURI, Part]
+    ) -> None:
+        """Load _Relationships for this part from the `load_xml_rels()` XML when first used.
+
+        Like `.load_rels_from_xml()`, but neither the XML nor the parts it refers to are read
+        until the relationships of this part are needed. Only used during package loading.
+        """
+        self._rels.defer_load_from_xml(load_xml_rels, parts)
+
     def load_rels_from_xml(self, xml_rels: CT_Relationships, parts: dict[PackURI, Part]) -> None:
         """load _Relationships for this part from `xml_rels`.
 
@@ -352,7 +623,8 @@ class Part(_RelatableMixin):
             raise TypeError(  # pragma: no cover
                 "partname must be instance of PackURI, got '%s'" % type(partname).__name__
             )
-        self._partname = partname
+        old_partname, self._partname = self._partname, partname
+        self._package.notify_part_renamed(self, old_partname)
 
     @lazyproperty
     def rels(self) -> _Relationships:
@@ -360,6 +632,21 @@ class Part(_RelatableMixin):
         # --- this must be public to allow the part graph to be traversed ---
         return self._rels
 
+    @property
+    def source_partname(self) -> PackURI | None:
+        """Partname this part was loaded from, as long as its blob is unchanged since loading.
+
+        |None| when this part was created after the package was opened or its blob has changed.
+        The package writer copies the stored (compressed) package member for a part having a
+        source-partname rather than compressing its blob again. Note this partname can differ
+        from the current partname when the part has been renamed.
+        """
+        return self._source_partname
+
+    def _notify_rel_added(self, rel: _Relationship) -> None:
+        """Tell the package relationship `rel` from this part was added."""
+        self._package.notify_rel_added(self, rel)
+
     def _blob_from_file(self, file: str | IO[bytes]) -> bytes:
         """Return bytes of `file`, which is either a str path or a file-like object."""
         # --- a str `file` is assumed to be a path ---
@@ -384,25 +671,87 @@ class XmlPart(Part):
 
     Provides additional methods to the |Part| base class that take care of parsing and
     reserializing the XML payload and managing relationships to other parts.
+
+    An XML part loaded from a package holds only its raw XML bytes until its XML is first
+    accessed, at which point those bytes are parsed into its element. A part whose XML is never
+    accessed is written back to the package byte-for-byte.
+
+    Once parsed, the element is serialized again each time the blob is required, because it can
+    be changed in ways that cannot be detected, like with `lxml.etree.SubElement()`. When its
+    package `.reuses_unchanged_xml`, the last serialization of the element is instead kept and
+    reused until the element tree changes, so saving a presentation again only serializes the
+    parts changed since it was last saved. The raw XML bytes a part is loaded with count as its
+    first serialization, so a part parsed but not changed is then also written back
+    byte-for-byte.
     """
 
     def __init__(
-        self, partname: PackURI, content_type: str, package: Package, element: BaseOxmlElement
+        self,
+        partname: PackURI,
+        content_type: str,
+        package: Package,
+        element: BaseOxmlElement | None,
+        blob: bytes | None = None,
     ):
-        super(XmlPart, self).__init__(partname, content_type, package)
-        self._element = element
+        super(XmlPart, self).__init__(partname, content_type, package, blob)
+        # -- (element, tree-revision, blob) recording the last serialization of the element --
+        self._serialization: tuple[BaseOxmlElement, int, bytes] | None = None
+        # -- `._element` is left unset on a loaded part until its XML is first accessed --
+        if element is not None:
+            self._element = element
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Parse the loaded XML of this part on first access of `._element`.
+
+            Only called when normal attribute lookup fails, so a part that already has its
+            element pays nothing for this on access.
+            """
+            if name != "_element":
+                raise AttributeError(
+                    "'%s' object has no attribute '%s'" % (type(self).__name__, name)
+                )
+            blob = self._blob or b""
+            self._element = element = cast("BaseOxmlElement", parse_xml(blob))
+            # -- the element is the source of truth from here on, the raw XML is retained only
+            # -- as its serialization, until the element changes
+            self._serialization = (element, tree_revision(element), blob)
+            self._blob = None
+            return element
 
     @classmethod
-    def load(cls, partname: PackURI, content_type: str, package: Package, blob: bytes):
-        """Return instance of `cls` loaded with parsed XML from `blob`."""
-        return cls(
-            partname, content_type, package, element=cast("BaseOxmlElement", parse_xml(blob))
-        )
+    def load(
+        cls, partname: PackURI, content_type: str, package: Package, blob: bytes | FileBackedBlob
+    ):
+        """Return instance of `cls` loaded with the XML in `blob`.
+
+        Parsing `blob` is deferred until the XML of the part is first accessed.
+        """
+        if isinstance(blob, FileBackedBlob):
+            blob = blob.read()
+        part = cls(partname, content_type, package, element=None, blob=blob)
+        part._source_partname = partname
+        return part
 
     @property
     def blob(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
-        """bytes XML serialization of this part."""
-        return serialize_part_xml(self._element)
+        """bytes XML serialization of this part.
+
+        These are the bytes originally loaded when the XML of this part has never been parsed.
+        Otherwise the element is serialized, unless the package reuses unchanged XML and the
+        element has not changed since it was loaded or last serialized.
+        """
+        if not self.is_parsed:
+            return self._blob or b""
+        blob = self._serialized_blob
+        if blob is None:
+            element = self._element
+            blob = serialize_part_xml(element)
+            self._serialization = (element, tree_revision(element), blob)
+            # -- these bytes are no longer those of the member this part was loaded from --
+            self._source_partname = None
+        return blob
 
     # -- XmlPart cannot set its blob, which is why pyright complains --
 
@@ -413,7 +762,15 @@ class XmlPart(Part):
         parts can drop relationships.
         """
         if self._rel_ref_count(rId) < 2:
-            self._rels.pop(rId)
+            self._package.notify_rel_dropped(self._rels.pop(rId))
+
+    @property
+    def is_parsed(self) -> bool:
+        """True when the XML of this part has been parsed into its element.
+
+        An XML part loaded from a package is not parsed until its XML is first accessed.
+        """
+        return "_element" in self.__dict__
 
     @property
     def part(self):
@@ -425,9 +782,40 @@ class XmlPart(Part):
         """
         return self
 
+    @property
+    def source_partname(self) -> PackURI | None:
+        """Partname this part was loaded from, as long as its XML is known to be unchanged.
+
+        That is while its XML has never been parsed or, when the package reuses unchanged XML,
+        while its element has not changed since loading. The XML of any other part must be
+        serialized again on save.
+        """
+        if self.is_parsed and self._serialized_blob is None:
+            return None
+        return self._source_partname
+
     def _rel_ref_count(self, rId: str) -> int:
-        """Return int count of references in this part's XML to `rId`."""
-        return len([r for r in cast("list[str]", self._element.xpath("//@r:id")) if r == rId])
+        """Return int count of references in this part's XML to `rId`.
+
+        The references in the XML are counted once, then the counts are kept current as the XML
+        changes, so dropping many relationships in turn does not scan the XML each time.
+        """
+        return attribute_value_counts(self._element, qn("r:id"))[rId]
+
+    @property
+    def _serialized_blob(self) -> bytes | None:
+        """The last serialization of the element of this part, when it can be reused.
+
+        |None| when the package does not reuse unchanged XML, or when the element has not been
+        serialized or has changed since it last was.
+        """
+        serialization = self._serialization
+        if serialization is None or not self._package.reuses_unchanged_xml:
+            return None
+        element, revision, blob = serialization
+        if element is not self._element or tree_revision(element) != revision:
+            return None
+        return blob
 
 
 class PartFactory:
@@ -439,7 +827,9 @@ class PartFactory:
 
     part_type_for: dict[str, type[Part]] = {}
 
-    def __new__(cls, partname: PackURI, content_type: str, package: Package, blob: bytes) -> Part:
+    def __new__(
+        cls, partname: PackURI, content_type: str, package: Package, blob: bytes | FileBackedBlob
+    ) -> Part:
         PartClass = cls._part_cls_for(content_type)
         return PartClass.load(partname, content_type, package, blob)
 
@@ -454,6 +844,36 @@ class PartFactory:
         return Part
 
 
+class _PartsOnDemand(Dict[PackURI, Part]):
+    """dict {partname: Part} of the parts loaded from a package, loading any other on lookup.
+
+    `parts` are the parts loaded up front. Any other part in the package read by `package_reader`,
+    like one reachable only through a slide left unloaded, is loaded by `load_part()` when it is
+    first looked up.
+    """
+
+    def __init__(
+        self,
+        parts: dict[PackURI, Part],
+        package_reader: PackageReader,
+        load_part: Callable[[PackURI], Part],
+    ):
+        super(_PartsOnDemand, self).__init__(parts)
+        self._package_reader = package_reader
+        self._load_part = load_part
+
+    def __contains__(self, partname: object) -> bool:
+        """True when `partname` is loaded or is present in the package to be loaded."""
+        if super(_PartsOnDemand, self).__contains__(partname):
+            return True
+        return partname in self._package_reader
+
+    def __missing__(self, partname: PackURI) -> Part:
+        """Load the part `partname` not yet loaded from the package."""
+        part = self[partname] = self._load_part(partname)
+        return part
+
+
 class _ContentTypeMap:
     """Value type providing dict semantics for looking up content type by partname."""
 
@@ -490,6 +910,299 @@ class _ContentTypeMap:
         return cls(overrides, defaults)
 
 
+class _PartnameIndex:
+    """Index of the partnames of the parts in a package, used to allocate a new partname.
+
+    The index is loaded with `parts` and kept current as parts are added, removed and renamed. A
+    partname is counted each time it appears because a part can briefly share its partname with
+    another while the parts of a sequence are renamed.
+    """
+
+    def __init__(self, parts: Iterable[Part]):
+        self._parts: Set[Part] = set()
+        self._partnames: collections.Counter[PackURI] = collections.Counter()
+        # -- `_PrefixIndex` for each partname prefix queried so far --
+        self._prefix_indexes: dict[str, _PrefixIndex] = {}
+        for part in parts:
+            self._add(part)
+
+    def add_part(self, part: Part) -> None:
+        """Add `part` and each part it relates to, directly or indirectly, to the index.
+
+        A part already in the index is skipped along with the parts it relates to, which were
+        added along with it.
+        """
+        parts = [part]
+        while parts:
+            part = parts.pop()
+            if part in self._parts:
+                continue
+            self._add(part)
+            parts.extend(rel.target_part for rel in part.rels.values() if not rel.is_external)
+
+    def first_available_idx(self, prefix: str) -> int:
+        """The lowest partname index not used by a partname starting with `prefix`.
+
+        For example, 3 for prefix `"/ppt/media/image"` when only "image1.png", "image2.jpg", and
+        "image4.png" are present.
+        """
+        return self._prefix_index(prefix).first_available_idx
+
+    def next_partname(self, tmpl: str) -> str:
+        """The next available partname matching `tmpl`.
+
+        `tmpl` is a printf (%)-style template string containing a single replacement item, a '%d'
+        to be used to insert the integer portion of the partname, like `/ppt/slides/slide%d.xml`.
+        """
+        # --- expected next partname is tmpl % n where n is one greater than the number
+        # --- of existing partnames that match tmpl. Speed up finding the next one
+        # --- (maybe) by searching from the end downward rather than from 1 upward.
+        prefix = tmpl[: (tmpl % 42).find("42")]
+        partnames = self._prefix_index(prefix).partnames
+        for n in range(len(partnames) + 1, 0, -1):
+            candidate_partname = tmpl % n
+            if candidate_partname not in partnames:
+                return candidate_partname
+        raise Exception("ProgrammingError: ran out of candidate_partnames")  # pragma: no cover
+
+    def remove_part(self, part: Part) -> None:
+        """Remove `part` alone from the index.
+
+        Does nothing when `part` is not in the index.
+        """
+        if part not in self._parts:
+            return
+        self._parts.remove(part)
+        self._remove_partname(part.partname)
+
+    def rename_part(self, part: Part, old_partname: PackURI) -> None:
+        """Update the index after `part` is renamed from `old_partname`.
+
+        Does nothing when `part` is not in the index, which means it is not in the package.
+        """
+        if part not in self._parts:
+            return
+        self._remove_partname(old_partname)
+        self._add_partname(part.partname)
+
+    def _add(self, part: Part) -> None:
+        """Add `part` alone to the index."""
+        self._parts.add(part)
+        self._add_partname(part.partname)
+
+    def _add_partname(self, partname: PackURI) -> None:
+        """Count `partname` in the index and in each prefix-index it belongs to."""
+        self._partnames[partname] += 1
+        for prefix, prefix_index in self._prefix_indexes.items():
+            if partname.startswith(prefix):
+                prefix_index.add(partname)
+
+    def _prefix_index(self, prefix: str) -> _PrefixIndex:
+        """The |_PrefixIndex| of the partnames starting with `prefix`, created on first use."""
+        prefix_index = self._prefix_indexes.get(prefix)
+        if prefix_index is None:
+            prefix_index = self._prefix_indexes[prefix] = _PrefixIndex()
+            for partname, count in self._partnames.items():
+                if partname.startswith(prefix):
+                    for _ in range(count):
+                        prefix_index.add(partname)
+        return prefix_index
+
+    def _remove_partname(self, partname: PackURI) -> None:
+        """Uncount `partname` in the index and in each prefix-index it belongs to."""
+        self._partnames[partname] -= 1
+        if self._partnames[partname] <= 0:
+            del self._partnames[partname]
+        for prefix, prefix_index in self._prefix_indexes.items():
+            if partname.startswith(prefix):
+                prefix_index.remove(partname)
+
+
+class _PrefixIndex:
+    """The partnames in a package starting with a certain prefix, like "/ppt/media/image".
+
+    Also tracks the lowest partname index (the integer in "image42.png") not in use.
+    """
+
+    def __init__(self):
+        self._partnames: collections.Counter[PackURI] = collections.Counter()
+        self._idxs: collections.Counter[int] = collections.Counter()
+        self._first_available_idx = 1
+
+    def add(self, partname: PackURI) -> None:
+        """Count `partname`."""
+        self._partnames[partname] += 1
+        idx = partname.idx
+        if idx is None:
+            return
+        self._idxs[idx] += 1
+        # -- the first available index only moves up when it is taken --
+        while self._first_available_idx in self._idxs:
+            self._first_available_idx += 1
+
+    @property
+    def first_available_idx(self) -> int:
+        """The lowest partname index (starting at 1) not used by a counted partname."""
+        return self._first_available_idx
+
+    @property
+    def partnames(self) -> KeysView[str]:
+        """The distinct counted partnames, supporting `len()` and `in`."""
+        return self._partnames.keys()
+
+    def remove(self, partname: PackURI) -> None:
+        """Uncount `partname`."""
+        self._partnames[partname] -= 1
+        if self._partnames[partname] <= 0:
+            del self._partnames[partname]
+        idx = partname.idx
+        if idx is None:
+            return
+        self._idxs[idx] -= 1
+        if self._idxs[idx] <= 0:
+            del self._idxs[idx]
+            self._first_available_idx = min(self._first_available_idx, idx)
+
+
+class _RelationshipGraph:
+    """The parts and relationships reachable from the package relationships `rels`.
+
+    The graph is traversed depth-first when created and kept current as relationships are added
+    and dropped. The number of relationships in the graph to each part is kept, so a dropped
+    relationship only leads to a search of the parts reachable from its target, for those no
+    longer reachable from the package, rather than to a traversal of the whole package. Parts and
+    relationships are iterated as they are when iteration starts, so the graph can change while
+    it is iterated.
+    """
+
+    def __init__(self, rels: _Relationships):
+        # -- dicts are used as insertion-ordered sets --
+        self._parts: dict[Part, None] = {}
+        self._rels: dict[_Relationship, None] = {}
+        # -- count of relationships in the graph to each part in it --
+        self._in_degrees: collections.Counter[Part] = collections.Counter()
+        self._add_rels(rels)
+
+    def add_rel(self, source: Part | None, rel: _Relationship) -> list[Part]:
+        """Add `rel` from `source` to the graph, along with the parts it makes reachable.
+
+        `source` is |None| for a package relationship. A relationship from a part not in the
+        graph is skipped; it is added along with that part when the part becomes reachable.
+        Returns the parts added to the graph, in the order they were reached.
+        """
+        if rel in self._rels:
+            return []
+        if source is not None and source not in self._parts:
+            return []
+        return self._add_rels({rel.rId: rel})
+
+    def drop_rel(self, rel: _Relationship) -> list[Part]:
+        """Remove `rel` from the graph, along with the parts no longer reachable without it.
+
+        `rel` has already been removed from the relationships of its source. Returns the parts
+        removed from the graph.
+        """
+        if rel not in self._rels:
+            return []
+        del self._rels[rel]
+        if rel.is_external:
+            return []
+        target_part = rel.target_part
+        self._in_degrees[target_part] -= 1
+        unreachable_parts = self._unreachable_parts(target_part)
+        for part in unreachable_parts:
+            for part_rel in part.rels.values():
+                self._drop_edge(part_rel)
+        for part in unreachable_parts:
+            del self._parts[part]
+            del self._in_degrees[part]
+        return unreachable_parts
+
+    def iter_parts(self) -> Iterator[Part]:
+        """Generate each part in the graph, in the order it was reached."""
+        return iter(tuple(self._parts))
+
+    def iter_rels(self) -> Iterator[_Relationship]:
+        """Generate each relationship in the graph, in the order it was reached."""
+        return iter(tuple(self._rels))
+
+    def _add_rels(self, rels: Mapping[str, _Relationship]) -> list[Part]:
+        """Add `rels` to the graph, each followed depth-first by those it makes reachable.
+
+        Returns the parts added to the graph. Traversal is iterative, using a stack of
+        relationship iterators in place of recursion, so the depth of the graph is not limited by
+        the interpreter recursion limit.
+        """
+        added_parts: list[Part] = []
+        stack: list[Iterator[_Relationship]] = [iter(rels.values())]
+        while stack:
+            rel = next(stack[-1], None)
+            if rel is None:
+                stack.pop()
+                continue
+            if rel in self._rels:
+                continue
+            self._rels[rel] = None
+            # --- external items can have no relationships ---
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            self._in_degrees[part] += 1
+            # -- a part already in the graph had its relationships added along with it --
+            if part in self._parts:
+                continue
+            self._parts[part] = None
+            added_parts.append(part)
+            stack.append(iter(part.rels.values()))
+        return added_parts
+
+    def _drop_edge(self, rel: _Relationship) -> None:
+        """Remove `rel`, from a part being removed from the graph, from the graph."""
+        if rel not in self._rels:
+            return
+        del self._rels[rel]
+        if not rel.is_external:
+            self._in_degrees[rel.target_part] -= 1
+
+    def _internal_targets(self, part: Part) -> Iterator[Part]:
+        """Generate the target part of each relationship in the graph from `part`."""
+        for rel in part.rels.values():
+            if rel.is_external or rel not in self._rels:
+                continue
+            yield rel.target_part
+
+    def _unreachable_parts(self, part: Part) -> list[Part]:
+        """The parts of the graph no longer reachable from the package, now `part` may not be.
+
+        Only a part reachable from `part` can have become unreachable. Among those, a part having
+        a relationship from a part elsewhere in the graph is still reachable, since no part
+        elsewhere can have been reachable only through `part`. So is each part reachable from such
+        a part. All others are unreachable. This costs a search of the parts reachable from
+        `part`, which, unlike the whole package, is small in the common case.
+        """
+        # -- parts reachable from `part`, and the count of relationships among them to each --
+        reached: dict[Part, None] = {part: None}
+        inner_degrees: collections.Counter[Part] = collections.Counter()
+        stack = [part]
+        while stack:
+            for target_part in self._internal_targets(stack.pop()):
+                inner_degrees[target_part] += 1
+                if target_part not in reached:
+                    reached[target_part] = None
+                    stack.append(target_part)
+
+        in_degrees = self._in_degrees
+        stack = [p for p in reached if in_degrees[p] > inner_degrees[p]]
+        reachable = set(stack)
+        while stack:
+            for target_part in self._internal_targets(stack.pop()):
+                if target_part not in reachable:
+                    reachable.add(target_part)
+                    stack.append(target_part)
+
+        return [p for p in reached if p not in reachable]
+
+
 class _Relationships(Mapping[str, "_Relationship"]):
     """Collection of |_Relationship| instances having `dict` semantics.
 
@@ -503,6 +1216,10 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
     def __init__(self, base_uri: str):
         self._base_uri = base_uri
+        # -- (load_xml_rels, parts) when loading these relationships is deferred to first use --
+        self._deferred_load: (
+            tuple[Callable[[], CT_Relationships], Mapping[PackURI, Part]] | None
+        ) = None
 
     def __contains__(self, rId: object) -> bool:
         """Implement 'in' operation, like `"rId7" in relationships`."""
@@ -547,26 +1264,29 @@ class _Relationships(Mapping[str, "_Relationship"]):
             else existing_rId
         )
 
-    def load_from_xml(
-        self, base_uri: str, xml_rels: CT_Relationships, parts: dict[PackURI, Part]
+    def defer_load_from_xml(
+        self, load_xml_rels: Callable[[], CT_Relationships], parts: Mapping[PackURI, Part]
     ) -> None:
-        """Replace any relationships in this collection with those from `xml_rels`."""
+        """Replace any relationships in this collection with those from `load_xml_rels()`.
 
-        def iter_valid_rels():
-            """Filter out broken relationships such as those pointing to NULL."""
-            for rel_elm in xml_rels.relationship_lst:
-                # --- Occasionally a PowerPoint plugin or other client will "remove"
-                # --- a relationship simply by "voiding" its Target value, like making
-                # --- it "/ppt/slides/NULL". Skip any relationships linking to a
-                # --- partname that is not present in the package.
-                if rel_elm.targetMode == RTM.INTERNAL:
-                    partname = PackURI.from_rel_ref(base_uri, rel_elm.target_ref)
-                    if partname not in parts:
-                        continue
-                yield _Relationship.from_xml(base_uri, rel_elm, parts)
+        The replacement is deferred until the relationships in this collection are first used,
+        so the XML is only read, and the parts it refers to only looked up, if they are needed.
+        """
+        self._deferred_load = (load_xml_rels, parts)
+        self.__dict__.pop("_rels", None)
+        self.__dict__.pop("_rels_by_reltype", None)
+        self.__dict__.pop("_rIds_by_target", None)
 
+    def load_from_xml(
+        self, base_uri: str, xml_rels: CT_Relationships, parts: Mapping[PackURI, Part]
+    ) -> None:
+        """Replace any relationships in this collection with those from `xml_rels`."""
         self._rels.clear()
-        self._rels.update((rel.rId, rel) for rel in iter_valid_rels())
+        self._rels.update(
+            (rel.rId, rel) for rel in self._iter_rels_from_xml(base_uri, xml_rels, parts)
+        )
+        self.__dict__.pop("_rels_by_reltype", None)
+        self.__dict__.pop("_rIds_by_target", None)
 
     def part_with_reltype(self, reltype: str) -> Part:
         """Return target part of relationship with matching `reltype`.
@@ -582,14 +1302,28 @@ class _Relationships(Mapping[str, "_Relationship"]):
         if len(rels_of_reltype) > 1:
             raise ValueError("multiple relationships of type '%s' in collection" % reltype)
 
-        return rels_of_reltype[0].target_part
+        return next(iter(rels_of_reltype.values())).target_part
 
     def pop(self, rId: str) -> _Relationship:
         """Return |_Relationship| identified by `rId` after removing it from collection.
 
         The caller is responsible for ensuring it is no longer required.
         """
-        return self._rels.pop(rId)
+        rel = self._rels.pop(rId)
+
+        rels_by_reltype = self.__dict__.get("_rels_by_reltype")
+        if rels_by_reltype is not None:
+            del rels_by_reltype[rel.reltype][rId]
+
+        rIds_by_target = self.__dict__.get("_rIds_by_target")
+        if rIds_by_target is not None:
+            key = self._target_key(rel)
+            rIds = rIds_by_target[key]
+            del rIds[rId]
+            if not rIds:
+                del rIds_by_target[key]
+
+        return rel
 
     @property
     def xml(self):
@@ -620,13 +1354,22 @@ class _Relationships(Mapping[str, "_Relationship"]):
     def _add_relationship(self, reltype: str, target: Part | str, is_external: bool = False) -> str:
         """Return str rId of |_Relationship| newly added to spec."""
         rId = self._next_rId
-        self._rels[rId] = _Relationship(
+        rel = self._rels[rId] = _Relationship(
             self._base_uri,
             rId,
             reltype,
             target_mode=RTM.EXTERNAL if is_external else RTM.INTERNAL,
             target=target,
         )
+
+        rels_by_reltype = self.__dict__.get("_rels_by_reltype")
+        if rels_by_reltype is not None:
+            rels_by_reltype[reltype][rId] = rel
+
+        rIds_by_target = self.__dict__.get("_rIds_by_target")
+        if rIds_by_target is not None:
+            rIds_by_target.setdefault((reltype, target, is_external), {})[rId] = None
+
         return rId
 
     def _get_matching(
@@ -634,16 +1377,11 @@ class _Relationships(Mapping[str, "_Relationship"]):
     ) -> str | None:
         """Return optional str rId of rel of `reltype`, `target`, and `is_external`.
 
-        Returns `None` on no matching relationship
+        Returns `None` on no matching relationship. When more than one relationship matches, the
+        first one in the collection is the one returned.
         """
-        for rel in self._rels_by_reltype[reltype]:
-            if rel.is_external != is_external:
-                continue
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target == target:
-                return rel.rId
-
-        return None
+        rIds = self._rIds_by_target.get((reltype, target, is_external))
+        return None if rIds is None else next(iter(rIds))
 
     @property
     def _next_rId(self) -> str:
@@ -663,19 +1401,72 @@ class _Relationships(Mapping[str, "_Relationship"]):
             "ProgrammingError: Impossible to have more distinct rIds than relationships"
         )
 
+    @staticmethod
+    def _iter_rels_from_xml(
+        base_uri: str, xml_rels: CT_Relationships, parts: Mapping[PackURI, Part]
+    ) -> Iterator[_Relationship]:
+        """Generate a |_Relationship| for each valid relationship in `xml_rels`.
+
+        Broken relationships, such as those pointing to NULL, are filtered out.
+        """
+        for rel_elm in xml_rels.relationship_lst:
+            # --- Occasionally a PowerPoint plugin or other client will "remove"
+            # --- a relationship simply by "voiding" its Target value, like making
+            # --- it "/ppt/slides/NULL". Skip any relationships linking to a
+            # --- partname that is not present in the package.
+            if rel_elm.targetMode == RTM.INTERNAL:
+                partname = PackURI.from_rel_ref(base_uri, rel_elm.target_ref)
+                if partname not in parts:
+                    continue
+            yield _Relationship.from_xml(base_uri, rel_elm, parts)
+
     @lazyproperty
     def _rels(self) -> dict[str, _Relationship]:
-        """dict {rId: _Relationship} containing relationships of this collection."""
-        return {}
+        """dict {rId: _Relationship} containing relationships of this collection.
 
-    @property
-    def _rels_by_reltype(self) -> dict[str, list[_Relationship]]:
-        """defaultdict {reltype: [rels]} for all relationships in collection."""
-        D: DefaultDict[str, list[_Relationship]] = collections.defaultdict(list)
-        for rel in self.values():
-            D[rel.reltype].append(rel)
+        Loaded from XML on first access when loading this collection has been deferred.
+        """
+        deferred_load, self._deferred_load = self._deferred_load, None
+        if deferred_load is None:
+            return {}
+        load_xml_rels, parts = deferred_load
+        return {
+            rel.rId: rel for rel in self._iter_rels_from_xml(self._base_uri, load_xml_rels(), parts)
+        }
+
+    @lazyproperty
+    def _rels_by_reltype(self) -> DefaultDict[str, dict[str, _Relationship]]:
+        """defaultdict {reltype: {rId: rel}} for all relationships in collection.
+
+        Built on first use and maintained as relationships are added and removed. The rels of
+        each reltype appear in collection order.
+        """
+        D: DefaultDict[str, dict[str, _Relationship]] = collections.defaultdict(dict)
+        for rId, rel in self._rels.items():
+            D[rel.reltype][rId] = rel
         return D
 
+    @lazyproperty
+    def _rIds_by_target(self) -> dict[tuple[str, Part | str, bool], dict[str, None]]:
+        """dict {(reltype, target, is_external): {rId: None}} for relationships in collection.
+
+        The target is the target-ref for an external relationship and the target-part otherwise.
+        The inner dict acts as an ordered set of the rIds of all the relationships matching that
+        key, in collection order. Built on first use and maintained as relationships are added
+        and removed.
+        """
+        rIds_by_target: dict[tuple[str, Part | str, bool], dict[str, None]] = {}
+        for rId, rel in self._rels.items():
+            rIds_by_target.setdefault(self._target_key(rel), {})[rId] = None
+        return rIds_by_target
+
+    @staticmethod
+    def _target_key(rel: _Relationship) -> tuple[str, Part | str, bool]:
+        """The (reltype, target, is_external) key of `rel` in the target index."""
+        if rel.is_external:
+            return (rel.reltype, rel.target_ref, True)
+        return (rel.reltype, rel.target_part, False)
+
 
 class _Relationship:
     """Value object describing link from a part or package to another part."""
@@ -689,14 +1480,20 @@ class _Relationship:
 
     @classmethod
     def from_xml(
-        cls, base_uri: str, rel: CT_Relationship, parts: dict[PackURI, Part]
+        cls, base_uri: str, rel: CT_Relationship, parts: Mapping[PackURI, Part]
     ) -> _Relationship:
-        """Return |_Relationship| object based on CT_Relationship element `rel`."""
-        target = (
-            rel.target_ref
-            if rel.targetMode == RTM.EXTERNAL
-            else parts[PackURI.from_rel_ref(base_uri, rel.target_ref)]
-        )
+        """Return |_Relationship| object based on CT_Relationship element `rel`.
+
+        A |_DeferredRelationship| is returned when the target part is in `parts` but not yet
+        loaded, so it is only loaded when the relationship is followed.
+        """
+        if rel.targetMode == RTM.EXTERNAL:
+            return cls(base_uri, rel.rId, rel.reltype, rel.targetMode, rel.target_ref)
+        partname = PackURI.from_rel_ref(base_uri, rel.target_ref)
+        # -- `.get()` finds only a part already loaded, where `parts[partname]` would load it --
+        target = parts.get(partname)
+        if target is None:
+            return _DeferredRelationship(base_uri, rel.rId, rel.reltype, partname, parts)
         return cls(base_uri, rel.rId, rel.reltype, rel.targetMode, target)
 
     @lazyproperty
@@ -727,8 +1524,7 @@ class _Relationship:
         """|Part| or subtype referred to by this relationship."""
         if self.is_external:
             raise ValueError(
-                "`.target_part` property on _Relationship is undefined when "
-                "target-mode is external"
+                "`.target_part` property on _Relationship is undefined when target-mode is external"
             )
         assert isinstance(self._target, Part)
         return self._target
@@ -760,3 +1556,40 @@ class _Relationship:
             return self._target
 
         return self.target_partname.relative_ref(self._base_uri)
+
+
+class _DeferredRelationship(_Relationship):
+    """Relationship to a part loaded from the package only when the relationship is followed.
+
+    `parts` loads the part `target_partname` when it is first looked up, like |_PartsOnDemand|.
+    """
+
+    def __init__(
+        self,
+        base_uri: str,
+        rId: str,
+        reltype: str,
+        target_partname: PackURI,
+        parts: Mapping[PackURI, Part],
+    ):
+        super(_DeferredRelationship, self).__init__(
+            base_uri, rId, reltype, RTM.INTERNAL, target_partname
+        )
+        self._parts = parts
+
+    @lazyproperty
+    def target_part(self) -> Part:
+        """|Part| or subtype referred to by this relationship, loaded on first access."""
+        return self._parts[cast(PackURI, self._target)]
+
+    @property
+    def target_partname(self) -> PackURI:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """|PackURI| partname of the part targeted by this relationship.
+
+        The partname the part was loaded from until the part is loaded; the part is not loaded
+        just to get its partname.
+        """
+        target_part = self.__dict__.get("target_part")
+        if target_part is None:
+            return cast(PackURI, self._target)
+        return target_part.partname
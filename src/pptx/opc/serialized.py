@@ -2,22 +2,68 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import posixpath
+import struct
+import time
 import zipfile
-from typing import IO, TYPE_CHECKING, Any, Container, Sequence
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Container, Iterable, Iterator, Sequence, cast
+
+from lxml import etree
 
 from pptx.exc import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.oxml import CT_Types, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from pptx.opc.shared import CaseInsensitiveDict
 from pptx.opc.spec import default_content_types
+from pptx.oxml.ns import qn
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
     from pptx.opc.package import Part, _Relationships  # pyright: ignore[reportPrivateUsage]
 
+# -- binary part content at least this many bytes is left in its file until it is needed --
+FILE_BACKED_MIN_SIZE = 16 * 1024 * 1024
+
+# -- file-backed content is read and written this many bytes at a time --
+_CHUNK_SIZE = 1024 * 1024
+
+# -- members compressed with these methods are copied verbatim, others are recompressed --
+_COPYABLE_COMPRESS_TYPES = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+
+# -- extensions of media and embedded-package formats that are already compressed --
+_PRECOMPRESSED_EXTS = frozenset(
+    (
+        "avi", "docx", "gif", "jpe", "jpeg", "jpg", "m4a", "m4v", "mov", "mp3", "mp4", "mpeg",
+        "mpg", "png", "pptx", "wdp", "wma", "wmv", "xlsb", "xlsm", "xlsx", "zip",
+    )
+)  # fmt: skip
+
+# -- fixed-length leading portion of zip local file header, per PKWARE APPNOTE 4.3.7 --
+_LOCAL_FILE_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\003\004"
+
+# -- general-purpose flag bit set when the sizes and CRC of a member follow its data --
+_DATA_DESCRIPTOR_FLAG = 0x08
+
+# -- parser for the XML of a package read without loading it, as by `pptx.extract` and
+# -- `pptx.opc.inspection`; custom element classes are of no use there and slow parsing --
+raw_xml_parser = etree.XMLParser(collect_ids=False, resolve_entities=False)
+
+_OVERRIDE = qn("ct:Override")
+_RELATIONSHIP = qn("pr:Relationship")
+
+# -- general-purpose flag bits giving the compression option of a deflated member, per PKWARE
+# -- APPNOTE 4.4.4, and their value when it was deflated at maximum compression --
+_DEFLATE_OPTION_FLAGS = 0x06
+_DEFLATE_MAXIMUM_FLAG = 0x02
+
 
 class PackageReader(Container[bytes]):
     """Provides access to package-parts of an OPC package with dict semantics.
@@ -37,6 +83,37 @@ class PackageReader(Container[bytes]):
         """Return bytes for part corresponding to `pack_uri`."""
         return self._blob_reader[pack_uri]
 
+    def close(self) -> None:
+        """Release any resources, like an open zip archive, held by this reader.
+
+        No blob can be read after the reader is closed.
+        """
+        self._blob_reader.close()
+
+    def file_blob(self, pack_uri: PackURI) -> FileBackedBlob | None:
+        """Return |FileBackedBlob| referring to content of member `pack_uri`, if it qualifies.
+
+        Only a member at least `FILE_BACKED_MIN_SIZE` bytes in a package read from a path
+        qualifies. Returns |None| otherwise, in which case the member should be read into memory.
+        """
+        return self._blob_reader.file_blob(pack_uri)
+
+    def is_package_file(self, pkg_file: str | IO[bytes]) -> bool:
+        """True when `pkg_file` is the package file this reader reads from.
+
+        Used to detect a save that overwrites the package it was loaded from.
+        """
+        return self._blob_reader.is_package_file(pkg_file)
+
+    def iter_member_sizes(self) -> Iterator[tuple[PackURI, int, int]]:
+        """Generate (pack_uri, compressed_size, size) triple for each member of the package.
+
+        Sizes are in bytes, `size` being that of the member content once decompressed. Sizes come
+        from the zip central-directory alone, so no member is read or decompressed. A member of a
+        package expanded into a directory is not compressed and has the same size both ways.
+        """
+        return self._blob_reader.iter_member_sizes()
+
     def rels_xml_for(self, partname: PackURI) -> bytes | None:
         """Return optional rels item XML for `partname`.
 
@@ -46,6 +123,15 @@ class PackageReader(Container[bytes]):
         blob_reader, uri = self._blob_reader, partname.rels_uri
         return blob_reader[uri] if uri in blob_reader else None
 
+    def stored_member(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Return (zip_info, stored_bytes) pair for the unchanged package member `pack_uri`.
+
+        `stored_bytes` is the member data exactly as stored in the zip archive, compressed when
+        the member is compressed. Returns |None| when no such member is available to be copied
+        verbatim, such as when the package is a directory or has changed since it was loaded.
+        """
+        return self._blob_reader.stored_member(pack_uri)
+
     @lazyproperty
     def _blob_reader(self) -> _PhysPkgReader:
         """|_PhysPkgReader| subtype providing read access to the package file."""
@@ -57,33 +143,108 @@ class PackageWriter:
 
     `pkg_file` can be either a path to a zip file (a string) or a file-like object. `pkg_rels` is
     the |_Relationships| object containing relationships for the package. `parts` is a sequence of
-    |Part| subtype instance to be written to the package.
+    |Part| subtype instance to be written to the package. The optional `source` is the
+    |PackageReader| for the package the parts were loaded from. `compression` is a
+    |CompressionPolicy| or the name of one of its profiles.
 
     Its single API classmethod is :meth:`write`. This class is not intended to be instantiated.
     """
 
-    def __init__(self, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]):
+    def __init__(
+        self,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        source: PackageReader | None = None,
+        workers: int = 1,
+        compression: str | CompressionPolicy = "default",
+    ):
         self._pkg_file = pkg_file
         self._pkg_rels = pkg_rels
         self._parts = parts
+        self._source = source
+        self._workers = workers
+        self._compression = (
+            CompressionPolicy.profile(compression) if isinstance(compression, str) else compression
+        )
 
     @classmethod
     def write(
-        cls, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]
+        cls,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        source: PackageReader | None = None,
+        workers: int = 1,
+        compression: str | CompressionPolicy = "default",
     ) -> None:
         """Write a physical package (.pptx file) to `pkg_file`.
 
         The serialized package contains `pkg_rels` and `parts`, a content-types stream based on
         the content type of each part, and a .rels file for each part that has relationships.
+
+        When `source` is provided, each part unchanged since it was loaded from that package is
+        copied from it in its stored (compressed) form rather than being compressed again.
+
+        When `workers` is greater than one, parts are compressed concurrently by that many
+        threads. Members are written in the same order either way.
+
+        `compression` determines how each member is compressed. It is either a
+        |CompressionPolicy| or the name of one of its profiles, like "fast".
         """
-        cls(pkg_file, pkg_rels, parts)._write()
+        cls(pkg_file, pkg_rels, parts, source, workers, compression)._write()
+
+    @classmethod
+    def iter_write(
+        cls,
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        source: PackageReader | None = None,
+        workers: int = 1,
+        compression: str | CompressionPolicy = "default",
+    ) -> Iterator[bytes]:
+        """Generate the bytes of a physical package (.pptx file) in chunks.
+
+        The package is the same one :meth:`write` would write for these arguments. A chunk is
+        generated as soon as each part has been written, so the first bytes are available long
+        before the package is complete and the whole package is never held in memory. Zip
+        members are written as they would be to a non-seekable stream; a member whose size is
+        not known until its content is written is followed by a data descriptor.
+        """
+        sink = _ChunkSink()
+        package_writer = cls(cast("IO[bytes]", sink), pkg_rels, parts, source, workers, compression)
+        for _ in package_writer._iter_write():
+            chunk = sink.take()
+            if chunk:
+                yield chunk
+        chunk = sink.take()
+        if chunk:
+            yield chunk
+
+    def _iter_write(self) -> Iterator[None]:
+        """Write physical package (.pptx file), yielding after each part is written."""
+        source = self._source
+        # -- a package file being overwritten cannot also be copied from --
+        if source is not None and source.is_package_file(self._pkg_file):
+            self._source = source = None
+        self._load_overwritten_file_blobs()
+
+        try:
+            with _PhysPkgWriter.factory(
+                self._pkg_file, self._workers, self._compression
+            ) as phys_writer:
+                self._write_content_types_stream(phys_writer)
+                self._write_pkg_rels(phys_writer)
+                yield
+                yield from self._iter_write_parts(phys_writer)
+        finally:
+            if source is not None:
+                source.close()
 
     def _write(self) -> None:
         """Write physical package (.pptx file)."""
-        with _PhysPkgWriter.factory(self._pkg_file) as phys_writer:
-            self._write_content_types_stream(phys_writer)
-            self._write_pkg_rels(phys_writer)
-            self._write_parts(phys_writer)
+        for _ in self._iter_write():
+            pass
 
     def _write_content_types_stream(self, phys_writer: _PhysPkgWriter) -> None:
         """Write `[Content_Types].xml` part to the physical package.
@@ -96,20 +257,279 @@ class PackageWriter:
             serialize_part_xml(_ContentTypesItem.xml_for(self._parts)),
         )
 
-    def _write_parts(self, phys_writer: _PhysPkgWriter) -> None:
-        """Write blob of each part in `parts` to the package.
+    def _iter_write_parts(self, phys_writer: _PhysPkgWriter) -> Iterator[None]:
+        """Write blob of each part in `parts` to the package, yielding after each one.
 
         A rels item for each part is also written when the part has relationships.
         """
         for part in self._parts:
-            phys_writer.write(part.partname, part.blob)
+            file_blob = part.file_blob
+            stored_member = None if file_blob is not None else self._stored_member_for(part)
+            if file_blob is not None:
+                phys_writer.write_file_blob(part.partname, file_blob)
+            elif stored_member is not None:
+                phys_writer.write_stored(part.partname, *stored_member)
+            else:
+                phys_writer.write(part.partname, part.blob)
             if part._rels:  # pyright: ignore[reportPrivateUsage]
                 phys_writer.write(part.partname.rels_uri, part.rels.xml)
+            yield
+
+    def _load_overwritten_file_blobs(self) -> None:
+        """Read into memory the content of each file-backed part stored in the save target.
+
+        Such a part is in a package being overwritten, and its content would be lost when the
+        target is truncated or replaced before that part is written.
+        """
+        pkg_file = self._pkg_file
+        for part in self._parts:
+            file_blob = part.file_blob
+            if file_blob is not None and file_blob.is_stored_in(pkg_file):
+                part.load_file_blob()
 
     def _write_pkg_rels(self, phys_writer: _PhysPkgWriter) -> None:
         """Write the XML rels item for `pkg_rels` ('/_rels/.rels') to the package."""
         phys_writer.write(PACKAGE_URI.rels_uri, self._pkg_rels.xml)
 
+    def _stored_member_for(self, part: Part) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Return optional (zip_info, stored_bytes) of source package member for `part`.
+
+        Returns |None| when `part` must be written from its blob, because it has changed since
+        loading, there is no source package to copy it from, or the source member is not
+        compressed the way the compression policy calls for.
+        """
+        source, source_partname = self._source, part.source_partname
+        if source is None or source_partname is None:
+            return None
+        stored_member = source.stored_member(source_partname)
+        if stored_member is None:
+            return None
+        if not self._compression.accepts_member(part.partname, stored_member[0]):
+            return None
+        return stored_member
+
+
+class CompressionPolicy:
+    """Determines how each member of a zip package is compressed when the package is saved.
+
+    Members are deflated at `level`, 1 (fastest) to 9 (smallest), or -1 for the zlib default
+    which is 6. A `level` of 0 stores every member without compression. A member having an
+    extension in `stored_exts`, like "jpg", is always stored without compression; this avoids
+    spending time compressing media that is already compressed, for little or no size gain.
+
+    A member of the source package of an unchanged part is copied as it is, without being
+    compressed again, when :meth:`accepts_member` finds it already compressed as called for.
+
+    The named profiles available from :meth:`profile` cover common cases.
+    """
+
+    def __init__(self, level: int = zlib.Z_DEFAULT_COMPRESSION, stored_exts: Iterable[str] = ()):
+        self._level = level
+        self._stored_exts = frozenset(ext.lower() for ext in stored_exts)
+
+    @classmethod
+    def profile(cls, name: str) -> CompressionPolicy:
+        """Return the |CompressionPolicy| named `name`.
+
+        The profiles are:
+
+        * "default" - deflate every member at the zlib default level, as PowerPoint does.
+        * "balanced" - store already-compressed media, deflate the rest at the default level.
+        * "fast" - store already-compressed media, deflate the rest at level 1.
+        * "smallest" - deflate every member at level 9.
+        * "stored" - store every member without compression.
+
+        Raises |ValueError| when `name` is not one of these.
+        """
+        if name == "default":
+            return cls()
+        if name == "balanced":
+            return cls(stored_exts=_PRECOMPRESSED_EXTS)
+        if name == "fast":
+            return cls(level=1, stored_exts=_PRECOMPRESSED_EXTS)
+        if name == "smallest":
+            return cls(level=9)
+        if name == "stored":
+            return cls(level=0)
+        raise ValueError("no compression profile named '%s'" % name)
+
+    def accepts_member(self, pack_uri: PackURI, zip_info: zipfile.ZipInfo) -> bool:
+        """True when the zip member `zip_info` is compressed as called for member `pack_uri`.
+
+        Such a member can be copied without compressing it again. A zip does not record the
+        deflate level of a member, only the option flags some zip writers, this one included, set
+        from it, so a deflated member is accepted at any level, except by a policy deflating at
+        level 8 or 9, which only accepts a member flagged as compressed at maximum level. Members
+        deflated at a lower level are compressed again, so every member of the package ends up at
+        least as small as the policy calls for.
+        """
+        compress_type, level = self.compression_for(pack_uri)
+        if zip_info.compress_type != compress_type:
+            return False
+        if compress_type == zipfile.ZIP_DEFLATED and level >= 8:
+            return zip_info.flag_bits & _DEFLATE_OPTION_FLAGS == _DEFLATE_MAXIMUM_FLAG
+        return True
+
+    def compression_for(self, pack_uri: PackURI) -> tuple[int, int]:
+        """Return (compress_type, level) pair for the member having `pack_uri`.
+
+        `compress_type` is `zipfile.ZIP_STORED` or `zipfile.ZIP_DEFLATED`. `level` is the deflate
+        level and is only meaningful for a deflated member.
+        """
+        if self._level == 0 or pack_uri.ext.lower() in self._stored_exts:
+            return zipfile.ZIP_STORED, 0
+        return zipfile.ZIP_DEFLATED, self._level
+
+
+class FileBackedBlob:
+    """Content of a part that stays in a file until it is needed rather than in memory.
+
+    A large media file, like a video, is represented this way so its bytes are never all held in
+    memory at once; the package writer streams it from its file in chunks. The file must remain
+    in place and unchanged until the presentation is saved.
+    """
+
+    @property
+    def size(self) -> int:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.size`"
+        )
+
+    def is_stored_in(self, pkg_file: str | IO[bytes]) -> bool:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.is_stored_in()`"
+        )
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Generate the bytes of this content in chunks of a modest size."""
+        with self.open() as f:
+            while True:
+                chunk = f.read(_CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+    def open(self) -> IO[bytes]:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.open()`"
+        )
+
+    def read(self) -> bytes:
+        """All the bytes of this content, read into memory."""
+        return b"".join(self.iter_chunks())
+
+    @lazyproperty
+    def sha1(self) -> str:
+        """SHA1 hash digest of this content, computed without reading it all into memory."""
+        sha1 = hashlib.sha1()
+        for chunk in self.iter_chunks():
+            sha1.update(chunk)
+        return sha1.hexdigest()
+
+
+class PathBlob(FileBackedBlob):
+    """Content of the file at `path`."""
+
+    def __init__(self, path: str):
+        self._path = os.path.abspath(path)
+
+    def is_stored_in(self, pkg_file: str | IO[bytes]) -> bool:
+        """True when this file is `pkg_file` or is inside the directory `pkg_file`."""
+        if not isinstance(pkg_file, str) or not os.path.exists(pkg_file):
+            return False
+        path, pkg_path = os.path.realpath(self._path), os.path.realpath(pkg_file)
+        return path == pkg_path or path.startswith(os.path.join(pkg_path, ""))
+
+    def open(self) -> IO[bytes]:
+        """Return the file, open for reading bytes."""
+        return open(self._path, "rb")
+
+    @property
+    def size(self) -> int:
+        """Size of this content in bytes."""
+        return os.path.getsize(self._path)
+
+
+class ZipMemberBlob(FileBackedBlob):
+    """Content of the member described by `zip_info` in the zip archive at path `pkg_file`.
+
+    The member is checked each time it is opened; |ValueError| is raised when it has changed
+    since `zip_info` was read.
+    """
+
+    def __init__(self, pkg_file: str, zip_info: zipfile.ZipInfo):
+        self._pkg_file = pkg_file
+        self._zip_info = zip_info
+
+    def is_stored_in(self, pkg_file: str | IO[bytes]) -> bool:
+        """True when `pkg_file` is the path of the zip archive holding this member."""
+        if not isinstance(pkg_file, str) or not os.path.exists(pkg_file):
+            return False
+        return os.path.samefile(pkg_file, self._pkg_file)
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Generate the bytes of this member in chunks, decompressing its stored bytes as it goes.
+
+        Raises |ValueError| when the decompressed content does not match its CRC.
+        """
+        zip_info = self._zip_info
+        if zip_info.compress_type not in _COPYABLE_COMPRESS_TYPES:
+            yield from super(ZipMemberBlob, self).iter_chunks()
+            return
+        decompressor = (
+            zlib.decompressobj(-15) if zip_info.compress_type == zipfile.ZIP_DEFLATED else None
+        )
+        crc = 0
+        for stored_chunk in self.iter_stored_chunks():
+            chunk = stored_chunk if decompressor is None else decompressor.decompress(stored_chunk)
+            crc = zlib.crc32(chunk, crc)
+            yield chunk
+        if decompressor is not None:
+            chunk = decompressor.flush()
+            crc = zlib.crc32(chunk, crc)
+            yield chunk
+        if crc != zip_info.CRC:
+            raise ValueError("bad CRC for member '%s'" % zip_info.filename)
+
+    def iter_stored_chunks(self) -> Iterator[bytes]:
+        """Generate the bytes of this member as stored in the archive, compressed or not."""
+        with open(self._pkg_file, "rb") as f:
+            _seek_checked_stored_data(f, self._zip_info)
+            remaining = self._zip_info.compress_size
+            while remaining > 0:
+                chunk = f.read(min(remaining, _CHUNK_SIZE))
+                if not chunk:
+                    raise ValueError("member '%s' is truncated" % self._zip_info.filename)
+                remaining -= len(chunk)
+                yield chunk
+
+    def open(self) -> IO[bytes]:
+        """Return the member content, open for reading (decompressed) bytes.
+
+        Unlike `.iter_chunks()`, this reads the zip central-directory, so is for access that needs
+        a seekable file, like Pillow's reading of an image.
+        """
+        zipf = zipfile.ZipFile(self._pkg_file)
+        try:
+            _check_member(zipf, self._zip_info)
+            # -- the member file keeps the archive file open until the member file is closed --
+            return zipf.open(self._zip_info)
+        finally:
+            zipf.close()
+
+    @property
+    def size(self) -> int:
+        """Size of this content in bytes, uncompressed."""
+        return self._zip_info.file_size
+
+    @property
+    def zip_info(self) -> zipfile.ZipInfo:
+        """`ZipInfo` describing this member as it was when the package was opened."""
+        return self._zip_info
+
 
 class _PhysPkgReader(Container[PackURI]):
     """Base class for physical package reader objects."""
@@ -126,6 +546,36 @@ class _PhysPkgReader(Container[PackURI]):
             f"`{type(self).__name__}` must implement `.__contains__()`"
         )
 
+    def close(self) -> None:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.close()`"
+        )
+
+    def file_blob(self, pack_uri: PackURI) -> FileBackedBlob | None:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.file_blob()`"
+        )
+
+    def is_package_file(self, pkg_file: str | IO[bytes]) -> bool:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.is_package_file()`"
+        )
+
+    def iter_member_sizes(self) -> Iterator[tuple[PackURI, int, int]]:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.iter_member_sizes()`"
+        )
+
+    def stored_member(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.stored_member()`"
+        )
+
     @classmethod
     def factory(cls, pkg_file: str | IO[bytes]) -> _PhysPkgReader:
         """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`."""
@@ -168,44 +618,172 @@ class _DirPkgReader(_PhysPkgReader):
         except IOError:
             raise KeyError("no member '%s' in package" % pack_uri)
 
+    def close(self) -> None:
+        """No-op, a directory package holds no open resources between reads."""
+
+    def file_blob(self, pack_uri: PackURI) -> FileBackedBlob | None:
+        """Return |PathBlob| for file of `pack_uri` when it is at least `FILE_BACKED_MIN_SIZE`."""
+        path = os.path.join(self._path, pack_uri.membername)
+        if not os.path.isfile(path) or os.path.getsize(path) < FILE_BACKED_MIN_SIZE:
+            return None
+        return PathBlob(path)
+
+    def is_package_file(self, pkg_file: str | IO[bytes]) -> bool:
+        """True when `pkg_file` is the path of the directory this package is expanded into."""
+        if not isinstance(pkg_file, str) or not os.path.isdir(pkg_file):
+            return False
+        return os.path.samefile(pkg_file, self._path)
+
+    def iter_member_sizes(self) -> Iterator[tuple[PackURI, int, int]]:
+        """Generate (pack_uri, size, size) triple for each file in the package directory."""
+        for dirpath, _, filenames in os.walk(self._path):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                membername = os.path.relpath(path, self._path).replace(os.sep, "/")
+                size = os.path.getsize(path)
+                yield PackURI("/%s" % membername), size, size
+
+    def stored_member(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Always |None|, a directory package has no stored (compressed) members to copy."""
+        return None
+
 
 class _ZipPkgReader(_PhysPkgReader):
-    """Implements |PhysPkgReader| interface for a zip-file OPC package."""
+    """Implements |PhysPkgReader| interface for a zip-file OPC package.
+
+    Only the zip central-directory is read when the package is opened. A member is decompressed
+    only when its blob is requested, so large media parts that are never accessed cost nothing
+    beyond their directory entry.
+    """
 
     def __init__(self, pkg_file: str | IO[bytes]):
         self._pkg_file = pkg_file
 
     def __contains__(self, pack_uri: object) -> bool:
         """Return True when part identified by `pack_uri` is present in zip archive."""
-        return pack_uri in self._blobs
+        return pack_uri in self._zip_infos
 
     def __getitem__(self, pack_uri: PackURI) -> bytes:
         """Return bytes for part corresponding to `pack_uri`.
 
         Raises |KeyError| if no matching member is present in zip archive.
         """
-        if pack_uri not in self._blobs:
+        if pack_uri not in self._zip_infos:
             raise KeyError("no member '%s' in package" % pack_uri)
-        return self._blobs[pack_uri]
+        return self._zipf.read(self._zip_infos[pack_uri])
+
+    def close(self) -> None:
+        """Close the zip archive, releasing the file-handle it holds when opened from a path.
+
+        A file-like `pkg_file` provided by the caller is not closed. Closing an archive that was
+        never opened is a no-op.
+        """
+        zipf = self.__dict__.pop("_zipf", None)
+        if zipf is not None:
+            zipf.close()
+
+    def file_blob(self, pack_uri: PackURI) -> FileBackedBlob | None:
+        """Return |ZipMemberBlob| for member `pack_uri` when it qualifies.
+
+        A member qualifies when it is at least `FILE_BACKED_MIN_SIZE` bytes uncompressed and the
+        package was opened from a path. A smaller member is read into memory, so the package file
+        can be moved or replaced once it is loaded. The lifetime of a file-like object belongs to
+        the caller, so a member is not left in one.
+        """
+        zip_info = self._zip_infos.get(pack_uri)
+        if not isinstance(self._pkg_file, str) or zip_info is None:
+            return None
+        if zip_info.file_size < FILE_BACKED_MIN_SIZE:
+            return None
+        return ZipMemberBlob(self._pkg_file, zip_info)
+
+    def is_package_file(self, pkg_file: str | IO[bytes]) -> bool:
+        """True when `pkg_file` is the path or file-like object this package was read from."""
+        if isinstance(self._pkg_file, str) and isinstance(pkg_file, str):
+            return os.path.exists(pkg_file) and os.path.samefile(self._pkg_file, pkg_file)
+        return pkg_file is self._pkg_file
+
+    def iter_member_sizes(self) -> Iterator[tuple[PackURI, int, int]]:
+        """Generate (pack_uri, compressed_size, size) triple for each member of the zip archive."""
+        for pack_uri, zip_info in self._zip_infos.items():
+            # -- some zip tools add an entry for each directory, which is not a package member --
+            if zip_info.is_dir():
+                continue
+            yield pack_uri, zip_info.compress_size, zip_info.file_size
+
+    def stored_member(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Return (zip_info, stored_bytes) pair for the member `pack_uri` as it was loaded.
+
+        The zip archive is reopened when it has been closed. Returns |None| when the member can't
+        be copied verbatim, such as when it is compressed with a method other than deflate, or
+        when the package file is no longer readable or its member has changed since loading.
+        """
+        zip_info = self._zip_infos.get(pack_uri)
+        if zip_info is None or zip_info.compress_type not in _COPYABLE_COMPRESS_TYPES:
+            return None
+        try:
+            return zip_info, self._read_stored(zip_info)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+
+    def _read_stored(self, zip_info: zipfile.ZipInfo) -> bytes:
+        """Return the stored bytes of the member described by `zip_info`.
+
+        Raises |ValueError| when the archive member no longer matches `zip_info`.
+        """
+        zipf = self._zipf
+        _check_member(zipf, zip_info)
+        fp = cast(IO[bytes], zipf.fp)
+        _seek_stored_data(fp, zip_info)
+        return fp.read(zip_info.compress_size)
+
+    @lazyproperty
+    def _zip_infos(self) -> dict[PackURI, zipfile.ZipInfo]:
+        """dict mapping partname to zip-info of the archive member holding that part.
+
+        Built from the zip central-directory only; no member is decompressed.
+        """
+        return {PackURI("/%s" % info.filename): info for info in self._zipf.infolist()}
 
     @lazyproperty
-    def _blobs(self) -> dict[PackURI, bytes]:
-        """dict mapping partname to package part binaries."""
-        with zipfile.ZipFile(self._pkg_file, "r") as z:
-            return {PackURI("/%s" % name): z.read(name) for name in z.namelist()}
+    def _zipf(self) -> zipfile.ZipFile:
+        """`ZipFile` instance open for reading, held open until `.close()` is called.
+
+        The archive is opened again on next access after it has been closed.
+        """
+        return zipfile.ZipFile(self._pkg_file, "r")
 
 
 class _PhysPkgWriter:
     """Base class for physical package writer objects."""
 
     @classmethod
-    def factory(cls, pkg_file: str | IO[bytes]) -> _ZipPkgWriter:
+    def factory(
+        cls,
+        pkg_file: str | IO[bytes],
+        workers: int = 1,
+        compression: CompressionPolicy | None = None,
+    ) -> _PhysPkgWriter:
         """Return |_PhysPkgWriter| subtype instance appropriage for `pkg_file`.
 
-        Currently the only subtype is `_ZipPkgWriter`, but a `_DirPkgWriter` could be implemented
-        or even a `_StreamPkgWriter`.
+        A `_DirPkgWriter` is returned when `pkg_file` is the path of an existing directory,
+        otherwise a `_ZipPkgWriter`. `workers` is the number of threads used to compress parts
+        and `compression` determines how each of them is compressed; neither applies to an
+        expanded package.
         """
-        return _ZipPkgWriter(pkg_file)
+        if isinstance(pkg_file, str) and os.path.isdir(pkg_file):
+            return _DirPkgWriter(pkg_file)
+        return _ZipPkgWriter(pkg_file, workers, compression)
+
+    def __enter__(self) -> _PhysPkgWriter:
+        """Enable use as a context-manager."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None = None, *exc: Any) -> None:
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.__exit__()`"
+        )
 
     def write(self, pack_uri: PackURI, blob: bytes) -> None:
         """Write `blob` to package with membername corresponding to `pack_uri`."""
@@ -213,36 +791,309 @@ class _PhysPkgWriter:
             f"`{type(self).__name__}` must implement `.write()`"
         )
 
+    def write_file_blob(self, pack_uri: PackURI, file_blob: FileBackedBlob) -> None:
+        """Write content of `file_blob` to package as `pack_uri`, streaming it in chunks."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.write_file_blob()`"
+        )
+
+    def write_stored(self, pack_uri: PackURI, zip_info: zipfile.ZipInfo, stored: bytes) -> None:
+        """Write `stored` member bytes described by `zip_info` to package as `pack_uri`."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.write_stored()`"
+        )
+
+
+class _DirPkgWriter(_PhysPkgWriter):
+    """Implements |_PhysPkgWriter| interface for an OPC package expanded into a directory.
+
+    `path` is the path to an existing directory. Each member is written without compression to
+    a file at its membername relative to that directory, the layout |_DirPkgReader| reads.
+    Subdirectories are created as needed.
+
+    When the directory already holds a package, like one saved there earlier, each member of that
+    package not written again is removed when the writer is exited without error, along with any
+    subdirectory that leaves empty. So a part dropped since the earlier save does not remain.
+    Files that are not a member of that package are never removed. Nothing is removed before
+    exit, because the package being written may still be reading unchanged parts from the
+    directory.
+    """
+
+    def __init__(self, path: str):
+        self._path = os.path.abspath(path)
+        self._previous_paths: set[str] = set()
+        self._written_paths: set[str] = set()
+
+    def __enter__(self) -> _DirPkgWriter:
+        """Enable use as a context-manager, noting the members of the package already present."""
+        self._previous_paths = {
+            self._normalized_path(pack_uri) for pack_uri in self._previous_member_uris()
+        }
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None = None, *exc: Any) -> None:
+        """Remove the members of the previous package not written again, unless writing failed.
+
+        Each member file is closed as soon as it is written.
+        """
+        if exc_type is None:
+            self._remove_stale_members()
+
+    def write(self, pack_uri: PackURI, blob: bytes) -> None:
+        """Write `blob` to the file corresponding to `pack_uri` in the package directory."""
+        with open(self._member_path(pack_uri), "wb") as f:
+            f.write(blob)
+
+    def write_file_blob(self, pack_uri: PackURI, file_blob: FileBackedBlob) -> None:
+        """Write content of `file_blob` to the file corresponding to `pack_uri`, in chunks."""
+        with open(self._member_path(pack_uri), "wb") as f:
+            for chunk in file_blob.iter_chunks():
+                f.write(chunk)
+
+    def write_stored(self, pack_uri: PackURI, zip_info: zipfile.ZipInfo, stored: bytes) -> None:
+        """Write content of `stored` zip member described by `zip_info` as `pack_uri`.
+
+        The member is decompressed, an expanded package has no compressed members.
+        """
+        if zip_info.compress_type == zipfile.ZIP_DEFLATED:
+            stored = zlib.decompress(stored, -15)
+        self.write(pack_uri, stored)
+
+    def _member_path(self, pack_uri: PackURI) -> str:
+        """Path of the file for member `pack_uri`, its directory created when not present."""
+        path = os.path.join(self._path, pack_uri.membername)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._written_paths.add(self._normalized_path(pack_uri))
+        return path
+
+    def _normalized_path(self, pack_uri: PackURI) -> str:
+        """Path of the file for member `pack_uri`, normalized for comparison with other paths."""
+        return os.path.normcase(os.path.join(self._path, pack_uri.membername))
+
+    def _previous_member_uris(self) -> set[PackURI]:
+        """PackURI of each member of the package already in the directory.
+
+        These are `[Content_Types].xml`, each part it names, each part reachable by relationship
+        from the package, and the rels item of each of those. The set is empty when the directory
+        holds no package, or one whose content-types or rels XML cannot be parsed.
+        """
+        package_reader = PackageReader(self._path)
+        if CONTENT_TYPES_URI not in package_reader:
+            return set()
+        try:
+            types = etree.fromstring(package_reader[CONTENT_TYPES_URI], raw_xml_parser)
+            pending = [PACKAGE_URI] + [
+                PackURI(partname)
+                for partname in (override.get("PartName", "") for override in types.iter(_OVERRIDE))
+                if partname.startswith("/")
+            ]
+            member_uris = {CONTENT_TYPES_URI}
+            visited: set[PackURI] = set()
+            while pending:
+                partname = pending.pop()
+                if partname in visited:
+                    continue
+                visited.add(partname)
+                if partname != PACKAGE_URI:
+                    member_uris.add(partname)
+                member_uris.add(partname.rels_uri)
+                pending.extend(
+                    target for _, target in internal_rels(package_reader, partname).values()
+                )
+        except etree.XMLSyntaxError:
+            return set()
+        finally:
+            package_reader.close()
+        return member_uris
+
+    def _remove_stale_members(self) -> None:
+        """Remove each file of the previous package not written again, and emptied directories."""
+        root = os.path.normcase(self._path)
+        for path in self._previous_paths - self._written_paths:
+            if not os.path.isfile(path):
+                continue
+            os.remove(path)
+            dirpath = os.path.dirname(path)
+            while dirpath != root and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+                dirpath = os.path.dirname(dirpath)
+
 
 class _ZipPkgWriter(_PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package.
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    When `workers` is greater than one, member content is deflated on a pool of that many threads
+    (zlib releases the GIL while compressing) and the compressed members are written to the zip
+    in the order they were submitted. At most `2 * workers` members are held in memory waiting
+    to be written. Each member is compressed as `compression` calls for, by default deflated at
+    the zlib default level.
+    """
+
+    def __init__(
+        self,
+        pkg_file: str | IO[bytes],
+        workers: int = 1,
+        compression: CompressionPolicy | None = None,
+    ):
         self._pkg_file = pkg_file
+        self._workers = workers
+        self._compression = CompressionPolicy() if compression is None else compression
+        self._executor = ThreadPoolExecutor(workers) if workers > 1 else None
+        self._pending: deque[Future[tuple[zipfile.ZipInfo, bytes]]] = deque()
 
     def __enter__(self) -> _ZipPkgWriter:
         """Enable use as a context-manager. Opening zip for writing happens here."""
         return self
 
-    def __exit__(self, *exc: list[Any]) -> None:
+    def __exit__(self, exc_type: type[BaseException] | None = None, *exc: Any) -> None:
         """Close the zip archive on exit from context.
 
         Closing flushes any pending physical writes and releasing any resources it's using.
+        Members still being compressed are written first unless the context is exiting on an
+        exception.
         """
-        self._zipf.close()
+        try:
+            if exc_type is None:
+                self._drain(0)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self._zipf.close()
 
     def write(self, pack_uri: PackURI, blob: bytes) -> None:
         """Write `blob` to zip package with membername corresponding to `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+        compress_type, level = self._compression.compression_for(pack_uri)
+        zinfo = _new_zip_info(pack_uri.membername)
+        if self._executor is None:
+            if compress_type == zipfile.ZIP_STORED:
+                self._zipf.write_stored(*_store(zinfo, blob))
+            else:
+                self._zipf.write_stored(*_deflate(zinfo, blob, level))
+            return
+        if compress_type == zipfile.ZIP_STORED:
+            future: Future[tuple[zipfile.ZipInfo, bytes]] = Future()
+            future.set_result(_store(zinfo, blob))
+            self._enqueue(future)
+            return
+        self._enqueue(self._executor.submit(_deflate, zinfo, blob, level))
+
+    def write_file_blob(self, pack_uri: PackURI, file_blob: FileBackedBlob) -> None:
+        """Write content of `file_blob` to zip package as `pack_uri`, streaming it in chunks.
+
+        The content is compressed as the compression policy calls for, except that a zip member
+        already compressed that way is copied in its stored form without recompressing it.
+        Members still being compressed on worker threads are written first.
+        """
+        self._drain(0)
+        compress_type, level = self._compression.compression_for(pack_uri)
+
+        if isinstance(file_blob, ZipMemberBlob) and self._compression.accepts_member(
+            pack_uri, file_blob.zip_info
+        ):
+            zinfo = _copied_zip_info(pack_uri.membername, file_blob.zip_info)
+            self._zipf.write_stored(zinfo, file_blob.iter_stored_chunks())
+            return
+
+        zinfo = _new_zip_info(pack_uri.membername)
+        zinfo.compress_type = compress_type
+        # -- `ZipFile` decides on zip64 extensions for a member from its expected size --
+        zinfo.file_size = file_blob.size
+        # -- `ZipInfo` has no public interface for the deflate level of a member --
+        cast(Any, zinfo)._compresslevel = level
+        with self._zipf.open(zinfo, "w") as f:
+            # -- opening clears the flags; the local header is written again from `zinfo` on
+            # -- close, except when a data descriptor follows the member, as in a stream --
+            if not zinfo.flag_bits & _DATA_DESCRIPTOR_FLAG:
+                zinfo.flag_bits |= _deflate_option_flags(level)
+            for chunk in file_blob.iter_chunks():
+                f.write(chunk)
+
+    def write_stored(self, pack_uri: PackURI, zip_info: zipfile.ZipInfo, stored: bytes) -> None:
+        """Write `stored` member bytes described by `zip_info` to package as `pack_uri`.
+
+        `stored` is written as-is, already compressed as indicated by `zip_info`, avoiding the
+        cost of compressing that content again.
+        """
+        zinfo = _copied_zip_info(pack_uri.membername, zip_info)
+        if self._executor is None:
+            self._zipf.write_stored(zinfo, stored)
+            return
+        # -- queued behind any members still being compressed so member order is preserved --
+        future: Future[tuple[zipfile.ZipInfo, bytes]] = Future()
+        future.set_result((zinfo, stored))
+        self._enqueue(future)
+
+    def _drain(self, limit: int) -> None:
+        """Write compressed members, oldest first, until no more than `limit` remain pending."""
+        pending = self._pending
+        while len(pending) > limit:
+            zinfo, stored = pending.popleft().result()
+            self._zipf.write_stored(zinfo, stored)
+
+    def _enqueue(self, future: Future[tuple[zipfile.ZipInfo, bytes]]) -> None:
+        """Add `future` member to those waiting to be written, writing any that are due."""
+        self._pending.append(future)
+        self._drain(2 * self._workers)
 
     @lazyproperty
-    def _zipf(self) -> zipfile.ZipFile:
+    def _zipf(self) -> _ZipFile:
         """`ZipFile` instance open for writing."""
-        return zipfile.ZipFile(
+        return _ZipFile(
             self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False
         )
 
 
+class _ZipFile(zipfile.ZipFile):
+    """`zipfile.ZipFile` extended to write a member that is already compressed."""
+
+    def write_stored(self, zinfo: zipfile.ZipInfo, stored: bytes | Iterable[bytes]) -> None:
+        """Write member described by `zinfo` having `stored` as its (compressed) data.
+
+        `stored` is either bytes or an iterable of byte chunks, allowing a large member to be
+        copied without holding it all in memory. `zinfo` must have its compress-type, CRC, and
+        sizes set to describe `stored`. `ZipFile` has no public interface for this, so this
+        follows what its `.mkdir()` method does to write a member having no data.
+        """
+        # -- the `ZipFile` internals used here are not described by its type stubs --
+        zipf: Any = self
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+        with zipf._lock:
+            if zipf._seekable:
+                zipf.fp.seek(zipf.start_dir)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf._writecheck(zinfo)
+            zipf._didModify = True
+            zipf.fp.write(zinfo.FileHeader(zip64))
+            for chunk in (stored,) if isinstance(stored, bytes) else stored:
+                zipf.fp.write(chunk)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.start_dir = zipf.fp.tell()
+
+
+class _ChunkSink:
+    """Write-only, non-seekable stream that accumulates bytes written to it as chunks.
+
+    Serves as the "file" a package is written to when it is generated in chunks.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def flush(self) -> None:
+        """Satisfy the stream interface; bytes are held until taken."""
+
+    def take(self) -> bytes:
+        """Return all bytes written since the last call, removing them from this sink."""
+        chunks, self._chunks = self._chunks, []
+        return b"".join(chunks)
+
+    def write(self, b: bytes) -> int:
+        """Append `b` to the bytes waiting to be taken."""
+        self._chunks.append(bytes(b))
+        return len(b)
+
+
 class _ContentTypesItem:
     """Composes content-types "part" ([Content_Types].xml) for a collection of parts."""
 
@@ -294,3 +1145,147 @@ class _ContentTypesItem:
                 overrides[partname] = content_type
 
         return defaults, overrides
+
+
+def internal_rels(
+    package_reader: PackageReader, partname: PackURI
+) -> dict[str, tuple[str, PackURI]]:
+    """dict mapping rId to (reltype, target-partname) for each internal relationship of a part.
+
+    Read straight from the rels item of `partname` in `package_reader`, without loading the
+    package. `partname` is |PACKAGE_URI| for the package relationships.
+    """
+    rels_xml = package_reader.rels_xml_for(partname)
+    if rels_xml is None:
+        return {}
+    baseURI = partname.baseURI
+    return {
+        rel.get("Id", ""): (
+            rel.get("Type", ""),
+            PackURI.from_rel_ref(baseURI, rel.get("Target", "")),
+        )
+        for rel in etree.fromstring(rels_xml, raw_xml_parser).iterchildren(_RELATIONSHIP)
+        if rel.get("TargetMode", RTM.INTERNAL) == RTM.INTERNAL
+    }
+
+
+def _check_member(zipf: zipfile.ZipFile, zip_info: zipfile.ZipInfo) -> None:
+    """Raise |ValueError| when member of `zipf` named in `zip_info` differs from `zip_info`."""
+    current = zipf.getinfo(zip_info.filename)
+    if _member_signature(current) != _member_signature(zip_info):
+        raise ValueError("member '%s' changed since package was loaded" % zip_info.filename)
+
+
+def _copied_zip_info(membername: str, zip_info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Return `ZipInfo` for member `membername` copied in the stored form described by `zip_info`.
+
+    The compression option flags of `zip_info` are kept along with its compress-type, CRC, and
+    sizes, so a copy of a member deflated at maximum level is still known to be.
+    """
+    zinfo = _new_zip_info(membername)
+    zinfo.compress_type = zip_info.compress_type
+    zinfo.flag_bits |= zip_info.flag_bits & _DEFLATE_OPTION_FLAGS
+    zinfo.CRC = zip_info.CRC
+    zinfo.compress_size = zip_info.compress_size
+    zinfo.file_size = zip_info.file_size
+    return zinfo
+
+
+def _deflate(
+    zinfo: zipfile.ZipInfo, blob: bytes, level: int = zlib.Z_DEFAULT_COMPRESSION
+) -> tuple[zipfile.ZipInfo, bytes]:
+    """Return (`zinfo`, compressed) pair after deflating `blob` and updating `zinfo` to suit.
+
+    Compresses the same way `ZipFile` does for a `ZIP_DEFLATED` member at `level`. Safe to call
+    from a worker thread.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(blob) + compressor.flush()
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.flag_bits |= _deflate_option_flags(level)
+    zinfo.CRC = zlib.crc32(blob)
+    zinfo.compress_size = len(compressed)
+    zinfo.file_size = len(blob)
+    return zinfo, compressed
+
+
+def _deflate_option_flags(level: int) -> int:
+    """General-purpose flag bits recording the compression option of a member deflated at `level`.
+
+    Only maximum compression, level 8 or 9, is flagged; that is what
+    :meth:`CompressionPolicy.accepts_member` looks for. Other levels have no flag set.
+    """
+    return _DEFLATE_MAXIMUM_FLAG if level >= 8 else 0
+
+
+def _member_signature(zip_info: zipfile.ZipInfo) -> tuple[int, int, int, int, int]:
+    """Return tuple of `zip_info` fields that identify the stored content of a zip member."""
+    return (
+        zip_info.header_offset,
+        zip_info.compress_type,
+        zip_info.CRC,
+        zip_info.compress_size,
+        zip_info.file_size,
+    )
+
+
+def _seek_stored_data(fp: IO[bytes], zip_info: zipfile.ZipInfo) -> None:
+    """Position `fp` at the start of the stored data of the zip member described by `zip_info`.
+
+    Raises |ValueError| when no local file header is found where `zip_info` locates it.
+    """
+    fp.seek(zip_info.header_offset)
+    fheader = _LOCAL_FILE_HEADER.unpack(fp.read(_LOCAL_FILE_HEADER.size))
+    if fheader[0] != _LOCAL_FILE_HEADER_SIGNATURE:
+        raise ValueError("bad local file header for member '%s'" % zip_info.filename)
+    # -- skip variable-length filename and extra-field that follow fixed-length header --
+    fp.seek(fheader[10] + fheader[11], os.SEEK_CUR)
+
+
+def _seek_checked_stored_data(fp: IO[bytes], zip_info: zipfile.ZipInfo) -> None:
+    """Position `fp` at the stored data of the zip member `zip_info`, checking it is unchanged.
+
+    The local file header of the member is compared with `zip_info`, which avoids reading the
+    whole central-directory of the archive for each member. The central-directory is only read
+    when the local header does not record the sizes and CRC of the member, as when they are in a
+    data descriptor or zip64 extra field. Raises |ValueError| when the member has changed since
+    `zip_info` was read.
+    """
+    fp.seek(zip_info.header_offset)
+    fheader = _LOCAL_FILE_HEADER.unpack(fp.read(_LOCAL_FILE_HEADER.size))
+    if fheader[0] != _LOCAL_FILE_HEADER_SIGNATURE:
+        raise ValueError("member '%s' changed since package was loaded" % zip_info.filename)
+    flags, compress_type, crc, compress_size, file_size = (
+        fheader[3],
+        fheader[4],
+        fheader[7],
+        fheader[8],
+        fheader[9],
+    )
+    if flags & _DATA_DESCRIPTOR_FLAG or 0xFFFFFFFF in (compress_size, file_size):
+        fp.seek(0)
+        with zipfile.ZipFile(fp) as zipf:
+            _check_member(zipf, zip_info)
+    elif (compress_type, crc, compress_size, file_size) != (
+        zip_info.compress_type,
+        zip_info.CRC,
+        zip_info.compress_size,
+        zip_info.file_size,
+    ):
+        raise ValueError("member '%s' changed since package was loaded" % zip_info.filename)
+    _seek_stored_data(fp, zip_info)
+
+
+def _store(zinfo: zipfile.ZipInfo, blob: bytes) -> tuple[zipfile.ZipInfo, bytes]:
+    """Return (`zinfo`, `blob`) pair after updating `zinfo` to describe uncompressed `blob`."""
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.CRC = zlib.crc32(blob)
+    zinfo.compress_size = zinfo.file_size = len(blob)
+    return zinfo, blob
+
+
+def _new_zip_info(membername: str) -> zipfile.ZipInfo:
+    """Return `ZipInfo` for a new member named `membername`, stamped with the current time."""
+    zinfo = zipfile.ZipInfo(membername, date_time=time.localtime(time.time())[:6])
+    zinfo.external_attr = 0o600 << 16
+    return zinfo
@@ -5,10 +5,13 @@ Also makes available a handful of functions that wrap its typical uses.
 
 from __future__ import annotations
 
+import copy
 import os
+import re
 from typing import TYPE_CHECKING, Type
 
 from lxml import etree
+from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
 
 from pptx.oxml.ns import NamespacePrefixedTag
 
@@ -36,6 +39,91 @@ def parse_xml(xml: str | bytes):
     return etree.fromstring(xml, oxml_parser)
 
 
+def new_from_prototype(xml: str, **values: str | int):
+    """Return a new element tree like the one `xml` parses to, having its `$name` slots filled.
+
+    `xml` is a fixed template, parsed only the first time it is seen. The element it produces is
+    kept as a prototype and each call returns a deep copy of it, which avoids the XML parser
+    entirely. An attribute value or element text of the form `$name` in `xml` is a slot, assigned
+    `values["name"]` on the copy; a |str| is used as-is and an |int| is written in decimal. Since
+    slot values are assigned rather than formatted into the XML, they need no escaping.
+    """
+    prototype = _prototypes.get(xml)
+    if prototype is None:
+        prototype = _prototypes[xml] = _Prototype(xml)
+    return prototype.new(values)
+
+
+class _Prototype:
+    """Element tree parsed from an XML template, copied to produce each new element."""
+
+    _slot_pattern = re.compile(r"\$([A-Za-z_]\w*)$")
+
+    def __init__(self, xml: str):
+        self._element = parse_xml(xml)
+        self._steps = self._slot_steps(self._element)
+
+    def new(self, values: dict[str, str | int]):
+        """Return a deep copy of this prototype having each slot assigned its item in `values`."""
+        # -- lxml copies the whole subtree on a shallow copy too, without the `copy.deepcopy()`
+        # -- memo overhead
+        element = copy.copy(self._element)
+        # -- each step reaches an element from one reached before it, so each element on the way
+        # -- to a slot is visited only once
+        reached: list[_Element] = []
+        for parent_step, idx, element_slots in self._steps:
+            target = reached[parent_step][idx] if parent_step >= 0 else element
+            reached.append(target)
+            for attr_name, key in element_slots:
+                value = values[key]
+                str_value = value if isinstance(value, str) else "%d" % value
+                if attr_name is None:
+                    target.text = str_value
+                else:
+                    # -- the copy is a new tree no index can be tracking yet, so skip the hooks
+                    # -- `BaseOxmlElement.set()` runs to keep those current
+                    _Element.set(target, attr_name, str_value)
+        return element
+
+    @classmethod
+    def _slot_steps(
+        cls, root: _Element
+    ) -> tuple[tuple[int, int, tuple[tuple[str | None, str], ...]], ...]:
+        """Return the steps that reach each element in `root` having a slot or such a descendant.
+
+        Each step is a (parent_step, idx, element_slots) triple. The element it reaches is child
+        `idx` of the one reached by the step at offset `parent_step`, except for the first step,
+        which reaches `root` itself. `element_slots` is a sequence of (attr_name, key) pairs,
+        `attr_name` being |None| for a slot in element text.
+        """
+        steps: list[tuple[int, int, tuple[tuple[str | None, str], ...]]] = []
+
+        def element_slots(element: _Element):
+            slots: list[tuple[str | None, str]] = []
+            for attr_name, value in element.attrib.items():
+                match = cls._slot_pattern.match(value)
+                if match:
+                    slots.append((attr_name, match.group(1)))
+            match = cls._slot_pattern.match(element.text or "")
+            if match:
+                slots.append((None, match.group(1)))
+            return tuple(slots)
+
+        def add_steps(element: _Element, step: int):
+            for idx, child in enumerate(element):
+                if not any(element_slots(e) for e in child.iter()):
+                    continue
+                steps.append((step, idx, element_slots(child)))
+                add_steps(child, len(steps) - 1)
+
+        steps.append((-1, -1, element_slots(root)))
+        add_steps(root, 0)
+        return tuple(steps)
+
+
+_prototypes: dict[str, _Prototype] = {}
+
+
 def register_element_cls(nsptagname: str, cls: Type[BaseOxmlElement]):
     """Register `cls` to be constructed when oxml parser encounters element having `nsptag_name`.
 
@@ -484,3 +572,9 @@ register_element_cls("p:txBody", CT_TextBody)
 from pptx.oxml.theme import CT_OfficeStyleSheet  # noqa: E402
 
 register_element_cls("a:theme", CT_OfficeStyleSheet)
+
+
+from pptx.oxml.xmlchemy import BaseOxmlElement  # noqa: E402
+
+# -- an element having no custom element class still gets the behaviors of the base class --
+element_class_lookup.set_fallback(etree.ElementDefaultClassLookup(element=BaseOxmlElement))
@@ -99,9 +99,26 @@ class CT_NumDataSource(BaseOxmlElement):
         Return the Y value for data point *idx* in this cache, or None if no
         value is present for that data point.
         """
-        results = self.xpath(".//c:pt[@idx=%d]" % idx)
+        results = self.xpath(".//c:pt[@idx=$idx]", idx=idx)
         return results[0].value if results else None
 
+    @property
+    def pt_values(self) -> list[float | None]:
+        """
+        Return a list containing the value of each data point in this cache, in
+        idx order. The list has `ptCount_val` items; an item is None where no
+        value is present for that data point. Equivalent to calling `pt_v()`
+        for each idx, but reads the cache in a single pass.
+        """
+        values: list[float | None] = [None] * self.ptCount_val
+        pt_count = len(values)
+        for pt in self.xpath(".//c:pt"):
+            idx = pt.idx
+            # ---first c:pt having an idx wins, like pt_v(); out-of-range idx ignored---
+            if idx < pt_count and values[idx] is None:
+                values[idx] = pt.value
+        return values
+
 
 class CT_SeriesComposite(BaseOxmlElement):
     """
@@ -196,7 +213,7 @@ class CT_SeriesComposite(BaseOxmlElement):
         Return the `c:dPt` child representing the visual properties of the
         data point at index *idx*.
         """
-        matches = self.xpath('c:dPt[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dPt[c:idx[@val=$idx]]", idx=str(idx))
         if matches:
             return matches[0]
         dPt = self._add_dPt()
@@ -102,7 +102,7 @@ class CT_SRgbColor(_BaseColorElement):
     Custom element class for <a:srgbClr> element.
     """
 
-    val = RequiredAttribute("val", ST_HexColorRGB)
+    val: str = RequiredAttribute("val", ST_HexColorRGB)  # pyright: ignore[reportAssignmentType]
 
 
 class CT_SystemColor(_BaseColorElement):
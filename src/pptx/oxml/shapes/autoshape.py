@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, cast
 
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, PP_PLACEHOLDER
-from pptx.oxml import parse_xml
+from pptx.oxml import new_from_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import (
@@ -253,16 +253,16 @@ class CT_Shape(BaseShapeElement):
         xml = (
             "<p:sp %s>\n"
             "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
+            '    <p:cNvPr id="$id" name="$name"/>\n'
             "    <p:cNvSpPr/>\n"
             "    <p:nvPr/>\n"
             "  </p:nvSpPr>\n"
             "  <p:spPr>\n"
             "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
+            '      <a:off x="$x" y="$y"/>\n'
+            '      <a:ext cx="$cx" cy="$cy"/>\n'
             "    </a:xfrm>\n"
-            '    <a:prstGeom prst="%s">\n'
+            '    <a:prstGeom prst="$prst">\n'
             "      <a:avLst/>\n"
             "    </a:prstGeom>\n"
             "  </p:spPr>\n"
@@ -287,9 +287,14 @@ class CT_Shape(BaseShapeElement):
             '      <a:pPr algn="ctr"/>\n'
             "    </a:p>\n"
             "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d", "%s")
-        ) % (id_, name, left, top, width, height, prst)
-        return cast(CT_Shape, parse_xml(xml))
+            "</p:sp>" % nsdecls("a", "p")
+        )
+        return cast(
+            CT_Shape,
+            new_from_prototype(
+                xml, id=id_, name=name, x=left, y=top, cx=width, cy=height, prst=prst
+            ),
+        )
 
     @staticmethod
     def new_freeform_sp(shape_id: int, name: str, x: int, y: int, cx: int, cy: int):
@@ -301,14 +306,14 @@ class CT_Shape(BaseShapeElement):
         xml = (
             "<p:sp %s>\n"
             "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
+            '    <p:cNvPr id="$id" name="$name"/>\n'
             "    <p:cNvSpPr/>\n"
             "    <p:nvPr/>\n"
             "  </p:nvSpPr>\n"
             "  <p:spPr>\n"
             "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
+            '      <a:off x="$x" y="$y"/>\n'
+            '      <a:ext cx="$cx" cy="$cy"/>\n'
             "    </a:xfrm>\n"
             "    <a:custGeom>\n"
             "      <a:avLst/>\n"
@@ -340,9 +345,11 @@ class CT_Shape(BaseShapeElement):
             '      <a:pPr algn="ctr"/>\n'
             "    </a:p>\n"
             "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d")
-        ) % (shape_id, name, x, y, cx, cy)
-        return cast(CT_Shape, parse_xml(xml))
+            "</p:sp>" % nsdecls("a", "p")
+        )
+        return cast(
+            CT_Shape, new_from_prototype(xml, id=shape_id, name=name, x=x, y=y, cx=cx, cy=cy)
+        )
 
     @staticmethod
     def new_placeholder_sp(
@@ -351,17 +358,19 @@ class CT_Shape(BaseShapeElement):
         """Return a new `p:sp` element tree configured as a placeholder shape."""
         sp = cast(
             CT_Shape,
-            parse_xml(
+            new_from_prototype(
                 f"<p:sp {nsdecls('a', 'p')}>\n"
                 f"  <p:nvSpPr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
+                f'    <p:cNvPr id="$id" name="$name"/>\n'
                 f"    <p:cNvSpPr>\n"
                 f'      <a:spLocks noGrp="1"/>\n'
                 f"    </p:cNvSpPr>\n"
                 f"    <p:nvPr/>\n"
                 f"  </p:nvSpPr>\n"
                 f"  <p:spPr/>\n"
-                f"</p:sp>"
+                f"</p:sp>",
+                id=id_,
+                name=name,
             ),
         )
 
@@ -385,12 +394,22 @@ class CT_Shape(BaseShapeElement):
         return sp
 
     @staticmethod
-    def new_textbox_sp(id_, name, left, top, width, height):
+    def new_textbox_sp(
+        id_: int, name: str, left: int, top: int, width: int, height: int
+    ) -> CT_Shape:
         """Return a new `p:sp` element tree configured as a base textbox shape."""
-        tmpl = CT_Shape._textbox_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height)
-        sp = parse_xml(xml)
-        return sp
+        return cast(
+            CT_Shape,
+            new_from_prototype(
+                CT_Shape._textbox_sp_tmpl(),
+                id=id_,
+                name=name,
+                x=left,
+                y=top,
+                cx=width,
+                cy=height,
+            ),
+        )
 
     @property
     def prst(self):
@@ -416,14 +435,14 @@ class CT_Shape(BaseShapeElement):
         return (
             "<p:sp %s>\n"
             "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
+            '    <p:cNvPr id="$id" name="$name"/>\n'
             '    <p:cNvSpPr txBox="1"/>\n'
             "    <p:nvPr/>\n"
             "  </p:nvSpPr>\n"
             "  <p:spPr>\n"
             "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
+            '      <a:off x="$x" y="$y"/>\n'
+            '      <a:ext cx="$cx" cy="$cy"/>\n'
             "    </a:xfrm>\n"
             '    <a:prstGeom prst="rect">\n'
             "      <a:avLst/>\n"
@@ -437,7 +456,7 @@ class CT_Shape(BaseShapeElement):
             "    <a:lstStyle/>\n"
             "    <a:p/>\n"
             "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d")
+            "</p:sp>" % nsdecls("a", "p")
         )
 
 
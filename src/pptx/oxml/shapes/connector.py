@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from pptx.oxml import parse_xml
+from pptx.oxml import new_from_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import ST_DrawingElementId, XsdUnsignedInt
@@ -46,22 +46,21 @@ class CT_Connector(BaseShapeElement):
         flipV: bool,
     ) -> CT_Connector:
         """Return a new `p:cxnSp` element tree configured as a base connector."""
-        flip = (' flipH="1"' if flipH else "") + (' flipV="1"' if flipV else "")
-        return cast(
+        cxnSp = cast(
             CT_Connector,
-            parse_xml(
+            new_from_prototype(
                 f"<p:cxnSp {nsdecls('a', 'p')}>\n"
                 f"  <p:nvCxnSpPr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
+                f'    <p:cNvPr id="$id" name="$name"/>\n'
                 f"    <p:cNvCxnSpPr/>\n"
                 f"    <p:nvPr/>\n"
                 f"  </p:nvCxnSpPr>\n"
                 f"  <p:spPr>\n"
-                f"    <a:xfrm{flip}>\n"
-                f'      <a:off x="{x}" y="{y}"/>\n'
-                f'      <a:ext cx="{cx}" cy="{cy}"/>\n'
+                f"    <a:xfrm>\n"
+                f'      <a:off x="$x" y="$y"/>\n'
+                f'      <a:ext cx="$cx" cy="$cy"/>\n'
                 f"    </a:xfrm>\n"
-                f'    <a:prstGeom prst="{prst}">\n'
+                f'    <a:prstGeom prst="$prst">\n'
                 f"      <a:avLst/>\n"
                 f"    </a:prstGeom>\n"
                 f"  </p:spPr>\n"
@@ -79,9 +78,22 @@ class CT_Connector(BaseShapeElement):
                 f'      <a:schemeClr val="tx1"/>\n'
                 f"    </a:fontRef>\n"
                 f"  </p:style>\n"
-                f"</p:cxnSp>"
+                f"</p:cxnSp>",
+                id=id_,
+                name=name,
+                x=x,
+                y=y,
+                cx=cx,
+                cy=cy,
+                prst=prst,
             ),
         )
+        xfrm = cxnSp.spPr.get_or_add_xfrm()
+        if flipH:
+            xfrm.flipH = True
+        if flipV:
+            xfrm.flipV = True
+        return cxnSp
 
 
 class CT_ConnectorNonVisual(BaseOxmlElement):
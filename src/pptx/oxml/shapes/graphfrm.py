@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from pptx.oxml import parse_xml
+from pptx.oxml import new_from_prototype
 from pptx.oxml.chart.chart import CT_Chart
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
@@ -199,23 +199,29 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         """
         return cast(
             CT_GraphicalObjectFrame,
-            parse_xml(
+            new_from_prototype(
                 f"<p:graphicFrame {nsdecls('a', 'p')}>\n"
                 f"  <p:nvGraphicFramePr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
+                f'    <p:cNvPr id="$id" name="$name"/>\n'
                 f"    <p:cNvGraphicFramePr>\n"
                 f'      <a:graphicFrameLocks noGrp="1"/>\n'
                 f"    </p:cNvGraphicFramePr>\n"
                 f"    <p:nvPr/>\n"
                 f"  </p:nvGraphicFramePr>\n"
                 f"  <p:xfrm>\n"
-                f'    <a:off x="{x}" y="{y}"/>\n'
-                f'    <a:ext cx="{cx}" cy="{cy}"/>\n'
+                f'    <a:off x="$x" y="$y"/>\n'
+                f'    <a:ext cx="$cx" cy="$cy"/>\n'
                 f"  </p:xfrm>\n"
                 f"  <a:graphic>\n"
                 f"    <a:graphicData/>\n"
                 f"  </a:graphic>\n"
-                f"</p:graphicFrame>"
+                f"</p:graphicFrame>",
+                id=id_,
+                name=name,
+                x=x,
+                y=y,
+                cx=cx,
+                cy=cy,
             ),
         )
 
@@ -246,27 +252,27 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         """
         return cast(
             CT_GraphicalObjectFrame,
-            parse_xml(
+            new_from_prototype(
                 f"<p:graphicFrame {nsdecls('a', 'p', 'r')}>\n"
                 f"  <p:nvGraphicFramePr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
+                f'    <p:cNvPr id="$id" name="$name"/>\n'
                 f"    <p:cNvGraphicFramePr>\n"
                 f'      <a:graphicFrameLocks noGrp="1"/>\n'
                 f"    </p:cNvGraphicFramePr>\n"
                 f"    <p:nvPr/>\n"
                 f"  </p:nvGraphicFramePr>\n"
                 f"  <p:xfrm>\n"
-                f'    <a:off x="{x}" y="{y}"/>\n'
-                f'    <a:ext cx="{cx}" cy="{cy}"/>\n'
+                f'    <a:off x="$x" y="$y"/>\n'
+                f'    <a:ext cx="$cx" cy="$cy"/>\n'
                 f"  </p:xfrm>\n"
                 f"  <a:graphic>\n"
                 f"    <a:graphicData"
                 f'        uri="http://schemas.openxmlformats.org/presentationml/2006/ole">\n'
                 f'      <p:oleObj showAsIcon="1"'
-                f'                r:id="{ole_object_rId}"'
-                f'                imgW="{imgW}"'
-                f'                imgH="{imgH}"'
-                f'                progId="{progId}">\n'
+                f'                r:id="$ole_object_rId"'
+                f'                imgW="$imgW"'
+                f'                imgH="$imgH"'
+                f'                progId="$progId">\n'
                 f"        <p:embed/>\n"
                 f"        <p:pic>\n"
                 f"          <p:nvPicPr>\n"
@@ -275,15 +281,15 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
                 f"            <p:nvPr/>\n"
                 f"          </p:nvPicPr>\n"
                 f"          <p:blipFill>\n"
-                f'            <a:blip r:embed="{icon_rId}"/>\n'
+                f'            <a:blip r:embed="$icon_rId"/>\n'
                 f"            <a:stretch>\n"
                 f"              <a:fillRect/>\n"
                 f"            </a:stretch>\n"
                 f"          </p:blipFill>\n"
                 f"          <p:spPr>\n"
                 f"            <a:xfrm>\n"
-                f'              <a:off x="{x}" y="{y}"/>\n'
-                f'              <a:ext cx="{cx}" cy="{cy}"/>\n'
+                f'              <a:off x="$x" y="$y"/>\n'
+                f'              <a:ext cx="$cx" cy="$cy"/>\n'
                 f"            </a:xfrm>\n"
                 f'            <a:prstGeom prst="rect">\n'
                 f"              <a:avLst/>\n"
@@ -293,7 +299,18 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
                 f"      </p:oleObj>\n"
                 f"    </a:graphicData>\n"
                 f"  </a:graphic>\n"
-                f"</p:graphicFrame>"
+                f"</p:graphicFrame>",
+                id=id_,
+                name=name,
+                ole_object_rId=ole_object_rId,
+                progId=progId,
+                icon_rId=icon_rId,
+                x=x,
+                y=y,
+                cx=cx,
+                cy=cy,
+                imgW=imgW,
+                imgH=imgH,
             ),
         )
 
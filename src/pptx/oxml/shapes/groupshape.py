@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Iterator
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, cast
 
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
-from pptx.oxml import parse_xml
+from pptx.oxml import new_from_prototype
 from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement
-from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
+from pptx.oxml.xmlchemy import (
+    BaseOxmlElement,
+    OneAndOnlyOne,
+    ZeroOrOne,
+    elements_by_attribute_value,
+    max_int_attribute_value,
+)
 from pptx.util import Emu
 
 if TYPE_CHECKING:
@@ -112,6 +118,19 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(graphicFrame, "p:extLst")
         return graphicFrame
 
+    def add_shape_elms(self, shape_elms: Iterable[ShapeElement]) -> None:
+        """Append each of `shape_elms` to this shape tree, in order.
+
+        As with the other `add_*()` methods, the shapes are placed before any `p:extLst` child,
+        which is looked for only once.
+        """
+        extLst = self.find(qn("p:extLst"))
+        if extLst is None:
+            self.extend(shape_elms)
+            return
+        for shape_elm in shape_elms:
+            extLst.addprevious(shape_elm)
+
     def add_textbox(self, id_: int, name: str, x: int, y: int, cx: int, cy: int) -> CT_Shape:
         """Append a newly-created textbox `p:sp` shape having the specified position and size."""
         sp = CT_Shape.new_textbox_sp(id_, name, x, y, cx, cy)
@@ -138,6 +157,34 @@ class CT_GroupShape(BaseShapeElement):
             if e.has_ph_elm:
                 yield e
 
+    def cNvPr_name_is_used(self, name: str) -> bool:
+        """True if a `p:cNvPr` element anywhere in this document is assigned `name`.
+
+        Answered from an index of the name attributes in the document, kept current as the
+        document changes, rather than by searching the document.
+        """
+        cNvPr_tag = qn("p:cNvPr")
+        named_elms = elements_by_attribute_value(self.getroottree().getroot(), "name").get(name, ())
+        return any(e.tag == cNvPr_tag for e in named_elms)
+
+    def iter_shape_elms_by_cNvPr(self, attr_name: str, value: str) -> Iterator[ShapeElement]:
+        """Generate each shape child of this element whose `p:cNvPr` has `attr_name` of `value`.
+
+        Shapes are found from an index of that attribute in the document rather than by searching
+        the shape tree, and appear in no particular order.
+        """
+        cNvPr_tag = qn("p:cNvPr")
+        root = self.getroottree().getroot()
+        for cNvPr in elements_by_attribute_value(root, attr_name).get(value, ()):
+            if cNvPr.tag != cNvPr_tag:
+                continue
+            nvXxPr = cNvPr.getparent()
+            shape_elm = None if nvXxPr is None else nvXxPr.getparent()
+            if shape_elm is None or shape_elm.getparent() is not self:
+                continue
+            if shape_elm.tag in self._shape_tags:
+                yield cast("ShapeElement", shape_elm)
+
     def iter_shape_elms(self) -> Iterator[ShapeElement]:
         """Generate each child of this `p:spTree` element that corresponds to a shape.
 
@@ -156,11 +203,10 @@ class CT_GroupShape(BaseShapeElement):
         (XML id-values have document scope).
 
         In practice, its minimum value is 1 because the spTree element itself
-        is always assigned id="1".
+        is always assigned id="1". The maximum is kept current as the document
+        changes, so this does not search the document on each call.
         """
-        id_str_lst = self.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        return max(used_ids) if used_ids else 0
+        return max_int_attribute_value(self.getroottree().getroot(), "id")
 
     @classmethod
     def new_grpSp(cls, id_: int, name: str) -> CT_GroupShape:
@@ -168,7 +214,7 @@ class CT_GroupShape(BaseShapeElement):
         xml = (
             "<p:grpSp %s>\n"
             "  <p:nvGrpSpPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s"/>\n'
+            '    <p:cNvPr id="$id" name="$name"/>\n'
             "    <p:cNvGrpSpPr/>\n"
             "    <p:nvPr/>\n"
             "  </p:nvGrpSpPr>\n"
@@ -181,9 +227,8 @@ class CT_GroupShape(BaseShapeElement):
             "    </a:xfrm>\n"
             "  </p:grpSpPr>\n"
             "</p:grpSp>" % nsdecls("a", "p", "r")
-        ) % (id_, name)
-        grpSp = parse_xml(xml)
-        return grpSp
+        )
+        return cast(CT_GroupShape, new_from_prototype(xml, id=id_, name=name))
 
     def recalculate_extents(self) -> None:
         """Adjust x, y, cx, and cy to incorporate all contained shapes.
@@ -237,16 +282,11 @@ class CT_GroupShape(BaseShapeElement):
     def _next_shape_id(self) -> int:
         """Return unique shape id suitable for use with a new shape element.
 
-        The returned id is the next available positive integer drawing object
-        id in shape tree, starting from 1 and making use of any gaps in
-        numbering. In practice, the minimum id is 2 because the spTree
-        element itself is always assigned id="1".
+        The returned id is 1 greater than the maximum id used so far in the
+        document. In practice, the minimum id is 2 because the spTree element
+        itself is always assigned id="1".
         """
-        id_str_lst = self.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids) + 2):
-            if n not in used_ids:
-                return n
+        return self.max_shape_id + 1
 
 
 class CT_GroupShapeNonVisual(BaseShapeElement):
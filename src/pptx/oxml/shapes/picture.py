@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
-from xml.sax.saxutils import escape
 
-from pptx.oxml import parse_xml
+from pptx.oxml import new_from_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne
@@ -36,7 +35,9 @@ class CT_Picture(BaseShapeElement):
             return blip.rEmbed
         return None
 
-    def crop_to_fit(self, image_size, view_size):
+    def crop_to_fit(
+        self, image_size: tuple[int, int], view_size: tuple[Length | None, Length | None]
+    ) -> None:
         """
         Set cropping values in `p:blipFill/a:srcRect` such that an image of
         *image_size* will stretch to exactly fit *view_size* when its aspect
@@ -58,17 +59,27 @@ class CT_Picture(BaseShapeElement):
         return self.spPr.ln
 
     @classmethod
-    def new_ph_pic(cls, id_, name, desc, rId):
+    def new_ph_pic(cls, id_: int, name: str, desc: str, rId: str) -> CT_Picture:
         """
         Return a new `p:pic` placeholder element populated with the supplied
         parameters.
         """
-        return parse_xml(cls._pic_ph_tmpl() % (id_, name, desc, rId))
+        return cast(
+            CT_Picture,
+            new_from_prototype(cls._pic_ph_tmpl(), id=id_, name=name, desc=desc, rId=rId),
+        )
 
     @classmethod
-    def new_pic(cls, shape_id, name, desc, rId, x, y, cx, cy):
+    def new_pic(
+        cls, shape_id: int, name: str, desc: str, rId: str, x: int, y: int, cx: int, cy: int
+    ) -> CT_Picture:
         """Return new `<p:pic>` element tree configured with supplied parameters."""
-        return parse_xml(cls._pic_tmpl() % (shape_id, name, escape(desc), rId, x, y, cx, cy))
+        return cast(
+            CT_Picture,
+            new_from_prototype(
+                cls._pic_tmpl(), id=shape_id, name=name, desc=desc, rId=rId, x=x, y=y, cx=cx, cy=cy
+            ),
+        )
 
     @classmethod
     def new_video_pic(
@@ -86,19 +97,17 @@ class CT_Picture(BaseShapeElement):
         """Return a new `p:pic` populated with the specified video."""
         return cast(
             CT_Picture,
-            parse_xml(
-                cls._pic_video_tmpl()
-                % (
-                    shape_id,
-                    shape_name,
-                    video_rId,
-                    media_rId,
-                    poster_frame_rId,
-                    x,
-                    y,
-                    cx,
-                    cy,
-                )
+            new_from_prototype(
+                cls._pic_video_tmpl(),
+                id=shape_id,
+                name=shape_name,
+                video_rId=video_rId,
+                media_rId=media_rId,
+                poster_frame_rId=poster_frame_rId,
+                x=x,
+                y=y,
+                cx=cx,
+                cy=cy,
             ),
         )
 
@@ -166,14 +175,14 @@ class CT_Picture(BaseShapeElement):
         return (
             "<p:pic %s>\n"
             "  <p:nvPicPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s" descr="%%s"/>\n'
+            '    <p:cNvPr id="$id" name="$name" descr="$desc"/>\n'
             "    <p:cNvPicPr>\n"
             '      <a:picLocks noGrp="1" noChangeAspect="1"/>\n'
             "    </p:cNvPicPr>\n"
             "    <p:nvPr/>\n"
             "  </p:nvPicPr>\n"
             "  <p:blipFill>\n"
-            '    <a:blip r:embed="%%s"/>\n'
+            '    <a:blip r:embed="$rId"/>\n'
             "    <a:stretch>\n"
             "      <a:fillRect/>\n"
             "    </a:stretch>\n"
@@ -187,22 +196,22 @@ class CT_Picture(BaseShapeElement):
         return (
             "<p:pic %s>\n"
             "  <p:nvPicPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s" descr="%%s"/>\n'
+            '    <p:cNvPr id="$id" name="$name" descr="$desc"/>\n'
             "    <p:cNvPicPr>\n"
             '      <a:picLocks noChangeAspect="1"/>\n'
             "    </p:cNvPicPr>\n"
             "    <p:nvPr/>\n"
             "  </p:nvPicPr>\n"
             "  <p:blipFill>\n"
-            '    <a:blip r:embed="%%s"/>\n'
+            '    <a:blip r:embed="$rId"/>\n'
             "    <a:stretch>\n"
             "      <a:fillRect/>\n"
             "    </a:stretch>\n"
             "  </p:blipFill>\n"
             "  <p:spPr>\n"
             "    <a:xfrm>\n"
-            '      <a:off x="%%d" y="%%d"/>\n'
-            '      <a:ext cx="%%d" cy="%%d"/>\n'
+            '      <a:off x="$x" y="$y"/>\n'
+            '      <a:ext cx="$cx" cy="$cy"/>\n'
             "    </a:xfrm>\n"
             '    <a:prstGeom prst="rect">\n'
             "      <a:avLst/>\n"
@@ -216,32 +225,32 @@ class CT_Picture(BaseShapeElement):
         return (
             "<p:pic %s>\n"
             "  <p:nvPicPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s">\n'
+            '    <p:cNvPr id="$id" name="$name">\n'
             '      <a:hlinkClick r:id="" action="ppaction://media"/>\n'
             "    </p:cNvPr>\n"
             "    <p:cNvPicPr>\n"
             '      <a:picLocks noChangeAspect="1"/>\n'
             "    </p:cNvPicPr>\n"
             "    <p:nvPr>\n"
-            '      <a:videoFile r:link="%%s"/>\n'
+            '      <a:videoFile r:link="$video_rId"/>\n'
             "      <p:extLst>\n"
             '        <p:ext uri="{DAA4B4D4-6D71-4841-9C94-3DE7FCFB9230}">\n'
             '          <p14:media xmlns:p14="http://schemas.microsoft.com/of'
-            'fice/powerpoint/2010/main" r:embed="%%s"/>\n'
+            'fice/powerpoint/2010/main" r:embed="$media_rId"/>\n'
             "        </p:ext>\n"
             "      </p:extLst>\n"
             "    </p:nvPr>\n"
             "  </p:nvPicPr>\n"
             "  <p:blipFill>\n"
-            '    <a:blip r:embed="%%s"/>\n'
+            '    <a:blip r:embed="$poster_frame_rId"/>\n'
             "    <a:stretch>\n"
             "      <a:fillRect/>\n"
             "    </a:stretch>\n"
             "  </p:blipFill>\n"
             "  <p:spPr>\n"
             "    <a:xfrm>\n"
-            '      <a:off x="%%d" y="%%d"/>\n'
-            '      <a:ext cx="%%d" cy="%%d"/>\n'
+            '      <a:off x="$x" y="$y"/>\n'
+            '      <a:ext cx="$cx" cy="$cy"/>\n'
             "    </a:xfrm>\n"
             '    <a:prstGeom prst="rect">\n'
             "      <a:avLst/>\n"
@@ -32,6 +32,7 @@ from pptx.util import Emu
 
 if TYPE_CHECKING:
     from pptx.oxml.action import CT_Hyperlink
+    from pptx.oxml.dml.fill import CT_SolidColorFillProperties
     from pptx.oxml.shapes.autoshape import CT_CustomGeometry2D, CT_PresetGeometry2D
     from pptx.util import Length
 
@@ -349,6 +350,7 @@ class CT_ShapeProperties(BaseOxmlElement):
 
     get_or_add_xfrm: Callable[[], CT_Transform2D]
     get_or_add_ln: Callable[[], CT_LineProperties]
+    get_or_change_to_solidFill: Callable[[], CT_SolidColorFillProperties]
     _add_prstGeom: Callable[[], CT_PresetGeometry2D]
     _remove_custGeom: Callable[[], None]
 
@@ -459,8 +461,12 @@ class CT_Transform2D(BaseOxmlElement):
     rot: float | None = OptionalAttribute(  # pyright: ignore[reportAssignmentType]
         "rot", ST_Angle, default=0.0
     )
-    flipH = OptionalAttribute("flipH", XsdBoolean, default=False)
-    flipV = OptionalAttribute("flipV", XsdBoolean, default=False)
+    flipH: bool = OptionalAttribute(  # pyright: ignore[reportAssignmentType]
+        "flipH", XsdBoolean, default=False
+    )
+    flipV: bool = OptionalAttribute(  # pyright: ignore[reportAssignmentType]
+        "flipV", XsdBoolean, default=False
+    )
 
     @property
     def x(self):
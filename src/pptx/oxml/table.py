@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, Iterator, cast
 
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
-from pptx.oxml import parse_xml
+from pptx.oxml import new_from_prototype
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
@@ -109,8 +109,7 @@ class CT_Table(BaseOxmlElement):
         if tableStyleId is None:
             tableStyleId = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = cast(CT_Table, parse_xml(xml))
+        tbl = cast(CT_Table, new_from_prototype(cls._tbl_tmpl(), tableStyleId=tableStyleId))
 
         # add specified number of rows and columns
         rowheight = height // rows
@@ -166,10 +165,10 @@ class CT_Table(BaseOxmlElement):
         return (
             "<a:tbl %s>\n"
             '  <a:tblPr firstRow="1" bandRow="1">\n'
-            "    <a:tableStyleId>%s</a:tableStyleId>\n"
+            "    <a:tableStyleId>$tableStyleId</a:tableStyleId>\n"
             "  </a:tblPr>\n"
             "  <a:tblGrid/>\n"
-            "</a:tbl>" % (nsdecls("a"), "%s")
+            "</a:tbl>" % nsdecls("a")
         )
 
 
@@ -308,7 +307,7 @@ class CT_TableCell(BaseOxmlElement):
         """Return a new `a:tc` element subtree."""
         return cast(
             CT_TableCell,
-            parse_xml(
+            new_from_prototype(
                 f"<a:tc {nsdecls('a')}>\n"
                 f"  <a:txBody>\n"
                 f"    <a:bodyPr/>\n"
@@ -13,7 +13,7 @@ from pptx.enum.text import (
     PP_PARAGRAPH_ALIGNMENT,
 )
 from pptx.exc import InvalidXmlError
-from pptx.oxml import parse_xml
+from pptx.oxml import new_from_prototype
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
@@ -127,9 +127,7 @@ class CT_TextBody(BaseOxmlElement):
     @classmethod
     def new(cls):
         """Return a new `p:txBody` element tree."""
-        xml = cls._txBody_tmpl()
-        txBody = parse_xml(xml)
-        return txBody
+        return new_from_prototype(cls._txBody_tmpl())
 
     @classmethod
     def new_a_txBody(cls) -> CT_TextBody:
@@ -137,15 +135,12 @@ class CT_TextBody(BaseOxmlElement):
 
         Suitable for use in a table cell and possibly other situations.
         """
-        xml = cls._a_txBody_tmpl()
-        txBody = cast(CT_TextBody, parse_xml(xml))
-        return txBody
+        return cast(CT_TextBody, new_from_prototype(cls._a_txBody_tmpl()))
 
     @classmethod
     def new_p_txBody(cls):
         """Return a new `p:txBody` element tree, suitable for use in an `p:sp` element."""
-        xml = cls._p_txBody_tmpl()
-        return parse_xml(xml)
+        return new_from_prototype(cls._p_txBody_tmpl())
 
     @classmethod
     def new_txPr(cls):
@@ -164,8 +159,7 @@ class CT_TextBody(BaseOxmlElement):
             "  </a:p>\n"
             "</c:txPr>\n"
         ) % nsdecls("c", "a")
-        txPr = parse_xml(xml)
-        return txPr
+        return new_from_prototype(xml)
 
     def unclear_content(self):
         """Ensure p:txBody has at least one a:p child.
@@ -455,8 +449,7 @@ class CT_TextParagraph(BaseOxmlElement):
         return "".join([child.text for child in self.content_children])
 
     def _new_r(self):
-        r_xml = "<a:r %s><a:t/></a:r>" % nsdecls("a")
-        return parse_xml(r_xml)
+        return new_from_prototype("<a:r %s><a:t/></a:r>" % nsdecls("a"))
 
 
 class CT_TextParagraphProperties(BaseOxmlElement):
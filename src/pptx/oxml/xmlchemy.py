@@ -2,8 +2,22 @@
 
 from __future__ import annotations
 
+import collections
+import functools
 import re
-from typing import Any, Callable, Iterable, Protocol, Sequence, Type, cast
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    Protocol,
+    Sequence,
+    Type,
+    cast,
+)
 
 from lxml import etree
 from lxml.etree import ElementBase, _Element  # pyright: ignore[reportPrivateUsage]
@@ -43,6 +57,214 @@ def OxmlElement(nsptag_str: str, nsmap: dict[str, str] | None = None) -> BaseOxm
     return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
+# -- count of changes made to each element tree being tracked, keyed by its root element --
+_tree_revisions: weakref.WeakKeyDictionary[_Element, int] = weakref.WeakKeyDictionary()
+
+
+def tree_revision(root: _Element) -> int:
+    """Count of changes made to the element tree under `root` since it was first tracked.
+
+    Tracking of the tree starts on the first call for `root`, so the count a caller sees only
+    advances when the tree changes after that. Only a change made through the methods of an
+    oxml element is counted, which is every change this package makes. Tracking ends when `root`
+    is garbage-collected.
+    """
+    return _tree_revisions.setdefault(root, 0)
+
+
+def _note_change(*elements: _Element) -> None:
+    """Count a change to the tracked element tree, if any, that each of `elements` is in.
+
+    Called *before* the change is made, so an element being moved is counted against the tree it
+    is moved out of.
+    """
+    if not _tree_revisions:
+        return
+    for element in elements:
+        root = element.getroottree().getroot()
+        if root in _tree_revisions:
+            _tree_revisions[root] += 1
+
+
+# -- counts of the values of attributes in each element tree being tracked, keyed by its root
+# -- element, then by attribute clark-name
+_tree_attr_counts: weakref.WeakKeyDictionary[_Element, dict[str, collections.Counter[str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def attribute_value_counts(root: _Element, clark_name: str) -> collections.Counter[str]:
+    """Count of each value of attribute `clark_name` in the element tree under `root`.
+
+    The counter is built on the first call for `root` and `clark_name` and then kept current as
+    the tree changes, so later calls are cheap. As with `tree_revision()`, only a change made
+    through the methods of an oxml element is counted. The returned counter must not be changed
+    by the caller.
+    """
+    counts_by_name = _tree_attr_counts.setdefault(root, {})
+    counts = counts_by_name.get(clark_name)
+    if counts is None:
+        counts = counts_by_name[clark_name] = collections.Counter(
+            value
+            for value in (e.get(clark_name) for e in root.iter())
+            if value is not None
+        )
+    return counts
+
+
+# -- elements having each value of an attribute in each element tree being indexed, keyed by its
+# -- root element, then by attribute clark-name
+_tree_attr_elements: weakref.WeakKeyDictionary[_Element, dict[str, dict[str, list[_Element]]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def elements_by_attribute_value(root: _Element, clark_name: str) -> dict[str, list[_Element]]:
+    """Elements in the element tree under `root` having each value of attribute `clark_name`.
+
+    Like `attribute_value_counts()`, the index is built on the first call for `root` and
+    `clark_name` and then kept current as the tree changes. Elements sharing a value appear in no
+    particular order. The returned mapping must not be changed by the caller.
+    """
+    # -- the index is maintained along with the counts, so those must be tracked too --
+    attribute_value_counts(root, clark_name)
+    index_by_name = _tree_attr_elements.setdefault(root, {})
+    index = index_by_name.get(clark_name)
+    if index is None:
+        index = index_by_name[clark_name] = {}
+        for e in root.iter():
+            value = e.get(clark_name)
+            if value is not None:
+                index.setdefault(value, []).append(e)
+    return index
+
+
+# -- greatest integer value of each attribute being counted in an element tree, keyed by its root
+# -- element, then by attribute clark-name. An entry is dropped when that value leaves the tree.
+_tree_attr_max_ints: weakref.WeakKeyDictionary[_Element, dict[str, int]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def max_int_attribute_value(root: _Element, clark_name: str) -> int:
+    """Greatest integer value of attribute `clark_name` in the element tree under `root`.
+
+    A value that is not an unsigned integer is ignored; 0 is returned when there are no integer
+    values. Like `attribute_value_counts()`, the result is kept current as the tree changes, so it
+    is only worked out again when the greatest value is removed from the tree.
+    """
+    counts = attribute_value_counts(root, clark_name)
+    max_ints = _tree_attr_max_ints.setdefault(root, {})
+    max_int = max_ints.get(clark_name)
+    if max_int is None:
+        int_values = [int(value) for value in counts if value.isdigit()]
+        max_int = max_ints[clark_name] = max(int_values) if int_values else 0
+    return max_int
+
+
+# -- clark-name of the attribute `lxml` keeps the base URL of an element in --
+_XML_BASE = "{http://www.w3.org/XML/1998/namespace}base"
+
+
+def _note_attribute_change(element: _Element, key: Any, value: str | None) -> None:
+    """Count the change of attribute `key` of `element` to `value`, |None| when it is deleted.
+
+    Called *before* the change is made.
+    """
+    if not _tree_attr_counts:
+        return
+    root = element.getroottree().getroot()
+    counts_by_name = _tree_attr_counts.get(root)
+    if counts_by_name is None:
+        return
+    clark_name = str(key)
+    counts = counts_by_name.get(clark_name)
+    if counts is None:
+        return
+    _adjust_count(root, clark_name, counts, element, element.get(key), -1)
+    _adjust_count(root, clark_name, counts, element, value, 1)
+
+
+def _note_subtree_moves(
+    removed: Sequence[_Element], added: Sequence[_Element] = (), parent: _Element | None = None
+) -> None:
+    """Count the attribute values in the subtrees of `removed` and `added` elements.
+
+    Each of `removed` is being removed from the tree it is in. Each of `added` is being added to
+    the tree `parent` is in, which also removes it from the tree it is in now, if any. Called
+    *before* the change is made.
+    """
+    if not _tree_attr_counts:
+        return
+    for element in removed:
+        _count_subtree(element, element.getroottree().getroot(), -1)
+    for element in added:
+        _count_subtree(element, element.getroottree().getroot(), -1)
+        if parent is not None:
+            _count_subtree(element, parent.getroottree().getroot(), 1)
+
+
+def _count_subtree(element: _Element, root: _Element, sign: int) -> None:
+    """Add `sign` to the attribute counts of the tracked tree under `root`, if any.
+
+    Each tracked attribute value of `element` and its descendants is counted.
+    """
+    counts_by_name = _tree_attr_counts.get(root)
+    if not counts_by_name:
+        return
+    for e in element.iter():
+        for clark_name, counts in counts_by_name.items():
+            _adjust_count(root, clark_name, counts, e, e.get(clark_name), sign)
+
+
+def _adjust_count(
+    root: _Element,
+    clark_name: str,
+    counts: collections.Counter[str],
+    element: _Element,
+    value: str | None,
+    sign: int,
+) -> None:
+    """Add `sign` to the count of `value` in `counts`, dropping a count that reaches zero.
+
+    `counts` are those of attribute `clark_name` in the tree under `root` and `element` is the one
+    whose `value` is entering (`sign` 1) or leaving (`sign` -1) the tree. The element index and
+    greatest integer value noted for that attribute, if any, are updated to match.
+    """
+    if value is None:
+        return
+    counts[value] += sign
+    removed = counts[value] <= 0
+    if removed:
+        del counts[value]
+
+    index = _tree_attr_elements.get(root, {}).get(clark_name)
+    if index is not None:
+        if sign > 0:
+            index.setdefault(value, []).append(element)
+        else:
+            elements = index.get(value, [])
+            if element in elements:
+                elements.remove(element)
+            if not elements:
+                index.pop(value, None)
+
+    max_ints = _tree_attr_max_ints.get(root)
+    if not max_ints or clark_name not in max_ints or not value.isdigit():
+        return
+    if removed and int(value) == max_ints[clark_name]:
+        # -- the greatest value has left the tree, the next greatest is found when next asked --
+        del max_ints[clark_name]
+    elif sign > 0 and int(value) > max_ints[clark_name]:
+        max_ints[clark_name] = int(value)
+
+
+@functools.lru_cache(maxsize=512)
+def _compiled_xpath(xpath_str: str) -> etree.XPath:
+    """Compiled XPath for `xpath_str`, using the standard Open XML namespace prefixes."""
+    return etree.XPath(xpath_str, namespaces=_nsmap)
+
+
 def serialize_for_reading(element: ElementBase):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -705,13 +927,147 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str: str) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+    def xpath(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, xpath_str: str, **variables: Any
+    ) -> Any:
         """Override of `lxml` _Element.xpath() method.
 
-        Provides standard Open XML namespace mapping (`nsmap`) in centralized location.
+        Provides standard Open XML namespace mapping (`nsmap`) in centralized location. The
+        expression is compiled on first use and the compiled form reused. Values that vary from
+        call to call are passed as `variables` and referenced as `$name` in the expression, like
+        `self.xpath("./c:pt[@idx=$idx]", idx=3)`, so each distinct value doesn't produce a new
+        expression to compile.
         """
-        return super().xpath(xpath_str, namespaces=_nsmap)
+        return _compiled_xpath(xpath_str)(self, **variables)
 
     @property
     def _nsptag(self) -> str:
         return NamespacePrefixedTag.from_clark_name(self.tag)
+
+    if not TYPE_CHECKING:
+        # -- `lxml` _Element mutators, overridden to count changes made to a tracked tree --
+
+        @property
+        def attrib(self) -> MutableMapping[str, str]:
+            """Mapping of the attributes of this element, changes to which are counted."""
+            return _ChangeTrackingAttrib(self)
+
+        def __delitem__(self, index: Any) -> None:
+            _note_change(self)
+            old = self[index]
+            _note_subtree_moves(old if isinstance(old, list) else [old])
+            super().__delitem__(index)
+
+        def __setitem__(self, index: Any, value: Any) -> None:
+            elements = [value] if isinstance(value, _Element) else list(value)
+            _note_change(self, *elements)
+            old = self[index]
+            removed = [e for e in (old if isinstance(old, list) else [old]) if e not in elements]
+            _note_subtree_moves(removed, elements, self)
+            super().__setitem__(index, value if isinstance(value, _Element) else elements)
+
+        def addnext(self, element: _Element) -> None:
+            _note_change(self, element)
+            _note_subtree_moves((), (element,), self)
+            super().addnext(element)
+
+        def addprevious(self, element: _Element) -> None:
+            _note_change(self, element)
+            _note_subtree_moves((), (element,), self)
+            super().addprevious(element)
+
+        def append(self, element: _Element) -> None:
+            _note_change(self, element)
+            _note_subtree_moves((), (element,), self)
+            super().append(element)
+
+        def clear(self, keep_tail: bool = False) -> None:
+            _note_change(self)
+            # -- this element stays, but without attributes it counts for nothing, same as if
+            # -- it was removed along with its children --
+            _note_subtree_moves((self,))
+            super().clear(keep_tail)
+
+        def extend(self, elements: Iterable[_Element]) -> None:
+            elements = list(elements)
+            _note_change(self, *elements)
+            _note_subtree_moves((), elements, self)
+            super().extend(elements)
+
+        def insert(self, index: int, element: _Element) -> None:
+            _note_change(self, element)
+            _note_subtree_moves((), (element,), self)
+            super().insert(index, element)
+
+        def remove(self, element: _Element) -> None:
+            _note_change(self)
+            # -- `lxml` raises on an element that is not a child, which leaves counts unchanged --
+            if element.getparent() is self:
+                _note_subtree_moves((element,))
+            super().remove(element)
+
+        def replace(self, old_element: _Element, new_element: _Element) -> None:
+            _note_change(self, new_element)
+            if old_element.getparent() is self:
+                removed = () if old_element is new_element else (old_element,)
+                _note_subtree_moves(removed, (new_element,), self)
+            super().replace(old_element, new_element)
+
+        def set(self, key: Any, value: Any) -> None:
+            _note_change(self)
+            _note_attribute_change(self, key, value)
+            super().set(key, value)
+
+        def _set_base(self, value: str | None) -> None:
+            _note_change(self)
+            # -- `lxml` stores the base URL in the `xml:base` attribute --
+            _note_attribute_change(self, _XML_BASE, value)
+            _Element.base.__set__(self, value)
+
+        def _set_tag(self, value: str) -> None:
+            _note_change(self)
+            _Element.tag.__set__(self, value)
+
+        def _set_tail(self, value: str | None) -> None:
+            _note_change(self)
+            _Element.tail.__set__(self, value)
+
+        def _set_text(self, value: str | None) -> None:
+            _note_change(self)
+            _Element.text.__set__(self, value)
+
+        # -- the `lxml` getters are used directly so reading these costs no Python call --
+        base = property(_Element.base.__get__, _set_base)
+        tag = property(_Element.tag.__get__, _set_tag)
+        tail = property(_Element.tail.__get__, _set_tail)
+        text = property(_Element.text.__get__, _set_text)
+
+
+class _ChangeTrackingAttrib(MutableMapping[str, str]):
+    """Attributes of `element`, like `lxml` `_Attrib`, but changes are counted by tree-revision."""
+
+    def __init__(self, element: BaseOxmlElement):
+        self._element = element
+
+    def __delitem__(self, key: str) -> None:
+        _note_change(self._element)
+        if key in self._lxml_attrib:
+            _note_attribute_change(self._element, key, None)
+        del self._lxml_attrib[key]
+
+    def __getitem__(self, key: str) -> str:
+        return self._lxml_attrib[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lxml_attrib)
+
+    def __len__(self) -> int:
+        return len(self._lxml_attrib)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._element.set(key, value)
+
+    @property
+    def _lxml_attrib(self) -> MutableMapping[str, str]:
+        """The `lxml` attributes mapping of the element."""
+        return cast("MutableMapping[str, str]", _Element.attrib.__get__(self._element))
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
-from typing import IO, Iterator
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Collection,
+    Generic,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import OpcPackage
+from pptx.opc.package import OpcPackage, Part
 from pptx.opc.packuri import PackURI
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
 from pptx.util import lazyproperty
 
+if TYPE_CHECKING:
+    from pptx.opc.package import _Relationship  # pyright: ignore[reportPrivateUsage]
+
+_PartT = TypeVar("_PartT", bound=Part)
+
 
 class Package(OpcPackage):
     """An overall .pptx package."""
@@ -51,25 +66,7 @@ class Package(OpcPackage):
         Partname uses the next available sequence number. *ext* is used as the extention on the
         returned partname.
         """
-
-        def first_available_image_idx():
-            image_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if (
-                        part.partname.startswith("/ppt/media/image")
-                        and part.partname.idx is not None
-                    )
-                ]
-            )
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs) + 1
-
-        idx = first_available_image_idx()
+        idx = self._partname_index.first_available_idx("/ppt/media/image")
         return PackURI("/ppt/media/image%d.%s" % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -79,24 +76,22 @@ class Package(OpcPackage):
         sequence numbers are reused. *ext* is used as the extension on the
         returned partname.
         """
-
-        def first_available_media_idx():
-            media_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/media")
-                ]
-            )
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs) + 1
-
-        idx = first_available_media_idx()
+        idx = self._partname_index.first_available_idx("/ppt/media/media")
         return PackURI("/ppt/media/media%d.%s" % (idx, ext))
 
+    def notify_rel_added(self, source: Part | None, rel: _Relationship) -> None:
+        """Also update the SHA1 indexes after relationship `rel` is added.
+
+        `source` is the part `rel` is from, or |None| for a package relationship.
+        """
+        super(Package, self).notify_rel_added(source, rel)
+        if rel.is_external:
+            return
+        if rel.reltype == RT.IMAGE:
+            self._image_parts.add_part(rel.target_part)
+        elif rel.reltype in (RT.MEDIA, RT.VIDEO):
+            self._media_parts.add_part(rel.target_part)
+
     @property
     def presentation_part(self):
         """
@@ -104,6 +99,15 @@ class Package(OpcPackage):
         """
         return self.main_document_part
 
+    def _notify_parts_removed(self, parts: Sequence[Part]) -> None:
+        """Also remove `parts` from the SHA1 indexes.
+
+        A part no longer in the package must not be found (and reused) by a SHA1 lookup.
+        """
+        super(Package, self)._notify_parts_removed(parts)
+        self._image_parts.remove_parts(parts)
+        self._media_parts.remove_parts(parts)
+
     @lazyproperty
     def _image_parts(self):
         """
@@ -143,6 +147,29 @@ class _ImageParts(object):
             image_parts.append(image_part)
             yield image_part
 
+    def add_part(self, part: Part) -> None:
+        """Add `part` to the SHA1 index when that index has been built.
+
+        Called when an image relationship to `part` is added. The first image part having a
+        given SHA1 is the one found by a lookup, same as when the index is built.
+        """
+        sha1_index: _Sha1Index[ImagePart] | None = self.__dict__.get("_sha1_index")
+        if sha1_index is None:
+            return
+        # ---skip unknown/unsupported image types, like SVG---
+        if not isinstance(part, ImagePart):
+            return
+        sha1_index.add(part, part.sha1)
+
+    def remove_parts(self, parts: Collection[Part]) -> None:
+        """Remove each of `parts` from the SHA1 index when that index has been built.
+
+        Called when `parts` are removed from the package.
+        """
+        sha1_index: _Sha1Index[ImagePart] | None = self.__dict__.get("_sha1_index")
+        if sha1_index is not None:
+            sha1_index.remove(parts)
+
     def get_or_add_image_part(self, image_file: str | IO[bytes]) -> ImagePart:
         """Return |ImagePart| object containing the image in `image_file`.
 
@@ -160,13 +187,22 @@ class _ImageParts(object):
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
+        return self._sha1_index.find(sha1)
+
+    @lazyproperty
+    def _sha1_index(self) -> _Sha1Index[ImagePart]:
+        """|_Sha1Index| of the image parts in the package.
+
+        Built on first use and maintained as image parts are related and removed, so finding an
+        image part does not require a traversal of the package graph.
+        """
+        sha1_index: _Sha1Index[ImagePart] = _Sha1Index()
         for image_part in self:
             # ---skip unknown/unsupported image types, like SVG---
             if not hasattr(image_part, "sha1"):
                 continue
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+            sha1_index.add(image_part, image_part.sha1)
+        return sha1_index
 
 
 class _MediaParts(object):
@@ -180,7 +216,7 @@ class _MediaParts(object):
         super(_MediaParts, self).__init__()
         self._package = package
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[MediaPart]:
         """Generate a reference to each |MediaPart| object in the package."""
         # A media part can appear in more than one relationship (and commonly
         # does in the case of video). Use media_parts to keep track of those
@@ -197,6 +233,26 @@ class _MediaParts(object):
             media_parts.append(media_part)
             yield media_part
 
+    def add_part(self, part: Part) -> None:
+        """Add `part` to the SHA1 index when that index has been built.
+
+        Called when a media or video relationship to `part` is added.
+        """
+        sha1_index: _Sha1Index[MediaPart] | None = self.__dict__.get("_sha1_index")
+        if sha1_index is None:
+            return
+        media_part = cast(MediaPart, part)
+        sha1_index.add(media_part, media_part.sha1)
+
+    def remove_parts(self, parts: Collection[Part]) -> None:
+        """Remove each of `parts` from the SHA1 index when that index has been built.
+
+        Called when `parts` are removed from the package.
+        """
+        sha1_index: _Sha1Index[MediaPart] | None = self.__dict__.get("_sha1_index")
+        if sha1_index is not None:
+            sha1_index.remove(parts)
+
     def get_or_add_media_part(self, media):
         """Return a |MediaPart| object containing the media in *media*.
 
@@ -209,14 +265,58 @@ class _MediaParts(object):
             media_part = MediaPart.new(self._package, media)
         return media_part
 
-    def _find_by_sha1(self, sha1):
+    def _find_by_sha1(self, sha1: str) -> MediaPart | None:
         """Return |MediaPart| object having *sha1* hash or None if not found.
 
         All media parts belonging to this package are considered. A media
         part is identified by the SHA1 hash digest of its bytestream
         ("file").
         """
+        return self._sha1_index.find(sha1)
+
+    @lazyproperty
+    def _sha1_index(self) -> _Sha1Index[MediaPart]:
+        """|_Sha1Index| of the media parts in the package.
+
+        Built on first use and maintained as media parts are related and removed.
+        """
+        sha1_index: _Sha1Index[MediaPart] = _Sha1Index()
         for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
-        return None
+            sha1_index.add(media_part, media_part.sha1)
+        return sha1_index
+
+
+class _Sha1Index(Generic[_PartT]):
+    """Index of parts by the SHA1 hash digest of their content.
+
+    Each part having a SHA1 is kept, in the order added, so when the part a lookup finds is
+    removed the next one having that SHA1 is found in its place. The SHA1 of each part is also
+    kept, so removing a part does not read its content to compute it again.
+    """
+
+    def __init__(self):
+        self._parts_by_sha1: dict[str, list[_PartT]] = {}
+        self._sha1_by_part: dict[Part, str] = {}
+
+    def add(self, part: _PartT, sha1: str) -> None:
+        """Add `part`, having content with hash digest `sha1`, when it is not already present."""
+        if part in self._sha1_by_part:
+            return
+        self._sha1_by_part[part] = sha1
+        self._parts_by_sha1.setdefault(sha1, []).append(part)
+
+    def find(self, sha1: str) -> _PartT | None:
+        """The first part added having `sha1` and not since removed, |None| if there is none."""
+        parts = self._parts_by_sha1.get(sha1)
+        return parts[0] if parts else None
+
+    def remove(self, parts: Iterable[Part]) -> None:
+        """Remove each of `parts` present in the index; any other part is ignored."""
+        for part in parts:
+            sha1 = self._sha1_by_part.pop(part, None)
+            if sha1 is None:
+                continue
+            sha1_parts = self._parts_by_sha1[sha1]
+            sha1_parts.remove(part)  # pyright: ignore[reportArgumentType]
+            if not sha1_parts:
+                del self._parts_by_sha1[sha1]
@@ -10,6 +10,7 @@ from typing import IO, TYPE_CHECKING, Any, cast
 from PIL import Image as PIL_Image
 
 from pptx.opc.package import Part
+from pptx.opc.serialized import FILE_BACKED_MIN_SIZE, FileBackedBlob, PathBlob
 from pptx.opc.spec import image_content_types
 from pptx.util import Emu, lazyproperty
 
@@ -30,11 +31,10 @@ class ImagePart(Part):
         partname: PackURI,
         content_type: str,
         package: Package,
-        blob: bytes,
+        blob: bytes | FileBackedBlob,
         filename: str | None = None,
     ):
         super(ImagePart, self).__init__(partname, content_type, package, blob)
-        self._blob = blob
         self._filename = filename
 
     @classmethod
@@ -43,11 +43,12 @@ class ImagePart(Part):
 
         `image` is an |Image| object.
         """
+        file_blob = image.file_blob
         return cls(
             package.next_image_partname(image.ext),
             image.content_type,
             package,
-            image.blob,
+            image.blob if file_blob is None else file_blob,
             image.filename,
         )
 
@@ -75,7 +76,7 @@ class ImagePart(Part):
 
         Note this is a `pptx.image.Image` object, not a PIL Image.
         """
-        return Image(self._blob, self.desc)
+        return Image(self._blob_or_file_blob, self.desc)
 
     def scale(self, scaled_cx: int | None, scaled_cy: int | None) -> tuple[int, int]:
         """Return scaled image dimensions in EMU based on the combination of parameters supplied.
@@ -109,12 +110,21 @@ class ImagePart(Part):
 
         like: `"1be010ea47803b00e140b852765cdf84f491da47"`.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._file_blob is not None:
+            return self._file_blob.sha1
+        return hashlib.sha1(self._blob or b"").hexdigest()
+
+    @property
+    def _blob_or_file_blob(self) -> bytes | FileBackedBlob:
+        """The image content, either in memory or left in its file."""
+        if self._file_blob is not None and self._blob is None:
+            return self._file_blob
+        return self._blob or b""
 
     @property
     def _dpi(self) -> tuple[int, int]:
         """(horz_dpi, vert_dpi) pair representing the dots-per-inch resolution of this image."""
-        image = Image.from_blob(self._blob)
+        image = Image.from_blob(self._blob_or_file_blob)
         return image.dpi
 
     @property
@@ -135,20 +145,20 @@ class ImagePart(Part):
     @property
     def _px_size(self) -> tuple[int, int]:
         """A (width, height) 2-tuple representing the dimensions of this image in pixels."""
-        image = Image.from_blob(self._blob)
+        image = Image.from_blob(self._blob_or_file_blob)
         return image.size
 
 
 class Image(object):
     """Immutable value object representing an image such as a JPEG, PNG, or GIF."""
 
-    def __init__(self, blob: bytes, filename: str | None):
+    def __init__(self, blob: bytes | FileBackedBlob, filename: str | None):
         super(Image, self).__init__()
         self._blob = blob
         self._filename = filename
 
     @classmethod
-    def from_blob(cls, blob: bytes, filename: str | None = None) -> Image:
+    def from_blob(cls, blob: bytes | FileBackedBlob, filename: str | None = None) -> Image:
         """Return a new |Image| object loaded from the image binary in `blob`."""
         return cls(blob, filename)
 
@@ -156,12 +166,19 @@ class Image(object):
     def from_file(cls, image_file: str | IO[bytes]) -> Image:
         """Return a new |Image| object loaded from `image_file`.
 
-        `image_file` can be either a path (str) or a file-like object.
+        `image_file` can be either a path (str) or a file-like object. An image file at a path
+        that is larger than `pptx.opc.serialized.FILE_BACKED_MIN_SIZE` is not read into memory;
+        it is streamed from that path when the presentation is saved, so it must remain in place
+        until then.
         """
+        blob: bytes | FileBackedBlob
         if isinstance(image_file, str):
             # treat image_file as a path
-            with open(image_file, "rb") as f:
-                blob = f.read()
+            if os.path.getsize(image_file) >= FILE_BACKED_MIN_SIZE:
+                blob = PathBlob(image_file)
+            else:
+                with open(image_file, "rb") as f:
+                    blob = f.read()
             filename = os.path.basename(image_file)
         else:
             # assume image_file is a file-like object
@@ -175,7 +192,12 @@ class Image(object):
 
     @property
     def blob(self) -> bytes:
-        """The binary image bytestream of this image."""
+        """The binary image bytestream of this image.
+
+        A file-backed image is read from its file each time.
+        """
+        if isinstance(self._blob, FileBackedBlob):
+            return self._blob.read()
         return self._blob
 
     @lazyproperty
@@ -237,6 +259,14 @@ class Image(object):
             raise ValueError(tmpl % (ext_map.keys(), format))
         return ext_map[format]
 
+    @property
+    def file_blob(self) -> FileBackedBlob | None:
+        """|FileBackedBlob| for an image left in its file rather than read into memory.
+
+        |None| when the bytes of this image are held in memory.
+        """
+        return self._blob if isinstance(self._blob, FileBackedBlob) else None
+
     @property
     def filename(self) -> str | None:
         """Filename from path used to load this image, if loaded from the filesystem.
@@ -248,6 +278,8 @@ class Image(object):
     @lazyproperty
     def sha1(self) -> str:
         """SHA1 hash digest of the image blob."""
+        if isinstance(self._blob, FileBackedBlob):
+            return self._blob.sha1
         return hashlib.sha1(self._blob).hexdigest()
 
     @lazyproperty
@@ -263,7 +295,10 @@ class Image(object):
     @lazyproperty
     def _pil_props(self) -> tuple[str | None, tuple[int, int], tuple[int, int] | None]:
         """tuple of image properties extracted from this image using Pillow."""
-        stream = io.BytesIO(self._blob)
+        # -- Pillow reads only as much of a file-backed image as it needs for these --
+        stream = (
+            self._blob.open() if isinstance(self._blob, FileBackedBlob) else io.BytesIO(self._blob)
+        )
         pil_image = PIL_Image.open(stream)  # pyright: ignore[reportUnknownMemberType]
         format = pil_image.format
         width_px, height_px = pil_image.size
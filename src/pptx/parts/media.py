@@ -25,7 +25,7 @@ class MediaPart(Part):
             package.next_media_partname(media.ext),
             media.content_type,
             package,
-            media.blob,
+            media.blob if media.file_blob is None else media.file_blob,
         )
 
     @lazyproperty
@@ -34,4 +34,6 @@ class MediaPart(Part):
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._file_blob is not None:
+            return self._file_blob.sha1
+        return hashlib.sha1(self._blob or b"").hexdigest()
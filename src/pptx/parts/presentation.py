@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterable
+from typing import IO, TYPE_CHECKING, Iterable, Iterator
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import XmlPart
@@ -12,6 +12,7 @@ from pptx.presentation import Presentation
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from pptx.opc.serialized import CompressionPolicy
     from pptx.parts.coreprops import CorePropertiesPart
     from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
@@ -51,6 +52,16 @@ class PresentationPart(XmlPart):
                 return self.related_part(sldId.rId).slide
         return None
 
+    def iter_save(
+        self, workers: int = 1, compression: str | CompressionPolicy = "default"
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this presentation package in chunks.
+
+        The bytes are those :meth:`save` would write. `workers` and `compression` are as for
+        :meth:`save`.
+        """
+        return self.package.iter_save(workers=workers, compression=compression)
+
     @lazyproperty
     def notes_master(self) -> NotesMaster:
         """
@@ -103,13 +114,19 @@ class PresentationPart(XmlPart):
             slide_part = self.related_part(rId)
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def save(
+        self,
+        path_or_stream: str | IO[bytes],
+        workers: int = 1,
+        compression: str | CompressionPolicy = "default",
+    ):
         """Save this presentation package to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. `workers` is the number of threads used to compress parts and
+        `compression` determines how each of them is compressed.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, workers=workers, compression=compression)
 
     def slide_id(self, slide_part):
         """Return the slide-id associated with `slide_part`."""
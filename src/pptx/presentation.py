@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Iterator, cast
 
 from pptx.shared import PartElementProxy
 from pptx.slide import SlideMasters, Slides
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from pptx.opc.serialized import CompressionPolicy
     from pptx.oxml.presentation import CT_Presentation, CT_SlideId
     from pptx.parts.presentation import PresentationPart
     from pptx.slide import NotesMaster, SlideLayouts
@@ -33,6 +34,21 @@ class Presentation(PartElementProxy):
         """
         return self.part.core_properties
 
+    def iter_save(
+        self, workers: int = 1, compression: str | CompressionPolicy = "default"
+    ) -> Iterator[bytes]:
+        """Generate the bytes of this presentation, as saved to a .pptx file, in chunks.
+
+        Each chunk is available as soon as the part it contains is written, so a large
+        presentation can be sent to a non-seekable destination, like an HTTP response or a
+        pipe, without first assembling it in memory. `workers` and `compression` are as for
+        :meth:`save`.
+
+        Note that :meth:`save` also accepts a write-only file-like object that does not support
+        seeking.
+        """
+        return self.part.iter_save(workers=workers, compression=compression)
+
     @property
     def notes_master(self) -> NotesMaster:
         """Instance of |NotesMaster| for this presentation.
@@ -42,12 +58,34 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file: str | IO[bytes]):
+    def save(
+        self,
+        file: str | IO[bytes],
+        workers: int = 1,
+        compression: str | CompressionPolicy = "default",
+    ):
         """Writes this presentation to `file`.
 
-        `file` can be either a file-path or a file-like object open for writing bytes.
+        `file` can be either a file-path or a file-like object open for writing bytes. When
+        `file` is the path of an existing directory, the package is saved expanded into that
+        directory, one uncompressed file per part, in the form a presentation can also be opened
+        from. When the directory already holds a package, like one saved there earlier, any member
+        of it not written again, like a part removed since, is deleted once the package is
+        written. Other files in the directory are left as they are.
+
+        Optional `workers` is the number of threads used to compress the parts of the package.
+        Compressing on more than one thread can shorten the save of a large presentation on a
+        multi-core machine. The default compresses each part in turn on the calling thread.
+
+        Optional `compression` trades file size for save speed. It is the name of a compression
+        profile; "default", "balanced", "fast", "smallest", or "stored"; or a
+        :class:`pptx.opc.serialized.CompressionPolicy` instance. The "fast" profile, for
+        example, stores already-compressed media like JPEG and MP4 files as-is and deflates XML
+        at the fastest level. Parts unchanged since loading are copied from the package they were
+        loaded from without being compressed again, except where the profile calls for smaller
+        compression than they have, as "smallest" does.
         """
-        self.part.save(file)
+        self.part.save(file, workers=workers, compression=compression)
 
     @property
     def slide_height(self) -> Length | None:
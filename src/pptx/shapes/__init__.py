@@ -16,6 +16,8 @@ class Subshape(object):
     `self._parent` attribute to subclasses.
     """
 
+    __slots__ = ("_parent", "__weakref__")
+
     def __init__(self, parent: ProvidesPart):
         super(Subshape, self).__init__()
         self._parent = parent
@@ -12,7 +12,7 @@ from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_SHAPE_TYPE
 from pptx.shapes.base import BaseShape
 from pptx.spec import autoshape_types
 from pptx.text.text import TextFrame
-from pptx.util import lazyproperty
+from pptx.util import lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.oxml.shapes.autoshape import CT_GeomGuide, CT_PresetGeometry2D, CT_Shape
@@ -259,11 +259,13 @@ class Shape(BaseShape):
     (slide, slideLayout, slideMaster, notesPage, notesMaster, handoutMaster).
     """
 
+    __slots__ = ("_sp", "_lazy_adjustments", "_lazy_fill", "_lazy_line")
+
     def __init__(self, sp: CT_Shape, parent: ProvidesPart):
         super(Shape, self).__init__(sp, parent)
         self._sp = sp
 
-    @lazyproperty
+    @lazyslotproperty
     def adjustments(self) -> AdjustmentCollection:
         """Read-only reference to |AdjustmentCollection| instance for this shape."""
         return AdjustmentCollection(self._sp.prstGeom)
@@ -278,7 +280,7 @@ class Shape(BaseShape):
             raise ValueError("shape is not an auto shape")
         return self._sp.prst
 
-    @lazyproperty
+    @lazyslotproperty
     def fill(self):
         """|FillFormat| instance for this shape.
 
@@ -295,7 +297,7 @@ class Shape(BaseShape):
         """|True| if this shape can contain text. Always |True| for an AutoShape."""
         return True
 
-    @lazyproperty
+    @lazyslotproperty
     def line(self):
         """|LineFormat| instance for this shape.
 
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, cast
 from pptx.action import ActionSetting
 from pptx.dml.effect import ShadowFormat
 from pptx.shared import ElementProxy
-from pptx.util import lazyproperty
+from pptx.util import lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
@@ -24,6 +24,8 @@ class BaseShape(object):
     Subclasses include |Shape|, |Picture|, and |GraphicFrame|.
     """
 
+    __slots__ = ("_element", "_parent", "_lazy_click_action", "_lazy_shadow", "__weakref__")
+
     def __init__(self, shape_elm: ShapeElement, parent: ProvidesPart):
         super().__init__()
         self._element = shape_elm
@@ -44,7 +46,7 @@ class BaseShape(object):
             return True
         return self._element is not other._element
 
-    @lazyproperty
+    @lazyslotproperty
     def click_action(self) -> ActionSetting:
         """|ActionSetting| instance providing access to click behaviors.
 
@@ -164,7 +166,7 @@ class BaseShape(object):
     def rotation(self, value: float):
         self._element.rot = value
 
-    @lazyproperty
+    @lazyslotproperty
     def shadow(self) -> ShadowFormat:
         """|ShadowFormat| object providing access to shadow for this shape.
 
@@ -221,6 +223,8 @@ class _PlaceholderFormat(ElementProxy):
     Accessed via the :attr:`~.BaseShape.placeholder_format` property of a placeholder shape,
     """
 
+    __slots__ = ("_ph",)
+
     def __init__(self, element: CT_Placeholder):
         super().__init__(element)
         self._ph = element
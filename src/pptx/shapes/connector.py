@@ -10,7 +10,7 @@ from __future__ import annotations
 from pptx.dml.line import LineFormat
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.shapes.base import BaseShape
-from pptx.util import Emu, lazyproperty
+from pptx.util import Emu, lazyslotproperty
 
 
 class Connector(BaseShape):
@@ -21,6 +21,8 @@ class Connector(BaseShape):
     have elbows, or can be curved.
     """
 
+    __slots__ = ("_lazy_line",)
+
     def begin_connect(self, shape, cxn_pt_idx):
         """
         **EXPERIMENTAL** - *The current implementation only works properly
@@ -222,7 +224,7 @@ class Connector(BaseShape):
         """Helper method required by |LineFormat|."""
         return self._element.spPr.get_or_add_ln()
 
-    @lazyproperty
+    @lazyslotproperty
     def line(self):
         """|LineFormat| instance for this connector.
 
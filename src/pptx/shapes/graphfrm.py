@@ -17,7 +17,7 @@ from pptx.spec import (
     GRAPHIC_DATA_URI_TABLE,
 )
 from pptx.table import Table
-from pptx.util import lazyproperty
+from pptx.util import lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.chart.chart import Chart
@@ -34,6 +34,8 @@ class GraphicFrame(BaseShape):
     Corresponds to a `p:graphicFrame` element in the shape tree.
     """
 
+    __slots__ = ("_graphicFrame",)
+
     def __init__(self, graphicFrame: CT_GraphicalObjectFrame, parent: ProvidesPart):
         super().__init__(graphicFrame, parent)
         self._graphicFrame = graphicFrame
@@ -85,7 +87,7 @@ class GraphicFrame(BaseShape):
             raise ValueError("not an OLE-object shape")
         return _OleFormat(self._graphicFrame.graphicData, self._parent)
 
-    @lazyproperty
+    @lazyslotproperty
     def shadow(self) -> ShadowFormat:
         """Unconditionally raises |NotImplementedError|.
 
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from pptx.dml.effect import ShadowFormat
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.shapes.base import BaseShape
-from pptx.util import lazyproperty
+from pptx.util import lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.action import ActionSetting
@@ -19,11 +19,13 @@ if TYPE_CHECKING:
 class GroupShape(BaseShape):
     """A shape that acts as a container for other shapes."""
 
+    __slots__ = ("_grpSp", "_lazy_shapes")
+
     def __init__(self, grpSp: CT_GroupShape, parent: ProvidesPart):
         super().__init__(grpSp, parent)
         self._grpSp = grpSp
 
-    @lazyproperty
+    @lazyslotproperty
     def click_action(self) -> ActionSetting:
         """Unconditionally raises `TypeError`.
 
@@ -40,7 +42,7 @@ class GroupShape(BaseShape):
         """
         return False
 
-    @lazyproperty
+    @lazyslotproperty
     def shadow(self) -> ShadowFormat:
         """|ShadowFormat| object representing shadow effect for this group.
 
@@ -57,7 +59,7 @@ class GroupShape(BaseShape):
         """
         return MSO_SHAPE_TYPE.GROUP
 
-    @lazyproperty
+    @lazyslotproperty
     def shapes(self) -> GroupShapes:
         """|GroupShapes| object for this group.
 
@@ -8,7 +8,7 @@ from pptx.dml.line import LineFormat
 from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE, PP_MEDIA_TYPE
 from pptx.shapes.base import BaseShape
 from pptx.shared import ParentedElementProxy
-from pptx.util import lazyproperty
+from pptx.util import lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.oxml.shapes.picture import CT_Picture
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 class _BasePicture(BaseShape):
     """Base class for shapes based on a `p:pic` element."""
 
+    __slots__ = ("_pic", "_lazy_line")
+
     def __init__(self, pic: CT_Picture, parent: ProvidesPart):
         super(_BasePicture, self).__init__(pic, parent)
         self._pic = pic
@@ -80,7 +82,7 @@ class _BasePicture(BaseShape):
         """
         return self._pic.get_or_add_ln()
 
-    @lazyproperty
+    @lazyslotproperty
     def line(self) -> LineFormat:
         """Provides access to properties of the picture outline, such as its color and width."""
         return LineFormat(self)
@@ -102,7 +104,9 @@ class Movie(_BasePicture):
     and a *poster frame*, the placeholder image that represents the video before it is played.
     """
 
-    @lazyproperty
+    __slots__ = ("_lazy_media_format",)
+
+    @lazyslotproperty
     def media_format(self) -> _MediaFormat:
         """The |_MediaFormat| object for this movie.
 
@@ -145,6 +149,8 @@ class Picture(_BasePicture):
     Based on the `p:pic` element.
     """
 
+    __slots__ = ()
+
     @property
     def auto_shape_type(self) -> MSO_SHAPE | None:
         """Member of MSO_SHAPE indicating masking shape.
@@ -31,6 +31,8 @@ class _InheritsDimensions(object):
     to inherit from.
     """
 
+    __slots__ = ()
+
     @property
     def height(self):
         """
@@ -130,6 +132,8 @@ class _BaseSlidePlaceholder(_InheritsDimensions, Shape):
     Provides common behaviors such as inherited dimensions.
     """
 
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -183,6 +187,8 @@ class BasePlaceholder(Shape):
     behaviors of placeholders on a master, layout, and slide.
     """
 
+    __slots__ = ()
+
     @property
     def idx(self):
         """
@@ -219,6 +225,8 @@ class LayoutPlaceholder(_InheritsDimensions, Shape):
     shape properties from the master placeholder having the same type, when a matching one exists.
     """
 
+    __slots__ = ()
+
     element: CT_Shape  # pyright: ignore[reportIncompatibleMethodOverride]
 
     @property
@@ -249,6 +257,8 @@ class LayoutPlaceholder(_InheritsDimensions, Shape):
 class MasterPlaceholder(BasePlaceholder):
     """Placeholder shape on a slide master."""
 
+    __slots__ = ()
+
     element: CT_Shape  # pyright: ignore[reportIncompatibleMethodOverride]
 
 
@@ -258,6 +268,8 @@ class NotesSlidePlaceholder(_InheritsDimensions, Shape):
     placeholder on the notes master that has the same type (e.g. 'body').
     """
 
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -276,10 +288,14 @@ class SlidePlaceholder(_BaseSlidePlaceholder):
     corresponding slide layout placeholder.
     """
 
+    __slots__ = ()
+
 
 class ChartPlaceholder(_BaseSlidePlaceholder):
     """Placeholder shape that can only accept a chart."""
 
+    __slots__ = ()
+
     def insert_chart(self, chart_type, chart_data):
         """
         Return a |PlaceholderGraphicFrame| object containing a new chart of
@@ -311,6 +327,8 @@ class ChartPlaceholder(_BaseSlidePlaceholder):
 class PicturePlaceholder(_BaseSlidePlaceholder):
     """Placeholder shape that can only accept a picture."""
 
+    __slots__ = ()
+
     def insert_picture(self, image_file):
         """Return a |PlaceholderPicture| object depicting the image in `image_file`.
 
@@ -352,6 +370,8 @@ class PlaceholderGraphicFrame(GraphicFrame):
     Placeholder shape populated with a table, chart, or smart art.
     """
 
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -366,6 +386,8 @@ class PlaceholderPicture(_InheritsDimensions, Picture):
     Placeholder shape populated with a picture.
     """
 
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -378,6 +400,8 @@ class PlaceholderPicture(_InheritsDimensions, Picture):
 class TablePlaceholder(_BaseSlidePlaceholder):
     """Placeholder shape that can only accept a table."""
 
+    __slots__ = ()
+
     def insert_table(self, rows, cols):
         """Return |PlaceholderGraphicFrame| object containing a `rows` by `cols` table.
 
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import copy
 import io
 import os
 from typing import IO, TYPE_CHECKING, Callable, Iterable, Iterator, cast
 
-from pptx.enum.shapes import PP_PLACEHOLDER, PROG_ID
+from typing_extensions import Literal, Required, TypedDict
+
+from pptx.enum.shapes import MSO_CONNECTOR_TYPE, PP_PLACEHOLDER, PROG_ID
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.oxml.ns import qn
 from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.simpletypes import ST_Direction
+from pptx.oxml.text import CT_TextParagraph
+from pptx.oxml.xmlchemy import OxmlElement
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -38,10 +44,10 @@ from pptx.util import Emu, lazyproperty
 if TYPE_CHECKING:
     from pptx.chart.chart import Chart
     from pptx.chart.data import ChartData
+    from pptx.dml.color import RGBColor
     from pptx.enum.chart import XL_CHART_TYPE
-    from pptx.enum.shapes import MSO_CONNECTOR_TYPE, MSO_SHAPE
+    from pptx.enum.shapes import MSO_SHAPE
     from pptx.oxml.shapes import ShapeElement
-    from pptx.oxml.shapes.connector import CT_Connector
     from pptx.oxml.shapes.groupshape import CT_GroupShape
     from pptx.parts.image import ImagePart
     from pptx.parts.slide import SlidePart
@@ -49,6 +55,30 @@ if TYPE_CHECKING:
     from pptx.types import ProvidesPart
     from pptx.util import Length
 
+
+class ShapeDescription(TypedDict, total=False):
+    """Description of a shape to be added by `add_shapes()`.
+
+    `type` is required and is either a member of :ref:`MsoAutoShapeType`, a member of
+    :ref:`MsoConnectorType` or `"textbox"`. An auto shape or text box is positioned by `left`,
+    `top`, `width` and `height` and a connector by `begin_x`, `begin_y`, `end_x` and `end_y`, each
+    a |Length| defaulting to 0. The optional `text` and `fill` (an |RGBColor| for a solid fill)
+    apply only to an auto shape or text box.
+    """
+
+    type: Required[MSO_SHAPE | MSO_CONNECTOR_TYPE | Literal["textbox"]]
+    left: Length
+    top: Length
+    width: Length
+    height: Length
+    begin_x: Length
+    begin_y: Length
+    end_x: Length
+    end_y: Length
+    text: str
+    fill: RGBColor
+
+
 # +-- _BaseShapes
 # |   |
 # |   +-- _BaseGroupShapes
@@ -83,21 +113,26 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree: CT_GroupShape, parent: ProvidesPart):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
+        self._turbo_add_enabled = False
+        # -- each cached shape object references its shape element, so the cache holds on to the
+        # -- element until the entry is pruned, a weak-keyed mapping would be of no help here --
+        self._proxy_cache: dict[ShapeElement, BaseShape] | None = None
 
     def __getitem__(self, idx: int) -> BaseShape:
         """Return shape at `idx` in sequence, e.g. `shapes[2]`."""
+        self._prune_proxy_cache()
         shape_elms = list(self._iter_member_elms())
         try:
             shape_elm = shape_elms[idx]
         except IndexError:
             raise IndexError("shape index out of range")
-        return self._shape_factory(shape_elm)
+        return self._shape_proxy(shape_elm)
 
     def __iter__(self) -> Iterator[BaseShape]:
         """Generate a reference to each shape in the collection, in sequence."""
+        self._prune_proxy_cache()
         for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+            yield self._shape_proxy(shape_elm)
 
     def __len__(self) -> int:
         """Return count of shapes in this shape tree.
@@ -116,6 +151,22 @@ class _BaseShapes(ParentedElementProxy):
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
 
+    def get_by_id(self, shape_id: int, default: BaseShape | None = None) -> BaseShape | None:
+        """The shape in this collection having `shape_id`, or `default` if not found.
+
+        The shape is found from an index of the ids in the slide, so this does not iterate the
+        shapes. As with indexed access, the shapes inside a group shape are not searched.
+        """
+        return self._get_by_cNvPr("id", str(shape_id), default)
+
+    def get_by_name(self, name: str, default: BaseShape | None = None) -> BaseShape | None:
+        """The first shape in this collection named `name`, or `default` if not found.
+
+        The shape is found from an index of the shape names in the slide, so this does not iterate
+        the shapes. As with indexed access, the shapes inside a group shape are not searched.
+        """
+        return self._get_by_cNvPr("name", name, default)
+
     def ph_basename(self, ph_type: PP_PLACEHOLDER) -> str:
         """Return the base name for a placeholder of `ph_type` in this shape collection.
 
@@ -141,35 +192,66 @@ class _BaseShapes(ParentedElementProxy):
         }[ph_type]
 
     @property
-    def turbo_add_enabled(self) -> bool:
-        """True if "turbo-add" mode is enabled. Read/Write.
+    def proxy_cache_enabled(self) -> bool:
+        """True if each shape in this collection is represented by a single shape object.
+
+        Read/Write. Default is |False|, in which case each access to a shape, by iteration,
+        indexing or otherwise, produces a new shape object. When enabled, the shape object for
+        each shape element is cached and returned again on each later access, so values a shape
+        object computes once and keeps, such as its text frame or fill, are not recomputed on
+        each pass over the shapes. This suits code that scans the same shapes repeatedly.
+
+        A cached shape object is only valid as long as its shape element is not replaced, so this
+        should not be enabled when the XML is changed by other means than this API. The shape
+        object of a shape element removed from the shape tree is dropped from the cache on the
+        next iteration or indexing of the collection. Disabling it discards the cache.
+        """
+        return self._proxy_cache is not None
 
-        EXPERIMENTAL: This feature can radically improve performance when adding large numbers
-        (hundreds of shapes) to a slide. It works by caching the last shape ID used and
-        incrementing that value to assign the next shape id. This avoids repeatedly searching all
-        shape ids in the slide each time a new ID is required.
+    @proxy_cache_enabled.setter
+    def proxy_cache_enabled(self, value: bool):
+        if not value:
+            self._proxy_cache = None
+        elif self._proxy_cache is None:
+            self._proxy_cache = {}
 
-        Performance is not noticeably improved for a slide with a relatively small number of
-        shapes, but because the search time rises with the square of the shape count, this option
-        can be useful for optimizing generation of a slide composed of many shapes.
+    @property
+    def turbo_add_enabled(self) -> bool:
+        """True if "turbo-add" mode is enabled. Read/Write.
 
-        Shape-id collisions can occur (causing a repair error on load) if more than one |Slide|
-        object is used to interact with the same slide in the presentation. Note that the |Slides|
-        collection creates a new |Slide| object each time a slide is accessed (e.g. `slide =
-        prs.slides[0]`, so you must be careful to limit use to a single |Slide| object.
+        DEPRECATED: This setting no longer has any effect and is retained only for backward
+        compatibility. Shape ids are now always assigned from the maximum id in the slide, which is
+        kept current as the slide changes rather than searched for on each new shape. So adding a
+        large number of shapes is fast without it, and no shape-id collision can occur when more
+        than one |Slide| object is used to interact with the same slide.
         """
-        return self._cached_max_shape_id is not None
+        return self._turbo_add_enabled
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value: bool):
-        enable = bool(value)
-        self._cached_max_shape_id = self._spTree.max_shape_id if enable else None
+        self._turbo_add_enabled = bool(value)
 
     @staticmethod
     def _is_member_elm(shape_elm: ShapeElement) -> bool:
         """Return true if `shape_elm` represents a member of this collection, False otherwise."""
         return True
 
+    def _get_by_cNvPr(
+        self, attr_name: str, value: str, default: BaseShape | None
+    ) -> BaseShape | None:
+        """The first shape in this collection whose `p:cNvPr` has `attr_name` of `value`."""
+        shape_elms = [
+            shape_elm
+            for shape_elm in self._spTree.iter_shape_elms_by_cNvPr(attr_name, value)
+            if self._is_member_elm(shape_elm)
+        ]
+        if not shape_elms:
+            return default
+        # -- more than one match is unusual, the first in document order is the one returned --
+        if len(shape_elms) > 1:
+            shape_elms.sort(key=self._spTree.index)
+        return self._shape_proxy(shape_elms[0])
+
     def _iter_member_elms(self) -> Iterator[ShapeElement]:
         """Generate each child of the `p:spTree` element that corresponds to a shape.
 
@@ -195,10 +277,9 @@ class _BaseShapes(ParentedElementProxy):
 
         # increment numpart as necessary to make name unique
         numpart = id - 1
-        names = self._spTree.xpath("//p:cNvPr/@name")
         while True:
             name = "%s %d" % (basename, numpart)
-            if name not in names:
+            if not self._spTree.cNvPr_name_is_used(name):
                 break
             numpart += 1
 
@@ -211,17 +292,35 @@ class _BaseShapes(ParentedElementProxy):
         The returned id is 1 greater than the maximum shape id used so far. In practice, the
         minimum id is 2 because the spTree element is always assigned id="1".
         """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
-
         return self._spTree.max_shape_id + 1
 
     def _shape_factory(self, shape_elm: ShapeElement) -> BaseShape:
         """Return an instance of the appropriate shape proxy class for `shape_elm`."""
         return BaseShapeFactory(shape_elm, self)
 
+    def _prune_proxy_cache(self) -> None:
+        """Drop each cached shape object whose shape element is no longer in this shape tree.
+
+        Called on each pass over the shape tree, which this costs no more than.
+        """
+        proxy_cache = self._proxy_cache
+        if not proxy_cache:
+            return
+        spTree = self._spTree
+        removed = [shape_elm for shape_elm in proxy_cache if shape_elm.getparent() is not spTree]
+        for shape_elm in removed:
+            del proxy_cache[shape_elm]
+
+    def _shape_proxy(self, shape_elm: ShapeElement) -> BaseShape:
+        """Return the shape object for `shape_elm`, the cached one when the cache is enabled."""
+        proxy_cache = self._proxy_cache
+        if proxy_cache is None:
+            return self._shape_factory(shape_elm)
+        shape = proxy_cache.get(shape_elm)
+        if shape is None:
+            shape = proxy_cache[shape_elm] = self._shape_factory(shape_elm)
+        return shape
+
 
 class _BaseGroupShapes(_BaseShapes):
     """Base class for shape-trees that can add shapes."""
@@ -255,7 +354,7 @@ class _BaseGroupShapes(_BaseShapes):
         rId = self.part.add_chart_part(chart_type, chart_data)
         graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
         self._recalculate_extents()
-        return cast("Chart", self._shape_factory(graphicFrame))
+        return cast("Chart", self._shape_proxy(graphicFrame))
 
     def add_connector(
         self,
@@ -273,7 +372,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         cxnSp = self._add_cxnSp(connector_type, begin_x, begin_y, end_x, end_y)
         self._recalculate_extents()
-        return cast(Connector, self._shape_factory(cxnSp))
+        return cast(Connector, self._shape_proxy(cxnSp))
 
     def add_group_shape(self, shapes: Iterable[BaseShape] = ()) -> GroupShape:
         """Return a |GroupShape| object newly appended to this shape tree.
@@ -291,7 +390,7 @@ class _BaseGroupShapes(_BaseShapes):
             )
         if shapes:
             grpSp.recalculate_extents()
-        return cast(GroupShape, self._shape_factory(grpSp))
+        return cast(GroupShape, self._shape_proxy(grpSp))
 
     def add_ole_object(
         self,
@@ -348,7 +447,7 @@ class _BaseGroupShapes(_BaseShapes):
         )
         self._spTree.append(graphicFrame)
         self._recalculate_extents()
-        return cast(GraphicFrame, self._shape_factory(graphicFrame))
+        return cast(GraphicFrame, self._shape_proxy(graphicFrame))
 
     def add_picture(
         self,
@@ -370,7 +469,7 @@ class _BaseGroupShapes(_BaseShapes):
         image_part, rId = self.part.get_or_add_image_part(image_file)
         pic = self._add_pic_from_image_part(image_part, rId, left, top, width, height)
         self._recalculate_extents()
-        return cast(Picture, self._shape_factory(pic))
+        return cast(Picture, self._shape_proxy(pic))
 
     def add_shape(
         self, autoshape_type_id: MSO_SHAPE, left: Length, top: Length, width: Length, height: Length
@@ -384,7 +483,29 @@ class _BaseGroupShapes(_BaseShapes):
         autoshape_type = AutoShapeType(autoshape_type_id)
         sp = self._add_sp(autoshape_type, left, top, width, height)
         self._recalculate_extents()
-        return cast(Shape, self._shape_factory(sp))
+        return cast(Shape, self._shape_proxy(sp))
+
+    def add_shapes(
+        self, shapes: Iterable[ShapeDescription], return_shapes: bool = False
+    ) -> list[BaseShape] | None:
+        """Append a new shape to this shape tree for each item in `shapes`, in a single pass.
+
+        Each item is a `ShapeDescription` mapping, e.g. `{"type": MSO_SHAPE.RECTANGLE, "left":
+        Inches(1), "top": Inches(1), "width": Inches(2), "height": Inches(1), "text": "Foo"}`. The
+        shapes are the same as those `add_shape()`, `add_connector()` and `add_textbox()` would
+        produce, but are added much faster when there are many of them. Each element is copied
+        from one prepared for its type rather than parsed, the shapes are assigned consecutive
+        ids, and no shape object is created for a shape unless asked for.
+
+        Returns a list of the new shapes, in the order described, when `return_shapes` is True,
+        and |None| otherwise.
+        """
+        shape_elms = list(self._iter_new_shape_elms(shapes))
+        self._spTree.add_shape_elms(shape_elms)
+        self._recalculate_extents()
+        if not return_shapes:
+            return None
+        return [self._shape_proxy(shape_elm) for shape_elm in shape_elms]
 
     def add_textbox(self, left: Length, top: Length, width: Length, height: Length) -> Shape:
         """Return newly added text box shape appended to this shape tree.
@@ -393,7 +514,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         sp = self._add_textbox_sp(left, top, width, height)
         self._recalculate_extents()
-        return cast(Shape, self._shape_factory(sp))
+        return cast(Shape, self._shape_proxy(sp))
 
     def build_freeform(
         self, start_x: float = 0, start_y: float = 0, scale: tuple[float, float] | float = 1.0
@@ -508,6 +629,81 @@ class _BaseGroupShapes(_BaseShapes):
         sp = self._spTree.add_textbox(id_, name, x, y, cx, cy)
         return sp
 
+    def _iter_new_shape_elms(self, shapes: Iterable[ShapeDescription]) -> Iterator[ShapeElement]:
+        """Generate a new "loose" shape element for each item in `shapes`.
+
+        Each is a copy of a prototype element prepared once for each distinct shape type and fill,
+        which is then given its id, name, position, size and text. Ids run consecutively from the
+        next available shape id, so the elements must all be added before any other shape is.
+        """
+        prototypes: dict[tuple[object, ...], tuple[str, ShapeElement]] = {}
+        for id_, spec in enumerate(shapes, start=self._next_shape_id):
+            type_ = spec["type"]
+            # -- members of different int-enums can be equal, so the key includes the enum --
+            key = (type(type_), type_, spec.get("fill"), "text" in spec)
+            if key not in prototypes:
+                prototypes[key] = self._new_shape_prototype(spec)
+            basename, prototype = prototypes[key]
+
+            # -- lxml copies the whole subtree on a shallow copy too, without the
+            # -- `copy.deepcopy()` memo overhead
+            shape_elm = copy.copy(prototype)
+            cNvPr = shape_elm._nvXxPr.cNvPr  # pyright: ignore[reportPrivateUsage]
+            cNvPr.id = id_
+            cNvPr.name = "%s %d" % (basename, id_ - 1)
+            xfrm = shape_elm.get_or_add_xfrm()
+
+            if isinstance(shape_elm, CT_Connector):
+                begin_x, begin_y = spec.get("begin_x", Emu(0)), spec.get("begin_y", Emu(0))
+                end_x, end_y = spec.get("end_x", Emu(0)), spec.get("end_y", Emu(0))
+                xfrm.x, xfrm.y = min(begin_x, end_x), min(begin_y, end_y)
+                xfrm.cx, xfrm.cy = abs(end_x - begin_x), abs(end_y - begin_y)
+                if begin_x > end_x:
+                    xfrm.flipH = True
+                if begin_y > end_y:
+                    xfrm.flipV = True
+                yield shape_elm
+                continue
+
+            xfrm.x, xfrm.y = spec.get("left", Emu(0)), spec.get("top", Emu(0))
+            xfrm.cx, xfrm.cy = spec.get("width", Emu(0)), spec.get("height", Emu(0))
+            if "text" in spec:
+                # -- same result as assigning `TextFrame.text`, prototype has no paragraphs --
+                txBody = cast(CT_Shape, shape_elm).get_or_add_txBody()
+                for p_text in spec["text"].split("\n"):
+                    p = cast(CT_TextParagraph, OxmlElement("a:p"))
+                    p.append_text(p_text)
+                    txBody.append(p)
+            yield shape_elm
+
+    @staticmethod
+    def _new_shape_prototype(spec: ShapeDescription) -> tuple[str, ShapeElement]:
+        """Return (basename, prototype) pair for the shapes `spec` describes.
+
+        The prototype is a loose shape element of the type in `spec` having its fill, if any, and
+        its paragraphs removed when `spec` has text, ready to be copied for each such shape.
+        """
+        type_ = spec["type"]
+        if isinstance(type_, MSO_CONNECTOR_TYPE):
+            if "text" in spec or "fill" in spec:
+                raise ValueError("a connector can have no text or fill")
+            prst = MSO_CONNECTOR_TYPE.to_xml(type_)
+            return "Connector", CT_Connector.new_cxnSp(0, "", prst, 0, 0, 0, 0, False, False)
+
+        if type_ == "textbox":
+            basename, sp = "TextBox", CT_Shape.new_textbox_sp(0, "", 0, 0, 0, 0)
+        else:
+            autoshape_type = AutoShapeType(type_)
+            basename = autoshape_type.basename
+            sp = CT_Shape.new_autoshape_sp(0, "", autoshape_type.prst, 0, 0, 0, 0)
+
+        if "text" in spec:
+            sp.get_or_add_txBody().clear_content()
+        if "fill" in spec:
+            solidFill = sp.spPr.get_or_change_to_solidFill()
+            solidFill.get_or_change_to_srgbClr().val = str(spec["fill"])
+        return basename, sp
+
     def _recalculate_extents(self) -> None:
         """Adjust position and size to incorporate all contained shapes.
 
@@ -584,7 +780,7 @@ class SlideShapes(_BaseGroupShapes):
         )
         self._spTree.append(movie_pic)
         self._add_video_timing(movie_pic)
-        return cast(GraphicFrame, self._shape_factory(movie_pic))
+        return cast(GraphicFrame, self._shape_proxy(movie_pic))
 
     def add_table(
         self, rows: int, cols: int, left: Length, top: Length, width: Length, height: Length
@@ -597,7 +793,7 @@ class SlideShapes(_BaseGroupShapes):
         returned |GraphicFrame| shape must be used to access the enclosed |Table| object.
         """
         graphicFrame = self._add_graphicFrame_containing_table(rows, cols, left, top, width, height)
-        return cast(GraphicFrame, self._shape_factory(graphicFrame))
+        return cast(GraphicFrame, self._shape_proxy(graphicFrame))
 
     def clone_layout_placeholders(self, slide_layout: SlideLayout) -> None:
         """Add placeholder shapes based on those in `slide_layout`.
@@ -621,7 +817,7 @@ class SlideShapes(_BaseGroupShapes):
         """
         for elm in self._spTree.iter_ph_elms():
             if elm.ph_idx == 0:
-                return cast(Shape, self._shape_factory(elm))
+                return cast(Shape, self._shape_proxy(elm))
         return None
 
     def _add_graphicFrame_containing_table(
@@ -8,7 +8,7 @@ from pptx.dml.fill import FillFormat
 from pptx.oxml.table import TcRange
 from pptx.shapes import Subshape
 from pptx.text.text import TextFrame
-from pptx.util import Emu, lazyproperty
+from pptx.util import Emu, lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.enum.text import MSO_VERTICAL_ANCHOR
@@ -26,6 +26,8 @@ class Table(object):
     :meth:`.Slide.shapes.add_table` to add a table to a slide.
     """
 
+    __slots__ = ("_tbl", "_graphic_frame", "_lazy_columns", "_lazy_rows", "__weakref__")
+
     def __init__(self, tbl: CT_Table, graphic_frame: GraphicFrame):
         super(Table, self).__init__()
         self._tbl = tbl
@@ -39,7 +41,7 @@ class Table(object):
         """
         return _Cell(self._tbl.tc(row_idx, col_idx), self)
 
-    @lazyproperty
+    @lazyslotproperty
     def columns(self) -> _ColumnCollection:
         """|_ColumnCollection| instance for this table.
 
@@ -142,7 +144,7 @@ class Table(object):
         """The package part containing this table."""
         return self._graphic_frame.part
 
-    @lazyproperty
+    @lazyslotproperty
     def rows(self):
         """|_RowCollection| instance for this table.
 
@@ -168,6 +170,8 @@ class Table(object):
 class _Cell(Subshape):
     """Table cell"""
 
+    __slots__ = ("_tc", "_lazy_fill")
+
     def __init__(self, tc: CT_TableCell, parent: ProvidesPart):
         super(_Cell, self).__init__(parent)
         self._tc = tc
@@ -187,7 +191,7 @@ class _Cell(Subshape):
             return True
         return self._tc is not other._tc
 
-    @lazyproperty
+    @lazyslotproperty
     def fill(self) -> FillFormat:
         """|FillFormat| instance for this cell.
 
@@ -381,6 +385,8 @@ class _Cell(Subshape):
 class _Column(Subshape):
     """Table column"""
 
+    __slots__ = ("_gridCol",)
+
     def __init__(self, gridCol: CT_TableCol, parent: _ColumnCollection):
         super(_Column, self).__init__(parent)
         self._parent = parent
@@ -400,6 +406,8 @@ class _Column(Subshape):
 class _Row(Subshape):
     """Table row"""
 
+    __slots__ = ("_tr",)
+
     def __init__(self, tr: CT_TableRow, parent: _RowCollection):
         super(_Row, self).__init__(parent)
         self._parent = parent
@@ -427,6 +435,8 @@ class _Row(Subshape):
 class _CellCollection(Subshape):
     """Horizontal sequence of row cells"""
 
+    __slots__ = ("_tr",)
+
     def __init__(self, tr: CT_TableRow, parent: _Row):
         super(_CellCollection, self).__init__(parent)
         self._parent = parent
@@ -451,6 +461,8 @@ class _CellCollection(Subshape):
 class _ColumnCollection(Subshape):
     """Sequence of table columns."""
 
+    __slots__ = ("_tbl",)
+
     def __init__(self, tbl: CT_Table, parent: Table):
         super(_ColumnCollection, self).__init__(parent)
         self._parent = parent
@@ -475,6 +487,8 @@ class _ColumnCollection(Subshape):
 class _RowCollection(Subshape):
     """Sequence of table rows"""
 
+    __slots__ = ("_tbl",)
+
     def __init__(self, tbl: CT_Table, parent: Table):
         super(_RowCollection, self).__init__(parent)
         self._parent = parent
@@ -13,7 +13,7 @@ from pptx.oxml.simpletypes import ST_TextWrappingType
 from pptx.shapes import Subshape
 from pptx.text.fonts import FontFiles
 from pptx.text.layout import TextFitter
-from pptx.util import Centipoints, Emu, Length, Pt, lazyproperty
+from pptx.util import Centipoints, Emu, Length, Pt, lazyslotproperty
 
 if TYPE_CHECKING:
     from pptx.dml.color import ColorFormat
@@ -40,6 +40,8 @@ class TextFrame(Subshape):
     appear as a child element of `p:sp`. Not intended to be constructed directly.
     """
 
+    __slots__ = ("_element", "_txBody")
+
     def __init__(self, txBody: CT_TextBody, parent: ProvidesPart):
         super(TextFrame, self).__init__(parent)
         self._element = self._txBody = txBody
@@ -284,6 +286,8 @@ class Font(object):
     `a:endParaRPr` in paragraph and `a:defRPr` in list style elements.
     """
 
+    __slots__ = ("_element", "_rPr", "_lazy_color", "_lazy_fill", "__weakref__")
+
     def __init__(self, rPr: CT_TextCharacterProperties):
         super(Font, self).__init__()
         self._element = self._rPr = rPr
@@ -302,14 +306,14 @@ class Font(object):
     def bold(self, value: bool | None):
         self._rPr.b = value
 
-    @lazyproperty
+    @lazyslotproperty
     def color(self) -> ColorFormat:
         """The |ColorFormat| instance that provides access to the color settings for this font."""
         if self.fill.type != MSO_FILL.SOLID:
             self.fill.solid()
         return self.fill.fore_color
 
-    @lazyproperty
+    @lazyslotproperty
     def fill(self) -> FillFormat:
         """|FillFormat| instance for this font.
 
@@ -428,6 +432,8 @@ class _Hyperlink(Subshape):
     Corresponds to `a:hlinkClick` child element of the run's properties element (`a:rPr`).
     """
 
+    __slots__ = ("_rPr",)
+
     def __init__(self, rPr: CT_TextCharacterProperties, parent: ProvidesPart):
         super(_Hyperlink, self).__init__(parent)
         self._rPr = rPr
@@ -467,6 +473,8 @@ class _Hyperlink(Subshape):
 class _Paragraph(Subshape):
     """Paragraph object. Not intended to be constructed directly."""
 
+    __slots__ = ("_element", "_p")
+
     def __init__(self, p: CT_TextParagraph, parent: ProvidesPart):
         super(_Paragraph, self).__init__(parent)
         self._element = self._p = p
@@ -635,6 +643,8 @@ class _Paragraph(Subshape):
 class _Run(Subshape):
     """Text run object. Corresponds to `a:r` child element in a paragraph."""
 
+    __slots__ = ("_r", "_lazy_hyperlink")
+
     def __init__(self, r: CT_RegularTextRun, parent: ProvidesPart):
         super(_Run, self).__init__(parent)
         self._r = r
@@ -650,7 +660,7 @@ class _Run(Subshape):
         rPr = self._r.get_or_add_rPr()
         return Font(rPr)
 
-    @lazyproperty
+    @lazyslotproperty
     def hyperlink(self) -> _Hyperlink:
         """Proxy for any `a:hlinkClick` element under the run properties element.
 
@@ -212,3 +212,40 @@ class lazyproperty(Generic[_T]):
         probably not a rich target for optimization efforts.
         """
         raise AttributeError("can't set attribute")
+
+
+class lazyslotproperty(lazyproperty[_T]):
+    """A |lazyproperty| for a class that uses `__slots__` and so has no instance `__dict__`.
+
+    The value is cached in the slot named `_lazy_` followed by the name of the decorated method,
+    which the class or one of its base classes must declare in its `__slots__`::
+
+        class Obj(object)
+
+            __slots__ = ("_lazy_fget",)
+
+            @lazyslotproperty
+            def fget(self):
+                return 'some result'
+
+    It otherwise behaves the same as |lazyproperty|; it is evaluated on first access only and
+    assigning to it raises AttributeError. Unlike |lazyproperty|, a |None| value is cached too.
+    """
+
+    def __init__(self, fget: Callable[..., _T]) -> None:
+        super(lazyslotproperty, self).__init__(fget)
+        self._slot_name = "_lazy_%s" % self._name
+
+    def __get__(self, obj: Any, type: Any = None) -> _T:
+        """Called on each access of 'fget' attribute on class or instance."""
+        if obj is None:
+            return self  # type: ignore
+
+        value = getattr(obj, self._slot_name, _UNSET)
+        if value is _UNSET:
+            value = self._fget(obj)
+            setattr(obj, self._slot_name, value)
+        return cast(_T, value)
+
+
+_UNSET = object()
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import array
+import math
+
 import pytest
 
 from pptx.chart.datalabel import DataLabels
@@ -26,7 +29,7 @@ from pptx.chart.series import (
 from pptx.dml.chtfmt import ChartFormat
 
 from ..unitutil.cxml import element, xml
-from ..unitutil.mock import class_mock, function_mock, instance_mock
+from ..unitutil.mock import FixtureRequest, Mock, class_mock, function_mock, instance_mock
 
 
 class Describe_BaseSeries(object):
@@ -107,6 +110,45 @@ class Describe_BaseCategorySeries(object):
         series, expected_value = values_get_fixture
         assert series.values == expected_value
 
+    def it_can_provide_its_values_as_a_float_array(self):
+        series = _BaseCategorySeries(
+            element(
+                'c:ser/c:val/c:numRef/c:numCache/(c:ptCount{val=3},c:pt{idx=0}/c:v"1.1",'
+                'c:pt{idx=2}/c:v"3.3")'
+            )
+        )
+
+        values = series.values_as("array")
+
+        assert isinstance(values, array.array)
+        assert values.typecode == "d"
+        assert values[0] == 1.1
+        assert math.isnan(values[1])
+        assert values[2] == 3.3
+
+    def it_can_provide_its_values_as_a_numpy_array(self, request: FixtureRequest):
+        numpy_ = Mock(name="numpy_")
+        import_module_ = function_mock(
+            request, "pptx.chart.series.importlib.import_module", return_value=numpy_
+        )
+        series = _BaseCategorySeries(
+            element('c:ser/c:val/c:numLit/(c:ptCount{val=2},c:pt{idx=1}/c:v"2.2")')
+        )
+
+        values = series.values_as("numpy")
+
+        import_module_.assert_called_once_with("numpy")
+        floats = numpy_.array.call_args.args[0]
+        assert math.isnan(floats[0])
+        assert floats[1] == 2.2
+        assert numpy_.array.call_args.kwargs == {"dtype": numpy_.float64}
+        assert values is numpy_.array.return_value
+
+    def but_it_raises_on_an_unknown_array_kind(self):
+        series = _BaseCategorySeries(element("c:ser"))
+        with pytest.raises(ValueError, match="kind must be 'array' or 'numpy', got 'list'"):
+            series.values_as("list")
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(
@@ -289,6 +331,31 @@ class Describe_BubbleSeries(object):
         BubblePoints_.assert_called_once_with(ser)
         assert points is points_
 
+    @pytest.mark.parametrize(
+        ("ser_cxml", "expected_value"),
+        [
+            ("c:ser", ()),
+            ("c:ser/c:bubbleSize/c:numRef", ()),
+            (
+                'c:ser/c:bubbleSize/c:numRef/c:numCache/(c:ptCount{val=3},c:pt{idx=0}/c:v"'
+                '1.1",c:pt{idx=2}/c:v"3.3")',
+                (1.1, None, 3.3),
+            ),
+        ],
+    )
+    def it_knows_its_bubble_sizes(self, ser_cxml: str, expected_value: tuple[float | None]):
+        assert BubbleSeries(element(ser_cxml)).bubble_sizes == expected_value
+
+    def it_can_provide_its_bubble_sizes_as_a_float_array(self):
+        series = BubbleSeries(
+            element('c:ser/c:bubbleSize/c:numLit/(c:ptCount{val=2},c:pt{idx=0}/c:v"4.2")')
+        )
+
+        bubble_sizes = series.bubble_sizes_as("array")
+
+        assert bubble_sizes[0] == 4.2
+        assert math.isnan(bubble_sizes[1])
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -402,6 +469,36 @@ class Describe_XySeries(object):
         series, expected_values = values_get_fixture
         assert series.values == expected_values
 
+    @pytest.mark.parametrize(
+        ("ser_cxml", "expected_value"),
+        [
+            ("c:ser", ()),
+            ("c:ser/c:xVal/c:numRef", ()),
+            (
+                'c:ser/c:xVal/c:numRef/c:numCache/(c:ptCount{val=3},c:pt{idx=2}/c:v"'
+                '3.3",c:pt{idx=0}/c:v"1.1")',
+                (1.1, None, 3.3),
+            ),
+        ],
+    )
+    def it_knows_its_x_values(self, ser_cxml: str, expected_value: tuple[float | None]):
+        assert XySeries(element(ser_cxml)).x_values == expected_value
+
+    def it_can_provide_its_x_and_y_values_as_float_arrays(self):
+        series = XySeries(
+            element(
+                'c:ser/(c:xVal/c:numLit/(c:ptCount{val=2},c:pt{idx=0}/c:v"1.0",c:pt{idx=1}/c:v'
+                '"2.0"),c:yVal/c:numLit/(c:ptCount{val=2},c:pt{idx=1}/c:v"4.0"))'
+            )
+        )
+
+        x_values = series.x_values_as("array")
+        y_values = series.values_as("array")
+
+        assert x_values == array.array("d", [1.0, 2.0])
+        assert math.isnan(y_values[0])
+        assert y_values[1] == 4.0
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,102 @@
+"""Unit-test suite for `pptx.opc.inspection` module."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+
+import pytest
+
+from pptx import Presentation
+from pptx.enum.shapes import PROG_ID
+from pptx.exc import PackageNotFoundError
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.inspection import PackageSummary, PartInfo, inspect_package
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import PackageReader
+from pptx.util import Inches
+
+from ..unitutil.file import absjoin, test_file_dir
+from ..unitutil.mock import FixtureRequest, method_mock
+
+
+class DescribeInspectPackage:
+    """Unit-test suite for `pptx.opc.inspection.inspect_package()`."""
+
+    def it_summarizes_each_part_in_the_package(self, pptx_stream: io.BytesIO):
+        summary = inspect_package(pptx_stream)
+
+        with zipfile.ZipFile(pptx_stream) as zipf:
+            expected = [
+                PartInfo(PackURI("/%s" % info.filename), None, info.compress_size, info.file_size)
+                for info in zipf.infolist()
+                if not info.filename.endswith(".rels") and info.filename != "[Content_Types].xml"
+            ]
+        assert [part._replace(content_type=None) for part in summary.parts] == expected
+        parts: dict[str, PartInfo] = {part.partname: part for part in summary.parts}
+        assert parts["/ppt/presentation.xml"].content_type == CT.PML_PRESENTATION_MAIN
+        assert parts["/ppt/media/image1.png"].content_type == CT.PNG
+
+    def it_counts_the_slides_in_the_slide_sequence(self, pptx_stream: io.BytesIO):
+        assert inspect_package(pptx_stream).slide_count == 3
+
+    def it_totals_the_media_and_embedded_objects(self, pptx_stream: io.BytesIO):
+        summary = inspect_package(pptx_stream)
+
+        assert [part.partname for part in summary.media_parts] == [
+            "/ppt/media/image1.png",
+            "/ppt/media/image2.wmf",
+        ]
+        assert summary.media_size == sum(part.size for part in summary.media_parts)
+        assert [part.partname for part in summary.embedded_parts] == [
+            "/ppt/embeddings/Microsoft_Excel_Sheet1.xlsx"
+        ]
+        assert summary.embedded_size == len(b"xlsx-bytes")
+        assert summary.size == sum(part.size for part in summary.parts)
+        assert summary.compressed_size < summary.size
+
+    def it_reads_only_the_parts_it_summarizes(
+        self, request: FixtureRequest, pptx_stream: io.BytesIO
+    ):
+        getitem = PackageReader.__getitem__
+        getitem_ = method_mock(request, PackageReader, "__getitem__", side_effect=getitem)
+        rels_xml_for_ = method_mock(
+            request, PackageReader, "rels_xml_for", side_effect=PackageReader.rels_xml_for
+        )
+
+        inspect_package(pptx_stream)
+
+        assert [c.args[1] for c in getitem_.call_args_list] == [
+            "/[Content_Types].xml",
+            "/ppt/presentation.xml",
+        ]
+        assert [c.args[1] for c in rels_xml_for_.call_args_list] == ["/"]
+
+    def it_can_summarize_an_expanded_package(self):
+        summary = inspect_package(absjoin(test_file_dir, "expanded_pptx"))
+
+        assert isinstance(summary, PackageSummary)
+        assert len(summary.parts) == 22
+        assert summary.slide_count == 1
+        assert summary.compressed_size == summary.size
+
+    def but_it_raises_when_the_file_is_not_a_package(self):
+        with pytest.raises(PackageNotFoundError):
+            inspect_package(absjoin(test_file_dir, "python-powered.png"))
+
+    # -- fixtures --------------------------------------------------------------------------------
+
+    @pytest.fixture
+    def pptx_stream(self) -> io.BytesIO:
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(absjoin(test_file_dir, "monty-truth.png"), Inches(0), Inches(0))
+        slide.shapes.add_ole_object(
+            io.BytesIO(b"xlsx-bytes"), PROG_ID.XLSX, Inches(0), Inches(0), Inches(1), Inches(1)
+        )
+        prs.slides.add_slide(prs.slide_layouts[6])
+        prs.slides.add_slide(prs.slide_layouts[6])
+        stream = io.BytesIO()
+        prs.save(stream)
+        stream.seek(0)
+        return stream
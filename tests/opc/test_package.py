@@ -7,10 +7,14 @@ from __future__ import annotations
 import collections
 import io
 import itertools
-from typing import Any
+import os
+import zipfile
+from pathlib import Path
 
 import pytest
+from lxml import etree
 
+from pptx.api import Presentation
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -21,16 +25,23 @@ from pptx.opc.package import (
     PartFactory,
     XmlPart,
     _ContentTypeMap,
+    _DeferredRelationship,
     _PackageLoader,
+    _PartnameIndex,
+    _PartsOnDemand,
+    _PrefixIndex,
     _RelatableMixin,
     _Relationship,
+    _RelationshipGraph,
     _Relationships,
 )
 from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import FileBackedBlob, PackageReader, ZipMemberBlob
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
 from pptx.parts.presentation import PresentationPart
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, nsdecls
 from ..unitutil.file import absjoin, snippet_bytes, test_file_dir, testfile_bytes
 from ..unitutil.mock import (
     ANY,
@@ -63,26 +74,35 @@ class Describe_RelatableMixin:
         relationships_.part_with_reltype.assert_called_once_with(RT.CHART)
         assert related_part is part_
 
-    def it_can_establish_a_relationship_to_another_part(self, _rels_prop_, relationships_, part_):
+    def it_can_establish_a_relationship_to_another_part(
+        self, request, _rels_prop_, relationships_, relationship_, part_
+    ):
         relationships_.get_or_add.return_value = "rId42"
+        relationships_.__getitem__.return_value = relationship_
         _rels_prop_.return_value = relationships_
+        _notify_rel_added_ = method_mock(request, _RelatableMixin, "_notify_rel_added")
         mixin = _RelatableMixin()
 
         rId = mixin.relate_to(part_, RT.SLIDE)
 
         relationships_.get_or_add.assert_called_once_with(RT.SLIDE, part_)
+        relationships_.__getitem__.assert_called_once_with("rId42")
+        _notify_rel_added_.assert_called_once_with(mixin, relationship_)
         assert rId == "rId42"
 
     def and_it_can_establish_a_relationship_to_an_external_link(
-        self, request, _rels_prop_, relationships_
+        self, request, _rels_prop_, relationships_, relationship_
     ):
         relationships_.get_or_add_ext_rel.return_value = "rId24"
+        relationships_.__getitem__.return_value = relationship_
         _rels_prop_.return_value = relationships_
+        _notify_rel_added_ = method_mock(request, _RelatableMixin, "_notify_rel_added")
         mixin = _RelatableMixin()
 
         rId = mixin.relate_to("http://url", RT.HYPERLINK, is_external=True)
 
         relationships_.get_or_add_ext_rel.assert_called_once_with(RT.HYPERLINK, "http://url")
+        _notify_rel_added_.assert_called_once_with(mixin, relationship_)
         assert rId == "rId24"
 
     def it_can_find_a_related_part_by_rId(
@@ -138,36 +158,32 @@ class DescribeOpcPackage:
         _init_ = initializer_mock(request, OpcPackage)
         _load_ = method_mock(request, OpcPackage, "_load", return_value=package_)
 
-        package = OpcPackage.open("package.pptx")
+        package = OpcPackage.open("package.pptx", slides=[2, 3], reuse_unchanged_xml=True)
 
-        _init_.assert_called_once_with(ANY, "package.pptx")
-        _load_.assert_called_once_with(ANY)
+        _init_.assert_called_once_with(ANY, "package.pptx", True)
+        _load_.assert_called_once_with(ANY, [2, 3])
         assert package is package_
 
-    def it_can_drop_a_relationship(self, _rels_prop_, relationships_):
+    def it_can_drop_a_relationship(self, request, _rels_prop_, relationships_):
+        relationship_ = instance_mock(request, _Relationship)
         _rels_prop_.return_value = relationships_
+        relationships_.pop.return_value = relationship_
+        notify_rel_dropped_ = method_mock(request, OpcPackage, "notify_rel_dropped")
+        package = OpcPackage(None)
 
-        OpcPackage(None).drop_rel("rId42")
+        package.drop_rel("rId42")
 
         relationships_.pop.assert_called_once_with("rId42")
+        notify_rel_dropped_.assert_called_once_with(package, relationship_)
 
     def it_can_iterate_over_its_parts(self, request):
-        part_, part_2_ = [instance_mock(request, Part, name="part_%d" % i) for i in range(2)]
-        rels_iter = (
-            instance_mock(request, _Relationship, is_external=is_external, target_part=target)
-            for is_external, target in (
-                (True, "http://some/url/"),
-                (False, part_),
-                (False, part_),
-                (False, part_2_),
-                (False, part_),
-                (False, part_2_),
-            )
-        )
-        method_mock(request, OpcPackage, "iter_rels", return_value=rels_iter)
+        parts_ = tuple(instance_mock(request, Part, name="part_%d" % i) for i in range(2))
+        rel_graph_ = instance_mock(request, _RelationshipGraph)
+        rel_graph_.iter_parts.return_value = iter(parts_)
+        property_mock(request, OpcPackage, "_rel_graph", return_value=rel_graph_)
         package = OpcPackage(None)
 
-        assert list(package.iter_parts()) == [part_, part_2_]
+        assert tuple(package.iter_parts()) == parts_
 
     def it_can_iterate_over_its_relationships(self, request, _rels_prop_):
         """
@@ -206,10 +222,46 @@ class DescribeOpcPackage:
         part_1_.rels = {r.rId: r for r in all_rels[4:]}
         package = OpcPackage(None)
 
-        rels = set(package.iter_rels())
+        rels = list(package.iter_rels())
+
+        assert rels == [all_rels[0], all_rels[3], all_rels[4], all_rels[1], all_rels[2]]
+
+    def it_keeps_its_rels_graph_current_once_it_is_built(self, request):
+        rel_graph_ = instance_mock(request, _RelationshipGraph)
+        part_ = instance_mock(request, Part)
+        rel_ = instance_mock(request, _Relationship, is_external=True)
+        package = OpcPackage(None)
+
+        package.notify_rel_added(part_, rel_)
+        package.__dict__["_rel_graph"] = rel_graph_
+        package.notify_rel_added(part_, rel_)
+
+        rel_graph_.add_rel.assert_called_once_with(part_, rel_)
+
+    def and_it_keeps_its_rels_graph_current_when_a_relationship_is_dropped(self, request):
+        rel_graph_ = instance_mock(request, _RelationshipGraph)
+        rel_ = instance_mock(request, _Relationship)
+        package = OpcPackage(None)
+
+        package.notify_rel_dropped(rel_)
+        package.__dict__["_rel_graph"] = rel_graph_
+        package.notify_rel_dropped(rel_)
+
+        rel_graph_.drop_rel.assert_called_once_with(rel_)
+
+    def it_traverses_its_rels_graph_on_first_use(self, request, _rels_prop_, relationships_):
+        _rels_prop_.return_value = relationships_
+        rel_graph_ = instance_mock(request, _RelationshipGraph)
+        _RelationshipGraph_ = class_mock(
+            request, "pptx.opc.package._RelationshipGraph", return_value=rel_graph_
+        )
+        package = OpcPackage(None)
+
+        rel_graph = package._rel_graph
 
-        # -- sequence is not guaranteed, but count (len) and uniqueness are --
-        assert rels == set(all_rels)
+        _RelationshipGraph_.assert_called_once_with(relationships_)
+        assert rel_graph is rel_graph_
+        assert package._rel_graph is rel_graph
 
     def it_provides_access_to_the_main_document_part(self, request):
         presentation_part_ = instance_mock(request, PresentationPart)
@@ -223,53 +275,137 @@ class DescribeOpcPackage:
         part_related_by_.assert_called_once_with(package, RT.OFFICE_DOCUMENT)
         assert presentation_part is presentation_part_
 
-    @pytest.mark.parametrize(
-        "ns, expected_n", (((), 1), ((1,), 2), ((1, 2), 3), ((2, 4), 3), ((1, 4), 3))
-    )
-    def it_can_find_the_next_available_partname(self, request, ns, expected_n):
-        tmpl = "/x%d.xml"
-        method_mock(
-            request,
-            OpcPackage,
-            "iter_parts",
-            return_value=(instance_mock(request, Part, partname=tmpl % n) for n in ns),
+    def it_can_find_the_next_available_partname(self, request):
+        partname_index_ = instance_mock(request, _PartnameIndex)
+        partname_index_.next_partname.return_value = "/x3.xml"
+        property_mock(request, OpcPackage, "_partname_index", return_value=partname_index_)
+        package = OpcPackage(None)
+
+        partname = package.next_partname("/x%d.xml")
+
+        partname_index_.next_partname.assert_called_once_with("/x%d.xml")
+        assert isinstance(partname, PackURI)
+        assert partname == "/x3.xml"
+
+    def it_keeps_its_partname_index_current_once_it_is_built(self, request):
+        part_, part_2_, part_3_ = (instance_mock(request, Part) for _ in range(3))
+        rel_graph_ = instance_mock(request, _RelationshipGraph)
+        rel_graph_.add_rel.return_value = [part_, part_2_]
+        rel_graph_.drop_rel.return_value = [part_3_]
+        partname_index_ = instance_mock(request, _PartnameIndex)
+        rel_ = instance_mock(request, _Relationship)
+        package = OpcPackage(None)
+        package.__dict__["_rel_graph"] = rel_graph_
+
+        package.notify_rel_added(None, rel_)
+        package.notify_rel_dropped(rel_)
+        package.notify_part_renamed(part_, PackURI("/x1.xml"))
+        package.__dict__["_partname_index"] = partname_index_
+        package.notify_rel_added(None, rel_)
+        package.notify_rel_dropped(rel_)
+        package.notify_part_renamed(part_, PackURI("/x1.xml"))
+
+        assert partname_index_.add_part.call_args_list == [call(part_), call(part_2_)]
+        partname_index_.remove_part.assert_called_once_with(part_3_)
+        partname_index_.rename_part.assert_called_once_with(part_, "/x1.xml")
+
+    def and_it_keeps_the_parts_of_a_package_current_as_relationships_are_dropped(self):
+        prs = Presentation()
+        slide_layout = prs.slide_layouts[6]
+        slide_parts = [prs.slides.add_slide(slide_layout).part for _ in range(3)]
+        # -- a notes slide and its slide each relate to the other --
+        notes_slide_part = slide_parts[1].notes_slide.part
+        package = prs.part.package
+        parts = list(package.iter_parts())
+
+        prs.part.drop_rel(prs.slides._sldIdLst[1].rId)
+        del prs.slides._sldIdLst[1]
+
+        assert list(package.iter_parts()) == [
+            p for p in parts if p not in (slide_parts[1], notes_slide_part)
+        ]
+        assert package.next_partname("/ppt/slides/slide%d.xml") == "/ppt/slides/slide2.xml"
+        assert package.next_partname("/ppt/notesSlides/notesSlide%d.xml") == (
+            "/ppt/notesSlides/notesSlide1.xml"
         )
-        next_partname = tmpl % expected_n
-        PackURI_ = class_mock(
-            request, "pptx.opc.package.PackURI", return_value=PackURI(next_partname)
+
+    def it_builds_its_partname_index_from_its_parts_to_help(self, request):
+        parts_ = tuple(
+            instance_mock(request, Part, partname=PackURI("/x%d.xml" % n)) for n in (1, 2)
         )
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
         package = OpcPackage(None)
 
-        partname = package.next_partname(tmpl)
+        partname_index = package._partname_index
 
-        PackURI_.assert_called_once_with(next_partname)
-        assert partname == next_partname
+        assert partname_index.next_partname("/x%d.xml") == "/x3.xml"
 
     def it_can_save_to_a_pkg_file(self, request, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
         parts_ = tuple(instance_mock(request, Part) for _ in range(3))
         method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
         PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        package_reader_ = instance_mock(request, PackageReader)
+        property_mock(request, OpcPackage, "_package_reader", return_value=package_reader_)
         package = OpcPackage(None)
 
         package.save("prs.pptx")
 
-        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_)
+        PackageWriter_.write.assert_called_once_with(
+            "prs.pptx",
+            relationships_,
+            parts_,
+            source=package_reader_,
+            workers=1,
+            compression="default",
+        )
+
+    def it_can_generate_the_saved_package_in_chunks(self, request, _rels_prop_, relationships_):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(3))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        PackageWriter_.iter_write.return_value = iter((b"foo", b"bar"))
+        package_reader_ = instance_mock(request, PackageReader)
+        property_mock(request, OpcPackage, "_package_reader", return_value=package_reader_)
+        package = OpcPackage(None)
+
+        chunks = package.iter_save(workers=2, compression="fast")
+
+        PackageWriter_.iter_write.assert_called_once_with(
+            relationships_, parts_, source=package_reader_, workers=2, compression="fast"
+        )
+        assert list(chunks) == [b"foo", b"bar"]
 
     def it_loads_the_pkg_file_to_help(self, request, _rels_prop_, relationships_):
         _PackageLoader_ = class_mock(request, "pptx.opc.package._PackageLoader")
         _PackageLoader_.load.return_value = "pkg-rels-xml", {"partname": "part"}
         _rels_prop_.return_value = relationships_
+        package_reader_ = instance_mock(request, PackageReader)
+        property_mock(request, OpcPackage, "_package_reader", return_value=package_reader_)
         package = OpcPackage("prs.pptx")
 
-        return_value = package._load()
+        return_value = package._load([2, 3])
 
-        _PackageLoader_.load.assert_called_once_with("prs.pptx", package)
+        _PackageLoader_.load.assert_called_once_with(package_reader_, package, [2, 3])
         relationships_.load_from_xml.assert_called_once_with(
             PACKAGE_URI, "pkg-rels-xml", {"partname": "part"}
         )
         assert return_value is package
 
+    def it_retains_its_package_reader_to_help(self, request):
+        package_reader_ = instance_mock(request, PackageReader)
+        PackageReader_ = class_mock(
+            request, "pptx.opc.package.PackageReader", return_value=package_reader_
+        )
+        package = OpcPackage("prs.pptx")
+
+        package_reader = package._package_reader
+
+        PackageReader_.assert_called_once_with("prs.pptx")
+        assert package_reader is package_reader_
+        assert package._package_reader is package_reader
+
     def it_constructs_its_relationships_object_to_help(self, request, relationships_):
         _Relationships_ = class_mock(
             request, "pptx.opc.package._Relationships", return_value=relationships_
@@ -292,6 +428,75 @@ class DescribeOpcPackage:
         return property_mock(request, OpcPackage, "_rels")
 
 
+class DescribeOpcPackage_partial_load:
+    """Integration-test suite for an `OpcPackage` opened with only selected slides loaded."""
+
+    def it_loads_only_the_selected_slides_up_front(self, pptx_stream: io.BytesIO):
+        package = OpcPackage.open(pptx_stream, [1])
+
+        prs_rels = package.main_document_part.rels
+        rels = [prs_rels[rId] for rId in ("rId7", "rId8", "rId9")]
+        assert [type(rel) for rel in rels] == [
+            _DeferredRelationship,
+            _Relationship,
+            _DeferredRelationship,
+        ]
+        assert [rel.target_partname for rel in rels] == [
+            "/ppt/slides/slide1.xml",
+            "/ppt/slides/slide2.xml",
+            "/ppt/slides/slide3.xml",
+        ]
+
+    def and_it_loads_any_other_slide_when_it_is_first_used(self, pptx_stream: io.BytesIO):
+        package = OpcPackage.open(pptx_stream, [1])
+
+        slide_part = package.main_document_part.related_part("rId9")
+
+        assert slide_part.partname == "/ppt/slides/slide3.xml"
+        assert slide_part.rels.part_with_reltype(RT.SLIDE_LAYOUT).partname == (
+            "/ppt/slideLayouts/slideLayout6.xml"
+        )
+        assert slide_part.part_related_by(RT.NOTES_SLIDE).partname == (
+            "/ppt/notesSlides/notesSlide1.xml"
+        )
+
+    def and_it_saves_the_parts_it_did_not_load_unchanged(self, pptx_stream: io.BytesIO):
+        expected = _package_members(pptx_stream)
+        package = OpcPackage.open(pptx_stream, [1])
+        stream = io.BytesIO()
+
+        package.save(stream)
+
+        assert _package_members(stream) == expected
+
+    def but_it_raises_IndexError_on_a_slide_index_out_of_range(self, pptx_stream: io.BytesIO):
+        with pytest.raises(IndexError) as e:
+            OpcPackage.open(pptx_stream, [3])
+        assert str(e.value) == "slide index out of range"
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def pptx_stream(self) -> io.BytesIO:
+        prs = Presentation()
+        for _ in range(3):
+            prs.slides.add_slide(prs.slide_layouts[5])
+        prs.slides[2].notes_slide.notes_text_frame.text = "notes"
+        stream = io.BytesIO()
+        prs.save(stream)
+        stream.seek(0)
+        return stream
+
+
+def _package_members(stream: io.BytesIO) -> dict[str, bytes]:
+    """dict {member-name: bytes} of the zip package in `stream`."""
+    stream.seek(0)
+    with zipfile.ZipFile(stream) as z:
+        members = {name: z.read(name) for name in z.namelist()}
+    stream.seek(0)
+    return members
+
+
 class Describe_PackageLoader:
     """Unit-test suite for `pptx.opc.package._PackageLoader` objects."""
 
@@ -305,9 +510,9 @@ class Describe_PackageLoader:
             return_value=(pkg_xml_rels_, {"partname": "part"}),
         )
 
-        pkg_xml_rels, parts = _PackageLoader.load("prs.pptx", package_)
+        pkg_xml_rels, parts = _PackageLoader.load("prs.pptx", package_, [2, 3])
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", package_)
+        _init_.assert_called_once_with(ANY, "prs.pptx", package_, [2, 3])
         _load_.assert_called_once_with(ANY)
         assert pkg_xml_rels is pkg_xml_rels_
         assert parts == {"partname": "part"}
@@ -325,12 +530,14 @@ class Describe_PackageLoader:
             )
         )
         _xml_rels_prop_.return_value = rels_
-        package_loader = _PackageLoader(None, None)
+        package_reader_ = instance_mock(request, PackageReader)
+        package_loader = _PackageLoader(package_reader_, None)
 
         pkg_xml_rels, parts = package_loader._load()
 
         for part_ in parts_.values():
             part_.load_rels_from_xml.assert_called_once_with(rels_[part_.partname], parts_)
+        package_reader_.close.assert_called_once_with()
         assert pkg_xml_rels is rels_["/"]
         assert parts is parts_
 
@@ -374,12 +581,136 @@ class Describe_PackageLoader:
             "/docProps/core.xml": core_xml_rels,
         }
 
+    def but_it_does_not_traverse_a_slide_left_unloaded(self, request):
+        property_mock(
+            request,
+            _PackageLoader,
+            "_deferred_partnames",
+            return_value={PackURI("/ppt/slides/slide1.xml")},
+        )
+        pkg_xml_rels = parse_xml(snippet_bytes("package-rels-xml"))
+        prs_xml_rels = parse_xml(snippet_bytes("presentation-rels-xml"))
+        _xml_rels_for_ = method_mock(
+            request,
+            _PackageLoader,
+            "_xml_rels_for",
+            side_effect=iter(
+                (pkg_xml_rels, prs_xml_rels, CT_Relationships.new(), CT_Relationships.new())
+            ),
+        )
+        package_loader = _PackageLoader(None, None)
+
+        xml_rels = package_loader._xml_rels
+
+        assert _xml_rels_for_.call_args_list == [
+            call(package_loader, "/"),
+            call(package_loader, "/ppt/presentation.xml"),
+            call(package_loader, "/docProps/thumbnail.jpeg"),
+            call(package_loader, "/docProps/core.xml"),
+        ]
+        assert "/ppt/slides/slide1.xml" not in xml_rels
+
+    def it_leaves_no_slides_unloaded_when_no_slides_are_selected(self):
+        package_loader = _PackageLoader(None, None)
+        assert package_loader._deferred_partnames == set()
+
+    def it_can_load_a_part_not_loaded_up_front(self, request, package_):
+        property_mock(
+            request,
+            _PackageLoader,
+            "_content_types",
+            return_value={"/ppt/slides/slide2.xml": CT.PML_SLIDE},
+        )
+        _blob_for_ = method_mock(request, _PackageLoader, "_blob_for", return_value=b"blob")
+        parts_ = property_mock(request, _PackageLoader, "_parts").return_value
+        part_ = instance_mock(request, Part)
+        PartFactory_ = class_mock(request, "pptx.opc.package.PartFactory", return_value=part_)
+        _xml_rels_for_ = method_mock(request, _PackageLoader, "_xml_rels_for")
+        package_loader = _PackageLoader(None, package_)
+        partname = PackURI("/ppt/slides/slide2.xml")
+
+        part = package_loader.load_part(partname)
+
+        _blob_for_.assert_called_once_with(package_loader, partname, CT.PML_SLIDE)
+        PartFactory_.assert_called_once_with(partname, CT.PML_SLIDE, package_, blob=b"blob")
+        load_xml_rels, parts = part_.defer_rels_from_xml.call_args.args
+        assert parts is parts_
+        assert _xml_rels_for_.call_count == 0
+        load_xml_rels()
+        _xml_rels_for_.assert_called_once_with(package_loader, partname)
+        assert part is part_
+
+    def it_leaves_a_large_binary_part_in_the_package_file(
+        self, pkg_path: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("pptx.opc.serialized.FILE_BACKED_MIN_SIZE", 1)
+
+        package = OpcPackage.open(pkg_path)
+
+        image_part = next(p for p in package.iter_parts() if p.partname.ext == "png")
+        assert isinstance(image_part.file_blob, ZipMemberBlob)
+        with open(absjoin(test_file_dir, "monty-truth.png"), "rb") as f:
+            assert image_part.blob == f.read()
+
+    @pytest.mark.parametrize("replace", [False, True])
+    def but_it_reads_a_smaller_one_so_the_package_file_can_go_once_loaded(
+        self, pkg_path: str, replace: bool
+    ):
+        package = OpcPackage.open(pkg_path)
+        os.remove(pkg_path)
+        if replace:
+            Presentation().save(pkg_path)
+        saved = io.BytesIO()
+
+        package.save(saved)
+
+        image_part = next(p for p in OpcPackage.open(saved).iter_parts() if p.partname.ext == "png")
+        with open(absjoin(test_file_dir, "monty-truth.png"), "rb") as f:
+            assert image_part.blob == f.read()
+
+    @pytest.mark.parametrize(
+        ("content_type", "file_blob", "expected_calls"),
+        [
+            (CT.MP4, "file-blob", (1, 0)),
+            (CT.MP4, None, (1, 1)),
+            (CT.PML_SLIDE, "file-blob", (0, 1)),
+        ],
+    )
+    def it_leaves_binary_parts_in_the_package_file_to_help(
+        self,
+        request,
+        content_type: str,
+        file_blob: str | None,
+        expected_calls: tuple[int, int],
+    ):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.file_blob.return_value = file_blob
+        package_reader_.__getitem__.return_value = b"blob"
+        package_loader = _PackageLoader(package_reader_, None)
+        partname = PackURI("/ppt/media/media1.mp4")
+
+        blob = package_loader._blob_for(partname, content_type)
+
+        file_blob_calls, getitem_calls = expected_calls
+        assert package_reader_.file_blob.call_count == file_blob_calls
+        assert package_reader_.__getitem__.call_count == getitem_calls
+        assert blob == (b"blob" if getitem_calls else file_blob)
+
     # fixture components -----------------------------------
 
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, OpcPackage)
 
+    @pytest.fixture
+    def pkg_path(self, tmp_path: Path) -> str:
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(absjoin(test_file_dir, "monty-truth.png"), 0, 0)
+        pkg_path = str(tmp_path / "prs.pptx")
+        prs.save(pkg_path)
+        return pkg_path
+
     @pytest.fixture
     def _xml_rels_prop_(self, request):
         return property_mock(request, _PackageLoader, "_xml_rels")
@@ -396,6 +727,7 @@ class DescribePart:
 
         _init_.assert_called_once_with(part, partname_, CT.PML_SLIDE, package_, b"blob")
         assert isinstance(part, Part)
+        assert part._source_partname is partname_
 
     def it_uses_the_load_blob_as_its_blob(self):
         assert Part(None, None, None, b"blob").blob == b"blob"
@@ -405,6 +737,54 @@ class DescribePart:
         part.blob = b"new-blob"
         assert part.blob == b"new-blob"
 
+    def it_can_leave_its_blob_in_a_file(self, request):
+        file_blob_ = instance_mock(request, FileBackedBlob)
+        file_blob_.read.return_value = b"file-bytes"
+        part = Part.load(PackURI("/ppt/media/media1.mp4"), CT.MP4, None, file_blob_)
+
+        assert part.file_blob is file_blob_
+        assert part.blob == b"file-bytes"
+        assert part.source_partname == PackURI("/ppt/media/media1.mp4")
+
+    def and_it_reads_that_blob_from_its_file_each_time(self, request):
+        file_blob_ = instance_mock(request, FileBackedBlob)
+        file_blob_.read.return_value = b"file-bytes"
+        part = Part.load(PackURI("/ppt/media/media1.mp4"), CT.MP4, None, file_blob_)
+
+        part.blob
+        part.blob
+
+        assert file_blob_.read.call_count == 2
+
+    def and_it_can_read_that_blob_into_memory(self, request):
+        file_blob_ = instance_mock(request, FileBackedBlob)
+        file_blob_.read.return_value = b"file-bytes"
+        part = Part(None, CT.MP4, None, file_blob_)
+
+        part.load_file_blob()
+
+        file_blob_.read.assert_called_once_with()
+        assert part.file_blob is None
+        assert part.blob == b"file-bytes"
+
+    def but_its_blob_is_no_longer_in_that_file_once_changed(self, request):
+        part = Part(None, CT.MP4, None, instance_mock(request, FileBackedBlob))
+
+        part.blob = b"new-blob"
+
+        assert part.file_blob is None
+        assert part.blob == b"new-blob"
+
+    def it_knows_the_partname_it_was_loaded_from(self):
+        partname = PackURI("/ppt/media/image1.png")
+        assert Part.load(partname, CT.PNG, None, b"blob").source_partname == partname
+        assert Part(partname, CT.PNG, None, b"blob").source_partname is None
+
+    def but_not_once_its_blob_has_changed(self):
+        part = Part.load(PackURI("/ppt/media/image1.png"), CT.PNG, None, b"old-blob")
+        part.blob = b"new-blob"
+        assert part.source_partname is None
+
     def it_knows_its_content_type(self):
         assert Part(None, CT.PML_SLIDE, None).content_type == CT.PML_SLIDE
 
@@ -414,15 +794,34 @@ class DescribePart:
     def it_knows_its_partname(self):
         assert Part(PackURI("/part/name"), None, None).partname == PackURI("/part/name")
 
-    def it_can_change_its_partname(self):
-        part = Part(PackURI("/old/part/name"), None, None)
+    def it_can_change_its_partname(self, package_):
+        part = Part(PackURI("/old/part/name"), None, package_)
+
         part.partname = PackURI("/new/part/name")
+
         assert part.partname == PackURI("/new/part/name")
+        package_.notify_part_renamed.assert_called_once_with(part, "/old/part/name")
+
+    def it_tells_its_package_when_it_is_related_to_another_part(self, request, package_):
+        rel_ = instance_mock(request, _Relationship)
+        part = Part(PackURI("/ppt/slides/slide1.xml"), None, package_)
+
+        part._notify_rel_added(rel_)
+
+        package_.notify_rel_added.assert_called_once_with(part, rel_)
 
     def it_provides_access_to_its_relationships_for_traversal(self, request, relationships_):
         property_mock(request, Part, "_rels", return_value=relationships_)
         assert Part(None, None, None).rels is relationships_
 
+    def it_can_defer_loading_its_relationships(self, request, relationships_):
+        property_mock(request, Part, "_rels", return_value=relationships_)
+        load_xml_rels_, parts_ = Mock(name="load_xml_rels"), {}
+
+        Part(None, None, None).defer_rels_from_xml(load_xml_rels_, parts_)
+
+        relationships_.defer_load_from_xml.assert_called_once_with(load_xml_rels_, parts_)
+
     def it_can_load_a_blob_from_a_file_path_to_help(self):
         path = absjoin(test_file_dir, "minimal.pptx")
         with open(path, "rb") as f:
@@ -462,17 +861,56 @@ class DescribeXmlPart:
 
     def it_can_be_constructed_by_PartFactory(self, request):
         partname = PackURI("/ppt/slides/slide1.xml")
-        element_ = element("p:sld")
         package_ = instance_mock(request, OpcPackage)
-        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
         _init_ = initializer_mock(request, XmlPart)
 
         part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
 
-        parse_xml_.assert_called_once_with(b"blob")
-        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element_)
+        parse_xml_.assert_not_called()
+        _init_.assert_called_once_with(
+            part, partname, CT.PML_SLIDE, package_, element=None, blob=b"blob"
+        )
         assert isinstance(part, XmlPart)
 
+    def it_parses_its_XML_on_first_access(self, request):
+        element_ = element("p:sld")
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        xml_part = XmlPart(None, None, None, None, b"blob")
+        assert xml_part.is_parsed is False
+
+        elm = xml_part._element
+
+        parse_xml_.assert_called_once_with(b"blob")
+        assert elm is element_
+        assert xml_part._element is element_
+        assert parse_xml_.call_count == 1
+        assert xml_part.is_parsed is True
+
+    def it_reads_a_file_backed_blob_into_memory_when_loaded(self, request):
+        file_blob_ = instance_mock(request, FileBackedBlob)
+        file_blob_.read.return_value = ("<p:sld %s/>" % nsdecls("p")).encode("utf-8")
+
+        xml_part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, file_blob_)
+
+        assert xml_part.file_blob is None
+        assert xml_part.blob == file_blob_.read.return_value
+
+    def it_knows_the_partname_it_was_loaded_from_while_unchanged(self, request: FixtureRequest):
+        package_ = instance_mock(request, OpcPackage, reuses_unchanged_xml=True)
+        partname = PackURI("/ppt/slides/slide1.xml")
+        blob = ("<p:sld %s/>" % nsdecls("p")).encode("utf-8")
+        xml_part = XmlPart.load(partname, CT.PML_SLIDE, package_, blob)
+        assert xml_part.source_partname == partname
+
+        xml_part._element
+
+        assert xml_part.source_partname == partname
+
+        xml_part._element.set("show", "0")
+
+        assert xml_part.source_partname is None
+
     def it_can_serialize_to_xml(self, request):
         element_ = element("p:sld")
         serialize_part_xml_ = function_mock(request, "pptx.opc.package.serialize_part_xml")
@@ -483,18 +921,128 @@ class DescribeXmlPart:
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
-    @pytest.mark.parametrize(("ref_count", "calls"), [(2, []), (1, [call("rId42")])])
+    def but_not_once_parsed_when_its_package_does_not_reuse_unchanged_XML(
+        self, request: FixtureRequest
+    ):
+        package_ = instance_mock(request, OpcPackage, reuses_unchanged_xml=False)
+        partname = PackURI("/ppt/slides/slide1.xml")
+        blob = ("<p:sld %s/>" % nsdecls("p")).encode("utf-8")
+        xml_part = XmlPart.load(partname, CT.PML_SLIDE, package_, blob)
+        assert xml_part.source_partname == partname
+
+        xml_part._element
+
+        assert xml_part.source_partname is None
+
+    def it_serializes_its_XML_each_time_by_default(self, request: FixtureRequest):
+        package_ = instance_mock(request, OpcPackage, reuses_unchanged_xml=False)
+        serialize_part_xml_ = function_mock(
+            request, "pptx.opc.package.serialize_part_xml", side_effect=[b"blob-1", b"blob-2"]
+        )
+        xml_part = XmlPart(None, None, package_, element("p:sld"))
+
+        assert xml_part.blob == b"blob-1"
+        assert xml_part.blob == b"blob-2"
+        assert serialize_part_xml_.call_count == 2
+
+    def and_its_blob_includes_a_change_made_with_lxml_functions(self, request: FixtureRequest):
+        package_ = instance_mock(request, OpcPackage, reuses_unchanged_xml=False)
+        blob = ("<p:sld %s><p:cSld/></p:sld>" % nsdecls("p")).encode("utf-8")
+        xml_part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, package_, blob)
+        assert xml_part.blob == blob
+
+        etree.SubElement(xml_part._element, qn("p:clrMapOvr"))
+
+        assert b"<p:clrMapOvr/>" in xml_part.blob
+
+    def it_reuses_its_last_serialization_until_its_XML_changes(self, request):
+        package_ = instance_mock(request, OpcPackage, reuses_unchanged_xml=True)
+        sld = element("p:sld")
+        serialize_part_xml_ = function_mock(
+            request, "pptx.opc.package.serialize_part_xml", side_effect=[b"blob-1", b"blob-2"]
+        )
+        xml_part = XmlPart(None, None, package_, sld)
+
+        assert xml_part.blob == b"blob-1"
+        assert xml_part.blob == b"blob-1"
+        assert serialize_part_xml_.call_count == 1
+
+        sld.set("show", "0")
+
+        assert xml_part.blob == b"blob-2"
+        assert serialize_part_xml_.call_count == 2
+
+    def and_it_provides_the_loaded_bytes_while_its_parsed_XML_is_unchanged(self, request):
+        package_ = instance_mock(request, OpcPackage, reuses_unchanged_xml=True)
+        serialize_part_xml_ = function_mock(
+            request, "pptx.opc.package.serialize_part_xml", return_value=b"reserialized"
+        )
+        blob = ("<p:sld %s>\r\n  <p:cSld/>\r\n</p:sld>" % nsdecls("p")).encode("utf-8")
+        xml_part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, package_, blob)
+
+        xml_part._element.cSld
+
+        assert xml_part.blob == blob
+        serialize_part_xml_.assert_not_called()
+
+        xml_part._element.remove(xml_part._element.cSld)
+
+        assert xml_part.blob == b"reserialized"
+        assert xml_part.source_partname is None
+
+    def it_saves_XML_changed_with_lxml_functions(self):
+        """Integrates with OpcPackage and PackageWriter."""
+        prs = Presentation()
+        prs.slides.add_slide(prs.slide_layouts[5])
+        stream = io.BytesIO()
+        prs.save(stream)
+        prs = Presentation(stream)
+        etree.SubElement(prs.slides[0].shapes[0]._element.spPr, qn("a:effectLst"))
+        saved = io.BytesIO()
+
+        prs.save(saved)
+
+        spPr = Presentation(saved).slides[0].shapes[0]._element.spPr
+        assert spPr.find(qn("a:effectLst")) is not None
+
+    def but_it_provides_the_loaded_bytes_when_its_XML_was_never_parsed(self, request):
+        serialize_part_xml_ = function_mock(request, "pptx.opc.package.serialize_part_xml")
+        xml_part = XmlPart.load(None, None, None, b"<?xml?>\r\n<p:sld/>")
+
+        blob = xml_part.blob
+
+        serialize_part_xml_.assert_not_called()
+        assert blob == b"<?xml?>\r\n<p:sld/>"
+
+    @pytest.mark.parametrize(("ref_count", "dropped"), [(2, False), (1, True)])
     def it_can_drop_a_relationship(
-        self, request: FixtureRequest, relationships_: Mock, ref_count: int, calls: list[Any]
+        self, request: FixtureRequest, relationships_: Mock, ref_count: int, dropped: bool
     ):
         _rel_ref_count_ = method_mock(request, XmlPart, "_rel_ref_count", return_value=ref_count)
         property_mock(request, XmlPart, "_rels", return_value=relationships_)
-        part = XmlPart(None, None, None, None)
+        rel_ = instance_mock(request, _Relationship)
+        relationships_.pop.return_value = rel_
+        package_ = instance_mock(request, OpcPackage)
+        part = XmlPart(None, None, package_, None)
 
         part.drop_rel("rId42")
 
         _rel_ref_count_.assert_called_once_with(part, "rId42")
-        assert relationships_.pop.call_args_list == calls
+        assert relationships_.pop.call_args_list == ([call("rId42")] if dropped else [])
+        assert package_.notify_rel_dropped.call_args_list == ([call(rel_)] if dropped else [])
+
+    def it_counts_the_references_to_an_rId_in_its_XML_to_help(self):
+        sld = parse_xml(
+            '<p:sld %s><p:foo r:id="rId1"/><p:bar r:id="rId2"/><p:baz r:id="rId1"/></p:sld>'
+            % nsdecls("p", "r")
+        )
+        part = XmlPart(None, None, None, sld)
+
+        assert [part._rel_ref_count(rId) for rId in ("rId1", "rId2", "rId3")] == [2, 1, 0]
+
+        sld.remove(sld[0])
+
+        assert [part._rel_ref_count(rId) for rId in ("rId1", "rId2", "rId3")] == [1, 1, 0]
 
     def it_knows_it_is_the_part_for_its_child_objects(self):
         xml_part = XmlPart(None, None, None, None)
@@ -510,11 +1058,13 @@ class DescribeXmlPart:
 class DescribePartFactory:
     """Unit-test suite for `pptx.opc.package.PartFactory` objects."""
 
-    def it_constructs_custom_part_type_for_registered_content_types(self, request, package_, part_):
+    def it_constructs_custom_part_type_for_registered_content_types(
+        self, request, package_, part_, monkeypatch
+    ):
         SlidePart_ = class_mock(request, "pptx.opc.package.XmlPart")
         SlidePart_.load.return_value = part_
         partname = PackURI("/ppt/slides/slide7.xml")
-        PartFactory.part_type_for[CT.PML_SLIDE] = SlidePart_
+        monkeypatch.setitem(PartFactory.part_type_for, CT.PML_SLIDE, SlidePart_)
 
         part = PartFactory(partname, CT.PML_SLIDE, package_, b"blob")
 
@@ -544,6 +1094,54 @@ class DescribePartFactory:
         return instance_mock(request, Part)
 
 
+class Describe_PartsOnDemand:
+    """Unit-test suite for `pptx.opc.package._PartsOnDemand` objects."""
+
+    @pytest.mark.parametrize(
+        ("partname", "in_package", "expected_value"),
+        [
+            ("/ppt/slides/slide1.xml", False, True),
+            ("/ppt/slides/slide2.xml", True, True),
+            ("/ppt/slides/slide2.xml", False, False),
+        ],
+    )
+    def it_knows_which_parts_it_can_provide(
+        self, request, part_, partname: str, in_package: bool, expected_value: bool
+    ):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__contains__.return_value = in_package
+        parts = _PartsOnDemand({PackURI("/ppt/slides/slide1.xml"): part_}, package_reader_, Mock())
+
+        assert (PackURI(partname) in parts) is expected_value
+
+    def it_loads_a_part_not_yet_loaded_when_it_is_looked_up(self, request, part_):
+        load_part_ = Mock(name="load_part", return_value=part_)
+        parts = _PartsOnDemand({}, instance_mock(request, PackageReader), load_part_)
+        partname = PackURI("/ppt/slides/slide2.xml")
+
+        assert parts[partname] is part_
+        assert parts[partname] is part_
+        load_part_.assert_called_once_with(partname)
+
+    def but_get_provides_only_a_part_already_loaded(self, request, part_):
+        load_part_ = Mock(name="load_part")
+        parts = _PartsOnDemand(
+            {PackURI("/ppt/slides/slide1.xml"): part_},
+            instance_mock(request, PackageReader),
+            load_part_,
+        )
+
+        assert parts.get(PackURI("/ppt/slides/slide1.xml")) is part_
+        assert parts.get(PackURI("/ppt/slides/slide2.xml")) is None
+        load_part_.assert_not_called()
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def part_(self, request):
+        return instance_mock(request, Part)
+
+
 class Describe_ContentTypeMap:
     """Unit-test suite for `pptx.opc.package._ContentTypeMap` objects."""
 
@@ -614,6 +1212,252 @@ class Describe_ContentTypeMap:
         return _ContentTypeMap.from_xml(testfile_bytes("expanded_pptx", "[Content_Types].xml"))
 
 
+class Describe_PartnameIndex:
+    """Unit-test suite for `pptx.opc.package._PartnameIndex` objects."""
+
+    @pytest.mark.parametrize(
+        ("ns", "expected_n"), [((), 1), ((1,), 2), ((1, 2), 3), ((2, 4), 3), ((1, 4), 3)]
+    )
+    def it_can_find_the_next_available_partname(
+        self, request: FixtureRequest, ns: tuple[int, ...], expected_n: int
+    ):
+        parts_ = [self.part_(request, "/x%d.xml" % n) for n in ns]
+        parts_.append(self.part_(request, "/y9.xml"))
+        partname_index = _PartnameIndex(parts_)
+
+        assert partname_index.next_partname("/x%d.xml") == "/x%d.xml" % expected_n
+
+    @pytest.mark.parametrize(
+        ("idxs", "expected_idx"), [((3, 4, 2), 1), ((4, 2, 1), 3), ((2, 3, 1), 4)]
+    )
+    def it_can_find_the_first_available_partname_idx(
+        self, request: FixtureRequest, idxs: tuple[int, ...], expected_idx: int
+    ):
+        parts_ = [self.part_(request, "/ppt/media/image%d.png" % idx) for idx in idxs]
+        parts_.append(self.part_(request, "/ppt/media/media1.mp4"))
+        partname_index = _PartnameIndex(parts_)
+
+        assert partname_index.first_available_idx("/ppt/media/image") == expected_idx
+
+    def it_indexes_a_part_added_to_the_package_along_with_the_parts_it_relates_to(
+        self, request: FixtureRequest
+    ):
+        image_part_ = self.part_(request, "/ppt/media/image1.png")
+        slide_part_ = self.part_(request, "/ppt/slides/slide1.xml")
+        chart_part_ = self.part_(request, "/ppt/charts/chart1.xml")
+        xlsx_part_ = self.part_(request, "/ppt/embeddings/Microsoft_Excel_Sheet1.xlsx")
+        chart_part_.rels = {
+            "rId1": instance_mock(
+                request, _Relationship, is_external=False, target_part=xlsx_part_
+            ),
+            "rId2": instance_mock(request, _Relationship, is_external=True),
+            "rId3": instance_mock(
+                request, _Relationship, is_external=False, target_part=slide_part_
+            ),
+        }
+        slide_part_.rels = {}
+        partname_index = _PartnameIndex([image_part_, slide_part_])
+
+        partname_index.add_part(chart_part_)
+        partname_index.add_part(image_part_)
+
+        assert partname_index.next_partname("/ppt/charts/chart%d.xml") == "/ppt/charts/chart2.xml"
+        assert (
+            partname_index.next_partname("/ppt/embeddings/Microsoft_Excel_Sheet%d.xlsx")
+            == "/ppt/embeddings/Microsoft_Excel_Sheet2.xlsx"
+        )
+        assert partname_index.first_available_idx("/ppt/media/image") == 2
+        assert partname_index.next_partname("/ppt/slides/slide%d.xml") == "/ppt/slides/slide2.xml"
+
+    def it_keeps_track_of_a_part_renamed_in_the_package(self, request: FixtureRequest):
+        parts_ = [self.part_(request, "/ppt/slides/slide%d.xml" % n) for n in (1, 2, 3)]
+        partname_index = _PartnameIndex(parts_)
+        assert partname_index.first_available_idx("/ppt/slides/slide") == 4
+
+        # -- the first two slides swap partnames, briefly sharing one partname --
+        parts_[1].partname = PackURI("/ppt/slides/slide1.xml")
+        partname_index.rename_part(parts_[1], PackURI("/ppt/slides/slide2.xml"))
+        parts_[0].partname = PackURI("/ppt/slides/slide2.xml")
+        partname_index.rename_part(parts_[0], PackURI("/ppt/slides/slide1.xml"))
+        assert partname_index.first_available_idx("/ppt/slides/slide") == 4
+
+        parts_[2].partname = PackURI("/ppt/slides/slide7.xml")
+        partname_index.rename_part(parts_[2], PackURI("/ppt/slides/slide3.xml"))
+        assert partname_index.first_available_idx("/ppt/slides/slide") == 3
+        assert partname_index.next_partname("/ppt/slides/slide%d.xml") == "/ppt/slides/slide4.xml"
+
+    def but_it_ignores_the_renaming_of_a_part_not_in_the_package(self, request: FixtureRequest):
+        part_ = self.part_(request, "/ppt/slides/slide1.xml")
+        partname_index = _PartnameIndex([part_])
+        other_part_ = self.part_(request, "/ppt/slides/slide2.xml")
+
+        partname_index.rename_part(other_part_, PackURI("/ppt/slides/slide1.xml"))
+
+        assert partname_index.first_available_idx("/ppt/slides/slide") == 2
+
+    def it_removes_a_part_removed_from_the_package(self, request: FixtureRequest):
+        parts_ = [self.part_(request, "/ppt/slides/slide%d.xml" % n) for n in (1, 2, 3)]
+        partname_index = _PartnameIndex(parts_)
+        assert partname_index.first_available_idx("/ppt/slides/slide") == 4
+
+        partname_index.remove_part(parts_[1])
+        partname_index.remove_part(parts_[1])
+
+        assert partname_index.first_available_idx("/ppt/slides/slide") == 2
+        assert partname_index.next_partname("/ppt/slides/slide%d.xml") == "/ppt/slides/slide2.xml"
+
+    # -- fixture components ------------------------------------------
+
+    def part_(self, request: FixtureRequest, partname: str) -> Mock:
+        return instance_mock(request, Part, partname=PackURI(partname))
+
+
+class Describe_PrefixIndex:
+    """Unit-test suite for `pptx.opc.package._PrefixIndex` objects."""
+
+    def it_tracks_the_first_available_partname_idx(self):
+        prefix_index = _PrefixIndex()
+        assert prefix_index.first_available_idx == 1
+
+        for n in (1, 2, 4):
+            prefix_index.add(PackURI("/ppt/media/image%d.png" % n))
+        prefix_index.add(PackURI("/ppt/media/image.png"))
+        assert prefix_index.first_available_idx == 3
+
+        prefix_index.add(PackURI("/ppt/media/image3.jpg"))
+        assert prefix_index.first_available_idx == 5
+
+        prefix_index.remove(PackURI("/ppt/media/image2.png"))
+        assert prefix_index.first_available_idx == 2
+        assert len(prefix_index.partnames) == 4
+        assert "/ppt/media/image2.png" not in prefix_index.partnames
+
+
+class Describe_RelationshipGraph:
+    """Unit-test suite for `pptx.opc.package._RelationshipGraph` objects."""
+
+    def it_traverses_the_rels_graph_depth_first_when_created(self, request):
+        """
+        pkg --r0--> part_0 --r2--> part_1 --r3--> part_0
+         |
+         +---r1---> external
+        """
+        part_0_, part_1_ = (instance_mock(request, Part, name="part_%d" % i) for i in range(2))
+        r0, r1, r2, r3 = (
+            instance_mock(request, _Relationship, is_external=ext, target_part=part)
+            for ext, part in ((False, part_0_), (True, None), (False, part_1_), (False, part_0_))
+        )
+        part_0_.rels = {"rId1": r2}
+        part_1_.rels = {"rId1": r3}
+
+        rel_graph = _RelationshipGraph({"rId1": r0, "rId2": r1})
+
+        assert list(rel_graph.iter_rels()) == [r0, r2, r3, r1]
+        assert list(rel_graph.iter_parts()) == [part_0_, part_1_]
+
+    def and_it_does_not_recurse_to_traverse_a_deep_graph(self):
+        parts = [Part(PackURI("/part%d.xml" % n), CT.XML, None) for n in range(5000)]
+        for part, target in zip(parts, parts[1:]):
+            part.rels._rels["rId1"] = _Relationship(
+                part.partname.baseURI, "rId1", RT.CUSTOM_XML, RTM.INTERNAL, target
+            )
+        pkg_rel = _Relationship("/", "rId1", RT.OFFICE_DOCUMENT, RTM.INTERNAL, parts[0])
+
+        rel_graph = _RelationshipGraph({"rId1": pkg_rel})
+
+        assert list(rel_graph.iter_parts()) == parts
+
+    def it_adds_a_relationship_and_the_parts_it_makes_reachable(self, request):
+        part_0_, part_1_, part_2_ = (
+            instance_mock(request, Part, name="part_%d" % i) for i in range(3)
+        )
+        r0, r1, r2, r3 = (
+            instance_mock(request, _Relationship, is_external=False, target_part=part)
+            for part in (part_0_, part_1_, part_2_, part_0_)
+        )
+        part_0_.rels = {}
+        part_1_.rels = {"rId1": r2}
+        part_2_.rels = {"rId1": r3}
+        rel_graph = _RelationshipGraph({"rId1": r0})
+
+        rel_graph.add_rel(part_0_, r1)
+        rel_graph.add_rel(part_0_, r1)
+
+        assert list(rel_graph.iter_rels()) == [r0, r1, r2, r3]
+        assert list(rel_graph.iter_parts()) == [part_0_, part_1_, part_2_]
+
+    def but_it_skips_a_relationship_from_a_part_not_in_the_graph(self, request):
+        part_0_, part_1_ = (instance_mock(request, Part, name="part_%d" % i) for i in range(2))
+        rel_ = instance_mock(request, _Relationship, is_external=False, target_part=part_1_)
+        rel_graph = _RelationshipGraph({})
+
+        rel_graph.add_rel(part_0_, rel_)
+
+        assert list(rel_graph.iter_rels()) == []
+        assert list(rel_graph.iter_parts()) == []
+
+    def and_it_adds_a_package_relationship(self, request):
+        rel_ = instance_mock(request, _Relationship, is_external=True)
+        rel_graph = _RelationshipGraph({})
+
+        rel_graph.add_rel(None, rel_)
+
+        assert list(rel_graph.iter_rels()) == [rel_]
+
+    def it_drops_a_relationship_and_the_parts_no_longer_reachable_without_it(self, request):
+        """
+        pkg --r0--> part_0 --r2--> part_1 --r3--> part_0
+         |                           |  |
+         +---r1---> part_2 <---r4----+  +--r5--> part_3
+        """
+        part_0_, part_1_, part_2_, part_3_ = (
+            instance_mock(request, Part, name="part_%d" % i) for i in range(4)
+        )
+        r0, r1, r2, r3, r4, r5 = (
+            instance_mock(request, _Relationship, is_external=False, target_part=part)
+            for part in (part_0_, part_2_, part_1_, part_0_, part_2_, part_3_)
+        )
+        part_0_.rels = {"rId1": r2}
+        part_1_.rels = {"rId1": r3, "rId2": r4, "rId3": r5}
+        part_2_.rels = {}
+        part_3_.rels = {}
+        rel_graph = _RelationshipGraph({"rId1": r0, "rId2": r1})
+
+        removed_parts = rel_graph.drop_rel(r0)
+
+        assert removed_parts == [part_0_, part_1_, part_3_]
+        assert list(rel_graph.iter_rels()) == [r1]
+        assert list(rel_graph.iter_parts()) == [part_2_]
+
+    def but_it_keeps_a_part_still_reachable_another_way(self, request):
+        """
+        pkg --r0--> part_0 --r1--> part_1
+                      |              ^
+                      +-----r2-------+
+        """
+        part_0_, part_1_ = (instance_mock(request, Part, name="part_%d" % i) for i in range(2))
+        r0, r1, r2 = (
+            instance_mock(request, _Relationship, is_external=False, target_part=part)
+            for part in (part_0_, part_1_, part_1_)
+        )
+        part_0_.rels = {"rId1": r1, "rId2": r2}
+        part_1_.rels = {}
+        rel_graph = _RelationshipGraph({"rId1": r0})
+
+        del part_0_.rels["rId1"]
+        removed_parts = rel_graph.drop_rel(r1)
+
+        assert removed_parts == []
+        assert list(rel_graph.iter_rels()) == [r0, r2]
+        assert list(rel_graph.iter_parts()) == [part_0_, part_1_]
+
+    def and_it_ignores_a_relationship_not_in_the_graph(self, request):
+        rel_ = instance_mock(request, _Relationship, is_external=False)
+        rel_graph = _RelationshipGraph({})
+
+        assert rel_graph.drop_rel(rel_) == []
+
+
 class Describe_Relationships:
     """Unit-test suite for `pptx.opc.package._Relationships` objects."""
 
@@ -711,17 +1555,49 @@ class Describe_Relationships:
         ]
         assert relationships._rels == {"rId1": rels_[0], "rId2": rels_[1]}
 
+    def and_it_discards_its_indexes_when_it_loads(self):
+        relationships = _Relationships(None)
+        relationships.__dict__["_rels_by_reltype"] = {}
+        relationships.__dict__["_rIds_by_target"] = {}
+
+        relationships.load_from_xml("/ppt/slides", CT_Relationships.new(), {})
+
+        assert "_rels_by_reltype" not in relationships.__dict__
+        assert "_rIds_by_target" not in relationships.__dict__
+
+    def it_can_defer_loading_from_xml_until_first_used(self, request, _Relationship_, part_):
+        rels_ = tuple(
+            instance_mock(request, _Relationship, rId="rId%d" % (i + 1)) for i in range(2)
+        )
+        _Relationship_.from_xml.side_effect = iter(rels_)
+        xml_rels = parse_xml(snippet_bytes("rels-load-from-xml"))
+        load_xml_rels_ = Mock(name="load_xml_rels", return_value=xml_rels)
+        parts = {"/ppt/slideLayouts/slideLayout1.xml": part_}
+        relationships = _Relationships("/ppt/slides")
+        relationships.__dict__["_rels_by_reltype"] = {}
+
+        relationships.defer_load_from_xml(load_xml_rels_, parts)
+
+        load_xml_rels_.assert_not_called()
+        assert "_rels_by_reltype" not in relationships.__dict__
+        assert list(relationships) == ["rId1", "rId2"]
+        load_xml_rels_.assert_called_once_with()
+        assert _Relationship_.from_xml.call_args_list == [
+            call("/ppt/slides", xml_rels[0], parts),
+            call("/ppt/slides", xml_rels[1], parts),
+        ]
+
     def it_can_find_a_part_with_reltype(self, _rels_by_reltype_prop_, relationship_, part_):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
-            list, ((RT.SLIDE_LAYOUT, [relationship_]),)
+            dict, ((RT.SLIDE_LAYOUT, {"rId1": relationship_}),)
         )
         relationships = _Relationships(None)
 
         assert relationships.part_with_reltype(RT.SLIDE_LAYOUT) is part_
 
     def but_it_raises_KeyError_when_there_is_no_such_part(self, _rels_by_reltype_prop_):
-        _rels_by_reltype_prop_.return_value = collections.defaultdict(list)
+        _rels_by_reltype_prop_.return_value = collections.defaultdict(dict)
         relationships = _Relationships(None)
 
         with pytest.raises(KeyError) as e:
@@ -736,7 +1612,7 @@ class Describe_Relationships:
     ):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
-            list, ((RT.SLIDE_LAYOUT, [relationship_, relationship_]),)
+            dict, ((RT.SLIDE_LAYOUT, {"rId1": relationship_, "rId2": relationship_}),)
         )
         relationships = _Relationships(None)
 
@@ -757,6 +1633,24 @@ class Describe_Relationships:
 
         assert relationships._rels == {}
 
+    def and_it_removes_the_relationship_from_its_indexes_when_they_are_built(self, request):
+        part_ = instance_mock(request, Part)
+        relationships = _Relationships("/ppt/slides")
+        relationships._add_relationship(RT.IMAGE, part_)
+        relationships._add_relationship(RT.IMAGE, part_)
+        relationships._add_relationship(RT.HYPERLINK, "http://url", is_external=True)
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId1"
+        assert len(relationships._rels_by_reltype) == 2
+
+        relationships.pop("rId1")
+        relationships.pop("rId3")
+
+        assert dict(relationships._rels_by_reltype) == {
+            RT.IMAGE: {"rId2": relationships["rId2"]},
+            RT.HYPERLINK: {},
+        }
+        assert relationships._rIds_by_target == {(RT.IMAGE, part_, False): {"rId2": None}}
+
     def it_can_serialize_itself_to_XML(self, request, _rels_prop_):
         _rels_prop_.return_value = {
             "rId11": instance_mock(
@@ -810,6 +1704,27 @@ class Describe_Relationships:
         assert relationships._rels == {"rId8": relationship_}
         assert rId == "rId8"
 
+    def and_it_adds_the_new_relationship_to_its_indexes_when_they_are_built(
+        self, request, relationship_
+    ):
+        part_ = instance_mock(request, Part)
+        relationships = _Relationships("/ppt/slides")
+        relationships._rels["rId1"] = relationship_
+        relationship_.configure_mock(reltype=RT.IMAGE, is_external=False, target_part=part_)
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId1"
+
+        relationships._add_relationship(RT.IMAGE, part_)
+        relationships._add_relationship(RT.HYPERLINK, "http://url", is_external=True)
+
+        assert dict(relationships._rels_by_reltype) == {
+            RT.IMAGE: {"rId1": relationship_, "rId2": relationships["rId2"]},
+            RT.HYPERLINK: {"rId3": relationships["rId3"]},
+        }
+        assert relationships._rIds_by_target == {
+            (RT.IMAGE, part_, False): {"rId1": None, "rId2": None},
+            (RT.HYPERLINK, "http://url", True): {"rId3": None},
+        }
+
     def and_it_can_add_an_external_relationship_to_help(
         self, request, _next_rId_prop_, _rels_prop_, _Relationship_, relationship_
     ):
@@ -837,26 +1752,27 @@ class Describe_Relationships:
         ),
     )
     def it_can_get_a_matching_relationship_to_help(
-        self, request, _rels_by_reltype_prop_, target_ref, is_external, expected_value
+        self, request, _rels_prop_, target_ref, is_external, expected_value
     ):
         part_1, part_2 = (instance_mock(request, Part) for _ in range(2))
-        _rels_by_reltype_prop_.return_value = {
-            RT.SLIDE: [
-                instance_mock(
-                    request,
-                    _Relationship,
-                    rId=rId,
-                    target_part=target_part,
-                    target_ref=ref,
-                    is_external=external,
-                )
-                for rId, target_part, ref, external in (
-                    ("rId1", None, "http://url", True),
-                    ("rId2", part_1, "/ppt/foo.bar", False),
-                    ("rId3", None, "http://foo", True),
-                    ("rId4", part_2, "/ppt/bar.foo", False),
-                )
-            ]
+        _rels_prop_.return_value = {
+            rId: instance_mock(
+                request,
+                _Relationship,
+                rId=rId,
+                reltype=reltype,
+                target_part=target_part,
+                target_ref=ref,
+                is_external=external,
+            )
+            for rId, reltype, target_part, ref, external in (
+                ("rId1", RT.SLIDE, None, "http://url", True),
+                ("rId2", RT.SLIDE, part_1, "/ppt/foo.bar", False),
+                ("rId3", RT.SLIDE, None, "http://foo", True),
+                ("rId4", RT.SLIDE, part_2, "/ppt/bar.foo", False),
+                ("rId5", RT.SLIDE, part_1, "/ppt/foo.bar", False),
+                ("rId6", RT.IMAGE, None, "http://bar", True),
+            )
         }
         target = target_ref if is_external else part_1 if target_ref == "part_1" else part_2
         relationships = _Relationships(None)
@@ -865,8 +1781,8 @@ class Describe_Relationships:
 
         assert matching == expected_value
 
-    def but_it_returns_None_when_there_is_no_matching_relationship(self, _rels_by_reltype_prop_):
-        _rels_by_reltype_prop_.return_value = collections.defaultdict(list)
+    def but_it_returns_None_when_there_is_no_matching_relationship(self, _rels_prop_):
+        _rels_prop_.return_value = {}
         relationships = _Relationships(None)
 
         assert relationships._get_matching(RT.HYPERLINK, "http://url", True) is None
@@ -898,11 +1814,11 @@ class Describe_Relationships:
 
         rels_by_reltype = relationships._rels_by_reltype
 
-        assert rels["rId1"] in rels_by_reltype[RT.SLIDE]
-        assert rels["rId2"] in rels_by_reltype[RT.IMAGE]
-        assert rels["rId3"] in rels_by_reltype[RT.SLIDE]
-        assert rels["rId4"] in rels_by_reltype[RT.HYPERLINK]
-        assert rels_by_reltype[RT.CHART] == []
+        assert list(rels_by_reltype[RT.SLIDE].values()) == [rels["rId1"], rels["rId3"]]
+        assert list(rels_by_reltype[RT.IMAGE].values()) == [rels["rId2"]]
+        assert list(rels_by_reltype[RT.HYPERLINK].values()) == [rels["rId4"]]
+        assert rels_by_reltype[RT.CHART] == {}
+        assert relationships._rels_by_reltype is rels_by_reltype
 
     # fixture components -----------------------------------
 
@@ -959,6 +1875,25 @@ class Describe_Relationship:
         _init_.assert_called_once_with(relationship, "/ppt", "rId42", RT.SLIDE, RTM.INTERNAL, part_)
         assert isinstance(relationship, _Relationship)
 
+    def but_it_defers_loading_a_target_part_not_yet_loaded(self, request):
+        _init_ = initializer_mock(request, _DeferredRelationship)
+        rel_elm = instance_mock(
+            request,
+            CT_Relationship,
+            rId="rId42",
+            reltype=RT.SLIDE,
+            targetMode=RTM.INTERNAL,
+            target_ref="slides/slide7.xml",
+        )
+        parts = {}
+
+        relationship = _Relationship.from_xml("/ppt", rel_elm, parts)
+
+        _init_.assert_called_once_with(
+            relationship, "/ppt", "rId42", RT.SLIDE, "/ppt/slides/slide7.xml", parts
+        )
+        assert isinstance(relationship, _DeferredRelationship)
+
     @pytest.mark.parametrize(
         "target_mode, expected_value",
         ((RTM.INTERNAL, False), (RTM.EXTERNAL, True), (None, False)),
@@ -1029,3 +1964,40 @@ class Describe_Relationship:
     @pytest.fixture
     def part_(self, request):
         return instance_mock(request, Part)
+
+
+class Describe_DeferredRelationship:
+    """Unit-test suite for `pptx.opc.package._DeferredRelationship` objects."""
+
+    def it_loads_its_target_part_when_it_is_first_accessed(self, request):
+        part_ = instance_mock(request, Part)
+        parts_ = instance_mock(request, _PartsOnDemand)
+        parts_.__getitem__.return_value = part_
+        partname = PackURI("/ppt/slides/slide7.xml")
+        relationship = _DeferredRelationship("/ppt", "rId42", RT.SLIDE, partname, parts_)
+
+        assert relationship.target_part is part_
+        assert relationship.target_part is part_
+        parts_.__getitem__.assert_called_once_with(partname)
+
+    def it_knows_its_target_partname_without_loading_the_part(self, request):
+        parts_ = instance_mock(request, _PartsOnDemand)
+        partname = PackURI("/ppt/slides/slide7.xml")
+        relationship = _DeferredRelationship("/ppt", "rId42", RT.SLIDE, partname, parts_)
+
+        assert relationship.target_partname == "/ppt/slides/slide7.xml"
+        assert relationship.target_ref == "slides/slide7.xml"
+        assert relationship.is_external is False
+        parts_.__getitem__.assert_not_called()
+
+    def and_it_knows_the_partname_of_the_part_once_loaded(self, request):
+        part_ = instance_mock(request, Part, partname=PackURI("/ppt/slides/slide3.xml"))
+        parts_ = instance_mock(request, _PartsOnDemand)
+        parts_.__getitem__.return_value = part_
+        relationship = _DeferredRelationship(
+            "/ppt", "rId42", RT.SLIDE, PackURI("/ppt/slides/slide7.xml"), parts_
+        )
+
+        relationship.target_part
+
+        assert relationship.target_partname == "/ppt/slides/slide3.xml"
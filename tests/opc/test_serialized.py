@@ -7,22 +7,32 @@ from __future__ import annotations
 import hashlib
 import io
 import zipfile
+import zlib
+from pathlib import Path
+from typing import IO, cast
 
 import pytest
 
 from pptx.exc import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
-from pptx.opc.package import Part, _Relationships
+from pptx.opc.package import OpcPackage, Part, _Relationships
 from pptx.opc.packuri import CONTENT_TYPES_URI, PackURI
 from pptx.opc.serialized import (
+    CompressionPolicy,
     PackageReader,
     PackageWriter,
+    PathBlob,
+    ZipMemberBlob,
+    _ChunkSink,
     _ContentTypesItem,
     _DirPkgReader,
+    _DirPkgWriter,
     _PhysPkgReader,
     _PhysPkgWriter,
+    _ZipFile,
     _ZipPkgReader,
     _ZipPkgWriter,
+    internal_rels,
 )
 
 from ..unitutil.file import absjoin, snippet_text, test_file_dir
@@ -60,6 +70,48 @@ class DescribePackageReader:
 
         assert package_reader[PackURI("/ppt/slides/slide1.xml")] == b"blob"
 
+    def it_can_close_its_blob_reader(self, _blob_reader_prop_: Mock):
+        phys_reader_ = _blob_reader_prop_.return_value
+
+        PackageReader("").close()
+
+        phys_reader_.close.assert_called_once_with()
+
+    def it_can_get_the_stored_member_for_a_partname(self, _blob_reader_prop_: Mock):
+        phys_reader_ = _blob_reader_prop_.return_value
+        phys_reader_.stored_member.return_value = ("zip-info", b"stored")
+        package_reader = PackageReader("")
+
+        stored_member = package_reader.stored_member(PackURI("/ppt/media/image1.png"))
+
+        phys_reader_.stored_member.assert_called_once_with("/ppt/media/image1.png")
+        assert stored_member == ("zip-info", b"stored")
+
+    def it_knows_whether_a_pkg_file_is_its_package_file(self, _blob_reader_prop_: Mock):
+        phys_reader_ = _blob_reader_prop_.return_value
+        phys_reader_.is_package_file.return_value = True
+        package_reader = PackageReader("prs.pptx")
+
+        assert package_reader.is_package_file("prs.pptx") is True
+        phys_reader_.is_package_file.assert_called_once_with("prs.pptx")
+
+    def it_can_get_a_file_backed_blob_for_a_partname(self, _blob_reader_prop_: Mock):
+        phys_reader_ = _blob_reader_prop_.return_value
+        phys_reader_.file_blob.return_value = "file-blob"
+        package_reader = PackageReader("prs.pptx")
+
+        file_blob = package_reader.file_blob(PackURI("/ppt/media/media1.mp4"))
+
+        phys_reader_.file_blob.assert_called_once_with("/ppt/media/media1.mp4")
+        assert file_blob == "file-blob"
+
+    def it_can_generate_the_sizes_of_its_members(self, _blob_reader_prop_: Mock):
+        phys_reader_ = _blob_reader_prop_.return_value
+        phys_reader_.iter_member_sizes.return_value = iter([("/ppt/presentation.xml", 42, 99)])
+        package_reader = PackageReader("prs.pptx")
+
+        assert list(package_reader.iter_member_sizes()) == [("/ppt/presentation.xml", 42, 99)]
+
     def it_can_get_the_rels_xml_for_a_partname(self, _blob_reader_prop_: Mock):
         _blob_reader_prop_.return_value = {"/ppt/_rels/presentation.xml.rels": b"blob"}
         package_reader = PackageReader("")
@@ -94,16 +146,38 @@ class DescribePackageWriter:
     """Unit-test suite for `pptx.opc.serialized.PackageWriter` objects."""
 
     def it_provides_a_write_interface_classmethod(
-        self, request: FixtureRequest, relationships_: Mock, part_: Mock
+        self,
+        request: FixtureRequest,
+        relationships_: Mock,
+        part_: Mock,
+        package_reader_: Mock,
     ):
         _init_ = initializer_mock(request, PackageWriter)
         _write_ = method_mock(request, PackageWriter, "_write")
 
-        PackageWriter.write("prs.pptx", relationships_, (part_, part_))
+        PackageWriter.write("prs.pptx", relationships_, (part_, part_), package_reader_, 4, "fast")
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_, part_))
+        _init_.assert_called_once_with(
+            ANY, "prs.pptx", relationships_, (part_, part_), package_reader_, 4, "fast"
+        )
         _write_.assert_called_once_with(ANY)
 
+    def it_can_generate_a_package_in_chunks(
+        self, request: FixtureRequest, relationships_: Mock, part_: Mock
+    ):
+        def iter_write(package_writer: PackageWriter):
+            stream = cast(_ChunkSink, package_writer._pkg_file)
+            for chunk in (b"abc", b"", b"def"):
+                stream.write(chunk)
+                yield
+            stream.write(b"ghi")
+
+        method_mock(request, PackageWriter, "_iter_write", side_effect=iter_write)
+
+        chunks = PackageWriter.iter_write(relationships_, (part_,))
+
+        assert list(chunks) == [b"abc", b"def", b"ghi"]
+
     def it_can_write_a_package(
         self, request: FixtureRequest, phys_writer_: Mock, relationships_: Mock
     ):
@@ -114,15 +188,43 @@ class DescribePackageWriter:
             request, PackageWriter, "_write_content_types_stream"
         )
         _write_pkg_rels_ = method_mock(request, PackageWriter, "_write_pkg_rels")
-        _write_parts_ = method_mock(request, PackageWriter, "_write_parts")
-        package_writer = PackageWriter("prs.pptx", relationships_, [])
+        _iter_write_parts_ = method_mock(
+            request, PackageWriter, "_iter_write_parts", return_value=iter(())
+        )
+        compression = CompressionPolicy(level=1)
+        package_writer = PackageWriter("prs.pptx", relationships_, [], compression=compression)
 
         package_writer._write()
 
-        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx", 1, compression)
         _write_content_types_stream_.assert_called_once_with(package_writer, phys_writer_)
         _write_pkg_rels_.assert_called_once_with(package_writer, phys_writer_)
-        _write_parts_.assert_called_once_with(package_writer, phys_writer_)
+        _iter_write_parts_.assert_called_once_with(package_writer, phys_writer_)
+
+    @pytest.mark.parametrize(("is_package_file", "source_close_calls"), [(False, 1), (True, 0)])
+    def it_closes_the_source_package_after_writing(
+        self,
+        request: FixtureRequest,
+        phys_writer_: Mock,
+        relationships_: Mock,
+        package_reader_: Mock,
+        is_package_file: bool,
+        source_close_calls: int,
+    ):
+        _PhysPkgWriter_ = class_mock(request, "pptx.opc.serialized._PhysPkgWriter")
+        phys_writer_.__enter__.return_value = phys_writer_
+        _PhysPkgWriter_.factory.return_value = phys_writer_
+        method_mock(request, PackageWriter, "_write_content_types_stream")
+        method_mock(request, PackageWriter, "_write_pkg_rels")
+        method_mock(request, PackageWriter, "_iter_write_parts", return_value=iter(()))
+        package_reader_.is_package_file.return_value = is_package_file
+        package_writer = PackageWriter("prs.pptx", relationships_, [], package_reader_)
+
+        package_writer._write()
+
+        package_reader_.is_package_file.assert_called_once_with("prs.pptx")
+        assert package_reader_.close.call_count == source_close_calls
+        assert package_writer._source is (None if is_package_file else package_reader_)
 
     def it_can_write_a_content_types_stream(
         self, request: FixtureRequest, phys_writer_: Mock, relationships_: Mock, part_: Mock
@@ -149,13 +251,14 @@ class DescribePackageWriter:
                 Part,
                 partname=PackURI("/ppt/%s.xml" % x),
                 blob="blob_%s" % x,
+                file_blob=None,
                 rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x),
             )
             for x in ("a", "b", "c")
         ]
         package_writer = PackageWriter("", relationships_, parts_)
 
-        package_writer._write_parts(phys_writer_)
+        list(package_writer._iter_write_parts(phys_writer_))
 
         assert phys_writer_.write.call_args_list == [
             call("/ppt/a.xml", "blob_a"),
@@ -166,6 +269,136 @@ class DescribePackageWriter:
             call("/ppt/_rels/c.xml.rels", "rels_xml_c"),
         ]
 
+    def it_copies_the_stored_member_of_a_part_unchanged_since_loading(
+        self, request: FixtureRequest, relationships_: Mock, phys_writer_: Mock
+    ):
+        zip_info = zipfile.ZipInfo("ppt/media/image1.png")
+        zip_info.compress_type = zipfile.ZIP_DEFLATED
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/media/image3.png"),
+            source_partname=PackURI("/ppt/media/image1.png"),
+            file_blob=None,
+            _rels={},
+        )
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.stored_member.return_value = (zip_info, b"stored")
+        package_writer = PackageWriter("", relationships_, [part_], package_reader_)
+
+        list(package_writer._iter_write_parts(phys_writer_))
+
+        package_reader_.stored_member.assert_called_once_with("/ppt/media/image1.png")
+        phys_writer_.write_stored.assert_called_once_with(
+            "/ppt/media/image3.png", zip_info, b"stored"
+        )
+        phys_writer_.write.assert_not_called()
+
+    def it_streams_the_content_of_a_file_backed_part(
+        self, request: FixtureRequest, relationships_: Mock, phys_writer_: Mock
+    ):
+        file_blob_ = instance_mock(request, PathBlob)
+        part_ = instance_mock(
+            request, Part, partname=PackURI("/ppt/media/media1.mp4"), file_blob=file_blob_, _rels={}
+        )
+        package_writer = PackageWriter("", relationships_, [part_])
+        _stored_member_for_ = method_mock(request, PackageWriter, "_stored_member_for")
+
+        list(package_writer._iter_write_parts(phys_writer_))
+
+        _stored_member_for_.assert_not_called()
+        phys_writer_.write_file_blob.assert_called_once_with("/ppt/media/media1.mp4", file_blob_)
+        phys_writer_.write.assert_not_called()
+
+    def it_reads_file_backed_parts_stored_in_the_save_target_into_memory(
+        self, request: FixtureRequest, relationships_: Mock
+    ):
+        file_blobs_ = [instance_mock(request, PathBlob) for _ in range(2)]
+        file_blobs_[0].is_stored_in.return_value = True
+        file_blobs_[1].is_stored_in.return_value = False
+        parts_ = [instance_mock(request, Part, file_blob=file_blob) for file_blob in file_blobs_]
+        parts_.append(instance_mock(request, Part, file_blob=None))
+        package_writer = PackageWriter("prs.pptx", relationships_, parts_)
+
+        package_writer._load_overwritten_file_blobs()
+
+        file_blobs_[0].is_stored_in.assert_called_once_with("prs.pptx")
+        parts_[0].load_file_blob.assert_called_once_with()
+        parts_[1].load_file_blob.assert_not_called()
+        parts_[2].load_file_blob.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("has_source", "source_partname", "compress_type", "compression"),
+        [
+            (False, "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, "default"),
+            (True, None, zipfile.ZIP_DEFLATED, "default"),
+            (True, "/ppt/slides/slide1.xml", None, "default"),
+            (True, "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, "stored"),
+            (True, "/ppt/slides/slide1.xml", zipfile.ZIP_STORED, "fast"),
+            (True, "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, "smallest"),
+        ],
+    )
+    def but_it_writes_the_blob_when_no_stored_member_is_available(
+        self,
+        request: FixtureRequest,
+        package_reader_: Mock,
+        has_source: bool,
+        source_partname: str | None,
+        compress_type: int | None,
+        compression: str,
+    ):
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/slides/slide1.xml"),
+            source_partname=source_partname,
+        )
+        zip_info = zipfile.ZipInfo("ppt/slides/slide1.xml")
+        if compress_type is not None:
+            zip_info.compress_type = compress_type
+        package_reader_.stored_member.return_value = (
+            None if compress_type is None else (zip_info, b"stored")
+        )
+        package_writer = PackageWriter(
+            "", [], [part_], package_reader_ if has_source else None, compression=compression
+        )
+
+        assert package_writer._stored_member_for(part_) is None
+
+    def it_compresses_unchanged_parts_again_for_a_smaller_compression_level(self, tmp_path: Path):
+        """Integrates with OpcPackage and zipfile.ZipFile."""
+        pkg_path = str(tmp_path / "prs.pptx")
+        OpcPackage.open(absjoin(test_file_dir, "test.pptx")).save(pkg_path)
+        stream = io.BytesIO()
+
+        OpcPackage.open(pkg_path).save(stream, compression="smallest")
+
+        with zipfile.ZipFile(stream) as zipf:
+            for zip_info in zipf.infolist():
+                compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+                deflated = compressor.compress(zipf.read(zip_info)) + compressor.flush()
+                assert zip_info.compress_size == len(deflated), zip_info.filename
+
+    def and_it_copies_the_members_it_compressed_at_that_level_when_saved_again(
+        self, request: FixtureRequest, tmp_path: Path
+    ):
+        """Integrates with OpcPackage and zipfile.ZipFile."""
+        pkg_path = str(tmp_path / "prs.pptx")
+        OpcPackage.open(absjoin(test_file_dir, "test.pptx")).save(pkg_path, compression="smallest")
+        write_stored_ = method_mock(
+            request, _ZipPkgWriter, "write_stored", side_effect=_ZipPkgWriter.write_stored
+        )
+
+        OpcPackage.open(pkg_path).save(io.BytesIO(), compression="smallest")
+
+        with zipfile.ZipFile(pkg_path) as zipf:
+            part_membernames = {
+                name
+                for name in zipf.namelist()
+                if not name.endswith(".rels") and name != "[Content_Types].xml"
+            }
+        assert {c.args[1].membername for c in write_stored_.call_args_list} == part_membernames
+
     def it_can_write_a_pkg_rels_item(self, phys_writer_: Mock, relationships_: Mock):
         relationships_.xml = b"pkg-rels-xml"
         package_writer = PackageWriter("", relationships_, [])
@@ -176,6 +409,10 @@ class DescribePackageWriter:
 
     # -- fixtures ----------------------------------------------------
 
+    @pytest.fixture
+    def package_reader_(self, request: FixtureRequest):
+        return instance_mock(request, PackageReader)
+
     @pytest.fixture
     def part_(self, request: FixtureRequest):
         return instance_mock(request, Part)
@@ -189,6 +426,188 @@ class DescribePackageWriter:
         return instance_mock(request, _Relationships)
 
 
+class DescribeCompressionPolicy:
+    """Unit-test suite for `pptx.opc.serialized.CompressionPolicy` objects."""
+
+    @pytest.mark.parametrize(
+        ("name", "partname", "expected_value"),
+        [
+            ("default", "/ppt/media/image1.png", (zipfile.ZIP_DEFLATED, -1)),
+            ("default", "/ppt/slides/slide1.xml", (zipfile.ZIP_DEFLATED, -1)),
+            ("balanced", "/ppt/media/image1.JPG", (zipfile.ZIP_STORED, 0)),
+            ("balanced", "/ppt/slides/slide1.xml", (zipfile.ZIP_DEFLATED, -1)),
+            ("fast", "/ppt/media/media1.mp4", (zipfile.ZIP_STORED, 0)),
+            ("fast", "/ppt/embeddings/Sheet1.xlsx", (zipfile.ZIP_STORED, 0)),
+            ("fast", "/ppt/media/image2.emf", (zipfile.ZIP_DEFLATED, 1)),
+            ("fast", "/ppt/slides/slide1.xml", (zipfile.ZIP_DEFLATED, 1)),
+            ("smallest", "/ppt/media/image1.png", (zipfile.ZIP_DEFLATED, 9)),
+            ("stored", "/ppt/slides/slide1.xml", (zipfile.ZIP_STORED, 0)),
+        ],
+    )
+    def it_provides_named_profiles(self, name: str, partname: str, expected_value: tuple[int, int]):
+        policy = CompressionPolicy.profile(name)
+        assert policy.compression_for(PackURI(partname)) == expected_value
+
+    def but_it_raises_on_an_unknown_profile_name(self):
+        with pytest.raises(ValueError, match="no compression profile named 'tiny'"):
+            CompressionPolicy.profile("tiny")
+
+    @pytest.mark.parametrize(
+        ("name", "partname", "compress_type", "flag_bits", "expected_value"),
+        [
+            ("default", "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, 0x00, True),
+            ("default", "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, 0x06, True),
+            ("default", "/ppt/slides/slide1.xml", zipfile.ZIP_STORED, 0x00, False),
+            ("fast", "/ppt/media/image1.png", zipfile.ZIP_STORED, 0x00, True),
+            ("fast", "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, 0x02, True),
+            ("smallest", "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, 0x00, False),
+            ("smallest", "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, 0x06, False),
+            ("smallest", "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, 0x02, True),
+            ("smallest", "/ppt/slides/slide1.xml", zipfile.ZIP_DEFLATED, 0x0A, True),
+            ("stored", "/ppt/slides/slide1.xml", zipfile.ZIP_STORED, 0x00, True),
+        ],
+    )
+    def it_knows_whether_a_member_is_already_compressed_as_called_for(
+        self, name: str, partname: str, compress_type: int, flag_bits: int, expected_value: bool
+    ):
+        zip_info = zipfile.ZipInfo(partname[1:])
+        zip_info.compress_type = compress_type
+        zip_info.flag_bits = flag_bits
+        policy = CompressionPolicy.profile(name)
+
+        assert policy.accepts_member(PackURI(partname), zip_info) is expected_value
+
+    def it_stores_members_having_a_stored_extension(self):
+        policy = CompressionPolicy(level=4, stored_exts=("BIN",))
+
+        assert policy.compression_for(PackURI("/ppt/embeddings/oleObject1.bin")) == (
+            zipfile.ZIP_STORED,
+            0,
+        )
+        assert policy.compression_for(PackURI("/ppt/slides/slide1.xml")) == (
+            zipfile.ZIP_DEFLATED,
+            4,
+        )
+
+
+class DescribePathBlob:
+    """Unit-test suite for `pptx.opc.serialized.PathBlob` objects."""
+
+    def it_provides_access_to_the_content_of_its_file(self, tmp_path: Path):
+        path = tmp_path / "media1.mp4"
+        path.write_bytes(b"0123456789")
+        path_blob = PathBlob(str(path))
+
+        assert path_blob.size == 10
+        assert path_blob.read() == b"0123456789"
+        assert b"".join(path_blob.iter_chunks()) == b"0123456789"
+        assert path_blob.sha1 == hashlib.sha1(b"0123456789").hexdigest()
+
+    def it_reads_its_file_in_chunks(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("pptx.opc.serialized._CHUNK_SIZE", 4)
+        path = tmp_path / "media1.mp4"
+        path.write_bytes(b"0123456789")
+
+        assert list(PathBlob(str(path)).iter_chunks()) == [b"0123", b"4567", b"89"]
+
+    def it_knows_whether_it_is_stored_in_a_pkg_file(self, tmp_path: Path):
+        (tmp_path / "ppt" / "media").mkdir(parents=True)
+        path = tmp_path / "ppt" / "media" / "media1.mp4"
+        path.write_bytes(b"0123456789")
+        path_blob = PathBlob(str(path))
+
+        assert path_blob.is_stored_in(str(path)) is True
+        assert path_blob.is_stored_in(str(tmp_path)) is True
+        assert path_blob.is_stored_in(str(tmp_path / "ppt" / "slides")) is False
+        assert path_blob.is_stored_in(str(tmp_path) + "-other") is False
+        assert path_blob.is_stored_in(io.BytesIO()) is False
+
+
+class DescribeZipMemberBlob:
+    """Unit-test suite for `pptx.opc.serialized.ZipMemberBlob` objects."""
+
+    @pytest.mark.parametrize("compress_type", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def it_provides_access_to_the_content_of_its_member(self, tmp_path: Path, compress_type: int):
+        pkg_path = str(tmp_path / "prs.pptx")
+        with zipfile.ZipFile(pkg_path, "w", compress_type) as zipf:
+            zipf.writestr("ppt/slides/slide1.xml", b"<p:sld/>")
+            zipf.writestr("ppt/media/media1.mp4", b"0123456789" * 10)
+        with zipfile.ZipFile(pkg_path) as zipf:
+            zip_info = zipf.getinfo("ppt/media/media1.mp4")
+        zip_member_blob = ZipMemberBlob(pkg_path, zip_info)
+
+        assert zip_member_blob.size == 100
+        assert zip_member_blob.zip_info is zip_info
+        assert zip_member_blob.read() == b"0123456789" * 10
+        assert zip_member_blob.sha1 == hashlib.sha1(b"0123456789" * 10).hexdigest()
+        stored = b"".join(zip_member_blob.iter_stored_chunks())
+        assert len(stored) == zip_info.compress_size
+        assert (
+            stored if compress_type == zipfile.ZIP_STORED else zlib.decompress(stored, -15)
+        ) == b"0123456789" * 10
+
+    def but_it_raises_when_its_member_has_changed(self, tmp_path: Path):
+        pkg_path = str(tmp_path / "prs.pptx")
+        with zipfile.ZipFile(pkg_path, "w") as zipf:
+            zipf.writestr("ppt/media/media1.mp4", b"0123456789")
+        with zipfile.ZipFile(pkg_path) as zipf:
+            zip_member_blob = ZipMemberBlob(pkg_path, zipf.getinfo("ppt/media/media1.mp4"))
+        with zipfile.ZipFile(pkg_path, "w") as zipf:
+            zipf.writestr("ppt/media/media1.mp4", b"9876543210")
+
+        with pytest.raises(ValueError, match="changed since package was loaded"):
+            zip_member_blob.read()
+        with pytest.raises(ValueError, match="changed since package was loaded"):
+            list(zip_member_blob.iter_stored_chunks())
+
+    def it_reads_its_member_without_reading_the_central_directory(
+        self, request: FixtureRequest, tmp_path: Path
+    ):
+        pkg_path = str(tmp_path / "prs.pptx")
+        with zipfile.ZipFile(pkg_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("ppt/media/image1.png", b"0123456789" * 10)
+        with zipfile.ZipFile(pkg_path) as zipf:
+            zip_member_blob = ZipMemberBlob(pkg_path, zipf.getinfo("ppt/media/image1.png"))
+        ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
+
+        assert zip_member_blob.read() == b"0123456789" * 10
+        ZipFile_.assert_not_called()
+
+    def but_it_reads_the_central_directory_when_the_local_header_has_no_sizes(self, tmp_path: Path):
+        pkg_path = str(tmp_path / "prs.pptx")
+        # -- a zip written to an unseekable stream puts member sizes in a data descriptor --
+        stream = _ChunkSink()
+        with zipfile.ZipFile(cast(IO[bytes], stream), "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("ppt/media/image1.png", b"0123456789" * 10)
+        with open(pkg_path, "wb") as f:
+            f.write(stream.take())
+        with zipfile.ZipFile(pkg_path) as zipf:
+            zip_member_blob = ZipMemberBlob(pkg_path, zipf.getinfo("ppt/media/image1.png"))
+
+        assert zip_member_blob.read() == b"0123456789" * 10
+
+    def and_it_raises_when_its_content_does_not_match_its_CRC(self, tmp_path: Path):
+        pkg_path = str(tmp_path / "prs.pptx")
+        with zipfile.ZipFile(pkg_path, "w", zipfile.ZIP_STORED) as zipf:
+            zipf.writestr("ppt/media/image1.png", b"0123456789")
+        with zipfile.ZipFile(pkg_path) as zipf:
+            zip_info = zipf.getinfo("ppt/media/image1.png")
+        with open(pkg_path, "r+b") as f:
+            f.seek(zip_info.header_offset + 30 + len(zip_info.filename))
+            f.write(b"X")
+
+        with pytest.raises(ValueError, match="bad CRC"):
+            ZipMemberBlob(pkg_path, zip_info).read()
+
+    def it_knows_whether_it_is_stored_in_a_pkg_file(self, tmp_path: Path):
+        zip_member_blob = ZipMemberBlob(zip_pkg_path, zipfile.ZipInfo("ppt/media/media1.mp4"))
+
+        assert zip_member_blob.is_stored_in(zip_pkg_path) is True
+        assert zip_member_blob.is_stored_in(str(tmp_path)) is False
+        assert zip_member_blob.is_stored_in(str(tmp_path / "new.pptx")) is False
+        assert zip_member_blob.is_stored_in(io.BytesIO()) is False
+
+
 class Describe_PhysPkgReader:
     """Unit-test suite for `pptx.opc.serialized._PhysPkgReader` objects."""
 
@@ -259,6 +678,40 @@ class Describe_DirPkgReader:
             dir_pkg_reader[PackURI("/ppt/foobar.xml")]
         assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
 
+    def it_has_no_stored_members_to_copy(self, dir_pkg_reader: _DirPkgReader):
+        assert dir_pkg_reader.stored_member(PackURI("/ppt/presentation.xml")) is None
+
+    def it_leaves_a_large_file_in_place(
+        self, dir_pkg_reader: _DirPkgReader, monkeypatch: pytest.MonkeyPatch
+    ):
+        assert dir_pkg_reader.file_blob(PackURI("/ppt/presentation.xml")) is None
+
+        monkeypatch.setattr("pptx.opc.serialized.FILE_BACKED_MIN_SIZE", 1)
+        file_blob = dir_pkg_reader.file_blob(PackURI("/ppt/presentation.xml"))
+
+        assert isinstance(file_blob, PathBlob)
+        assert file_blob.read() == dir_pkg_reader[PackURI("/ppt/presentation.xml")]
+        assert dir_pkg_reader.file_blob(PackURI("/ppt/foobar.xml")) is None
+
+    def it_knows_whether_a_path_is_its_package_directory(
+        self, dir_pkg_reader: _DirPkgReader, tmp_path: Path
+    ):
+        assert dir_pkg_reader.is_package_file(dir_pkg_path) is True
+        assert dir_pkg_reader.is_package_file(str(tmp_path)) is False
+        assert dir_pkg_reader.is_package_file(absjoin(test_file_dir, "test.pptx")) is False
+        assert dir_pkg_reader.is_package_file(io.BytesIO()) is False
+
+    def it_can_generate_the_sizes_of_its_members(self, dir_pkg_reader: _DirPkgReader):
+        member_sizes = {
+            pack_uri: (compressed_size, size)
+            for pack_uri, compressed_size, size in dir_pkg_reader.iter_member_sizes()
+        }
+
+        assert len(member_sizes) == 38
+        assert member_sizes["/[Content_Types].xml"] == (3359, 3359)
+        assert member_sizes["/_rels/.rels"] == (758, 758)
+        assert member_sizes["/ppt/presentation.xml"] == (4157, 4157)
+
     # --- fixture components -------------------------------
 
     @pytest.fixture(scope="class")
@@ -284,11 +737,127 @@ class Describe_ZipPkgReader:
             zip_pkg_reader[PackURI("/ppt/foobar.xml")]
         assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
 
-    def it_loads_the_package_blobs_on_first_access_to_help(self, zip_pkg_reader: _ZipPkgReader):
-        blobs = zip_pkg_reader._blobs
-        assert len(blobs) == 38
-        assert "/ppt/presentation.xml" in blobs
-        assert "/ppt/_rels/presentation.xml.rels" in blobs
+    def it_can_generate_the_sizes_of_its_members(self, zip_pkg_reader: _ZipPkgReader):
+        member_sizes = {
+            pack_uri: (compressed_size, size)
+            for pack_uri, compressed_size, size in zip_pkg_reader.iter_member_sizes()
+        }
+
+        assert len(member_sizes) == 38
+        assert member_sizes["/_rels/.rels"] == (269, 738)
+        assert member_sizes["/ppt/presentation.xml"] == (589, 3228)
+
+    def but_it_skips_directory_entries(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as zipf:
+            zipf.writestr("ppt/", b"")
+            zipf.writestr("ppt/presentation.xml", b"<p:presentation/>")
+
+        assert [pack_uri for pack_uri, _, _ in _ZipPkgReader(stream).iter_member_sizes()] == [
+            "/ppt/presentation.xml"
+        ]
+
+    def it_can_close_the_zip_archive(self):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+        zipf = zip_pkg_reader._zipf
+
+        zip_pkg_reader.close()
+
+        assert zipf.fp is None
+
+    def but_it_does_not_open_the_archive_just_to_close_it(self, request: FixtureRequest):
+        ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
+
+        _ZipPkgReader(zip_pkg_path).close()
+
+        ZipFile_.assert_not_called()
+
+    def it_can_get_the_stored_member_for_a_partname(self):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+        zip_pkg_reader.close()
+
+        zip_info, stored = cast(
+            "tuple[zipfile.ZipInfo, bytes]",
+            zip_pkg_reader.stored_member(PackURI("/ppt/presentation.xml")),
+        )
+
+        assert zip_info.filename == "ppt/presentation.xml"
+        assert zip_info.compress_type == zipfile.ZIP_DEFLATED
+        assert len(stored) == zip_info.compress_size
+        assert zlib.decompress(stored, -15) == zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+    def but_it_returns_None_when_the_member_has_changed_since_loading(self):
+        pkg_file = io.BytesIO()
+        with zipfile.ZipFile(pkg_file, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            z.writestr("ppt/presentation.xml", b"<original/>")
+        zip_pkg_reader = _ZipPkgReader(pkg_file)
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        zip_pkg_reader.close()
+        pkg_file.seek(0)
+        pkg_file.truncate()
+        with zipfile.ZipFile(pkg_file, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            z.writestr("ppt/presentation.xml", b"<changed/>")
+
+        assert zip_pkg_reader.stored_member(PackURI("/ppt/presentation.xml")) is None
+
+    def and_it_returns_None_when_the_package_file_is_closed(self):
+        with open(zip_pkg_path, "rb") as pkg_file:
+            zip_pkg_reader = _ZipPkgReader(pkg_file)
+            assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+            zip_pkg_reader.close()
+
+        assert zip_pkg_reader.stored_member(PackURI("/ppt/presentation.xml")) is None
+
+    def it_knows_whether_a_pkg_file_is_its_package_file(self, tmp_path: Path):
+        pkg_file = io.BytesIO()
+        other_path = str(tmp_path / "other.pptx")
+        with open(other_path, "wb") as f:
+            f.write(b"foobar")
+
+        assert _ZipPkgReader(zip_pkg_path).is_package_file(zip_pkg_path) is True
+        assert _ZipPkgReader(zip_pkg_path).is_package_file(other_path) is False
+        assert _ZipPkgReader(zip_pkg_path).is_package_file(str(tmp_path / "new.pptx")) is False
+        assert _ZipPkgReader(pkg_file).is_package_file(pkg_file) is True
+        assert _ZipPkgReader(pkg_file).is_package_file(io.BytesIO()) is False
+
+    def it_leaves_a_large_member_in_a_package_file_at_a_path(
+        self, zip_pkg_reader: _ZipPkgReader, monkeypatch: pytest.MonkeyPatch
+    ):
+        assert zip_pkg_reader.file_blob(PackURI("/ppt/presentation.xml")) is None
+
+        monkeypatch.setattr("pptx.opc.serialized.FILE_BACKED_MIN_SIZE", 1)
+        file_blob = zip_pkg_reader.file_blob(PackURI("/ppt/presentation.xml"))
+
+        assert isinstance(file_blob, ZipMemberBlob)
+        assert file_blob.read() == zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+        assert zip_pkg_reader.file_blob(PackURI("/ppt/foobar.xml")) is None
+
+    def but_not_a_member_of_a_package_in_a_stream(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("pptx.opc.serialized.FILE_BACKED_MIN_SIZE", 1)
+        with open(zip_pkg_path, "rb") as f:
+            zip_pkg_reader = _ZipPkgReader(io.BytesIO(f.read()))
+
+        assert zip_pkg_reader.file_blob(PackURI("/ppt/presentation.xml")) is None
+
+    def it_indexes_the_package_members_on_first_access_to_help(self, zip_pkg_reader: _ZipPkgReader):
+        zip_infos = zip_pkg_reader._zip_infos
+        assert len(zip_infos) == 38
+        assert zip_infos["/ppt/presentation.xml"].filename == "ppt/presentation.xml"
+        assert "/ppt/_rels/presentation.xml.rels" in zip_infos
+
+    def and_it_only_decompresses_a_member_when_its_blob_is_requested(self, request: FixtureRequest):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+        read_ = method_mock(request, zipfile.ZipFile, "read", return_value=b"blob")
+
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        read_.assert_not_called()
+
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+        read_.assert_called_once_with(
+            zip_pkg_reader._zipf, zip_pkg_reader._zip_infos["/ppt/presentation.xml"]
+        )
+        assert blob == b"blob"
 
     # --- fixture components -------------------------------
 
@@ -300,17 +869,155 @@ class Describe_ZipPkgReader:
 class Describe_PhysPkgWriter:
     """Unit-test suite for `pptx.opc.serialized._PhysPkgWriter` objects."""
 
-    def it_constructs_ZipPkgWriter_unconditionally(self, request: FixtureRequest):
+    def it_constructs_ZipPkgWriter_for_a_file_or_stream(self, request: FixtureRequest):
         zip_pkg_writer_ = instance_mock(request, _ZipPkgWriter)
         _ZipPkgWriter_ = class_mock(
             request, "pptx.opc.serialized._ZipPkgWriter", return_value=zip_pkg_writer_
         )
 
-        phys_writer = _PhysPkgWriter.factory("prs.pptx")
+        compression = CompressionPolicy()
 
-        _ZipPkgWriter_.assert_called_once_with("prs.pptx")
+        phys_writer = _PhysPkgWriter.factory("prs.pptx", 4, compression)
+
+        _ZipPkgWriter_.assert_called_once_with("prs.pptx", 4, compression)
         assert phys_writer is zip_pkg_writer_
 
+    def and_it_constructs_DirPkgWriter_for_a_directory(self, request: FixtureRequest):
+        dir_pkg_writer_ = instance_mock(request, _DirPkgWriter)
+        _DirPkgWriter_ = class_mock(
+            request, "pptx.opc.serialized._DirPkgWriter", return_value=dir_pkg_writer_
+        )
+
+        phys_writer = _PhysPkgWriter.factory(dir_pkg_path, 4)
+
+        _DirPkgWriter_.assert_called_once_with(dir_pkg_path)
+        assert phys_writer is dir_pkg_writer_
+
+
+class Describe_DirPkgWriter:
+    """Unit-test suite for `pptx.opc.serialized._DirPkgWriter` objects."""
+
+    def it_can_write_a_blob(self, tmp_path: Path):
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(CONTENT_TYPES_URI, b"types")
+            pkg_writer.write(PackURI("/ppt/slides/_rels/slide1.xml.rels"), b"rels")
+
+        assert (tmp_path / "[Content_Types].xml").read_bytes() == b"types"
+        assert (tmp_path / "ppt" / "slides" / "_rels" / "slide1.xml.rels").read_bytes() == b"rels"
+
+    @pytest.mark.parametrize("compress_type", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def it_can_write_a_stored_member(self, tmp_path: Path, compress_type: int):
+        blob = b"<p:sld/>" * 100
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w", compress_type) as zipf:
+            zipf.writestr("ppt/slides/slide1.xml", blob)
+        zip_info = zipfile.ZipInfo("ppt/slides/slide1.xml")
+        zip_info.compress_type = compress_type
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        stored = (
+            blob
+            if compress_type == zipfile.ZIP_STORED
+            else compressor.compress(blob) + compressor.flush()
+        )
+        pkg_writer = _DirPkgWriter(str(tmp_path))
+
+        pkg_writer.write_stored(PackURI("/ppt/slides/slide2.xml"), zip_info, stored)
+
+        assert (tmp_path / "ppt" / "slides" / "slide2.xml").read_bytes() == blob
+
+    def it_can_write_a_file_backed_blob(self, tmp_path: Path):
+        src_path = tmp_path / "media1.mp4"
+        src_path.write_bytes(b"0123456789")
+        pkg_writer = _DirPkgWriter(str(tmp_path / "pkg"))
+
+        pkg_writer.write_file_blob(PackURI("/ppt/media/media2.mp4"), PathBlob(str(src_path)))
+
+        assert (tmp_path / "pkg" / "ppt" / "media" / "media2.mp4").read_bytes() == b"0123456789"
+
+    def it_removes_the_members_of_the_previous_package_it_did_not_write_on_exit(
+        self, tmp_path: Path
+    ):
+        (tmp_path / "[Content_Types].xml").write_bytes(
+            b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            b'<Override PartName="/ppt/slides/slide1.xml" ContentType="app/vnd.sld"/>'
+            b'<Override PartName="/ppt/slides/slide2.xml" ContentType="app/vnd.sld"/>'
+            b"</Types>"
+        )
+        (tmp_path / "_rels").mkdir()
+        (tmp_path / "_rels" / ".rels").write_bytes(
+            b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            b'<Relationship Id="rId1" Type="http://img" Target="ppt/media/image1.png"/>'
+            b"</Relationships>"
+        )
+        (tmp_path / "ppt" / "slides").mkdir(parents=True)
+        (tmp_path / "ppt" / "slides" / "slide1.xml").write_bytes(b"old")
+        (tmp_path / "ppt" / "slides" / "slide2.xml").write_bytes(b"old")
+        (tmp_path / "ppt" / "media").mkdir()
+        (tmp_path / "ppt" / "media" / "image1.png").write_bytes(b"png")
+        (tmp_path / "ppt" / "notes.txt").write_bytes(b"unrelated")
+
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(CONTENT_TYPES_URI, b"types")
+            pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"new")
+
+        assert sorted(
+            path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*") if path.is_file()
+        ) == ["[Content_Types].xml", "ppt/notes.txt", "ppt/slides/slide1.xml"]
+        assert (tmp_path / "ppt" / "slides" / "slide1.xml").read_bytes() == b"new"
+        assert not (tmp_path / "ppt" / "media").exists()
+        assert not (tmp_path / "_rels").exists()
+
+    def but_it_removes_nothing_when_writing_fails(self, tmp_path: Path):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"))
+        package.save(str(tmp_path))
+        members = sorted(tmp_path.rglob("*"))
+
+        with pytest.raises(ValueError):
+            with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+                pkg_writer.write(CONTENT_TYPES_URI, b"types")
+                raise ValueError("write failed")
+
+        assert sorted(tmp_path.rglob("*")) == members
+
+    def and_it_leaves_files_that_are_not_package_members(self, tmp_path: Path):
+        (tmp_path / "thesis.docx").write_bytes(b"docx")
+        (tmp_path / "photos").mkdir()
+        (tmp_path / "photos" / "cat.jpg").write_bytes(b"jpg")
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"))
+
+        package.save(str(tmp_path))
+        package.save(str(tmp_path))
+
+        assert (tmp_path / "thesis.docx").read_bytes() == b"docx"
+        assert (tmp_path / "photos" / "cat.jpg").read_bytes() == b"jpg"
+
+    def it_writes_a_package_the_dir_reader_can_read(self, tmp_path: Path):
+        """Integrates with OpcPackage and _DirPkgReader."""
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"))
+
+        package.save(str(tmp_path))
+
+        expanded = OpcPackage.open(str(tmp_path))
+        assert {p.partname: p.blob for p in expanded.iter_parts()} == {
+            p.partname: p.blob for p in package.iter_parts()
+        }
+
+    def it_leaves_no_part_removed_since_an_earlier_save(self, tmp_path: Path):
+        """Integrates with OpcPackage and _DirPkgReader."""
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"))
+        package.save(str(tmp_path))
+        assert (tmp_path / "docProps" / "thumbnail.jpeg").is_file()
+        # -- rId2 is the package relationship to the thumbnail, its only reference --
+        package.drop_rel("rId2")
+
+        package.save(str(tmp_path))
+
+        assert not (tmp_path / "docProps" / "thumbnail.jpeg").exists()
+        expanded = OpcPackage.open(str(tmp_path))
+        assert sorted(p.partname for p in expanded.iter_parts()) == sorted(
+            p.partname for p in package.iter_parts()
+        )
+
 
 class Describe_ZipPkgWriter:
     """Unit-test suite for `pptx.opc.serialized._ZipPkgWriter` objects."""
@@ -326,7 +1033,7 @@ class Describe_ZipPkgWriter:
     def it_can_write_a_blob(self, _zipf_prop_: Mock):
         """Integrates with zipfile.ZipFile."""
         pack_uri = PackURI("/part/name.xml")
-        _zipf_prop_.return_value = zipf = zipfile.ZipFile(io.BytesIO(), "w")
+        _zipf_prop_.return_value = zipf = _ZipFile(io.BytesIO(), "w")
         pkg_writer = _ZipPkgWriter("")
 
         pkg_writer.write(pack_uri, b"blob")
@@ -335,8 +1042,180 @@ class Describe_ZipPkgWriter:
         assert len(members) == 1
         assert members[pack_uri] == b"blob"
 
+    def it_can_write_a_stored_member(self, _zipf_prop_: Mock):
+        """Integrates with zipfile.ZipFile."""
+        blob = b"<p:sld/>" * 100
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        stored = compressor.compress(blob) + compressor.flush()
+        zip_info = zipfile.ZipInfo("ppt/slides/slide1.xml")
+        zip_info.compress_type = zipfile.ZIP_DEFLATED
+        zip_info.flag_bits = 0x0A
+        zip_info.CRC = zlib.crc32(blob)
+        zip_info.compress_size = len(stored)
+        zip_info.file_size = len(blob)
+        stream = io.BytesIO()
+        _zipf_prop_.return_value = _ZipFile(stream, "w")
+        pkg_writer = _ZipPkgWriter("")
+
+        pkg_writer.write_stored(PackURI("/ppt/slides/slide9.xml"), zip_info, stored)
+        pkg_writer.write(PackURI("/ppt/slides/slide2.xml"), b"blob")
+        pkg_writer.__exit__()
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == ["ppt/slides/slide9.xml", "ppt/slides/slide2.xml"]
+            assert zipf.read("ppt/slides/slide9.xml") == blob
+            assert zipf.read("ppt/slides/slide2.xml") == b"blob"
+            # -- the compression option flags are kept, the data-descriptor flag is not --
+            assert zipf.getinfo("ppt/slides/slide9.xml").flag_bits == 0x02
+
+    @pytest.mark.parametrize(
+        ("src_compress_type", "compression", "expected_compress_type"),
+        [
+            (zipfile.ZIP_DEFLATED, "default", zipfile.ZIP_DEFLATED),
+            (zipfile.ZIP_STORED, "stored", zipfile.ZIP_STORED),
+            (zipfile.ZIP_STORED, "default", zipfile.ZIP_DEFLATED),
+            (zipfile.ZIP_DEFLATED, "stored", zipfile.ZIP_STORED),
+        ],
+    )
+    def it_can_write_a_zip_member_blob(
+        self,
+        request: FixtureRequest,
+        _zipf_prop_: Mock,
+        tmp_path: Path,
+        src_compress_type: int,
+        compression: str,
+        expected_compress_type: int,
+    ):
+        """Integrates with zipfile.ZipFile."""
+        blob = b"0123456789" * 100
+        src_path = str(tmp_path / "src.pptx")
+        with zipfile.ZipFile(src_path, "w", src_compress_type) as zipf:
+            zipf.writestr("ppt/media/media1.mp4", blob)
+        with zipfile.ZipFile(src_path) as zipf:
+            file_blob = ZipMemberBlob(src_path, zipf.getinfo("ppt/media/media1.mp4"))
+        iter_chunks_ = method_mock(
+            request, ZipMemberBlob, "iter_chunks", return_value=iter((blob[:300], blob[300:]))
+        )
+        stream = io.BytesIO()
+        _zipf_prop_.return_value = _ZipFile(stream, "w")
+        pkg_writer = _ZipPkgWriter("", 2, CompressionPolicy.profile(compression))
+
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>")
+        pkg_writer.write_file_blob(PackURI("/ppt/media/media2.mp4"), file_blob)
+        pkg_writer.__exit__()
+
+        assert iter_chunks_.call_count == (src_compress_type != expected_compress_type)
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == ["ppt/slides/slide1.xml", "ppt/media/media2.mp4"]
+            assert zipf.getinfo("ppt/media/media2.mp4").compress_type == expected_compress_type
+            assert zipf.read("ppt/media/media2.mp4") == blob
+
+    def it_can_write_a_path_blob(self, _zipf_prop_: Mock, tmp_path: Path):
+        """Integrates with zipfile.ZipFile."""
+        src_path = tmp_path / "media1.mp4"
+        src_path.write_bytes(b"0123456789" * 100)
+        stream = io.BytesIO()
+        _zipf_prop_.return_value = _ZipFile(stream, "w")
+        pkg_writer = _ZipPkgWriter("")
+
+        pkg_writer.write_file_blob(PackURI("/ppt/media/media1.mp4"), PathBlob(str(src_path)))
+        pkg_writer.__exit__()
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("ppt/media/media1.mp4") == b"0123456789" * 100
+
+    def it_can_compress_members_on_worker_threads(self, _zipf_prop_: Mock):
+        """Integrates with zipfile.ZipFile."""
+        blobs = [(PackURI("/ppt/slides/slide%d.xml" % n), b"<p:sld/>" * n) for n in range(1, 20)]
+        stored_blob = b"stored"
+        zip_info = zipfile.ZipInfo("ppt/media/image1.png")
+        zip_info.CRC = zlib.crc32(stored_blob)
+        zip_info.compress_size = zip_info.file_size = len(stored_blob)
+        stream = io.BytesIO()
+        _zipf_prop_.return_value = _ZipFile(stream, "w")
+        pkg_writer = _ZipPkgWriter("", workers=3)
+
+        for pack_uri, blob in blobs[:10]:
+            pkg_writer.write(pack_uri, blob)
+        pkg_writer.write_stored(PackURI("/ppt/media/image1.png"), zip_info, stored_blob)
+        for pack_uri, blob in blobs[10:]:
+            pkg_writer.write(pack_uri, blob)
+        pkg_writer.__exit__()
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.namelist() == (
+                [uri.membername for uri, _ in blobs[:10]]
+                + ["ppt/media/image1.png"]
+                + [uri.membername for uri, _ in blobs[10:]]
+            )
+            assert all(zipf.read(uri.membername) == blob for uri, blob in blobs)
+            assert zipf.read("ppt/media/image1.png") == stored_blob
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def it_compresses_each_member_as_its_compression_policy_calls_for(
+        self, _zipf_prop_: Mock, workers: int
+    ):
+        """Integrates with zipfile.ZipFile."""
+        stream = io.BytesIO()
+        _zipf_prop_.return_value = _ZipFile(stream, "w")
+        pkg_writer = _ZipPkgWriter("", workers, CompressionPolicy.profile("fast"))
+
+        pkg_writer.write(PackURI("/ppt/media/image1.png"), b"png-bytes" * 10)
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>" * 10)
+        pkg_writer.__exit__()
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            assert [zi.compress_type for zi in zipf.infolist()] == [
+                zipfile.ZIP_STORED,
+                zipfile.ZIP_DEFLATED,
+            ]
+            assert zipf.read("ppt/media/image1.png") == b"png-bytes" * 10
+            assert zipf.read("ppt/slides/slide1.xml") == b"<p:sld/>" * 10
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def it_flags_the_members_it_deflates_at_maximum_level(
+        self, _zipf_prop_: Mock, tmp_path: Path, workers: int
+    ):
+        """Integrates with zipfile.ZipFile."""
+        media_path = tmp_path / "media1.mp4"
+        media_path.write_bytes(b"0123456789" * 100)
+        stream = io.BytesIO()
+        _zipf_prop_.return_value = _ZipFile(stream, "w")
+        pkg_writer = _ZipPkgWriter("", workers, CompressionPolicy.profile("smallest"))
+
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>" * 10)
+        pkg_writer.write_file_blob(PackURI("/ppt/media/media1.mp4"), PathBlob(str(media_path)))
+        pkg_writer.__exit__()
+
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.testzip() is None
+            assert [zi.flag_bits for zi in zipf.infolist()] == [0x02, 0x02]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def it_can_write_to_a_stream_that_does_not_support_seeking(
+        self, _zipf_prop_: Mock, workers: int
+    ):
+        """Integrates with zipfile.ZipFile."""
+        sink = _ChunkSink()
+        _zipf_prop_.return_value = _ZipFile(cast(IO[bytes], sink), "w", zipfile.ZIP_DEFLATED)
+        pkg_writer = _ZipPkgWriter("", workers)
+
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>" * 10)
+        pkg_writer.write(PackURI("/ppt/slides/slide2.xml"), b"blob")
+        pkg_writer.__exit__()
+
+        with zipfile.ZipFile(io.BytesIO(sink.take())) as zipf:
+            assert zipf.testzip() is None
+            assert zipf.read("ppt/slides/slide1.xml") == b"<p:sld/>" * 10
+            assert zipf.read("ppt/slides/slide2.xml") == b"blob"
+
     def it_provides_access_to_the_open_zip_file_to_help(self, request: FixtureRequest):
-        ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
+        ZipFile_ = class_mock(request, "pptx.opc.serialized._ZipFile")
         pkg_writer = _ZipPkgWriter("prs.pptx")
 
         zipf = pkg_writer._zipf
@@ -353,6 +1232,20 @@ class Describe_ZipPkgWriter:
         return property_mock(request, _ZipPkgWriter, "_zipf")
 
 
+class Describe_ChunkSink:
+    """Unit-test suite for `pptx.opc.serialized._ChunkSink` objects."""
+
+    def it_hands_over_the_bytes_written_to_it_since_last_taken(self):
+        sink = _ChunkSink()
+
+        assert sink.write(b"foo") == 3
+        assert sink.write(bytearray(b"bar")) == 3
+        sink.flush()
+
+        assert sink.take() == b"foobar"
+        assert sink.take() == b""
+
+
 class Describe_ContentTypesItem:
     """Unit-test suite for `pptx.opc.serialized._ContentTypesItem` objects."""
 
@@ -408,3 +1301,31 @@ class Describe_ContentTypesItem:
     @pytest.fixture
     def part_(self, request: FixtureRequest):
         return instance_mock(request, Part)
+
+
+class DescribeInternalRels:
+    """Unit-test suite for `pptx.opc.serialized.internal_rels()`."""
+
+    def it_reads_the_internal_relationships_of_a_part(self, request: FixtureRequest):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.rels_xml_for.return_value = (
+            b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            b'<Relationship Id="rId1" Type="http://sl" Target="../slideLayouts/slideLayout1.xml"/>'
+            b'<Relationship Id="rId2" Type="http://hl" Target="http://x" TargetMode="External"/>'
+            b'<Relationship Id="rId3" Type="http://img" Target="../media/image1.png"/>'
+            b"</Relationships>"
+        )
+
+        rels = internal_rels(package_reader_, PackURI("/ppt/slides/slide1.xml"))
+
+        package_reader_.rels_xml_for.assert_called_once_with("/ppt/slides/slide1.xml")
+        assert rels == {
+            "rId1": ("http://sl", "/ppt/slideLayouts/slideLayout1.xml"),
+            "rId3": ("http://img", "/ppt/media/image1.png"),
+        }
+
+    def but_it_returns_an_empty_dict_when_the_part_has_no_rels(self, request: FixtureRequest):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.rels_xml_for.return_value = None
+
+        assert internal_rels(package_reader_, PackURI("/ppt/media/image1.png")) == {}
@@ -83,6 +83,28 @@ class DescribeCT_GroupShape(object):
         assert xSp.xml == expected_xml
         assert parent_sp.recalculate_extents.call_args_list == calls
 
+    @pytest.mark.parametrize(
+        ("name", "expected_value"), [("Foo", True), ("Bar", True), ("Baz", False), ("Qux", False)]
+    )
+    def it_knows_whether_a_shape_name_is_used(self, name: str, expected_value: bool):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:cNvPr{name=Foo},p:grpSp/p:sp/p:nvSpPr/p:cNvPr{name=Bar},"
+            "p:sp/p:spPr/a:prstGeom/a:avLst/a:gd{name=Baz})"
+        )
+        assert spTree.cNvPr_name_is_used(name) is expected_value
+
+    def it_can_find_its_shape_children_by_a_cNvPr_attribute(self):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1,name=Foo},p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},"
+            "p:grpSp/(p:nvGrpSpPr/p:cNvPr{id=3,name=Foo},p:sp/p:nvSpPr/p:cNvPr{id=4,name=Foo}))"
+        )
+
+        shape_elms = list(spTree.iter_shape_elms_by_cNvPr("name", "Foo"))
+
+        assert sorted(shape_elms, key=spTree.index) == [spTree[1], spTree[2]]
+        assert list(spTree.iter_shape_elms_by_cNvPr("id", "4")) == []
+        assert list(spTree[2].iter_shape_elms_by_cNvPr("id", "4")) == [spTree[2][1]]
+
     def it_calculates_its_child_extents_to_help(self, child_exts_fixture):
         xSp, expected_values = child_exts_fixture
         x, y, cx, cy = xSp._child_extents
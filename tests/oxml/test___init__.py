@@ -5,10 +5,12 @@ from __future__ import annotations
 import pytest
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
-from pptx.oxml.ns import qn
+from pptx.oxml import new_from_prototype, oxml_parser, parse_xml, register_element_cls
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.shared import CT_NonVisualDrawingProps
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
+from ..unitutil.cxml import xml
 from ..unitutil.mock import function_mock, loose_mock, var_mock
 
 
@@ -44,12 +46,41 @@ class DescribeParseXml(object):
             parse_xml(xml_text)
 
 
+class DescribeNewFromPrototype(object):
+    def it_creates_an_element_from_the_template_with_its_slots_filled(self):
+        template = '<p:cNvPr %s id="$id" name="$name"><a:t>$text</a:t></p:cNvPr>' % nsdecls(
+            "a", "p"
+        )
+
+        cNvPr = new_from_prototype(template, id=42, name='A & "B"', text="foo")
+
+        assert isinstance(cNvPr, CT_NonVisualDrawingProps)
+        assert etree.tostring(cNvPr) == etree.tostring(
+            parse_xml(
+                '<p:cNvPr %s id="42" name="A &amp; &quot;B&quot;"><a:t>foo</a:t></p:cNvPr>'
+                % nsdecls("a", "p")
+            )
+        )
+
+    def it_parses_each_template_only_once(self, request: pytest.FixtureRequest):
+        parse_xml_ = function_mock(request, "pptx.oxml.parse_xml", side_effect=parse_xml)
+        template = '<a:foo %s val="$val"><a:bar/></a:foo>' % nsdecls("a")
+
+        foo = new_from_prototype(template, val="1")
+        foo_2 = new_from_prototype(template, val="2")
+        foo_2.append(new_from_prototype(template, val="3"))
+
+        parse_xml_.assert_called_once_with(template)
+        assert foo.xml == xml("a:foo{val=1}/a:bar")
+        assert foo_2.xml == xml("a:foo{val=2}/(a:bar,a:foo{val=3}/a:bar)")
+
+
 class DescribeRegisterCustomElementClass(object):
     def it_determines_cust_elm_class_constructed_for_specified_tag(self, xml_bytes):
         register_element_cls("a:foo", CustElmCls)
         foo = etree.fromstring(xml_bytes, oxml_parser)
         assert type(foo) is CustElmCls
-        assert type(foo.find(qn("a:bar"))) is etree._Element
+        assert type(foo.find(qn("a:bar"))) is BaseOxmlElement
 
 
 # ===========================================================================
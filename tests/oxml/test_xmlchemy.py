@@ -6,11 +6,17 @@ is provided by the metaclass-built test classes at the end of the file.
 
 from __future__ import annotations
 
+import re
+from pathlib import Path
+from typing import Any
+
 import pytest
+from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
 
+import pptx
 from pptx.exc import InvalidXmlError
-from pptx.oxml import register_element_cls
-from pptx.oxml.ns import qn
+from pptx.oxml import parse_xml, register_element_cls
+from pptx.oxml.ns import _nsmap, nsdecls, qn  # pyright: ignore[reportPrivateUsage]
 from pptx.oxml.simpletypes import BaseIntType
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
@@ -22,9 +28,16 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    _compiled_xpath,  # pyright: ignore[reportPrivateUsage]
+    _tree_attr_max_ints,  # pyright: ignore[reportPrivateUsage]
+    attribute_value_counts,
+    elements_by_attribute_value,
+    max_int_attribute_value,
+    tree_revision,
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.mock import FixtureRequest, call, class_mock
 
 
 class DescribeCustomElementClass(object):
@@ -32,6 +45,31 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class DescribeBaseOxmlElement(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.BaseOxmlElement` objects."""
+
+    def it_evaluates_an_XPath_expression_using_the_standard_namespace_prefixes(self):
+        sld = parse_xml('<p:sld %s><p:foo/><a:t id="1"/><a:t id="2"/></p:sld>' % nsdecls("a", "p"))
+        assert sld.xpath("./a:t/@id") == ["1", "2"]
+
+    def and_it_binds_variables_referenced_in_the_expression(self):
+        sld = parse_xml('<p:sld %s><a:t id="1"/><a:t id="2"/></p:sld>' % nsdecls("a", "p"))
+        assert sld.xpath("./a:t[@id=$id]", id="2") == [sld[1]]
+        assert sld.xpath("./a:t[@id=$id]", id=1) == [sld[0]]
+
+    def and_it_compiles_each_expression_only_once(self, request: FixtureRequest):
+        XPath_ = class_mock(request, "pptx.oxml.xmlchemy.etree.XPath")
+        _compiled_xpath.cache_clear()
+        sld = parse_xml("<p:sld %s/>" % nsdecls("p"))
+
+        sld.xpath("./p:foo")
+        sld.xpath("./p:foo")
+        _compiled_xpath.cache_clear()
+
+        XPath_.assert_called_once_with("./p:foo", namespaces=_nsmap)
+        assert XPath_.return_value.call_args_list == [call(sld), call(sld)]
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
@@ -469,11 +507,268 @@ class DescribeZeroOrOneChoice(object):
         return parent_bldr
 
 
+class DescribeTreeRevision(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.tree_revision()`."""
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda sld: sld.append(parse_xml("<p:foo %s/>" % nsdecls("p"))),
+            lambda sld: sld.insert(0, parse_xml("<p:foo %s/>" % nsdecls("p"))),
+            lambda sld: sld.extend([parse_xml("<p:foo %s/>" % nsdecls("p"))]),
+            lambda sld: sld[0].addnext(parse_xml("<p:foo %s/>" % nsdecls("p"))),
+            lambda sld: sld[0].addprevious(parse_xml("<p:foo %s/>" % nsdecls("p"))),
+            lambda sld: sld.replace(sld[0], parse_xml("<p:foo %s/>" % nsdecls("p"))),
+            lambda sld: sld.remove(sld[0]),
+            lambda sld: sld.__delitem__(0),
+            lambda sld: sld.__setitem__(0, parse_xml("<p:foo %s/>" % nsdecls("p"))),
+            lambda sld: sld[0][0].clear(),
+            lambda sld: sld[0][0].set("name", "foo"),
+            lambda sld: sld[0][0].attrib.__delitem__("id"),
+            lambda sld: sld[0][0].attrib.__setitem__("id", "42"),
+            lambda sld: setattr(sld[0][0][0], "text", "foo"),
+            lambda sld: setattr(sld[0][0][0], "tail", "foo"),
+            lambda sld: setattr(sld[0][0], "tag", qn("p:bar")),
+            lambda sld: setattr(sld[0][0], "base", "http://foo/"),
+        ],
+    )
+    def it_counts_each_change_made_to_a_tracked_element_tree(self, change: Any):
+        sld = parse_xml(
+            '<p:sld %s><p:cSld><p:foo id="1"><a:t>bar</a:t></p:foo></p:cSld></p:sld>'
+            % nsdecls("a", "p")
+        )
+        revision = tree_revision(sld)
+
+        change(sld)
+
+        assert tree_revision(sld) == revision + 1
+
+    def and_it_counts_an_element_moved_out_of_it_as_a_change(self):
+        sld = parse_xml("<p:sld %s><p:cSld/></p:sld>" % nsdecls("p"))
+        other = parse_xml("<p:sld %s/>" % nsdecls("p"))
+        revision = tree_revision(sld)
+
+        other.append(sld[0])
+
+        assert tree_revision(sld) == revision + 1
+
+    def but_it_does_not_count_reading_the_tree_as_a_change(self):
+        sld = parse_xml(
+            '<p:sld %s><p:cSld name="foo"><a:t>bar</a:t></p:cSld></p:sld>' % nsdecls("a", "p")
+        )
+        revision = tree_revision(sld)
+
+        assert (sld[0].get("name"), dict(sld[0].attrib), sld[0][0].text) == (
+            "foo",
+            {"name": "foo"},
+            "bar",
+        )
+        assert sld.xpath("//a:t") == [sld[0][0]]
+        assert tree_revision(sld) == revision
+
+    def it_counts_a_change_made_by_any_lxml_element_mutator(self):
+        # -- each `lxml` element member not listed here can change the tree, so it must be
+        # -- overridden to count the change, including any added by a later `lxml` release --
+        non_mutators = {
+            "__bool__", "__contains__", "__copy__", "__deepcopy__", "__getitem__", "__iter__",
+            "__len__", "__reversed__", "_init", "cssselect", "find", "findall", "findtext", "get",
+            "getchildren", "getiterator", "getnext", "getparent", "getprevious", "getroottree",
+            "index", "items", "iter", "iterancestors", "iterchildren", "iterdescendants",
+            "iterfind", "itersiblings", "itertext", "keys", "makeelement", "nsmap", "prefix",
+            "sourceline", "values", "xpath",
+        }  # fmt: skip
+        lxml_members = set(dir(_Element)) - set(dir(object))
+
+        assert sorted(lxml_members - non_mutators - set(vars(BaseOxmlElement))) == []
+
+    def and_this_package_changes_no_tree_by_other_means(self):
+        # -- these `lxml` functions change an element tree without calling a method of any of
+        # -- its elements, so a change made with one of them would not be counted; a call has
+        # -- arguments, a docstring naming one like "SubElement()" is not a use --
+        pattern = re.compile(
+            r"\b(SubElement|cleanup_namespaces|strip_attributes|strip_elements|strip_tags)\((?!\))"
+        )
+        package_dir = Path(pptx.__file__).parent
+
+        uses = [
+            "%s:%d" % (path.relative_to(package_dir), line_no)
+            for path in sorted(package_dir.rglob("*.py"))
+            for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1)
+            if pattern.search(line)
+        ]
+
+        assert uses == []
+
+
+class DescribeAttributeValueCounts(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.attribute_value_counts()`."""
+
+    def it_counts_the_values_of_an_attribute_in_an_element_tree(self):
+        sld = parse_xml(
+            '<p:sld %s><p:foo r:id="rId1"><p:bar r:id="rId2"/></p:foo><p:baz r:id="rId1"/>'
+            '<!-- r:id="rId3" --></p:sld>' % nsdecls("p", "r")
+        )
+
+        counts = attribute_value_counts(sld, qn("r:id"))
+
+        assert counts == {"rId1": 2, "rId2": 1}
+        assert attribute_value_counts(sld, qn("r:id")) is counts
+
+    @pytest.mark.parametrize(
+        ("change", "expected_value"),
+        [
+            (lambda sld: sld.append(qux("rId1")), {"rId1": 3, "rId2": 1}),
+            (lambda sld: sld.insert(0, qux("rId3")), {"rId1": 2, "rId2": 1, "rId3": 1}),
+            (lambda sld: sld.extend([qux("rId2")]), {"rId1": 2, "rId2": 2}),
+            (lambda sld: sld[0].addnext(qux("rId2")), {"rId1": 2, "rId2": 2}),
+            (lambda sld: sld[0].addprevious(qux("rId2")), {"rId1": 2, "rId2": 2}),
+            (lambda sld: sld.replace(sld[0], qux("rId2")), {"rId1": 1, "rId2": 1}),
+            (lambda sld: sld.remove(sld[0]), {"rId1": 1}),
+            (lambda sld: sld.__delitem__(0), {"rId1": 1}),
+            (lambda sld: sld.__delitem__(slice(0, 2)), {}),
+            (lambda sld: sld.__setitem__(1, qux("rId4")), {"rId1": 1, "rId2": 1, "rId4": 1}),
+            (lambda sld: sld.__setitem__(slice(0, 2), [sld[1]]), {"rId1": 1}),
+            (lambda sld: sld[0].clear(), {"rId1": 1}),
+            (lambda sld: sld[0][0].set(qn("r:id"), "rId1"), {"rId1": 3}),
+            (lambda sld: sld[0].set(qn("r:id"), "rId5"), {"rId1": 1, "rId2": 1, "rId5": 1}),
+            (lambda sld: sld[0].attrib.__delitem__(qn("r:id")), {"rId1": 1, "rId2": 1}),
+            (lambda sld: sld.insert(0, sld[1]), {"rId1": 2, "rId2": 1}),
+        ],
+    )
+    def and_it_keeps_the_counts_current_as_the_tree_changes(
+        self, change: Any, expected_value: dict[str, int]
+    ):
+        sld = parse_xml(
+            '<p:sld %s><p:foo r:id="rId1"><p:bar r:id="rId2"/></p:foo><p:baz r:id="rId1"/>'
+            "</p:sld>" % nsdecls("p", "r")
+        )
+        counts = attribute_value_counts(sld, qn("r:id"))
+
+        change(sld)
+
+        assert counts == expected_value
+
+    def and_it_counts_an_element_moved_out_of_it_as_removed(self):
+        sld = parse_xml('<p:sld %s><p:foo r:id="rId1"/></p:sld>' % nsdecls("p", "r"))
+        other = parse_xml('<p:sld %s><p:foo r:id="rId1"/></p:sld>' % nsdecls("p", "r"))
+        counts = attribute_value_counts(sld, qn("r:id"))
+        other_counts = attribute_value_counts(other, qn("r:id"))
+
+        other.append(sld[0])
+
+        assert counts == {}
+        assert other_counts == {"rId1": 2}
+
+    def but_it_leaves_the_counts_unchanged_when_a_change_fails(self):
+        sld = parse_xml('<p:sld %s><p:foo r:id="rId1"/></p:sld>' % nsdecls("p", "r"))
+        counts = attribute_value_counts(sld, qn("r:id"))
+
+        with pytest.raises(ValueError):
+            sld.remove(qux("rId1"))
+
+        assert counts == {"rId1": 1}
+
+
+class DescribeElementsByAttributeValue(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.elements_by_attribute_value()`."""
+
+    def it_indexes_the_elements_of_a_tree_by_the_value_of_an_attribute(self):
+        sld = parse_xml(
+            '<p:sld %s><p:foo r:id="rId1"><p:bar r:id="rId2"/></p:foo><p:baz r:id="rId1"/>'
+            "</p:sld>" % nsdecls("p", "r")
+        )
+
+        index = elements_by_attribute_value(sld, qn("r:id"))
+
+        assert index == {"rId1": [sld[0], sld[1]], "rId2": [sld[0][0]]}
+        assert elements_by_attribute_value(sld, qn("r:id")) is index
+
+    def and_it_keeps_the_index_current_as_the_tree_changes(self):
+        sld = parse_xml(
+            '<p:sld %s><p:foo r:id="rId1"><p:bar r:id="rId2"/></p:foo><p:baz r:id="rId1"/>'
+            "</p:sld>" % nsdecls("p", "r")
+        )
+        index = elements_by_attribute_value(sld, qn("r:id"))
+        new_qux = qux("rId3")
+
+        sld.remove(sld[0])
+        sld.append(new_qux)
+        sld[0].set(qn("r:id"), "rId3")
+
+        assert index == {"rId3": [new_qux, sld[0]]}
+
+
+class DescribeMaxIntAttributeValue(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.max_int_attribute_value()`."""
+
+    @pytest.mark.parametrize(
+        ("ids", "expected_value"),
+        [
+            ((), 0),
+            (("foo",), 0),
+            (("3", "1fo", "7", "2"), 7),
+        ],
+    )
+    def it_finds_the_greatest_integer_value_of_an_attribute(
+        self, ids: tuple[str, ...], expected_value: int
+    ):
+        sld = parse_xml(
+            "<p:sld %s>%s</p:sld>"
+            % (nsdecls("p"), "".join('<p:cNvPr id="%s"/>' % id_ for id_ in ids))
+        )
+        assert max_int_attribute_value(sld, "id") == expected_value
+
+    @pytest.mark.parametrize(
+        ("change", "expected_value"),
+        [
+            (lambda sld: sld.append(cNvPr("9")), 9),
+            (lambda sld: sld.append(cNvPr("2")), 4),
+            (lambda sld: sld[0].set("id", "12"), 12),
+            (lambda sld: sld.remove(sld[2]), 3),
+            (lambda sld: sld[2].set("id", "1"), 3),
+            (lambda sld: sld[2].attrib.__delitem__("id"), 3),
+            (lambda sld: sld.remove(sld[0]), 4),
+            (lambda sld: sld.clear(), 0),
+        ],
+    )
+    def and_it_keeps_the_value_current_as_the_tree_changes(self, change: Any, expected_value: int):
+        sld = parse_xml(
+            '<p:sld %s><p:cNvPr id="1"/><p:cNvPr id="3"/><p:cNvPr id="4"/></p:sld>' % nsdecls("p")
+        )
+        assert max_int_attribute_value(sld, "id") == 4
+
+        change(sld)
+
+        assert max_int_attribute_value(sld, "id") == expected_value
+
+    def and_it_only_works_out_the_value_again_when_the_greatest_value_is_removed(self):
+        sld = parse_xml('<p:sld %s><p:cNvPr id="1"/><p:cNvPr id="3"/></p:sld>' % nsdecls("p"))
+        assert max_int_attribute_value(sld, "id") == 3
+
+        sld.append(cNvPr("4"))
+        sld.remove(sld[0])
+        assert _tree_attr_max_ints[sld] == {"id": 4}
+
+        sld.remove(sld[1])
+        assert _tree_attr_max_ints[sld] == {}
+        assert max_int_attribute_value(sld, "id") == 3
+
+
 # --------------------------------------------------------------------
 # static shared fixture
 # --------------------------------------------------------------------
 
 
+def cNvPr(id_: str) -> BaseOxmlElement:
+    """Return a loose `p:cNvPr` element having `id` of `id_`."""
+    return parse_xml('<p:cNvPr %s id="%s"/>' % (nsdecls("p"), id_))
+
+
+def qux(rId: str) -> BaseOxmlElement:
+    """Return a loose `p:qux` element having `r:id` of `rId`."""
+    return parse_xml('<p:qux %s r:id="%s"/>' % (nsdecls("p", "r"), rId))
+
+
 class ST_IntegerType(BaseIntType):
     @classmethod
     def validate(cls, value):
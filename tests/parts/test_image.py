@@ -6,6 +6,7 @@ import io
 
 import pytest
 
+from pptx.opc.serialized import PathBlob
 from pptx.package import Package
 from pptx.parts.image import Image, ImagePart
 from pptx.util import Emu
@@ -33,6 +34,7 @@ class DescribeImagePart(object):
         package_ = instance_mock(request, Package)
         _init_ = initializer_mock(request, ImagePart)
         partname_ = package_.next_image_partname.return_value
+        image_.file_blob = None
 
         image_part = ImagePart.new(package_, image_)
 
@@ -47,6 +49,23 @@ class DescribeImagePart(object):
         )
         assert isinstance(image_part, ImagePart)
 
+    def and_it_leaves_a_file_backed_image_in_its_file(self, request, image_):
+        package_ = instance_mock(request, Package)
+        _init_ = initializer_mock(request, ImagePart)
+        file_blob = PathBlob(test_image_path)
+        image_.file_blob = file_blob
+
+        image_part = ImagePart.new(package_, image_)
+
+        _init_.assert_called_once_with(
+            image_part,
+            package_.next_image_partname.return_value,
+            image_.content_type,
+            package_,
+            file_blob,
+            image_.filename,
+        )
+
     def it_provides_access_to_its_image(self, request, image_):
         Image_ = class_mock(request, "pptx.parts.image.Image")
         Image_.return_value = image_
@@ -74,6 +93,16 @@ class DescribeImagePart(object):
 
         assert image_part.scale(width, height) == (expected_width, expected_height)
 
+    def it_reads_a_file_backed_image_from_its_file(self):
+        with open(test_image_path, "rb") as f:
+            blob = f.read()
+        image_part = ImagePart(None, None, None, PathBlob(test_image_path), "python-icon.jpeg")
+
+        assert image_part.blob == blob
+        assert image_part.sha1 == ImagePart(None, None, None, blob).sha1
+        assert image_part.image.size == (204, 204)
+        assert image_part._px_size == (204, 204)
+
     def it_knows_its_pixel_dimensions_to_help(self):
         with open(test_image_path, "rb") as f:
             blob = f.read()
@@ -101,6 +130,17 @@ class DescribeImage(object):
         Image.from_blob.assert_called_once_with(blob, "python-icon.jpeg")
         assert image is image_
 
+    def but_it_leaves_a_large_image_file_in_place(self, from_blob_, image_, monkeypatch):
+        monkeypatch.setattr("pptx.parts.image.FILE_BACKED_MIN_SIZE", 1)
+        from_blob_.return_value = image_
+
+        image = Image.from_file(test_image_path)
+
+        blob, filename = from_blob_.call_args.args
+        assert isinstance(blob, PathBlob)
+        assert filename == "python-icon.jpeg"
+        assert image is image_
+
     def it_can_construct_from_a_stream(self, from_stream_fixture):
         image_file, blob, image_ = from_stream_fixture
         image = Image.from_file(image_file)
@@ -117,6 +157,20 @@ class DescribeImage(object):
         image, expected_value = blob_fixture
         assert image.blob == expected_value
 
+    def and_it_reads_the_blob_of_a_file_backed_image_from_its_file(self):
+        file_blob = PathBlob(test_image_path)
+        image = Image(file_blob, "python-icon.jpeg")
+        with open(test_image_path, "rb") as f:
+            blob = f.read()
+
+        assert image.file_blob is file_blob
+        assert image.blob == blob
+        assert image.sha1 == Image(blob, None).sha1
+        assert image._pil_props == ("JPEG", (204, 204), None)
+
+    def but_it_has_no_file_blob_when_its_bytes_are_in_memory(self):
+        assert Image(b"blob", None).file_blob is None
+
     def it_knows_its_content_type(self, content_type_fixture):
         image, expected_value = content_type_fixture
         assert image.content_type == expected_value
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from pptx.media import Video
+from pptx.opc.serialized import PathBlob
 from pptx.package import Package
 from pptx.parts.media import MediaPart
 
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import initializer_mock, instance_mock
 
 
@@ -18,6 +20,7 @@ class DescribeMediaPart(object):
         package_ = instance_mock(request, Package)
         package_.next_media_partname.return_value = "media42.mp4"
         media_.blob, media_.content_type = b"blob-bytes", "video/mp4"
+        media_.file_blob = None
 
         media_part = MediaPart.new(package_, media_)
 
@@ -27,7 +30,26 @@ class DescribeMediaPart(object):
         )
         assert isinstance(media_part, MediaPart)
 
+    def and_it_leaves_file_backed_media_in_its_file(self, request):
+        media_ = instance_mock(request, Video, content_type="video/mp4")
+        file_blob = PathBlob(absjoin(test_file_dir, "dummy.mp4"))
+        media_.file_blob = file_blob
+        _init_ = initializer_mock(request, MediaPart)
+        package_ = instance_mock(request, Package)
+        package_.next_media_partname.return_value = "media42.mp4"
+
+        media_part = MediaPart.new(package_, media_)
+
+        _init_.assert_called_once_with(media_part, "media42.mp4", "video/mp4", package_, file_blob)
+
     def it_knows_the_sha1_hash_of_the_media(self):
         assert MediaPart(None, None, None, b"blobish-bytes").sha1 == (
             "61efc464c21e54cfc1382fb5b6ef7512e141ceae"
         )
+
+    def and_it_computes_the_sha1_hash_of_file_backed_media_from_its_file(self):
+        media_part = MediaPart(None, None, None, PathBlob(absjoin(test_file_dir, "dummy.mp4")))
+        with open(absjoin(test_file_dir, "dummy.mp4"), "rb") as f:
+            expected_value = MediaPart(None, None, None, f.read()).sha1
+
+        assert media_part.sha1 == expected_value
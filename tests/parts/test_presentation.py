@@ -121,7 +121,15 @@ class DescribePresentationPart(object):
 
     def it_can_save_the_package_to_a_file(self, package_):
         PresentationPart(None, None, package_, None).save("prs.pptx")
-        package_.save.assert_called_once_with("prs.pptx")
+        package_.save.assert_called_once_with("prs.pptx", workers=1, compression="default")
+
+    def it_can_generate_the_saved_package_in_chunks(self, package_):
+        package_.iter_save.return_value = iter((b"foo", b"bar"))
+
+        chunks = PresentationPart(None, None, package_, None).iter_save()
+
+        package_.iter_save.assert_called_once_with(workers=1, compression="default")
+        assert list(chunks) == [b"foo", b"bar"]
 
     def it_can_add_a_new_slide(self, request, package_, slide_part_, slide_, relate_to_):
         slide_layout_ = instance_mock(request, SlideLayout)
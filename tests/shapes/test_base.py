@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING, cast
 
 import pytest
@@ -53,6 +54,11 @@ class DescribeBaseShape(object):
         ActionSetting_.assert_called_once_with(cNvPr, shape)
         assert click_action is click_action_
 
+    def it_can_be_weakly_referenced(self, provides_part: ProvidesPart):
+        shape_elm = cast("ShapeElement", element("p:sp/p:nvSpPr/p:cNvPr{id=1}"))
+        shape = BaseShape(shape_elm, provides_part)
+        assert weakref.ref(shape)() is shape
+
     def it_knows_its_shape_id(self, id_fixture):
         shape, expected_value = id_fixture
         assert shape.shape_id == expected_value
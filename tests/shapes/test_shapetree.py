@@ -4,13 +4,16 @@
 
 from __future__ import annotations
 
+import gc
 import io
+import weakref
 
 import pytest
 
 from pptx.chart.data import ChartData
+from pptx.dml.color import RGBColor
 from pptx.enum.chart import XL_CHART_TYPE
-from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER, PROG_ID
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, MSO_SHAPE, PP_PLACEHOLDER, PROG_ID
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.oxml import parse_xml
 from pptx.oxml.shapes.groupshape import CT_GroupShape
@@ -136,11 +139,109 @@ class Describe_BaseShapes(object):
         with pytest.raises(IndexError):
             shapes[2]
 
+    @pytest.mark.parametrize(
+        ("shape_id", "expected_name"), [(2, "Foo"), (3, "Bar"), (4, None), (5, None)]
+    )
+    def it_can_get_a_shape_by_its_id(self, shape_id: int, expected_name: str | None):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},p:grpSp/("
+            "p:nvGrpSpPr/p:cNvPr{id=3,name=Bar},p:sp/p:nvSpPr/p:cNvPr{id=4,name=Baz}),p:cTn{id=5})"
+        )
+        shapes = SlideShapes(spTree, None)
+
+        shape = shapes.get_by_id(shape_id)
+
+        assert (shape and shape.name) == expected_name
+
+    def it_can_get_a_shape_by_its_name(self):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},p:sp/p:nvSpP"
+            "r/p:cNvPr{id=3,name=Bar},p:sp/p:nvSpPr/p:cNvPr{id=4,name=Foo})"
+        )
+        shapes = SlideShapes(spTree, None)
+
+        assert shapes.get_by_name("Foo").shape_id == 2
+        assert shapes.get_by_name("Bar").shape_id == 3
+        assert shapes.get_by_name("Baz") is None
+        assert shapes.get_by_name("Baz", default=42) == 42
+
+    def and_it_finds_a_shape_added_or_renamed_after_the_first_lookup(self):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo})"
+        )
+        shapes = SlideShapes(spTree, None)
+        assert shapes.get_by_name("Bar") is None
+
+        spTree.add_autoshape(3, "Bar", "rect", 0, 0, 1, 1)
+        shapes[0].name = "Baz"
+
+        assert shapes.get_by_name("Bar").shape_id == 3
+        assert shapes.get_by_id(3).name == "Bar"
+        assert shapes.get_by_name("Foo") is None
+        assert shapes.get_by_name("Baz").shape_id == 2
+
     def it_can_clone_a_placeholder(self, clone_ph_fixture):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
         assert shapes._element.xml == expected_xml
 
+    def it_returns_a_new_shape_object_on_each_access_by_default(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2})")
+        shapes = SlideShapes(spTree, None)
+
+        assert shapes.proxy_cache_enabled is False
+        assert next(iter(shapes)) is not next(iter(shapes))
+        assert shapes[0] is not shapes[0]
+
+    def but_it_returns_the_same_shape_object_when_the_proxy_cache_is_enabled(self):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},p:grpSp/"
+            "p:nvGrpSpPr/p:cNvPr{id=3})"
+        )
+        shapes = SlideShapes(spTree, None)
+        shapes.proxy_cache_enabled = True
+
+        sp, grpSp = list(shapes)
+        textbox = shapes.add_textbox(0, 0, 1, 1)
+
+        assert shapes.proxy_cache_enabled is True
+        assert list(shapes) == [sp, grpSp, textbox]
+        assert all(a is b for a, b in zip(shapes, [sp, grpSp, textbox]))
+        assert shapes[1] is grpSp
+        assert shapes.get_by_name("Foo") is sp
+        assert shapes.get_by_id(3) is grpSp
+
+    def and_it_discards_the_cache_when_the_proxy_cache_is_disabled(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2})")
+        shapes = SlideShapes(spTree, None)
+        shapes.proxy_cache_enabled = True
+        shape = shapes[0]
+
+        shapes.proxy_cache_enabled = False
+
+        assert shapes.proxy_cache_enabled is False
+        assert shapes[0] is not shape
+
+    def and_it_drops_the_cached_shape_object_of_a_removed_shape(self):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=2},"
+            "p:sp/p:nvSpPr/p:cNvPr{id=3})"
+        )
+        shapes = SlideShapes(spTree, None)
+        shapes.proxy_cache_enabled = True
+        shape, other_shape = list(shapes)
+        sp = shape._element
+        sp_ref = weakref.ref(sp)
+        assert len(shapes._proxy_cache) == 2
+
+        spTree.remove(sp)
+        del shape, sp
+        assert list(shapes) == [other_shape]
+        gc.collect()
+
+        assert len(shapes._proxy_cache) == 1
+        assert sp_ref() is None
+
     def it_knows_if_turbo_add_is_enabled(self, turbo_fixture):
         shapes, expected_value = turbo_fixture
         turbo_add_enabled = shapes.turbo_add_enabled
@@ -155,6 +256,19 @@ class Describe_BaseShapes(object):
         shapes, expected_value = next_id_fixture
         assert shapes._next_shape_id == expected_value
 
+    def and_the_next_shape_id_is_unique_across_proxies_for_the_same_shape_tree(self):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}")
+        shapes, other_shapes = SlideShapes(spTree, None), SlideShapes(spTree, None)
+        shapes.turbo_add_enabled = True
+
+        ids = []
+        for shapes_ in (shapes, other_shapes, shapes, other_shapes):
+            id_ = shapes_._next_shape_id
+            spTree.add_autoshape(id_, "Shape %d" % id_, "rect", 0, 0, 1, 1)
+            ids.append(id_)
+
+        assert ids == [2, 3, 4, 5]
+
     def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
         assert shapes._next_ph_name(ph_type, sp_id, orient) == expected_value
@@ -250,12 +364,12 @@ class Describe_BaseShapes(object):
         shapes = SlideShapes(spTree, None)
         return shapes, ph_type, sp_id, orient, expected_name
 
-    @pytest.fixture(params=[(None, False), (42, True)])
+    @pytest.fixture(params=[False, True])
     def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
+        expected_value = request.param
         shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
+        if expected_value:
+            shapes._turbo_add_enabled = True
         return shapes, expected_value
 
     @pytest.fixture(
@@ -436,6 +550,70 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, sp)
         assert shape is shape_
 
+    def it_can_add_many_shapes_in_a_single_pass(self):
+        spTree_cxml = "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:extLst)"
+        shapes = SlideShapes(element(spTree_cxml), None)
+        expected_shapes = SlideShapes(element(spTree_cxml), None)
+        rectangle = expected_shapes.add_shape(MSO_SHAPE.RECTANGLE, 1, 2, 3, 4)
+        rectangle.text = "Foo\nBar"
+        rectangle.fill.solid()
+        rectangle.fill.fore_color.rgb = RGBColor(0x12, 0x34, 0x56)
+        expected_shapes.add_connector(MSO_CONNECTOR.STRAIGHT, 50, 60, 10, 20)
+        expected_shapes.add_textbox(5, 6, 7, 8).text = "Baz"
+        expected_shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, 0, 0)
+
+        return_value = shapes.add_shapes(
+            [
+                {
+                    "type": MSO_SHAPE.RECTANGLE,
+                    "left": Emu(1),
+                    "top": Emu(2),
+                    "width": Emu(3),
+                    "height": Emu(4),
+                    "text": "Foo\nBar",
+                    "fill": RGBColor(0x12, 0x34, 0x56),
+                },
+                {
+                    "type": MSO_CONNECTOR.STRAIGHT,
+                    "begin_x": Emu(50),
+                    "begin_y": Emu(60),
+                    "end_x": Emu(10),
+                    "end_y": Emu(20),
+                },
+                {
+                    "type": "textbox",
+                    "left": Emu(5),
+                    "top": Emu(6),
+                    "width": Emu(7),
+                    "height": Emu(8),
+                    "text": "Baz",
+                },
+                {"type": MSO_SHAPE.RECTANGLE},
+            ]
+        )
+
+        assert return_value is None
+        assert shapes._element.xml == expected_shapes._element.xml
+
+    def and_it_can_return_the_shapes_it_adds(self):
+        spTree = element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=41}")
+        shapes = SlideShapes(spTree, None)
+
+        new_shapes = shapes.add_shapes(
+            ({"type": MSO_SHAPE.OVAL} for _ in range(3)), return_shapes=True
+        )
+
+        assert new_shapes is not None
+        assert [type(shape) for shape in new_shapes] == [Shape, Shape, Shape]
+        assert [shape.shape_id for shape in new_shapes] == [42, 43, 44]
+        assert [shape.name for shape in new_shapes] == ["Oval 41", "Oval 42", "Oval 43"]
+        assert shapes[-1].shape_id == 44
+
+    def but_it_raises_on_text_for_a_connector(self):
+        shapes = SlideShapes(element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}"), None)
+        with pytest.raises(ValueError, match="a connector can have no text or fill"):
+            shapes.add_shapes([{"type": MSO_CONNECTOR.STRAIGHT, "text": "foo"}])
+
     def it_knows_the_index_of_each_of_its_shapes(self, index_fixture):
         shapes, shape_, expected_value = index_fixture
         assert shapes.index(shape_) == expected_value
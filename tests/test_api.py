@@ -18,7 +18,19 @@ class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, None, False)
+        assert prs is prs_
+
+    def it_can_open_only_selected_slides(self, call_fixture):
+        Package_, _, prs_ = call_fixture
+        prs = Presentation("foo.pptx", slides=[9, 10, 11])
+        Package_.open.assert_called_once_with("foo.pptx", [9, 10, 11], False)
+        assert prs is prs_
+
+    def it_can_open_a_presentation_that_reuses_unchanged_xml(self, call_fixture):
+        Package_, _, prs_ = call_fixture
+        prs = Presentation("foo.pptx", reuse_unchanged_xml=True)
+        Package_.open.assert_called_once_with("foo.pptx", None, True)
         assert prs is prs_
 
     # fixtures -------------------------------------------------------
@@ -0,0 +1,88 @@
+"""Unit-test suite for `pptx.extract` module."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from pptx import Presentation
+from pptx.extract import TextRecord, iter_text
+from pptx.opc.serialized import PackageReader
+from pptx.util import Inches
+
+from .unitutil.file import absjoin, test_file_dir
+from .unitutil.mock import FixtureRequest, method_mock
+
+
+class DescribeIterText:
+    """Unit-test suite for `pptx.extract.iter_text()`."""
+
+    def it_generates_a_record_for_each_text_frame_having_text(self, pptx_stream: io.BytesIO):
+        assert list(iter_text(pptx_stream)) == [
+            TextRecord(0, 2, "Title 0", False),
+            TextRecord(0, 3, "foo\nbar\vbaz", False),
+            TextRecord(0, 4, "cell", False),
+            TextRecord(0, 6, "grouped", False),
+            TextRecord(1, 2, "Title 1", False),
+            TextRecord(1, 3, "Notes 1", True),
+        ]
+
+    def it_gives_the_same_text_as_the_shape_objects(self, pptx_stream: io.BytesIO):
+        prs = Presentation(pptx_stream)
+        slide = prs.slides[0]
+        pptx_stream.seek(0)
+
+        records = list(iter_text(pptx_stream))
+
+        assert records[1].text == slide.shapes[1].text_frame.text
+        assert records[3].shape_id == slide.shapes[3].shapes[0].shape_id
+
+    def it_can_leave_out_the_notes_pages(self, pptx_stream: io.BytesIO):
+        assert [r for r in iter_text(pptx_stream, notes=False) if r.is_notes] == []
+
+    def it_visits_the_slides_in_slide_sequence(self, pptx_stream: io.BytesIO):
+        prs = Presentation(pptx_stream)
+        sldIdLst = prs.slides._sldIdLst  # pyright: ignore[reportPrivateUsage]
+        sldIdLst.append(sldIdLst[0])
+        stream = io.BytesIO()
+        prs.save(stream)
+        stream.seek(0)
+
+        assert [r.text for r in iter_text(stream) if r.shape_id == 2] == ["Title 1", "Title 0"]
+
+    def it_can_read_an_expanded_package(self):
+        assert list(iter_text(absjoin(test_file_dir, "expanded_pptx"))) == [
+            TextRecord(0, 2, "Presentation Title Text", False),
+            TextRecord(0, 3, "Subtitle Text", False),
+        ]
+
+    def it_closes_the_package_when_the_generator_is_closed(
+        self, request: FixtureRequest, pptx_stream: io.BytesIO
+    ):
+        close_ = method_mock(request, PackageReader, "close")
+        records = iter_text(pptx_stream)
+
+        next(records)
+        records.close()
+
+        close_.assert_called_once()
+
+    # -- fixtures --------------------------------------------------------------------------------
+
+    @pytest.fixture
+    def pptx_stream(self) -> io.BytesIO:
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "Title 0"
+        slide.placeholders[1].text_frame.text = "foo\nbar\vbaz"
+        table = slide.shapes.add_table(2, 2, 0, 0, Inches(2), Inches(1)).table
+        table.cell(0, 0).text = "cell"
+        slide.shapes.add_group_shape().shapes.add_textbox(0, 0, 9, 9).text = "grouped"
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Title 1"
+        slide.notes_slide.notes_text_frame.text = "Notes 1"
+        stream = io.BytesIO()
+        prs.save(stream)
+        stream.seek(0)
+        return stream
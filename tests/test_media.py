@@ -7,6 +7,7 @@ import io
 import pytest
 
 from pptx.media import Video
+from pptx.opc.serialized import PathBlob
 
 from .unitutil.file import absjoin, test_file_dir
 from .unitutil.mock import initializer_mock, instance_mock, method_mock, property_mock
@@ -27,6 +28,19 @@ class DescribeVideo(object):
         Video.from_blob.assert_called_once_with(blob, "video/mp4", "dummy.mp4")
         assert video is video_
 
+    def but_it_leaves_a_large_movie_file_in_place(self, video_, from_blob_, monkeypatch):
+        monkeypatch.setattr("pptx.media.FILE_BACKED_MIN_SIZE", 1)
+        from_blob_.return_value = video_
+
+        video = Video.from_path_or_file_like(TEST_VIDEO_PATH, "video/mp4")
+
+        blob, mime_type, filename = from_blob_.call_args.args
+        assert isinstance(blob, PathBlob)
+        with open(TEST_VIDEO_PATH, "rb") as f:
+            assert blob.read() == f.read()
+        assert (mime_type, filename) == ("video/mp4", "dummy.mp4")
+        assert video is video_
+
     def it_can_construct_from_a_stream(self, from_stream_fixture):
         movie_stream, mime_type, blob, video_ = from_stream_fixture
         video = Video.from_path_or_file_like(movie_stream, mime_type)
@@ -43,6 +57,19 @@ class DescribeVideo(object):
         video, expected_value = blob_fixture
         assert video.blob == expected_value
 
+    def and_it_reads_the_bytestream_of_a_file_backed_video_from_its_file(self):
+        file_blob = PathBlob(TEST_VIDEO_PATH)
+        video = Video(file_blob, "video/mp4", "dummy.mp4")
+        with open(TEST_VIDEO_PATH, "rb") as f:
+            blob = f.read()
+
+        assert video.file_blob is file_blob
+        assert video.blob == blob
+        assert video.sha1 == Video(blob, "video/mp4", "dummy.mp4").sha1
+
+    def but_it_has_no_file_blob_when_its_bytes_are_in_memory(self):
+        assert Video(b"blob-bytes", None, None).file_blob is None
+
     def it_knows_its_content_type(self, content_type_fixture):
         video, expected_value = content_type_fixture
         assert video.content_type == expected_value
@@ -9,15 +9,17 @@ import os
 import pytest
 
 import pptx
+from pptx import Presentation
 from pptx.media import Video
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import Part, _Relationship
+from pptx.opc.package import OpcPackage, Part, _Relationship
 from pptx.opc.packuri import PackURI
-from pptx.package import Package, _ImageParts, _MediaParts
+from pptx.package import Package, _ImageParts, _MediaParts, _Sha1Index
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
 
+from .unitutil.file import absjoin, test_file_dir
 from .unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
 
 
@@ -53,6 +55,99 @@ class DescribePackage(object):
         partname = package.next_media_partname(ext)
         assert partname == expected_value
 
+    @pytest.mark.parametrize(
+        ("reltype", "is_external", "image_calls", "media_calls"),
+        [
+            (RT.IMAGE, False, 1, 0),
+            (RT.MEDIA, False, 0, 1),
+            (RT.VIDEO, False, 0, 1),
+            (RT.SLIDE, False, 0, 0),
+            (RT.IMAGE, True, 0, 0),
+        ],
+    )
+    def it_indexes_an_image_or_media_part_when_it_is_related(
+        self,
+        request,
+        reltype,
+        is_external,
+        image_calls,
+        media_calls,
+        _image_parts_prop_,
+        image_parts_,
+        _media_parts_prop_,
+        media_parts_,
+    ):
+        notify_rel_added_ = method_mock(request, OpcPackage, "notify_rel_added")
+        _image_parts_prop_.return_value = image_parts_
+        _media_parts_prop_.return_value = media_parts_
+        part_ = instance_mock(request, Part)
+        rel_ = instance_mock(
+            request, _Relationship, reltype=reltype, is_external=is_external, target_part=part_
+        )
+        package = Package(None)
+
+        package.notify_rel_added(None, rel_)
+
+        notify_rel_added_.assert_called_once_with(package, None, rel_)
+        assert image_parts_.add_part.call_args_list == [call(part_)] * image_calls
+        assert media_parts_.add_part.call_args_list == [call(part_)] * media_calls
+
+    def it_removes_parts_removed_from_the_package_from_its_sha1_indexes(
+        self, request, _image_parts_prop_, image_parts_, _media_parts_prop_, media_parts_
+    ):
+        _notify_parts_removed_ = method_mock(request, OpcPackage, "_notify_parts_removed")
+        _image_parts_prop_.return_value = image_parts_
+        _media_parts_prop_.return_value = media_parts_
+        parts_ = [instance_mock(request, Part)]
+        package = Package(None)
+
+        package._notify_parts_removed(parts_)
+
+        _notify_parts_removed_.assert_called_once_with(package, parts_)
+        image_parts_.remove_parts.assert_called_once_with(parts_)
+        media_parts_.remove_parts.assert_called_once_with(parts_)
+
+    def and_it_no_longer_finds_an_image_part_removed_from_the_package(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        image_path = absjoin(test_file_dir, "monty-truth.png")
+        other_image_path = absjoin(test_file_dir, "python-icon.jpeg")
+        pic = slide.shapes.add_picture(image_path, 0, 0)._element
+        other_pic = slide.shapes.add_picture(other_image_path, 0, 0)._element
+        image_part = slide.part.related_part(pic.blip_rId)
+        other_image_part = slide.part.related_part(other_pic.blip_rId)
+        package = prs.part.package
+
+        pic.getparent().remove(pic)
+        slide.part.drop_rel(pic.blip_rId)
+
+        assert package._image_parts._find_by_sha1(image_part.sha1) is None
+        assert package.get_or_add_image_part(other_image_path) is other_image_part
+
+    def but_it_finds_another_image_part_having_the_same_SHA1_in_its_place(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        image_path = absjoin(test_file_dir, "monty-truth.png")
+        pic = slide.shapes.add_picture(image_path, 0, 0)._element
+        image_part = slide.part.related_part(pic.blip_rId)
+        # -- a second part having the same image, as a package made elsewhere can have --
+        with open(image_path, "rb") as f:
+            twin_part = ImagePart.load(
+                PackURI("/ppt/media/image2.png"),
+                image_part.content_type,
+                prs.part.package,
+                f.read(),
+            )
+        twin_rId = slide.part.relate_to(twin_part, RT.IMAGE)
+        package = prs.part.package
+        assert package.get_or_add_image_part(image_path) is image_part
+
+        pic.getparent().remove(pic)
+        slide.part.drop_rel(pic.blip_rId)
+
+        assert package.get_or_add_image_part(image_path) is twin_part
+        assert slide.part.related_part(twin_rId) is twin_part
+
     def it_provides_access_to_its_MediaParts_object(self, m_parts_fixture):
         package, _MediaParts_, media_parts_ = m_parts_fixture
         media_parts = package._media_parts
@@ -203,6 +298,54 @@ class Describe_ImageParts(object):
 
         assert result == png_part_
 
+    def it_indexes_image_parts_by_sha1_on_first_use(self, request, _iter_):
+        part_1_ = instance_mock(request, ImagePart, name="part_1_", sha1="f00")
+        part_2_ = instance_mock(request, ImagePart, name="part_2_", sha1="ba7")
+        part_3_ = instance_mock(request, ImagePart, name="part_3_", sha1="f00")
+        _iter_.return_value = iter((part_1_, part_2_, part_3_))
+        image_parts = _ImageParts(None)
+
+        sha1_index = image_parts._sha1_index
+
+        assert sha1_index.find("f00") is part_1_
+        assert sha1_index.find("ba7") is part_2_
+        assert image_parts._sha1_index is sha1_index
+        _iter_.assert_called_once_with(image_parts)
+
+    def it_adds_a_related_image_part_to_its_sha1_index(self, request, _iter_):
+        part_1_ = instance_mock(request, ImagePart, name="part_1_", sha1="f00")
+        part_2_ = instance_mock(request, ImagePart, name="part_2_", sha1="ba7")
+        part_3_ = instance_mock(request, ImagePart, name="part_3_", sha1="f00")
+        svg_part_ = instance_mock(request, Part, name="svg_part_")
+        _iter_.return_value = iter((part_1_,))
+        image_parts = _ImageParts(None)
+
+        image_parts.add_part(part_2_)
+        assert "_sha1_index" not in image_parts.__dict__
+
+        image_parts._find_by_sha1("f00")
+        image_parts.add_part(part_2_)
+        image_parts.add_part(part_3_)
+        image_parts.add_part(svg_part_)
+
+        assert image_parts._find_by_sha1("f00") is part_1_
+        assert image_parts._find_by_sha1("ba7") is part_2_
+
+    def it_removes_parts_removed_from_the_package_from_its_sha1_index(self, request, _iter_):
+        part_1_ = instance_mock(request, ImagePart, name="part_1_", sha1="f00")
+        part_2_ = instance_mock(request, ImagePart, name="part_2_", sha1="ba7")
+        _iter_.return_value = iter((part_1_, part_2_))
+        image_parts = _ImageParts(None)
+
+        image_parts.remove_parts([part_1_])
+        assert "_sha1_index" not in image_parts.__dict__
+
+        image_parts._find_by_sha1("f00")
+        image_parts.remove_parts([part_1_])
+
+        assert image_parts._find_by_sha1("f00") is None
+        assert image_parts._find_by_sha1("ba7") is part_2_
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -291,6 +434,27 @@ class Describe_MediaParts(object):
         media_part = media_parts._find_by_sha1(sha1)
         assert media_part is expected_value
 
+    def it_maintains_a_sha1_index_of_its_media_parts(self, request, _iter_):
+        part_1_ = instance_mock(request, MediaPart, name="part_1_", sha1="f00")
+        part_2_ = instance_mock(request, MediaPart, name="part_2_", sha1="ba7")
+        part_3_ = instance_mock(request, MediaPart, name="part_3_", sha1="f00")
+        _iter_.side_effect = lambda media_parts: iter((part_1_,))
+        media_parts = _MediaParts(None)
+
+        media_parts.add_part(part_2_)
+        assert "_sha1_index" not in media_parts.__dict__
+
+        assert media_parts._find_by_sha1("f00") is part_1_
+        media_parts.add_part(part_2_)
+        media_parts.add_part(part_3_)
+        assert media_parts._find_by_sha1("ba7") is part_2_
+
+        media_parts.remove_parts([part_1_])
+        assert media_parts._find_by_sha1("f00") is part_3_
+
+        media_parts.remove_parts([part_3_])
+        assert media_parts._find_by_sha1("f00") is None
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -375,3 +539,30 @@ class Describe_MediaParts(object):
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
+
+
+class Describe_Sha1Index:
+    """Unit-test suite for `pptx.package._Sha1Index` objects."""
+
+    def it_finds_the_first_part_added_having_a_SHA1(self, request):
+        part_1_, part_2_, part_3_ = (instance_mock(request, Part) for _ in range(3))
+        sha1_index = _Sha1Index()
+
+        for part_, sha1 in ((part_1_, "f00"), (part_2_, "ba7"), (part_3_, "f00"), (part_1_, "f00")):
+            sha1_index.add(part_, sha1)
+
+        assert sha1_index.find("f00") is part_1_
+        assert sha1_index.find("ba7") is part_2_
+        assert sha1_index.find("b0a") is None
+
+    def and_the_next_one_having_it_once_that_part_is_removed(self, request):
+        part_1_, part_2_, other_part_ = (instance_mock(request, Part) for _ in range(3))
+        sha1_index = _Sha1Index()
+        sha1_index.add(part_1_, "f00")
+        sha1_index.add(part_2_, "f00")
+
+        sha1_index.remove([part_1_, other_part_])
+        assert sha1_index.find("f00") is part_2_
+
+        sha1_index.remove([part_2_])
+        assert sha1_index.find("f00") is None
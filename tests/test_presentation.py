@@ -74,7 +74,26 @@ class DescribePresentation(object):
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(file_, workers=1, compression="default")
+
+    def and_it_can_compress_the_saved_parts_on_worker_threads(self, save_fixture):
+        prs, file_, prs_part_ = save_fixture
+        prs.save(file_, workers=4)
+        prs_part_.save.assert_called_once_with(file_, workers=4, compression="default")
+
+    def and_it_can_save_with_a_compression_profile(self, save_fixture):
+        prs, file_, prs_part_ = save_fixture
+        prs.save(file_, compression="fast")
+        prs_part_.save.assert_called_once_with(file_, workers=1, compression="fast")
+
+    def it_can_generate_the_saved_presentation_in_chunks(self, prs_part_):
+        prs_part_.iter_save.return_value = iter((b"foo", b"bar"))
+        prs = Presentation(None, prs_part_)
+
+        chunks = prs.iter_save(workers=2, compression="fast")
+
+        prs_part_.iter_save.assert_called_once_with(workers=2, compression="fast")
+        assert list(chunks) == [b"foo", b"bar"]
 
     # fixtures -------------------------------------------------------
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import weakref
+
 import pytest
 
 from pptx.opc.package import XmlPart
@@ -29,6 +31,15 @@ class DescribeElementProxy(object):
         proxy, element = element_fixture
         assert proxy.element is element
 
+    def it_can_be_weakly_referenced(self, element_fixture):
+        proxy, _ = element_fixture
+        assert weakref.ref(proxy)() is proxy
+
+    def but_it_does_not_accept_an_attribute_its_class_does_not_define(self, element_fixture):
+        proxy, _ = element_fixture
+        with pytest.raises(AttributeError):
+            proxy.foo = 1
+
     # fixture --------------------------------------------------------
 
     @pytest.fixture
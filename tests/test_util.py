@@ -4,7 +4,50 @@ from __future__ import annotations
 
 import pytest
 
-from pptx.util import Centipoints, Cm, Emu, Inches, Length, Mm, Pt
+from pptx.util import Centipoints, Cm, Emu, Inches, Length, Mm, Pt, lazyslotproperty
+
+
+class DescribeLazyslotproperty(object):
+    """Unit-test suite for `pptx.util.lazyslotproperty` objects."""
+
+    def it_computes_the_value_on_first_access_only(self):
+        obj = SlottedObj()
+
+        value = obj.value
+
+        assert value == [1]
+        assert obj.value is value
+        assert obj.calls == 1
+
+    def and_it_caches_a_None_value(self):
+        obj = SlottedObj(None)
+
+        assert obj.value is None
+        assert obj.value is None
+        assert obj.calls == 1
+
+    def it_raises_on_assignment(self):
+        obj = SlottedObj()
+        with pytest.raises(AttributeError):
+            obj.value = [42]
+
+    def it_looks_like_the_decorated_method_on_the_class(self):
+        assert isinstance(SlottedObj.value, lazyslotproperty)
+        assert SlottedObj.value.__doc__ == "The value, computed on first access."
+
+
+class SlottedObj(object):
+    __slots__ = ("calls", "_lazy_value", "_value")
+
+    def __init__(self, value: list[int] | None = [1]):
+        self.calls = 0
+        self._value = value
+
+    @lazyslotproperty
+    def value(self) -> list[int] | None:
+        """The value, computed on first access."""
+        self.calls += 1
+        return self._value
 
 
 class DescribeLength(object):
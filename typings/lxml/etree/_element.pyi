@@ -41,6 +41,7 @@ class _Element:
     def __iter__(self) -> Iterator[_Element]: ...
     def addprevious(self, element: _Element) -> None: ...
     def append(self, element: _Element) -> None: ...
+    def extend(self, elements: Iterable[_Element]) -> None: ...
     @property
     def attrib(self) -> _Attrib: ...
     def find(self, path: _t._ElemPathArg) -> Self | None: ...
@@ -52,7 +53,9 @@ class _Element:
     @overload
     def get(self, key: _t._AttrName, default: _T) -> str | _T: ...
     def getparent(self) -> _Element | None: ...
+    def getroottree(self) -> _ElementTree[Self]: ...
     def index(self, child: _Element, start: int | None = None, end: int | None = None) -> int: ...
+    def iter(self, *tags: _t._TagSelector) -> Iterator[_Element]: ...
     def iterancestors(
         self, *, tag: _t._TagSelector | Collection[_t._TagSelector] | None = None
     ) -> Iterator[Self]: ...
@@ -93,4 +96,5 @@ class _Element:
         namespaces: _t._NonDefaultNSMapArg | None = None,
     ) -> _t._XPathObject: ...
 
-class _ElementTree(Generic[_t._ET_co]): ...
+class _ElementTree(Generic[_t._ET_co]):
+    def getroot(self) -> _t._ET_co: ...
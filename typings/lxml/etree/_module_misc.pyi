@@ -3,3 +3,7 @@
 from __future__ import annotations
 
 class QName: ...
+
+class LxmlError(Exception): ...
+class LxmlSyntaxError(LxmlError, SyntaxError): ...
+class XMLSyntaxError(LxmlSyntaxError): ...
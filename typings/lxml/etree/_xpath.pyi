@@ -0,0 +1,20 @@
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+from typing import Any
+
+from .. import _types as _t
+from ._element import _Element
+
+class XPath:
+    def __init__(
+        self,
+        path: str,
+        *,
+        namespaces: _t._NonDefaultNSMapArg | None = None,
+        smart_strings: bool = True,
+    ) -> None: ...
+    def __call__(self, _etree_or_element: _Element, /, **_variables: Any) -> _t._XPathObject: ...
+    @property
+    def path(self) -> str: ...